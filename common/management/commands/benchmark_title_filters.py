@@ -0,0 +1,296 @@
+import random
+import statistics
+import time
+import uuid
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models import Model, QuerySet
+from wagtail.models import Page
+
+from common.title_search import (
+    TITLE_TRIGRAM_INDEX,
+    filter_titles,
+    trigram_search_available,
+)
+from contact.models import Meeting, Person
+from library.models import LibraryItem
+from memorials.models import Memorial
+from pagination.helpers import get_paginated_items
+
+WORDS = [
+    "friends",
+    "meeting",
+    "peace",
+    "quaker",
+    "worship",
+    "memorial",
+    "minute",
+    "journal",
+    "testimony",
+    "light",
+]
+
+SYLLABLES = ["ka", "lo", "mi", "ren", "sto", "val", "der", "pin", "qua", "tor"]
+
+VOCABULARY = WORDS + [
+    a + b + c for a in SYLLABLES for b in SYLLABLES for c in SYLLABLES
+]
+
+DEFAULT_QUERIES = [
+    "peace",
+    "quaker journal",
+    "kalomi",
+    "renval",
+]
+
+MEETING_COUNT = 50
+
+
+class Command(BaseCommand):
+    help = (
+        "Time the title filters of the library and memorial listings on a "
+        "generated corpus of library items and memorials, and show whether "
+        "PostgreSQL scans the page table or uses the title trigram index. The "
+        "corpus is created in a transaction that is rolled back afterwards "
+        "unless --keep is given."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--items",
+            type=int,
+            default=50_000,
+            help="Number of library items and of memorials to generate",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=5,
+            help="Number of timed runs per query and listing",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of pages to create per batch",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="Random seed for the generated corpus",
+        )
+        parser.add_argument(
+            "--query",
+            action="append",
+            dest="queries",
+            help="Title to filter by (may be repeated); defaults to a built-in set",
+        )
+        parser.add_argument(
+            "--keep",
+            action="store_true",
+            help="Keep the generated pages instead of rolling them back",
+        )
+
+    def handle(self, *args, **options):
+        queries = options["queries"] or DEFAULT_QUERIES
+        rng = random.Random(options["seed"])
+
+        with transaction.atomic():
+            parent = self.create_page(Page(title="Title filter benchmark"))
+            person = self.create_page(
+                Person(given_name="Benchmark", family_name="Person"),
+                parent,
+            )
+            meetings = [
+                self.create_page(Meeting(title=self.make_title(rng)), parent)
+                for _ in range(MEETING_COUNT)
+            ]
+
+            self.generate_pages(
+                LibraryItem,
+                parent,
+                options["items"],
+                options["batch_size"],
+                rng,
+                dict,
+            )
+            self.generate_pages(
+                Memorial,
+                parent,
+                options["items"],
+                options["batch_size"],
+                rng,
+                lambda: {
+                    "memorial_person_id": person.pk,
+                    "memorial_meeting_id": rng.choice(meetings).pk,
+                },
+            )
+
+            self.analyze()
+
+            self.stdout.write(
+                f"pg_trgm installed: {'yes' if trigram_search_available() else 'no'}",
+            )
+            self.stdout.write(
+                f"{'query':<20}{'listing':<24}{'hits':>8}{'median ms':>12}"
+                f"{'p95 ms':>10}  scan",
+            )
+            for query in queries:
+                for listing, queryset in (
+                    (
+                        "library title",
+                        filter_titles(LibraryItem.objects.live(), {"title": query}),
+                    ),
+                    (
+                        "memorial title",
+                        filter_titles(Memorial.objects.all(), {"title": query}),
+                    ),
+                    (
+                        "memorial meeting",
+                        filter_titles(
+                            Memorial.objects.all(),
+                            {"memorial_meeting__title": query},
+                        ),
+                    ),
+                ):
+                    timings, hits = self.time_listing(queryset, options["repeat"])
+                    self.stdout.write(
+                        f"{query:<20}{listing:<24}{hits:>8}"
+                        f"{statistics.median(timings):>12.1f}"
+                        f"{self.percentile(timings, 95):>10.1f}"
+                        f"  {self.get_scan(queryset)}",
+                    )
+
+            if options["keep"]:
+                self.stdout.write(
+                    self.style.SUCCESS(f"Kept generated pages below '{parent.title}'"),
+                )
+            else:
+                transaction.set_rollback(True)
+                self.stdout.write(self.style.SUCCESS("Rolled back generated pages"))
+
+    @staticmethod
+    def make_title(rng: random.Random) -> str:
+        return " ".join(rng.choices(VOCABULARY, k=rng.randint(3, 8)))
+
+    @staticmethod
+    def create_page(page: Page, parent: Page | None = None) -> Page:
+        parent = parent or Page.get_first_root_node()
+        page.slug = f"title-benchmark-{uuid.uuid4().hex[:8]}"
+        return parent.add_child(instance=page)
+
+    def generate_pages(
+        self,
+        model: type[Model],
+        parent: Page,
+        count: int,
+        batch_size: int,
+        rng: random.Random,
+        get_fields,
+    ) -> None:
+        """Create ``count`` live pages of a page model below the parent.
+
+        The page rows are inserted in bulk, and then the rows of the model's
+        own table, which bulk_create() does not support for page models.
+        """
+        content_type = ContentType.objects.get_for_model(model)
+        label = model._meta.model_name
+        parent.refresh_from_db()
+        first_position = parent.numchild
+
+        self.stdout.write(f"Generating {count} {model._meta.verbose_name_plural}...")
+        for start in range(0, count, batch_size):
+            batch = []
+            for offset in range(start, min(start + batch_size, count)):
+                title = self.make_title(rng)
+                slug = f"{label}-{offset}"
+                batch.append(
+                    Page(
+                        title=title,
+                        draft_title=title,
+                        slug=slug,
+                        content_type=content_type,
+                        live=True,
+                        depth=parent.depth + 1,
+                        path=Page._get_path(
+                            parent.path,
+                            parent.depth + 1,
+                            first_position + offset + 1,
+                        ),
+                        numchild=0,
+                        url_path=f"{parent.url_path}{slug}/",
+                        locale_id=parent.locale_id,
+                    ),
+                )
+            pages = Page.objects.bulk_create(batch)
+            model._base_manager._insert(  # type: ignore[attr-defined]
+                [model(page_ptr_id=page.pk, **get_fields()) for page in pages],
+                fields=model._meta.local_concrete_fields,
+            )
+
+        Page.objects.filter(pk=parent.pk).update(numchild=first_position + count)
+
+    def analyze(self) -> None:
+        self.stdout.write("Analyzing tables...")
+        tables = [
+            Page._meta.db_table,
+            LibraryItem._meta.db_table,
+            Memorial._meta.db_table,
+            Meeting._meta.db_table,
+        ]
+        with connection.cursor() as cursor:
+            # Merge the GIN pending lists filled by the bulk inserts, as
+            # autovacuum would have done on a live database
+            cursor.execute(
+                """
+                SELECT gin_clean_pending_list(i.indexrelid::regclass)
+                FROM pg_index i
+                JOIN pg_class c ON c.oid = i.indexrelid
+                JOIN pg_am am ON am.oid = c.relam
+                WHERE am.amname = 'gin' AND i.indrelid::regclass::text = ANY(%s)
+                """,
+                [tables],
+            )
+            for table in tables:
+                cursor.execute(f"ANALYZE {connection.ops.quote_name(table)}")
+
+    @staticmethod
+    def run_listing(queryset: QuerySet) -> int:
+        paginated = get_paginated_items(queryset, 10, 1, keyset=True)
+        list(paginated.page.object_list)
+        return paginated.page.paginator.count
+
+    def time_listing(self, queryset: QuerySet, repeat: int) -> tuple[list[float], int]:
+        hits = self.run_listing(queryset)  # warm up caches
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            self.run_listing(queryset)
+            timings.append((time.perf_counter() - started) * 1000)
+        return timings, hits
+
+    @staticmethod
+    def get_scan(queryset: QuerySet) -> str:
+        """Return how the query plan applies the title filter."""
+        plan = queryset.explain()
+        if TITLE_TRIGRAM_INDEX in plan:
+            return "trigram index"
+
+        # The LIKE filter is listed below the plan node that applies it
+        node = ""
+        for line in plan.splitlines():
+            if "~~" in line and "Filter:" in line:
+                if "Seq Scan" in node:
+                    return "sequential scan"
+                return "row filter"
+            node = line
+        return "other"
+
+    @staticmethod
+    def percentile(values: list[float], percent: int) -> float:
+        ordered = sorted(values)
+        index = min(len(ordered) - 1, round(percent / 100 * (len(ordered) - 1)))
+        return ordered[index]
@@ -0,0 +1,54 @@
+# Adds a pg_trgm GIN index on page titles, for case-insensitive "contains"
+# filters on library item, memorial and meeting titles (see
+# common.title_search). Skipped on databases without pg_trgm.
+
+from django.db import migrations
+
+TITLE_TRIGRAM_INDEX = "wagtailcore_page_title_upper_trgm_idx"
+
+
+def create_title_trigram_index(apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor != "postgresql":
+        return
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'",
+        )
+        if cursor.fetchone() is None:
+            return
+
+        cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        # The same expression as Django's icontains lookup, so that the
+        # planner uses the index for it
+        cursor.execute(
+            f"""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS {TITLE_TRIGRAM_INDEX}
+            ON wagtailcore_page
+            USING GIN (UPPER(title::text) gin_trgm_ops)
+            """,
+        )
+
+
+def drop_title_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(f"DROP INDEX IF EXISTS {TITLE_TRIGRAM_INDEX}")
+
+
+class Migration(migrations.Migration):
+    atomic = False  # Required for concurrent index creation
+
+    dependencies = [
+        ("wagtailcore", "0096_referenceindex_referenceindex_source_object_and_more"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            create_title_trigram_index,
+            drop_title_trigram_index,
+        ),
+    ]
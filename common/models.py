@@ -1,4 +1,9 @@
 from django.db import models
+from django.db.models import Prefetch, QuerySet, prefetch_related_objects
+from django.db.models.constants import LOOKUP_SEP
+from django.http import Http404
+from taggit.managers import TaggableManager
+from wagtail.models import Page
 
 
 class DrupalFields(models.Model):
@@ -8,3 +13,135 @@ class DrupalFields(models.Model):
 
     class Meta:
         abstract = True
+
+
+class ServePrefetchMixin:
+    """Load the related objects a page's template uses when it is served.
+
+    Page classes declare the forward relations to join, the relations to
+    prefetch and the fields to defer once:
+
+        class LibraryItem(ServePrefetchMixin, Page):
+            serve_select_related = ("item_genre",)
+            serve_prefetch_related = ("authors__author", "tags")
+            serve_defer = ("drupal_body_migrated",)
+
+    Parent pages using ServePrefetchRouteMixin load the page they route to
+    with get_serve_queryset(), so the page and its relations come from the
+    one load Wagtail makes anyway. get_context() loads whatever is still
+    missing, e.g. on previews, which are not routed.
+
+    Override get_serve_prefetch_related() for Prefetch objects whose
+    querysets use models that cannot be imported at class definition.
+    """
+
+    # Direct forward relations, loaded in one joined query
+    serve_select_related: tuple[str, ...] = ()
+    serve_prefetch_related: tuple[str | Prefetch, ...] = ()
+    # Fields the page's template does not use
+    serve_defer: tuple[str, ...] = ()
+
+    @classmethod
+    def get_serve_prefetch_related(cls) -> list[str | Prefetch]:
+        return list(cls.serve_prefetch_related)
+
+    @classmethod
+    def get_serve_queryset(cls) -> QuerySet:
+        """Return a queryset loading pages with their declared relations."""
+        return (
+            cls._default_manager.select_related(  # type: ignore[attr-defined]
+                *cls.serve_select_related,
+            )
+            .prefetch_related(*cls.get_serve_prefetch_related())
+            .defer(*cls.serve_defer)
+        )
+
+    def _holds_in_memory(self, lookup: str | Prefetch) -> bool:
+        """Return whether the first relation of a prefetch lookup is held in
+        memory by modelcluster, as on previews built from the edit form.
+
+        modelcluster managers read those objects rather than the prefetch
+        cache, so prefetching them would only query stale rows.
+        """
+        cluster_objects = getattr(self, "_cluster_related_objects", None)
+        if not cluster_objects:
+            return False
+
+        path = lookup.prefetch_through if isinstance(lookup, Prefetch) else lookup
+        field = self._meta.get_field(path.split(LOOKUP_SEP)[0])  # type: ignore[attr-defined]
+        if isinstance(field, TaggableManager):
+            # Tags are held as the objects of their through model
+            field = field.through._meta.get_field("content_object").remote_field
+        return field.get_accessor_name() in cluster_objects
+
+    def prefetch_for_serve(self) -> None:
+        """Load the declared relations onto this instance.
+
+        Relations that are already loaded are skipped, so calling this again
+        makes no queries. Unsaved instances, such as previews of new pages,
+        have no rows to load relations from.
+        """
+        if self.pk is None:  # type: ignore[attr-defined]
+            return
+
+        fields = [
+            self._meta.get_field(name)  # type: ignore[attr-defined]
+            for name in self.serve_select_related
+        ]
+        missing_fields = [field for field in fields if not field.is_cached(self)]
+        if missing_fields:
+            names = [field.name for field in missing_fields]
+            related = (
+                type(self)
+                ._base_manager.select_related(*names)  # type: ignore[attr-defined]
+                .only("pk", *names)
+                .filter(pk=self.pk)  # type: ignore[attr-defined]
+                .first()
+            )
+            for field in missing_fields:
+                # Previews may refer to other objects than the saved page
+                saved_value = getattr(related, field.attname, None)
+                if related is not None and saved_value == getattr(self, field.attname):
+                    field.set_cached_value(self, field.get_cached_value(related))
+
+        prefetch_related_objects(
+            [self],
+            *(
+                lookup
+                for lookup in self.get_serve_prefetch_related()
+                if not self._holds_in_memory(lookup)
+            ),
+        )
+
+    def get_context(self, request, *args, **kwargs):
+        self.prefetch_for_serve()
+        return super().get_context(request, *args, **kwargs)  # type: ignore[misc]
+
+
+class ServePrefetchRouteMixin:
+    """Route to child pages loaded with their serve prefetches.
+
+    Page.route() loads the specific child page with ``subpage.specific``.
+    For children using ServePrefetchMixin, this loads it with their
+    get_serve_queryset() instead, in the same one query.
+    """
+
+    def route(self, request, path_components):
+        if not path_components:
+            return super().route(request, path_components)  # type: ignore[misc]
+
+        try:
+            subpage = self.get_children().get(slug=path_components[0])  # type: ignore[attr-defined]
+        except Page.DoesNotExist as e:
+            raise Http404 from e
+
+        specific_class = subpage.specific_class
+        if specific_class is not None and issubclass(
+            specific_class,
+            ServePrefetchMixin,
+        ):
+            subpage = specific_class.get_serve_queryset().get(pk=subpage.pk)
+
+        # Avoid another query for the parent, as Page.route() does
+        subpage._cached_parent_obj = self
+        return subpage.specific.route(request, path_components[1:])
@@ -1,5 +1,7 @@
 from django import template
 
+from core.page_registry import get_page_registry
+
 register = template.Library()
 
 
@@ -40,6 +42,30 @@ def specific_pages(queryset):
     return queryset.specific()
 
 
+@register.filter
+def page_ancestors(page):
+    """Return the specific ancestors of a page from the request's page registry.
+
+    All ancestors are fetched in one batch, and reused by later calls for
+    the same page or its relatives in the same request.
+    """
+    if not page:
+        return []
+    return get_page_registry().get_ancestors(page)
+
+
+@register.filter
+def resolve_specific(pages):
+    """Return pages with their specific instances loaded in bulk.
+
+    Loads through the request's page registry, so ``page.specific`` in a
+    loop over the pages costs no query per page.
+    """
+    pages = list(pages or [])
+    get_page_registry().resolve_specific(pages)
+    return pages
+
+
 @register.filter
 def visible_breadcrumb_ancestors(ancestors):
     """Return only the ancestors that appear as visible breadcrumb items.
@@ -1,20 +1,32 @@
-from unittest.mock import MagicMock
+from io import StringIO
+from unittest.mock import MagicMock, patch
 
 from django.conf import settings
+from django.core.management import call_command
 from django.core.signals import request_finished, request_started
 from django.forms import CharField, TextInput
 from django.forms.forms import Form
 from django.template.loader import render_to_string
 from django.test import RequestFactory, TestCase
+from wagtail.models import Page
 
 from common.apps import CommonConfig, _locale_cache_local
 from common.templatetags.common_form_tags import add_class
 from common.templatetags.common_tags import (
     exclude_from_breadcrumbs,
     model_name,
+    resolve_specific,
     specific_pages,
     visible_breadcrumb_ancestors,
 )
+from common.title_search import (
+    TITLE_SIMILARITY_ALIAS,
+    filter_titles,
+    trigram_search_available,
+)
+from contact.factories import MeetingFactory, PersonFactory
+from memorials.factories import MemorialFactory
+from memorials.models import Memorial
 
 
 class MockModel:
@@ -153,6 +165,22 @@ class SpecificPagesFilterTest(TestCase):
         self.assertEqual(specific_pages([]), [])
 
 
+class ResolveSpecificFilterTest(TestCase):
+    """Tests for the resolve_specific template filter."""
+
+    def test_loads_specific_pages_in_bulk(self):
+        people = [PersonFactory(), PersonFactory()]
+        pages = Page.objects.filter(pk__in=[person.pk for person in people])
+
+        resolved = resolve_specific(pages.order_by("pk"))
+
+        with self.assertNumQueries(0):
+            self.assertEqual([page.specific for page in resolved], people)
+
+    def test_returns_empty_list_for_falsy_input(self):
+        self.assertEqual(resolve_specific(None), [])
+
+
 class VisibleBreadcrumbAncestorsTest(TestCase):
     """Tests for the visible_breadcrumb_ancestors template filter."""
 
@@ -347,3 +375,93 @@ class BreadcrumbsTemplateTest(TestCase):
         self.assertIn('"position": 1', output)
         self.assertIn('"position": 2', output)
         self.assertIn('"position": 3', output)
+
+
+class FilterTitlesTest(TestCase):
+    def setUp(self) -> None:
+        person = PersonFactory.create()
+        self.monthly = MeetingFactory.create(title="Monthly Meeting")
+        self.yearly = MeetingFactory.create(title="Yearly Meeting")
+        self.peace = MemorialFactory.create(
+            title="Peace Testimony",
+            memorial_person=person,
+            memorial_meeting=self.monthly,
+        )
+        self.peacemakers = MemorialFactory.create(
+            title="The Peacemakers of the Valley",
+            memorial_person=person,
+            memorial_meeting=self.yearly,
+        )
+        self.other = MemorialFactory.create(
+            title="Light",
+            memorial_person=person,
+            memorial_meeting=self.yearly,
+        )
+
+    def test_filters_titles_ignoring_case(self) -> None:
+        memorials = filter_titles(Memorial.objects.all(), {"title": "PEACE"})
+
+        self.assertCountEqual(memorials, [self.peace, self.peacemakers])
+
+    def test_filters_related_titles(self) -> None:
+        memorials = filter_titles(
+            Memorial.objects.all(),
+            {"title": "peace", "memorial_meeting__title": "yearly"},
+        )
+
+        self.assertEqual(list(memorials), [self.peacemakers])
+
+    def test_empty_values_are_ignored(self) -> None:
+        queryset = Memorial.objects.all()
+
+        self.assertIs(filter_titles(queryset, {"title": ""}), queryset)
+
+    def test_fallback_keeps_queryset_order(self) -> None:
+        if trigram_search_available():
+            self.skipTest("pg_trgm is installed")
+
+        memorials = filter_titles(
+            Memorial.objects.order_by("-title"),
+            {"title": "peace"},
+        )
+
+        self.assertEqual(list(memorials), [self.peacemakers, self.peace])
+        self.assertNotIn(TITLE_SIMILARITY_ALIAS, memorials.query.annotations)
+
+    def test_results_are_ranked_by_similarity(self) -> None:
+        if not trigram_search_available():
+            self.skipTest("pg_trgm is not installed")
+
+        memorials = filter_titles(
+            Memorial.objects.order_by("-title"),
+            {"title": "peace testimony"},
+        )
+
+        self.assertEqual(list(memorials), [self.peace])
+
+        memorials = filter_titles(Memorial.objects.all(), {"title": "peace"})
+
+        self.assertEqual(list(memorials), [self.peace, self.peacemakers])
+
+    @patch("common.title_search.trigram_search_available", return_value=True)
+    def test_ranked_results_are_ordered_by_pk_last(self, _) -> None:
+        memorials = filter_titles(Memorial.objects.all(), {"title": "peace"})
+
+        ordering = memorials.query.order_by
+        self.assertEqual(ordering[0], f"-{TITLE_SIMILARITY_ALIAS}")
+        self.assertEqual(ordering[-1], "pk")
+
+    def test_benchmark_command(self) -> None:
+        stdout = StringIO()
+
+        call_command(
+            "benchmark_title_filters",
+            items=20,
+            repeat=1,
+            query=["ka"],
+            stdout=stdout,
+        )
+
+        self.assertIn("memorial meeting", stdout.getvalue())
+        self.assertIn("Rolled back generated pages", stdout.getvalue())
+        self.assertFalse(Page.objects.filter(slug="memorial-0").exists())
@@ -0,0 +1,81 @@
+"""Case-insensitive "contains" filters on titles, backed by trigram indexes.
+
+A plain ``title__icontains`` filter compiles to
+``UPPER(title::text) LIKE UPPER('%value%')``, which a B-tree index cannot
+serve, so PostgreSQL scans the whole page table. Migration
+common.0001_page_title_trigram_index adds a pg_trgm GIN index on that same
+expression of wagtailcore_page.title, which the planner uses for the
+unchanged LIKE filter, so filter_titles() keeps Django's icontains lookup.
+
+Where pg_trgm is installed, filter_titles() also ranks the results by
+word_similarity() between the search values and the titles. On other
+databases, and PostgreSQL servers without pg_trgm, it falls back to the
+unranked icontains filter, which gives the same results in the
+queryset's own order.
+"""
+
+from django.contrib.postgres.search import TrigramWordSimilarity
+from django.db import connections
+from django.db.models import QuerySet
+from django.db.models.functions import Coalesce
+
+TRIGRAM_EXTENSION = "pg_trgm"
+# Created by migration common.0001_page_title_trigram_index
+TITLE_TRIGRAM_INDEX = "wagtailcore_page_title_upper_trgm_idx"
+TITLE_SIMILARITY_ALIAS = "title_similarity"
+
+# Database alias -> whether pg_trgm is installed
+_trigram_available: dict[str, bool] = {}
+
+
+def trigram_search_available(using: str = "default") -> bool:
+    """Return whether the database has the pg_trgm extension installed."""
+    if using not in _trigram_available:
+        connection = connections[using]
+        available = False
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT 1 FROM pg_extension WHERE extname = %s",
+                    [TRIGRAM_EXTENSION],
+                )
+                available = cursor.fetchone() is not None
+        _trigram_available[using] = available
+    return _trigram_available[using]
+
+
+def filter_titles(queryset: QuerySet, lookups: dict[str, str]) -> QuerySet:
+    """Filter a queryset to rows whose fields contain the given values.
+
+    ``lookups`` maps field paths, such as ``"title"`` or
+    ``"memorial_meeting__title"``, to the values they must contain,
+    ignoring case. Empty values are ignored. With pg_trgm, the rows are
+    ordered by their summed similarity to the values, most similar first,
+    then by the queryset's ordering, and then by primary key, so rows with
+    equal scores keep a stable order across pages.
+    """
+    lookups = {field: value for field, value in lookups.items() if value}
+    if not lookups:
+        return queryset
+
+    queryset = queryset.filter(
+        **{f"{field}__icontains": value for field, value in lookups.items()},
+    )
+    if not trigram_search_available(queryset.db):
+        return queryset
+
+    similarities = [
+        Coalesce(TrigramWordSimilarity(value, field), 0.0)
+        for field, value in lookups.items()
+    ]
+    similarity = similarities[0]
+    for field_similarity in similarities[1:]:
+        similarity += field_similarity
+
+    ordering = list(queryset.query.order_by) or list(queryset.model._meta.ordering)
+    if not any(field.lstrip("-") in ("pk", "id") for field in ordering):
+        ordering.append("pk")
+    return queryset.annotate(**{TITLE_SIMILARITY_ALIAS: similarity}).order_by(
+        f"-{TITLE_SIMILARITY_ALIAS}",
+        *ordering,
+    )
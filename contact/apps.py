@@ -3,3 +3,7 @@ from django.apps import AppConfig
 
 class ContactConfig(AppConfig):
     name = "contact"
+
+    def ready(self):
+        """Import signals when app is ready."""
+        from . import signals  # noqa: F401
@@ -0,0 +1,328 @@
+"""Paginated bibliographies of contact pages.
+
+A contact page lists what the contact has published, in sections:
+magazine articles, archive articles, books, library items and, for
+meetings, memorial minutes. Each section is listed newest first,
+BIBLIOGRAPHY_ITEMS_PER_PAGE at a time, so a contact page loads the same
+number of rows however much the contact has published. The section sizes
+come from the contact's ContactPublicationStatistics row, and are only
+counted when the contact has no statistics yet.
+
+The first page of every section is cached together with the section sizes,
+and later pages are cached one by one, in the contact's own namespace (see
+core.cache). ContactPublicationStatistics.update_for_contacts() bumps it
+whenever the contact's statistics are recomputed, which the authorship
+signals schedule (see contact.publication_stats); in database queue mode
+the flush bumps it too, so the listings do not wait for the queue. Renamed
+or republished items show once the entries expire, after
+BIBLIOGRAPHY_CACHE_TIMEOUT.
+
+A visitor pages through one section at a time, with ?section=<key>&page=N;
+the other sections stay on their first page.
+"""
+
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from django.db.models import F, QuerySet
+from django.http import HttpRequest
+from wagtail.models import Page
+
+from core.cache import bump_namespaces, get_or_set_cached
+from pagination.helpers import PaginatorPageWithElidedPageRange, get_paginated_items
+
+BIBLIOGRAPHY_NAMESPACE = "contact:bibliography"
+BIBLIOGRAPHY_CACHE_TIMEOUT = 60 * 60
+BIBLIOGRAPHY_ITEMS_PER_PAGE = 12
+
+
+def bibliography_namespace(contact_id: int) -> str:
+    return f"{BIBLIOGRAPHY_NAMESPACE}:{contact_id}"
+
+
+def invalidate_bibliographies(contact_ids: Iterable[int | None]) -> None:
+    bump_namespaces(
+        bibliography_namespace(contact_id)
+        for contact_id in set(contact_ids)
+        if contact_id is not None
+    )
+
+
+def get_magazine_articles(contact_id: int) -> QuerySet:
+    from magazine.models import MagazineArticleAuthor
+
+    return (
+        MagazineArticleAuthor.objects.filter(author_id=contact_id)
+        .select_related("article__department")
+        .prefetch_related("article__authors__author")
+        .defer("article__body", "article__body_migrated")
+        .order_by(F("article__issue_publication_date").desc(nulls_last=True), "-pk")
+    )
+
+
+def get_archive_articles(contact_id: int) -> QuerySet:
+    from magazine.models import ArchiveArticleAuthor
+
+    return (
+        ArchiveArticleAuthor.objects.filter(author_id=contact_id)
+        .select_related("article__issue")
+        .order_by(
+            F("article__issue__publication_date").desc(nulls_last=True),
+            "-pk",
+        )
+    )
+
+
+def get_books(contact_id: int) -> QuerySet:
+    from store.models import BookAuthor
+
+    return (
+        BookAuthor.objects.filter(author_id=contact_id)
+        .select_related("book")
+        .prefetch_related("book__authors__author")
+        .order_by(F("book__first_published_at").desc(nulls_last=True), "-pk")
+    )
+
+
+def get_library_items(contact_id: int) -> QuerySet:
+    from library.models import LibraryItemAuthor
+
+    return (
+        LibraryItemAuthor.objects.filter(author_id=contact_id)
+        .select_related("library_item")
+        .prefetch_related("library_item__authors__author")
+        .defer("library_item__body", "library_item__drupal_body_migrated")
+        .order_by(F("library_item__publication_date").desc(nulls_last=True), "-pk")
+    )
+
+
+def get_memorials(contact_id: int) -> QuerySet:
+    from memorials.models import Memorial
+
+    return (
+        Memorial.objects.filter(memorial_meeting_id=contact_id)
+        .select_related("memorial_person")
+        .defer("memorial_minute", "drupal_body_migrated")
+        .order_by(F("date_of_death").desc(nulls_last=True), "-pk")
+    )
+
+
+def prepare_magazine_articles(article_links: list) -> None:
+    from magazine.models import MagazineArticle
+
+    # Avoid an N+1 from article.parent_issue in magazine_article_summary.html
+    MagazineArticle.prefetch_parent_issues(link.article for link in article_links)
+
+
+@dataclass(frozen=True)
+class BibliographySection:
+    """A section of contact bibliographies.
+
+    ``get_items`` returns the section's rows for a contact ID, newest first,
+    and ``count_field`` names the ContactPublicationStatistics field with
+    the number of rows. ``relation`` is the reverse relation a contact
+    model must have for the section to apply to it.
+    """
+
+    key: str
+    heading: str
+    relation: str
+    count_field: str
+    get_items: Callable[[int], QuerySet]
+    prepare_items: Callable[[list], None] | None = None
+
+    def applies_to(self, contact: Page) -> bool:
+        return hasattr(type(contact), self.relation)
+
+    def fetch(self, contact_id: int, page_number: int) -> list:
+        """Return one page of the contact's rows in this section."""
+        offset = (page_number - 1) * BIBLIOGRAPHY_ITEMS_PER_PAGE
+        items = list(
+            self.get_items(contact_id)[offset : offset + BIBLIOGRAPHY_ITEMS_PER_PAGE],
+        )
+        if self.prepare_items is not None:
+            self.prepare_items(items)
+        return items
+
+
+BIBLIOGRAPHY_SECTIONS = (
+    BibliographySection(
+        key="articles",
+        heading="Articles",
+        relation="articles_authored",
+        count_field="magazine_article_count",
+        get_items=get_magazine_articles,
+        prepare_items=prepare_magazine_articles,
+    ),
+    BibliographySection(
+        key="archive_articles",
+        heading="Archive Articles",
+        relation="archive_articles_authored",
+        count_field="archive_article_count",
+        get_items=get_archive_articles,
+    ),
+    BibliographySection(
+        key="books",
+        heading="Books",
+        relation="books_authored",
+        count_field="book_count",
+        get_items=get_books,
+    ),
+    BibliographySection(
+        key="library_items",
+        heading="Library items",
+        relation="library_items_authored",
+        count_field="library_item_count",
+        get_items=get_library_items,
+    ),
+    BibliographySection(
+        key="memorials",
+        heading="Memorials",
+        relation="memorial_minutes",
+        count_field="memorial_count",
+        get_items=get_memorials,
+    ),
+)
+
+
+class BibliographyPageItems(Sequence):
+    """One fetched page of a section, sized as the whole section.
+
+    Paginating it gives the page numbers of the full section, but only the
+    fetched page can be sliced from it.
+    """
+
+    def __init__(self, items: list, count: int, offset: int):
+        self.items = items
+        self.total = count
+        self.offset = offset
+
+    def __len__(self) -> int:
+        return self.total
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            start = (index.start or 0) - self.offset
+            stop = None if index.stop is None else index.stop - self.offset
+            return self.items[start:stop]
+        return self.items[index - self.offset]
+
+
+@dataclass
+class BibliographyListing:
+    """The current page of one section of a contact's bibliography."""
+
+    section: BibliographySection
+    paginated_items: PaginatorPageWithElidedPageRange
+
+    @property
+    def items(self) -> list:
+        return self.paginated_items.page.object_list
+
+    @property
+    def count(self) -> int:
+        return self.paginated_items.page.paginator.count
+
+    @property
+    def querystring(self) -> str:
+        return f"section={self.section.key}"
+
+    @property
+    def fragment_identifier(self) -> str:
+        # The id of the section's heading in contact.html
+        return f"#{self.section.key.replace('_', '-')}-heading"
+
+
+def get_section_counts(contact: Page) -> dict[str, int]:
+    """Return the sizes of the contact's sections, from its statistics."""
+    from .models import ContactPublicationStatistics
+
+    sections = [
+        section for section in BIBLIOGRAPHY_SECTIONS if section.applies_to(contact)
+    ]
+    stats = ContactPublicationStatistics.objects.filter(contact_id=contact.pk).first()
+    if stats is None:
+        return {
+            section.key: section.get_items(contact.pk).count() for section in sections
+        }
+    return {section.key: getattr(stats, section.count_field) for section in sections}
+
+
+def build_first_pages(contact: Page) -> dict[str, dict]:
+    """Return the first page and size of each of the contact's non-empty
+    sections."""
+    sections = {section.key: section for section in BIBLIOGRAPHY_SECTIONS}
+    return {
+        key: {"items": sections[key].fetch(contact.pk, 1), "count": count}
+        for key, count in get_section_counts(contact).items()
+        if count
+    }
+
+
+def get_bibliography(
+    contact: Page,
+    section_key: str | None = None,
+    page_number: int = 1,
+) -> dict[str, BibliographyListing]:
+    """Return the listings of a contact's non-empty sections, by key.
+
+    The section named by ``section_key`` is on ``page_number``, or on its
+    first page if there is no such page; the others are on their first page.
+    """
+    if contact.pk is None:
+        # Previews of new contacts have nothing listed yet
+        return {}
+
+    first_pages = get_or_set_cached(
+        BIBLIOGRAPHY_NAMESPACE,
+        [contact.pk],
+        lambda: build_first_pages(contact),
+        depends_on=[bibliography_namespace(contact.pk)],
+        timeout=BIBLIOGRAPHY_CACHE_TIMEOUT,
+    )
+
+    bibliography = {}
+    for section in BIBLIOGRAPHY_SECTIONS:
+        if section.key not in first_pages:
+            continue
+        items = first_pages[section.key]["items"]
+        count = first_pages[section.key]["count"]
+
+        number = 1
+        if section.key == section_key and page_number > 1:
+            offset = (page_number - 1) * BIBLIOGRAPHY_ITEMS_PER_PAGE
+            # Pages past the end fall back to the first page
+            if offset < count:
+                number = page_number
+                items = get_or_set_cached(
+                    BIBLIOGRAPHY_NAMESPACE,
+                    [contact.pk, section.key, page_number],
+                    lambda section=section: section.fetch(contact.pk, page_number),
+                    depends_on=[bibliography_namespace(contact.pk)],
+                    timeout=BIBLIOGRAPHY_CACHE_TIMEOUT,
+                )
+
+        bibliography[section.key] = BibliographyListing(
+            section=section,
+            paginated_items=get_paginated_items(
+                items=BibliographyPageItems(  # type: ignore[arg-type]
+                    items,
+                    count,
+                    offset=(number - 1) * BIBLIOGRAPHY_ITEMS_PER_PAGE,
+                ),
+                items_per_page=BIBLIOGRAPHY_ITEMS_PER_PAGE,
+                page_number=number,
+            ),
+        )
+    return bibliography
+
+
+def get_bibliography_for_request(
+    contact: Page,
+    request: HttpRequest,
+) -> dict[str, BibliographyListing]:
+    """Return the contact's bibliography at the page the request asks for."""
+    _page_raw = request.GET.get("page", "1")
+    page_number = int(_page_raw) if _page_raw.isdigit() else 1
+    return get_bibliography(contact, request.GET.get("section"), page_number)
@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+
+from contact.publication_stats import process_publication_stats_queue
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute publication statistics for contacts queued by authorship "
+        "changes (used when PUBLICATION_STATS_QUEUE is 'database')"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of queued contacts to recompute per batch",
+        )
+
+    def handle(self, *args, **options):
+        processed = process_publication_stats_queue(
+            batch_size=options["batch_size"],
+        )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Processed publication statistics for {processed} queued contacts",
+            ),
+        )
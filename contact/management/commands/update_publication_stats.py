@@ -1,11 +1,24 @@
 import logging
 
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
 
 from contact.models import ContactPublicationStatistics, Meeting, Organization, Person
+from library.models import LibraryItemAuthor
+from magazine.models import ArchiveArticleAuthor, MagazineArticleAuthor
+from memorials.models import Memorial
+from store.models import BookAuthor
 
 logger = logging.getLogger(__name__)
 
+CONTACT_MODELS = {
+    "person": Person,
+    "meeting": Meeting,
+    "organization": Organization,
+}
+
 
 class Command(BaseCommand):
     help = "Generate or update publication statistics for all contacts"
@@ -17,31 +30,97 @@ class Command(BaseCommand):
             default="all",
             help="Type of contacts to update statistics for",
         )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of contacts to recompute per batch",
+        )
+        parser.add_argument(
+            "--since",
+            help=(
+                "Only update contacts without statistics, or authoring articles, "
+                "books or library items, or listing memorials, edited or "
+                "published since this date (YYYY-MM-DD or ISO datetime)"
+            ),
+        )
 
     def handle(self, *args, **options):
         contact_type = options["type"]
-        updated_count = 0
-
-        if contact_type in ["person", "all"]:
-            self.stdout.write("Updating statistics for people...")
-            for person in Person.objects.all():
-                ContactPublicationStatistics.update_for_contact(person)
-                updated_count += 1
-
-        if contact_type in ["meeting", "all"]:
-            self.stdout.write("Updating statistics for meetings...")
-            for meeting in Meeting.objects.all():
-                ContactPublicationStatistics.update_for_contact(meeting)
-                updated_count += 1
-
-        if contact_type in ["organization", "all"]:
-            self.stdout.write("Updating statistics for organizations...")
-            for org in Organization.objects.all():
-                ContactPublicationStatistics.update_for_contact(org)
-                updated_count += 1
+        since = self.parse_since(options["since"]) if options["since"] else None
+
+        contact_ids = []
+        for type_name, model in CONTACT_MODELS.items():
+            if contact_type not in [type_name, "all"]:
+                continue
+            contacts = model.objects.all()
+            if since is not None:
+                contacts = contacts.filter(
+                    Q(publication_statistics__isnull=True)
+                    | self.authored_changes_since(since),
+                )
+            contact_ids += contacts.values_list("pk", flat=True)
+
+        self.stdout.write(
+            f"Updating statistics for {len(contact_ids)} contacts...",
+        )
+        updated_stats = ContactPublicationStatistics.update_for_contacts(
+            contact_ids,
+            batch_size=options["batch_size"],
+        )
 
         self.stdout.write(
             self.style.SUCCESS(
-                f"Successfully updated publication statistics for {updated_count} contacts",
+                f"Successfully updated publication statistics for {len(updated_stats)} contacts",
             ),
         )
+
+    @staticmethod
+    def parse_since(value: str):
+        since = parse_datetime(value)
+        if since is None:
+            since_date = parse_date(value)
+            if since_date is None:
+                raise CommandError(f"Invalid --since value: {value}")
+            since = timezone.datetime.combine(since_date, timezone.datetime.min.time())
+        if timezone.is_naive(since):
+            since = timezone.make_aware(since)
+        return since
+
+    @staticmethod
+    def authored_changes_since(since) -> Q:
+        """Match authors of articles, books and library items, and meetings
+        of memorials, saved or published since a time.
+
+        Authorship is stored with the page (magazine articles, books and
+        library items) or the issue (archive articles), so their revision
+        and publish times stand in for when an author was added. Removed
+        authors are updated by the signals in magazine.signals and
+        contact.signals.
+        """
+        magazine_authors = MagazineArticleAuthor.objects.filter(
+            Q(article__latest_revision_created_at__gte=since)
+            | Q(article__last_published_at__gte=since),
+        ).values("author_id")
+        archive_authors = ArchiveArticleAuthor.objects.filter(
+            Q(article__issue__latest_revision_created_at__gte=since)
+            | Q(article__issue__last_published_at__gte=since),
+        ).values("author_id")
+        book_authors = BookAuthor.objects.filter(
+            Q(book__latest_revision_created_at__gte=since)
+            | Q(book__last_published_at__gte=since),
+        ).values("author_id")
+        library_item_authors = LibraryItemAuthor.objects.filter(
+            Q(library_item__latest_revision_created_at__gte=since)
+            | Q(library_item__last_published_at__gte=since),
+        ).values("author_id")
+        memorial_meetings = Memorial.objects.filter(
+            Q(latest_revision_created_at__gte=since) | Q(last_published_at__gte=since),
+        ).values("memorial_meeting_id")
+        return (
+            Q(pk__in=magazine_authors)
+            | Q(pk__in=archive_authors)
+            | Q(pk__in=book_authors)
+            | Q(pk__in=library_item_authors)
+            | Q(pk__in=memorial_meetings)
+        )
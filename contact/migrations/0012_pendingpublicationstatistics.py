@@ -0,0 +1,34 @@
+# Generated by Django 6.0.4 on 2026-10-18 12:39
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("contact", "0011_contactpublicationstatistics"),
+        ("wagtailcore", "0096_referenceindex_referenceindex_source_object_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PendingPublicationStatistics",
+            fields=[
+                (
+                    "contact",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="pending_publication_statistics",
+                        serialize=False,
+                        to="wagtailcore.page",
+                    ),
+                ),
+                ("queued_at", models.DateTimeField(auto_now_add=True, db_index=True)),
+            ],
+            options={
+                "verbose_name": "Pending Publication Statistics",
+                "verbose_name_plural": "Pending Publication Statistics",
+            },
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 6.0.4 on 2026-10-18 15:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("contact", "0012_pendingpublicationstatistics"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="contactpublicationstatistics",
+            name="archive_article_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="contactpublicationstatistics",
+            name="book_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="contactpublicationstatistics",
+            name="library_item_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="contactpublicationstatistics",
+            name="magazine_article_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="contactpublicationstatistics",
+            name="memorial_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
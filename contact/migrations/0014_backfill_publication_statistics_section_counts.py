@@ -0,0 +1,63 @@
+# Generated by Django 6.0.4 on 2026-10-18 18:20
+
+from django.db import migrations
+from django.db.models import Count
+
+# Counted model, contact field and statistics field of each section
+SECTION_COUNTS = [
+    ("magazine", "MagazineArticleAuthor", "author_id", "magazine_article_count"),
+    ("magazine", "ArchiveArticleAuthor", "author_id", "archive_article_count"),
+    ("store", "BookAuthor", "author_id", "book_count"),
+    ("library", "LibraryItemAuthor", "author_id", "library_item_count"),
+    ("memorials", "Memorial", "memorial_meeting_id", "memorial_count"),
+]
+
+
+def backfill_section_counts(apps, schema_editor):
+    """Count the bibliography sections of contacts that have statistics."""
+    ContactPublicationStatistics = apps.get_model(
+        "contact",
+        "ContactPublicationStatistics",
+    )
+
+    stats = {
+        stat.contact_id: stat for stat in ContactPublicationStatistics.objects.all()
+    }
+    if not stats:
+        return
+
+    for app_label, model_name, contact_field, count_field in SECTION_COUNTS:
+        rows = (
+            apps.get_model(app_label, model_name)
+            .objects.filter(**{f"{contact_field}__isnull": False})
+            .values(contact_field)
+            .annotate(count=Count("pk"))
+            .order_by()
+            .values_list(contact_field, "count")
+        )
+        for contact_id, count in rows:
+            if contact_id in stats:
+                setattr(stats[contact_id], count_field, count)
+
+    ContactPublicationStatistics.objects.bulk_update(
+        stats.values(),
+        [count_field for *_, count_field in SECTION_COUNTS],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("contact", "0013_contactpublicationstatistics_section_counts"),
+        ("library", "0026_library_item_facet_date_indexes"),
+        ("magazine", "0038_backfill_article_issue_fields"),
+        ("memorials", "0003_memorial_drupal_body_migrated_and_more"),
+        ("store", "0010_rename_price_product_price_usd"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            backfill_section_counts,
+            migrations.RunPython.noop,
+        ),
+    ]
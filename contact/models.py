@@ -2,11 +2,12 @@ from typing import TYPE_CHECKING, Any
 
 from django.contrib.postgres.fields import ArrayField
 from django.db import connection, models
-from django.db.models import TextChoices
+from django.db.models import Count, Max, OuterRef, Subquery, TextChoices
+from django.db.models.functions import Length, Substr
 from django.http import HttpRequest
 
 if TYPE_CHECKING:
-    from django.db.models import Prefetch
+    from .bibliography import BibliographyListing
 from django.utils import timezone
 from django.utils.encoding import force_str
 from django.utils.html import strip_tags
@@ -50,6 +51,13 @@ class ContactPublicationStatistics(models.Model):
     article_count = models.PositiveIntegerField(default=0)
     last_published_at = models.DateTimeField(null=True, blank=True)
 
+    # Bibliography section sizes (see contact.bibliography)
+    magazine_article_count = models.PositiveIntegerField(default=0)
+    archive_article_count = models.PositiveIntegerField(default=0)
+    book_count = models.PositiveIntegerField(default=0)
+    library_item_count = models.PositiveIntegerField(default=0)
+    memorial_count = models.PositiveIntegerField(default=0)
+
     # Metadata
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -68,120 +76,195 @@ class ContactPublicationStatistics(models.Model):
 
     @classmethod
     def update_for_contact(cls, contact):
-        """Update publication statistics for a given contact."""
+        """Update publication statistics for a given contact.
+
+        Returns None if the contact no longer exists.
+        """
+        stats = cls.update_for_contacts([contact.pk])
+        return stats[0] if stats else None
+
+    @staticmethod
+    def _as_datetime(publication_date):
+        """Convert an issue publication date to a datetime at midnight."""
+        if publication_date is None or isinstance(
+            publication_date,
+            timezone.datetime,
+        ):
+            return publication_date
+        return timezone.datetime.combine(
+            publication_date,
+            timezone.datetime.min.time(),
+            tzinfo=timezone.get_current_timezone(),
+        )
+
+    @classmethod
+    def update_for_contacts(cls, contact_ids, batch_size=500):
+        """Recompute and store publication statistics for many contacts.
+
+        Each batch takes seven queries: the contacts, article counts and
+        latest issue dates for magazine articles (whose issue is the parent
+        page in the page tree) and for archive articles (whose issue is a
+        foreign key), counts of authored books and library items and of
+        memorial minutes, plus one upsert of the statistics rows.
+
+        The bibliographies of the contacts are invalidated, as their section
+        sizes come from these rows.
+        """
+        from library.models import LibraryItemAuthor
         from magazine.models import (
             ArchiveArticleAuthor,
-            MagazineArticle,
             MagazineArticleAuthor,
             MagazineIssue,
         )
+        from memorials.models import Memorial
+        from store.models import BookAuthor
 
-        # Get all magazine articles authored by this contact
-        articles_authored = MagazineArticleAuthor.objects.filter(
-            author=contact,
-        ).select_related(
-            "article",
-        )
-        archive_articles_authored = ArchiveArticleAuthor.objects.filter(
-            author=contact,
-        ).select_related("article__issue")
-
-        # Count the total number of articles
-        article_count = articles_authored.count() + archive_articles_authored.count()
-
-        # Find the most recent publication date
-        recent_article_date = None
-
-        # For magazine articles, get the publication date from the parent issue
-        if articles_authored.exists():
-            # We'll query all magazine articles by this author and find the latest one
-            magazine_article_ids = articles_authored.values_list(
-                "article_id",
-                flat=True,
-            )
+        from .bibliography import invalidate_bibliographies
+
+        contact_types = {
+            "person": cls.ContactType.PERSON,
+            "meeting": cls.ContactType.MEETING,
+            "organization": cls.ContactType.ORGANIZATION,
+        }
 
-            # Find articles from their IDs
-            magazine_articles = MagazineArticle.objects.filter(
-                id__in=magazine_article_ids,
+        # A magazine article's issue is the page whose path is the
+        # article's path minus its last step
+        parent_issue_date = MagazineIssue.objects.filter(
+            path=Substr(
+                OuterRef("article__path"),
+                1,
+                Length(OuterRef("article__path")) - Page.steplen,
+            ),
+        ).values("publication_date")[:1]
+
+        contact_ids = list(contact_ids)
+        updated_stats = []
+        for start in range(0, len(contact_ids), batch_size):
+            batch_ids = contact_ids[start : start + batch_size]
+
+            contacts = Page.objects.filter(pk__in=batch_ids).values_list(
+                "pk",
+                "content_type__model",
             )
 
-            # Get parent issues
-            parent_issue_ids = []
-            for article in magazine_articles:
-                # Get parent page which should be a MagazineIssue
-                parent = article.get_parent()
-                if parent and isinstance(parent.specific, MagazineIssue):
-                    parent_issue_ids.append(parent.id)
-
-            # Now query all related magazine issues with their publication dates
-            if parent_issue_ids:
-                recent_issues = MagazineIssue.objects.filter(
-                    id__in=parent_issue_ids,
-                ).order_by(
-                    "-publication_date",
+            article_counts = dict.fromkeys(batch_ids, 0)
+            magazine_article_counts = dict.fromkeys(batch_ids, 0)
+            archive_article_counts = dict.fromkeys(batch_ids, 0)
+            last_published_dates = dict.fromkeys(batch_ids)
+
+            magazine_rows = (
+                MagazineArticleAuthor.objects.filter(author_id__in=batch_ids)
+                .values("author_id")
+                .annotate(
+                    article_count=Count("pk"),
+                    last_published_on=Max(
+                        Subquery(parent_issue_date),
+                    ),
+                )
+                .order_by()
+            )
+            archive_rows = (
+                ArchiveArticleAuthor.objects.filter(author_id__in=batch_ids)
+                .values("author_id")
+                .annotate(
+                    article_count=Count("pk"),
+                    last_published_on=Max("article__issue__publication_date"),
                 )
+                .order_by()
+            )
+            for rows, source_counts in (
+                (magazine_rows, magazine_article_counts),
+                (archive_rows, archive_article_counts),
+            ):
+                for row in rows:
+                    author_id = row["author_id"]
+                    source_counts[author_id] = row["article_count"]
+                    article_counts[author_id] += row["article_count"]
+                    last_published_at = cls._as_datetime(row["last_published_on"])
+                    if last_published_at is not None and (
+                        last_published_dates[author_id] is None
+                        or last_published_at > last_published_dates[author_id]
+                    ):
+                        last_published_dates[author_id] = last_published_at
 
-                if recent_issues.exists():
-                    recent_issue = recent_issues.first()
-                    if hasattr(recent_issue, "publication_date"):
-                        pub_date = recent_issue.publication_date
-                        if isinstance(pub_date, timezone.datetime):
-                            recent_article_date = pub_date
-                        else:
-                            # Convert date to datetime if needed
-                            recent_article_date = timezone.datetime.combine(
-                                pub_date,
-                                timezone.datetime.min.time(),
-                                tzinfo=timezone.get_current_timezone(),
-                            )
-
-        # For archive articles, use the archive issue's publication date
-        if archive_articles_authored.exists():
-            recent_archive_articles = archive_articles_authored.order_by(
-                "-article__issue__publication_date",
+            book_counts = cls._count_by_contact(
+                BookAuthor.objects.filter(author_id__in=batch_ids),
+                "author_id",
+            )
+            library_item_counts = cls._count_by_contact(
+                LibraryItemAuthor.objects.filter(author_id__in=batch_ids),
+                "author_id",
+            )
+            memorial_counts = cls._count_by_contact(
+                Memorial.objects.filter(memorial_meeting_id__in=batch_ids),
+                "memorial_meeting_id",
             )
-            if recent_archive_articles.exists():
-                recent_archive = recent_archive_articles.first()
-                if hasattr(recent_archive.article.issue, "publication_date"):
-                    pub_date = recent_archive.article.issue.publication_date
-                    if isinstance(pub_date, timezone.datetime):
-                        archive_date = pub_date
-                    else:
-                        # Convert date to datetime if needed
-                        archive_date = timezone.datetime.combine(
-                            pub_date,
-                            timezone.datetime.min.time(),
-                            tzinfo=timezone.get_current_timezone(),
-                        )
 
-                    if (
-                        recent_article_date is None
-                        or archive_date > recent_article_date
-                    ):
-                        recent_article_date = archive_date
-
-        # Determine contact type
-        if contact.specific_class.__name__ == "Person":
-            contact_type = cls.ContactType.PERSON
-        elif contact.specific_class.__name__ == "Meeting":
-            contact_type = cls.ContactType.MEETING
-        elif contact.specific_class.__name__ == "Organization":
-            contact_type = cls.ContactType.ORGANIZATION
-        else:
-            # Default fallback
-            contact_type = cls.ContactType.PERSON
-
-        # Create or update the statistics
-        stats, created = cls.objects.update_or_create(
-            contact=contact,
-            defaults={
-                "article_count": article_count,
-                "last_published_at": recent_article_date,
-                "contact_type": contact_type,
-            },
+            stats = [
+                cls(
+                    contact_id=contact_id,
+                    contact_type=contact_types.get(
+                        model_name,
+                        cls.ContactType.PERSON,
+                    ),
+                    article_count=article_counts[contact_id],
+                    last_published_at=last_published_dates[contact_id],
+                    magazine_article_count=magazine_article_counts[contact_id],
+                    archive_article_count=archive_article_counts[contact_id],
+                    book_count=book_counts.get(contact_id, 0),
+                    library_item_count=library_item_counts.get(contact_id, 0),
+                    memorial_count=memorial_counts.get(contact_id, 0),
+                )
+                for contact_id, model_name in contacts
+            ]
+            updated_stats += cls.objects.bulk_create(
+                stats,
+                update_conflicts=True,
+                unique_fields=["contact"],
+                update_fields=[
+                    "contact_type",
+                    "article_count",
+                    "last_published_at",
+                    "magazine_article_count",
+                    "archive_article_count",
+                    "book_count",
+                    "library_item_count",
+                    "memorial_count",
+                    "updated_at",
+                ],
+            )
+            invalidate_bibliographies(batch_ids)
+
+        return updated_stats
+
+    @staticmethod
+    def _count_by_contact(queryset, contact_field: str) -> dict[int, int]:
+        """Return the number of rows of a queryset per contact ID."""
+        return dict(
+            queryset.values(contact_field)
+            .annotate(count=Count("pk"))
+            .order_by()
+            .values_list(contact_field, "count"),
         )
 
-        return stats
+
+class PendingPublicationStatistics(models.Model):
+    """A contact whose publication statistics are queued for recomputing."""
+
+    contact = models.OneToOneField(
+        "wagtailcore.Page",
+        on_delete=models.CASCADE,
+        related_name="pending_publication_statistics",
+        primary_key=True,
+    )
+    queued_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        verbose_name = "Pending Publication Statistics"
+        verbose_name_plural = "Pending Publication Statistics"
+
+    def __str__(self):
+        return f"Pending publication stats for {self.contact_id}"
 
 
 class JSONLDMixin:
@@ -318,142 +401,20 @@ class ContactBase(JSONLDMixin, Page):
 
     template = "contact/contact.html"
 
-    def _build_prefetch_objects(self) -> "list[Prefetch]":
-        """Build list of Prefetch objects for all related content.
-
-        Returns:
-            List of Prefetch objects for optimized queryset loading.
-        """
-        from django.db.models import Prefetch
-
-        from magazine.models import MagazineArticleAuthor
-
-        prefetch_objects: list[Prefetch] = []
-
-        # Optimize magazine articles with deferred streamfields
-        if hasattr(self, "articles_authored"):
-            optimized_articles_qs = (
-                MagazineArticleAuthor.objects.select_related(
-                    "article__department",
-                )
-                .prefetch_related(
-                    "article__authors__author",
-                )
-                .defer(
-                    "article__body",
-                    "article__body_migrated",
-                )
-            )
-            prefetch_objects.append(
-                Prefetch("articles_authored", queryset=optimized_articles_qs),
-            )
-
-        # Optimize archive articles with issue relationship
-        if hasattr(self, "archive_articles_authored"):
-            archive_articles_qs = (
-                self.archive_articles_authored.model.objects.select_related(
-                    "article__issue",
-                )
-            )
-            prefetch_objects.append(
-                Prefetch(
-                    "archive_articles_authored",
-                    queryset=archive_articles_qs,
-                ),
-            )
-
-        # Optimize books with author relationships
-        if hasattr(self, "books_authored"):
-            books_qs = self.books_authored.model.objects.prefetch_related(
-                "book__authors__author",
-            )
-            prefetch_objects.append(
-                Prefetch("books_authored", queryset=books_qs),
-            )
-
-        # Optimize library items with author relationships
-        if hasattr(self, "library_items_authored"):
-            library_items_qs = (
-                self.library_items_authored.model.objects.prefetch_related(
-                    "library_item__authors__author",
-                )
-            )
-            prefetch_objects.append(
-                Prefetch("library_items_authored", queryset=library_items_qs),
-            )
-
-        # Optimize memorial minutes with person relationship (Person pages)
-        if hasattr(self, "memorial_minute"):
-            memorials_qs = self.memorial_minute.model.objects.select_related(
-                "memorial_person",
-            )
-            prefetch_objects.append(
-                Prefetch("memorial_minute", queryset=memorials_qs),
-            )
-
-        # Optimize memorial minutes with person relationship (Meeting pages)
-        if hasattr(self, "memorial_minutes"):
-            memorials_qs = self.memorial_minutes.model.objects.select_related(
-                "memorial_person",
-            )
-            prefetch_objects.append(
-                Prefetch("memorial_minutes", queryset=memorials_qs),
-            )
-
-        return prefetch_objects
-
-    def _cache_article_parents(self) -> None:
-        """Bulk-fetch and cache parent pages for articles.
-
-        This prevents N+1 queries when templates call {% pageurl issue %}.
-        """
-        if not hasattr(self, "articles_authored") or not hasattr(
-            self,
-            "_prefetched_objects_cache",
-        ):
-            return
-
-        article_author_links = self._prefetched_objects_cache.get(
-            "articles_authored",
-            [],
-        )
-        if not article_author_links:
-            return
-
-        # Collect unique parent paths for all articles
-        parent_paths = set()
-        for article_link in article_author_links:
-            article = article_link.article
-            if article.depth > 1:  # Skip root pages
-                parent_path = article.path[: -article.steplen]
-                parent_paths.add(parent_path)
-
-        if not parent_paths:
-            return
-
-        # Bulk fetch all parent pages and create lookup map
-        parent_pages = Page.objects.filter(path__in=parent_paths).specific()  # type: ignore[attr-defined]
-        parent_map = {page.path: page for page in parent_pages}
-
-        # Cache parent on each article by monkey-patching get_parent()
-        for article_link in article_author_links:
-            article = article_link.article
-            if article.depth > 1:
-                parent_path = article.path[: -article.steplen]
-                if parent_path in parent_map:
-                    cached_parent = parent_map[parent_path]
-                    # Override get_parent to return cached parent
-                    article.get_parent = lambda cached=cached_parent: cached
-
-    def _add_sentry_context(self, initial_queries: int) -> None:
+    def _add_sentry_context(
+        self,
+        initial_queries: int,
+        bibliography: "dict[str, BibliographyListing]",
+    ) -> None:
         """Add Sentry transaction context for debugging/monitoring.
 
-        Note: optimization_query_count is only meaningful in development/staging (DEBUG=True)
+        Note: bibliography_query_count is only meaningful in development/staging (DEBUG=True)
         because connection.queries is empty in production. In production, we rely on
-        relationship counts and Sentry's automatic performance monitoring instead.
+        section sizes and Sentry's automatic performance monitoring instead.
 
         Args:
-            initial_queries: Query count before optimization.
+            initial_queries: Query count before loading the bibliography.
+            bibliography: The listings of the contact's bibliography sections.
         """
         try:
             import sentry_sdk
@@ -462,26 +423,17 @@ class ContactBase(JSONLDMixin, Page):
             final_queries = len(connection.queries) if settings.DEBUG else 0
             query_count = final_queries - initial_queries
 
-            sentry_sdk.set_tag("contact.queries_optimized", "true")
-
-            # Safely get prefetch cache
-            prefetch_cache = getattr(self, "_prefetched_objects_cache", {})
+            sentry_sdk.set_tag("contact.bibliography_paginated", "true")
 
             sentry_sdk.set_context(
-                "contact_optimization",
+                "contact_bibliography",
                 {
                     "contact_type": self.__class__.__name__,
-                    "optimization_query_count": query_count,  # Only non-zero when DEBUG=True
-                    "articles_count": len(prefetch_cache.get("articles_authored", [])),
-                    "archive_articles_count": len(
-                        prefetch_cache.get("archive_articles_authored", []),
-                    ),
-                    "books_count": len(prefetch_cache.get("books_authored", [])),
-                    "library_items_count": len(
-                        prefetch_cache.get("library_items_authored", []),
-                    ),
-                    "memorials_count": len(prefetch_cache.get("memorial_minute", []))
-                    + len(prefetch_cache.get("memorial_minutes", [])),
+                    "bibliography_query_count": query_count,  # Only non-zero when DEBUG=True
+                    **{
+                        f"{key}_count": listing.count
+                        for key, listing in bibliography.items()
+                    },
                 },
             )
         except ImportError:
@@ -494,42 +446,25 @@ class ContactBase(JSONLDMixin, Page):
         *args: Any,
         **kwargs: Any,
     ) -> dict:
-        """Optimize queries for contact page to prevent N+1 queries.
+        """Add the contact's bibliography, paginated per section.
 
-        This method prefetches all related content (articles, books, library items,
-        memorials) and their nested relationships to avoid N+1 query patterns that
-        would otherwise occur when the template iterates over these relationships.
+        Each section loads one page of rows, so the cost of a contact page
+        does not grow with how much the contact has published (see
+        contact.bibliography).
         """
         from django.conf import settings
 
+        from .bibliography import get_bibliography_for_request
+
         # Track initial query count for Sentry diagnostics
         initial_queries = len(connection.queries) if settings.DEBUG else 0
 
-        # Build and apply prefetch objects
-        prefetch_objects = self._build_prefetch_objects()
-
-        if prefetch_objects:
-            # Reload the instance with prefetches
-            self_with_prefetch = (
-                self.__class__.objects.filter(pk=self.pk)
-                .prefetch_related(*prefetch_objects)
-                .first()
-            )
-
-            # Merge prefetched data to preserve any existing prefetches
-            if self_with_prefetch:
-                existing = getattr(self, "_prefetched_objects_cache", {})
-                new = getattr(self_with_prefetch, "_prefetched_objects_cache", {})
-                self._prefetched_objects_cache = {**existing, **new}
-
-        # Bulk prefetch parent MagazineIssue pages for articles
-        self._cache_article_parents()
+        context = super().get_context(request, *args, **kwargs)
+        context["bibliography"] = get_bibliography_for_request(self, request)
 
         # Add Sentry diagnostics
-        self._add_sentry_context(initial_queries)
+        self._add_sentry_context(initial_queries, context["bibliography"])
 
-        # Call parent get_context to get the base context
-        context = super().get_context(request, *args, **kwargs)
         return context
 
     class Meta:
@@ -0,0 +1,126 @@
+"""Deferred, coalesced updates of contact publication statistics.
+
+Authorship signals call schedule_publication_stats_update() instead of
+recomputing statistics straight away. Contact IDs are collected per database
+connection and flushed once the surrounding transaction commits, so saving
+an article with several authors, or importing an issue with many articles,
+recomputes each affected contact once.
+
+With the PUBLICATION_STATS_QUEUE setting set to "database", flushed contacts
+are written to PendingPublicationStatistics instead, and the
+process_publication_stats_queue management command recomputes them.
+"""
+
+import threading
+from collections.abc import Iterable
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, transaction
+from wagtail.models import Page
+
+from .bibliography import invalidate_bibliographies
+from .models import ContactPublicationStatistics, PendingPublicationStatistics
+
+PUBLICATION_STATS_QUEUE_IMMEDIATE = "immediate"
+PUBLICATION_STATS_QUEUE_DATABASE = "database"
+
+_pending = threading.local()
+
+
+def _get_pending_contact_ids(using: str) -> set[int]:
+    if not hasattr(_pending, "contact_ids"):
+        _pending.contact_ids = {}
+    return _pending.contact_ids.setdefault(using, set())
+
+
+def get_publication_stats_queue_mode() -> str:
+    """Return how flushed contacts are processed."""
+    return getattr(
+        settings,
+        "PUBLICATION_STATS_QUEUE",
+        PUBLICATION_STATS_QUEUE_IMMEDIATE,
+    )
+
+
+def schedule_publication_stats_update(
+    contact_ids: Iterable[int | None],
+    using: str = DEFAULT_DB_ALIAS,
+) -> None:
+    """Mark contacts as changed and flush them when the transaction commits.
+
+    Outside a transaction the contacts are flushed immediately.
+    """
+    pending_contact_ids = _get_pending_contact_ids(using)
+    pending_contact_ids.update(
+        contact_id for contact_id in contact_ids if contact_id is not None
+    )
+    # Every scheduled callback flushes everything pending, so all but the
+    # first callback of a transaction find nothing left to do. IDs left
+    # behind by a rolled back transaction are flushed with the next one,
+    # which only recomputes statistics that are already correct.
+    transaction.on_commit(
+        lambda: flush_publication_stats_updates(using),
+        using=using,
+    )
+
+
+def flush_publication_stats_updates(using: str = DEFAULT_DB_ALIAS) -> int:
+    """Process the pending contacts now and return how many there were."""
+    pending_contact_ids = _get_pending_contact_ids(using)
+    if not pending_contact_ids:
+        return 0
+    contact_ids = sorted(pending_contact_ids)
+    pending_contact_ids.clear()
+
+    if get_publication_stats_queue_mode() == PUBLICATION_STATS_QUEUE_DATABASE:
+        enqueue_publication_stats_updates(contact_ids, using=using)
+        # Show the changed listings before the queue is processed
+        invalidate_bibliographies(contact_ids)
+    else:
+        ContactPublicationStatistics.update_for_contacts(contact_ids)
+    return len(contact_ids)
+
+
+def enqueue_publication_stats_updates(
+    contact_ids: Iterable[int],
+    using: str = DEFAULT_DB_ALIAS,
+) -> None:
+    """Add contacts to the database queue, skipping ones already queued."""
+    # Authorship rows deleted along with their contact leave nothing to update
+    existing_ids = Page.objects.using(using).filter(pk__in=list(contact_ids))
+    PendingPublicationStatistics.objects.using(using).bulk_create(
+        [
+            PendingPublicationStatistics(contact_id=contact_id)
+            for contact_id in existing_ids.values_list("pk", flat=True)
+        ],
+        ignore_conflicts=True,
+    )
+
+
+def process_publication_stats_queue(batch_size: int = 500) -> int:
+    """Recompute queued contacts in batches and return how many were done.
+
+    Each batch is claimed with SELECT ... FOR UPDATE SKIP LOCKED, so several
+    workers can drain the queue at once.
+    """
+    processed = 0
+    while True:
+        with transaction.atomic():
+            contact_ids = list(
+                PendingPublicationStatistics.objects.select_for_update(
+                    skip_locked=True,
+                )
+                .order_by("queued_at")
+                .values_list("contact_id", flat=True)[:batch_size],
+            )
+            if not contact_ids:
+                return processed
+
+            ContactPublicationStatistics.update_for_contacts(
+                contact_ids,
+                batch_size=batch_size,
+            )
+            PendingPublicationStatistics.objects.filter(
+                contact_id__in=contact_ids,
+            ).delete()
+        processed += len(contact_ids)
@@ -0,0 +1,47 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from library.models import LibraryItemAuthor
+from memorials.models import Memorial
+from store.models import BookAuthor
+
+from .publication_stats import schedule_publication_stats_update
+
+# The authorship of magazine and archive articles is handled in
+# magazine.signals
+
+
+@receiver(post_save, sender=BookAuthor)
+@receiver(post_delete, sender=BookAuthor)
+@receiver(post_save, sender=LibraryItemAuthor)
+@receiver(post_delete, sender=LibraryItemAuthor)
+def schedule_contact_stats_on_author_change(sender, instance, using, **kwargs):
+    """Schedule a statistics update for the author of a changed book or
+    library item author relationship."""
+    schedule_publication_stats_update([instance.author_id], using=using)
+
+
+@receiver(pre_save, sender=Memorial)
+def record_previous_memorial_meeting(sender, instance, **kwargs):
+    """Remember the meeting of a memorial before it is saved, so the
+    statistics of a meeting it leaves are updated too."""
+    if instance.pk is None:
+        return
+    instance._previous_memorial_meeting_id = (
+        Memorial.objects.filter(pk=instance.pk)
+        .values_list("memorial_meeting_id", flat=True)
+        .first()
+    )
+
+
+@receiver(post_save, sender=Memorial)
+@receiver(post_delete, sender=Memorial)
+def schedule_contact_stats_on_memorial_change(sender, instance, using, **kwargs):
+    """Schedule a statistics update for the meetings of a changed memorial."""
+    schedule_publication_stats_update(
+        [
+            instance.memorial_meeting_id,
+            getattr(instance, "_previous_memorial_meeting_id", None),
+        ],
+        using=using,
+    )
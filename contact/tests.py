@@ -1,6 +1,13 @@
+import datetime
+from io import StringIO
+
+from django.contrib.auth.models import AnonymousUser
+from django.core.management import call_command
 from django.test import RequestFactory, TestCase
+from django.utils import timezone
 
 from community.models import CommunityPage
+from contact.bibliography import BIBLIOGRAPHY_ITEMS_PER_PAGE, invalidate_bibliographies
 from contact.factories import (
     MeetingFactory,
     MeetingIndexPageFactory,
@@ -10,6 +17,7 @@ from contact.factories import (
     PersonIndexPageFactory,
 )
 from contact.models import (
+    ContactPublicationStatistics,
     Meeting,
     MeetingIndexPage,
     Organization,
@@ -17,6 +25,20 @@ from contact.models import (
     Person,
     PersonIndexPage,
 )
+from library.factories import LibraryItemFactory
+from library.models import LibraryItemAuthor
+from magazine.factories import (
+    MagazineArticleFactory,
+    MagazineIssueFactory,
+)
+from magazine.models import (
+    ArchiveArticle,
+    ArchiveArticleAuthor,
+    ArchiveIssue,
+    MagazineArticleAuthor,
+)
+from memorials.factories import MemorialFactory
+from memorials.models import Memorial
 
 
 class PersonIndexPageFactoryTest(TestCase):
@@ -195,12 +217,12 @@ class TestMeetingGetContext(TestCase):
 class ContactQueryOptimizationTestCase(TestCase):
     """Test query optimization in contact pages to prevent N+1 queries.
 
-    These tests verify that the get_context method in ContactBase properly
-    prefetches all related content (articles, books, library items, memorials)
-    and their nested relationships to avoid N+1 query patterns.
+    These tests verify that the get_context method in ContactBase loads each
+    bibliography section (articles, books, library items, memorials) with the
+    nested relationships the template uses, to avoid N+1 query patterns.
 
-    Each test creates a contact with multiple related items, renders the template,
-    and then asserts that accessing the relationships triggers zero additional queries.
+    Each test creates a contact with multiple related items, gets the context,
+    and then asserts that accessing the listed items triggers zero additional queries.
     """
 
     def setUp(self) -> None:
@@ -242,10 +264,35 @@ class ContactQueryOptimizationTestCase(TestCase):
         self.LibraryItemAuthor = LibraryItemAuthor
         self.Memorial = Memorial
 
+    def access_bibliography(self, bibliography: dict) -> None:
+        """Access everything contact.html renders for the listed items."""
+        for article_link in bibliography["articles"].items:
+            _ = article_link.article.title
+            _ = article_link.article.department.title
+            _ = article_link.article.parent_issue.title
+            for author in article_link.article.authors.all():
+                _ = author.author.title
+
+        for archive_link in bibliography["archive_articles"].items:
+            _ = archive_link.article.title
+            _ = archive_link.article.issue.title
+
+        for book_link in bibliography["books"].items:
+            _ = book_link.book.title
+            for author in book_link.book.authors.all():
+                _ = author.author.title
+
+        for item_link in bibliography["library_items"].items:
+            _ = item_link.library_item.title
+            for author in item_link.library_item.authors.all():
+                _ = author.author.title
+
+        for memorial in getattr(bibliography.get("memorials"), "items", []):
+            _ = memorial.memorial_person.given_name
+            _ = memorial.memorial_person.family_name
+
     def test_person_with_related_content_query_optimization(self) -> None:
         """Test that Person pages with related content don't trigger N+1 queries."""
-        from django.test.utils import override_settings
-
         person = PersonFactory.create()
 
         # Create magazine structure: MagazineIndexPage > DepartmentIndexPage > Department
@@ -317,83 +364,22 @@ class ContactQueryOptimizationTestCase(TestCase):
         )
         memorial_index.add_child(instance=memorial)
 
-        # Get context (this should prefetch everything)
+        # Get context (this should load the first page of each section)
         request = self.factory.get("/")
         context = person.get_context(request)
 
-        # Access all relationships - should trigger 0 additional queries
-        with override_settings(DEBUG=True):
-            from django.db import connection, reset_queries
-
-            reset_queries()
-
-            # Access magazine articles and their authors
-            articles = list(context["page"].articles_authored.all())
-            self.assertEqual(len(articles), 2)
-            for article_link in articles:
-                _ = article_link.article.title
-                _ = article_link.article.department.title
-                authors = list(article_link.article.authors.all())
-                for author in authors:
-                    _ = author.author.title
-
-            # Access archive articles and their issues
-            archive_articles = list(context["page"].archive_articles_authored.all())
-            self.assertEqual(len(archive_articles), 1)
-            for archive_link in archive_articles:
-                _ = archive_link.article.title
-                _ = archive_link.article.issue.title
-
-            # Access books and their authors
-            books = list(context["page"].books_authored.all())
-            self.assertEqual(len(books), 1)
-            for book_link in books:
-                _ = book_link.book.title
-                book_authors = list(book_link.book.authors.all())
-                for author in book_authors:
-                    _ = author.author.title
-
-            # Access library items and their authors
-            library_items = list(context["page"].library_items_authored.all())
-            self.assertEqual(len(library_items), 1)
-            for item_link in library_items:
-                _ = item_link.library_item.title
-                item_authors = list(item_link.library_item.authors.all())
-                for author in item_authors:
-                    _ = author.author.title
-
-            # Access memorials and their persons
-            memorials = list(context["page"].memorial_minute.all())
-            self.assertEqual(len(memorials), 1)
-            for memorial in memorials:
-                _ = memorial.memorial_person.given_name
-                _ = memorial.memorial_person.family_name
-
-            # Test .count() method works (production bug fix)
-            # Template uses {% if page.articles_authored.count %}
-            # Previously failed with: TypeError: list.count() takes exactly one argument (0 given)
-            self.assertIsInstance(context["page"].articles_authored.count(), int)
-            self.assertIsInstance(
-                context["page"].archive_articles_authored.count(),
-                int,
-            )
-            self.assertIsInstance(context["page"].books_authored.count(), int)
-            self.assertIsInstance(context["page"].library_items_authored.count(), int)
-            self.assertIsInstance(context["page"].memorial_minute.count(), int)
-
-            # Assert no additional queries were made
-            query_count = len(connection.queries)
-            self.assertEqual(
-                query_count,
-                0,
-                f"Expected 0 queries after prefetch, but got {query_count}. "
-                f"This indicates N+1 query regression.",
-            )
+        bibliography = context["bibliography"]
+        self.assertEqual(
+            {key: listing.count for key, listing in bibliography.items()},
+            {"articles": 2, "archive_articles": 1, "books": 1, "library_items": 1},
+        )
+
+        # Access all listed items - should trigger 0 additional queries
+        with self.assertNumQueries(0):
+            self.access_bibliography(bibliography)
 
     def test_meeting_with_related_content_query_optimization(self) -> None:
         """Test that Meeting pages with related content don't trigger N+1 queries."""
-        from django.test.utils import override_settings
-
         meeting = MeetingFactory.create()
 
         # Create magazine structure
@@ -455,48 +441,22 @@ class ContactQueryOptimizationTestCase(TestCase):
         library_index.add_child(instance=library_item)
         self.LibraryItemAuthor.objects.create(library_item=library_item, author=meeting)
 
-        # Get context
+        # Get context (this should load the first page of each section)
         request = self.factory.get("/")
         context = meeting.get_context(request)
 
-        # Access relationships - should trigger 0 queries
-        with override_settings(DEBUG=True):
-            from django.db import connection, reset_queries
-
-            reset_queries()
-
-            # Access all prefetched relationships including nested relationships
-            articles = list(context["page"].articles_authored.all())
-            for article_link in articles:
-                _ = article_link.article.department.title
-                for author in article_link.article.authors.all():
-                    _ = author.author.title
-
-            archive_articles = list(context["page"].archive_articles_authored.all())
-            for archive_link in archive_articles:
-                _ = archive_link.article.issue.title
-
-            books = list(context["page"].books_authored.all())
-            for book_link in books:
-                for author in book_link.book.authors.all():
-                    _ = author.author.title
-
-            library_items = list(context["page"].library_items_authored.all())
-            for item_link in library_items:
-                for author in item_link.library_item.authors.all():
-                    _ = author.author.title
-
-            query_count = len(connection.queries)
-            self.assertEqual(
-                query_count,
-                0,
-                f"Expected 0 queries for Meeting, got {query_count}",
-            )
+        bibliography = context["bibliography"]
+        self.assertEqual(
+            {key: listing.count for key, listing in bibliography.items()},
+            {"articles": 2, "archive_articles": 1, "books": 1, "library_items": 1},
+        )
+
+        # Access all listed items - should trigger 0 additional queries
+        with self.assertNumQueries(0):
+            self.access_bibliography(bibliography)
 
     def test_organization_with_related_content_query_optimization(self) -> None:
         """Test that Organization pages with related content don't trigger N+1 queries."""
-        from django.test.utils import override_settings
-
         organization = OrganizationFactory.create()
 
         # Create magazine structure
@@ -564,40 +524,388 @@ class ContactQueryOptimizationTestCase(TestCase):
             author=organization,
         )
 
-        # Get context
+        # Get context (this should load the first page of each section)
         request = self.factory.get("/")
         context = organization.get_context(request)
 
-        # Access relationships - should trigger 0 queries
-        with override_settings(DEBUG=True):
-            from django.db import connection, reset_queries
-
-            reset_queries()
-
-            # Access all prefetched relationships including nested relationships
-            articles = list(context["page"].articles_authored.all())
-            for article_link in articles:
-                _ = article_link.article.department.title
-                for author in article_link.article.authors.all():
-                    _ = author.author.title
-
-            archive_articles = list(context["page"].archive_articles_authored.all())
-            for archive_link in archive_articles:
-                _ = archive_link.article.issue.title
-
-            books = list(context["page"].books_authored.all())
-            for book_link in books:
-                for author in book_link.book.authors.all():
-                    _ = author.author.title
-
-            library_items = list(context["page"].library_items_authored.all())
-            for item_link in library_items:
-                for author in item_link.library_item.authors.all():
-                    _ = author.author.title
-
-            query_count = len(connection.queries)
-            self.assertEqual(
-                query_count,
-                0,
-                f"Expected 0 queries for Organization, got {query_count}",
+        bibliography = context["bibliography"]
+        self.assertEqual(
+            {key: listing.count for key, listing in bibliography.items()},
+            {"articles": 2, "archive_articles": 1, "books": 1, "library_items": 1},
+        )
+
+        # Access all listed items - should trigger 0 additional queries
+        with self.assertNumQueries(0):
+            self.access_bibliography(bibliography)
+
+    def test_get_context_on_preview_of_new_contact(self) -> None:
+        person = Person(given_name="New", family_name="Person")
+
+        with self.assertNumQueries(0):
+            context = person.get_context(self.factory.get("/"))
+
+        self.assertIs(context["page"], person)
+        self.assertEqual(context["bibliography"], {})
+
+    def test_get_context_does_not_reload_page(self) -> None:
+        """The served instance is used as is; it is not reloaded."""
+        person = PersonFactory.create()
+        person = Person.objects.get(pk=person.pk)
+
+        # The statistics row and, as there is none yet, a count per
+        # section, and no reload of the page
+        with self.assertNumQueries(5):
+            context = person.get_context(self.factory.get("/"))
+
+        self.assertIs(context["page"], person)
+        self.assertEqual(context["bibliography"], {})
+
+        # The bibliography is cached
+        with self.assertNumQueries(0):
+            person.get_context(self.factory.get("/"))
+
+
+class ContactBibliographyTestCase(TestCase):
+    def setUp(self) -> None:
+        self.factory = RequestFactory()
+        self.person = PersonFactory.create()
+        self.item_count = BIBLIOGRAPHY_ITEMS_PER_PAGE + 2
+        for year in range(2000, 2000 + self.item_count):
+            library_item = LibraryItemFactory.create(
+                title=f"Item {year}",
+                publication_date=datetime.date(year, 1, 1),
+            )
+            LibraryItemAuthor.objects.create(
+                library_item=library_item,
+                author=self.person,
+            )
+        ContactPublicationStatistics.update_for_contact(self.person)
+
+    def get_bibliography(self, contact, **params) -> dict:
+        return contact.get_context(self.factory.get("/", params))["bibliography"]
+
+    def get_titles(self, listing) -> list[str]:
+        return [item_link.library_item.title for item_link in listing.items]
+
+    def test_sections_are_paginated_newest_first(self) -> None:
+        listing = self.get_bibliography(self.person)["library_items"]
+
+        self.assertEqual(listing.count, self.item_count)
+        self.assertEqual(listing.paginated_items.page.paginator.num_pages, 2)
+        self.assertEqual(
+            self.get_titles(listing),
+            [
+                f"Item {year}"
+                for year in range(
+                    2000 + self.item_count - 1,
+                    1999 + self.item_count - BIBLIOGRAPHY_ITEMS_PER_PAGE,
+                    -1,
+                )
+            ],
+        )
+
+        listing = self.get_bibliography(
+            self.person,
+            section="library_items",
+            page="2",
+        )["library_items"]
+        self.assertEqual(listing.paginated_items.page.number, 2)
+        self.assertEqual(self.get_titles(listing), ["Item 2001", "Item 2000"])
+
+    def test_contact_page_renders_section_pagination(self) -> None:
+        request = self.factory.get("/")
+        request.user = AnonymousUser()
+        response = self.person.serve(request)
+        response.render()
+        content = response.content.decode()
+
+        self.assertIn(f"Library items ({self.item_count})", content)
+        self.assertIn(f"Item {1999 + self.item_count}", content)
+        self.assertNotIn("Item 2000<", content)
+        self.assertIn("?page=2&section=library_items#library-items-heading", content)
+
+    def test_pages_past_the_end_fall_back_to_the_first_page(self) -> None:
+        listing = self.get_bibliography(
+            self.person,
+            section="library_items",
+            page="3",
+        )["library_items"]
+
+        self.assertEqual(listing.paginated_items.page.number, 1)
+        self.assertEqual(len(listing.items), BIBLIOGRAPHY_ITEMS_PER_PAGE)
+
+    def test_section_sizes_come_from_statistics(self) -> None:
+        ContactPublicationStatistics.objects.filter(contact=self.person).update(
+            library_item_count=40,
+        )
+        invalidate_bibliographies([self.person.pk])
+
+        listing = self.get_bibliography(self.person)["library_items"]
+
+        self.assertEqual(listing.count, 40)
+        self.assertEqual(listing.paginated_items.page.paginator.num_pages, 4)
+
+    def test_query_count_does_not_grow_with_the_section(self) -> None:
+        other_person = PersonFactory.create()
+        library_item = LibraryItemFactory.create()
+        LibraryItemAuthor.objects.create(
+            library_item=library_item,
+            author=other_person,
+        )
+        ContactPublicationStatistics.update_for_contact(other_person)
+
+        # The statistics row, then the library item rows, their author links
+        # and the authors
+        with self.assertNumQueries(4):
+            self.get_bibliography(other_person)
+        with self.assertNumQueries(4):
+            self.get_bibliography(self.person)
+
+    def test_bibliography_is_cached_until_authorship_changes(self) -> None:
+        self.get_bibliography(self.person)
+        with self.assertNumQueries(0):
+            self.get_bibliography(self.person)
+
+        library_item = LibraryItemFactory.create(
+            title="Newest item",
+            publication_date=datetime.date(2030, 1, 1),
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            LibraryItemAuthor.objects.create(
+                library_item=library_item,
+                author=self.person,
+            )
+
+        listing = self.get_bibliography(self.person)["library_items"]
+        self.assertEqual(listing.count, self.item_count + 1)
+        self.assertEqual(self.get_titles(listing)[0], "Newest item")
+
+    def test_meeting_memorials_are_listed_newest_first(self) -> None:
+        meeting = MeetingFactory.create()
+        with self.captureOnCommitCallbacks(execute=True):
+            for year in (1990, 2010, 2000):
+                MemorialFactory.create(
+                    memorial_meeting=meeting,
+                    date_of_death=datetime.date(year, 1, 1),
+                )
+
+        listing = self.get_bibliography(meeting)["memorials"]
+
+        self.assertEqual(listing.count, 3)
+        self.assertEqual(
+            [memorial.date_of_death.year for memorial in listing.items],
+            [2010, 2000, 1990],
+        )
+
+    def test_moving_a_memorial_updates_both_meetings(self) -> None:
+        meeting = MeetingFactory.create()
+        other_meeting = MeetingFactory.create()
+        with self.captureOnCommitCallbacks(execute=True):
+            memorial = MemorialFactory.create(memorial_meeting=meeting)
+        self.assertEqual(self.get_bibliography(meeting)["memorials"].count, 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            memorial = Memorial.objects.get(pk=memorial.pk)
+            memorial.memorial_meeting = other_meeting
+            memorial.save()
+
+        self.assertNotIn("memorials", self.get_bibliography(meeting))
+        self.assertEqual(self.get_bibliography(other_meeting)["memorials"].count, 1)
+
+
+class ContactPublicationStatisticsBulkUpdateTestCase(TestCase):
+    def setUp(self) -> None:
+        self.person = PersonFactory.create()
+        self.meeting = MeetingFactory.create()
+        self.organization = OrganizationFactory.create()
+
+        self.older_issue = MagazineIssueFactory.create(
+            publication_date=datetime.date(2021, 3, 1),
+        )
+        self.newer_issue = MagazineIssueFactory.create(
+            publication_date=datetime.date(2022, 6, 1),
+        )
+        magazine_index = self.older_issue.get_parent()
+        older_article = MagazineArticleFactory.create(parent=self.older_issue)
+        newer_article = MagazineArticleFactory.create(parent=self.newer_issue)
+
+        self.archive_issue = ArchiveIssue(
+            title="Archive Issue",
+            slug="archive-issue",
+            publication_date=datetime.date(1950, 1, 1),
+            internet_archive_identifier="test-archive",
+        )
+        magazine_index.add_child(instance=self.archive_issue)
+        archive_article = ArchiveArticle.objects.create(
+            title="Archive Article",
+            issue=self.archive_issue,
+        )
+
+        MagazineArticleAuthor.objects.create(
+            article=older_article,
+            author=self.person,
+        )
+        MagazineArticleAuthor.objects.create(
+            article=newer_article,
+            author=self.person,
+        )
+        ArchiveArticleAuthor.objects.create(
+            article=archive_article,
+            author=self.person,
+        )
+        ArchiveArticleAuthor.objects.create(
+            article=archive_article,
+            author=self.meeting,
+        )
+        # Start without the statistics computed by the magazine signals
+        ContactPublicationStatistics.objects.all().delete()
+
+    def test_update_for_contacts(self) -> None:
+        ContactPublicationStatistics.update_for_contacts(
+            [self.person.pk, self.meeting.pk, self.organization.pk],
+        )
+
+        person_stats = ContactPublicationStatistics.objects.get(contact=self.person)
+        self.assertEqual(person_stats.article_count, 3)
+        self.assertEqual(
+            person_stats.last_published_at.date(),
+            self.newer_issue.publication_date,
+        )
+        self.assertEqual(
+            person_stats.contact_type,
+            ContactPublicationStatistics.ContactType.PERSON,
+        )
+
+        meeting_stats = ContactPublicationStatistics.objects.get(contact=self.meeting)
+        self.assertEqual(meeting_stats.article_count, 1)
+        self.assertEqual(
+            meeting_stats.last_published_at.date(),
+            self.archive_issue.publication_date,
+        )
+        self.assertEqual(
+            meeting_stats.contact_type,
+            ContactPublicationStatistics.ContactType.MEETING,
+        )
+
+        organization_stats = ContactPublicationStatistics.objects.get(
+            contact=self.organization,
+        )
+        self.assertEqual(organization_stats.article_count, 0)
+        self.assertIsNone(organization_stats.last_published_at)
+        self.assertEqual(
+            organization_stats.contact_type,
+            ContactPublicationStatistics.ContactType.ORGANIZATION,
+        )
+
+    def test_update_for_contacts_counts_bibliography_sections(self) -> None:
+        library_item = LibraryItemFactory.create()
+        LibraryItemAuthor.objects.create(
+            library_item=library_item,
+            author=self.organization,
+        )
+        MemorialFactory.create(memorial_meeting=self.meeting)
+        MemorialFactory.create(memorial_meeting=self.meeting)
+
+        ContactPublicationStatistics.update_for_contacts(
+            [self.person.pk, self.meeting.pk, self.organization.pk],
+        )
+
+        counts = {
+            stats.contact_id: (
+                stats.magazine_article_count,
+                stats.archive_article_count,
+                stats.book_count,
+                stats.library_item_count,
+                stats.memorial_count,
+            )
+            for stats in ContactPublicationStatistics.objects.all()
+        }
+        self.assertEqual(counts[self.person.pk], (2, 1, 0, 0, 0))
+        self.assertEqual(counts[self.meeting.pk], (0, 1, 0, 0, 2))
+        self.assertEqual(counts[self.organization.pk], (0, 0, 0, 1, 0))
+
+    def test_update_for_contacts_matches_update_for_contact(self) -> None:
+        ContactPublicationStatistics.update_for_contacts([self.person.pk])
+        bulk_stats = ContactPublicationStatistics.objects.get(contact=self.person)
+
+        single_stats = ContactPublicationStatistics.update_for_contact(self.person)
+
+        self.assertEqual(single_stats.article_count, bulk_stats.article_count)
+        self.assertEqual(
+            single_stats.last_published_at,
+            bulk_stats.last_published_at,
+        )
+
+    def test_update_for_contact_of_deleted_contact(self) -> None:
+        # A stale instance, as deleting clears the pk of the deleted one
+        contact = type(self.organization).objects.get(pk=self.organization.pk)
+        self.organization.delete()
+
+        self.assertIsNone(ContactPublicationStatistics.update_for_contact(contact))
+
+    def test_update_for_contacts_updates_existing_rows(self) -> None:
+        ContactPublicationStatistics.objects.create(
+            contact=self.person,
+            contact_type=ContactPublicationStatistics.ContactType.PERSON,
+            article_count=99,
+        )
+
+        ContactPublicationStatistics.update_for_contacts([self.person.pk])
+
+        self.assertEqual(
+            ContactPublicationStatistics.objects.get(
+                contact=self.person,
+            ).article_count,
+            3,
+        )
+
+    def test_update_for_contacts_query_count_is_per_batch(self) -> None:
+        contact_ids = [self.person.pk, self.meeting.pk, self.organization.pk]
+
+        # Contacts, magazine aggregates, archive aggregates, book, library
+        # item and memorial counts, and the upsert
+        with self.assertNumQueries(7):
+            ContactPublicationStatistics.update_for_contacts(contact_ids)
+
+        with self.assertNumQueries(21):
+            ContactPublicationStatistics.update_for_contacts(
+                contact_ids,
+                batch_size=1,
             )
+
+    def test_command_updates_all_contacts(self) -> None:
+        stdout = StringIO()
+        call_command("update_publication_stats", "--batch-size", "2", stdout=stdout)
+
+        self.assertIn("for 3 contacts", stdout.getvalue())
+        self.assertEqual(ContactPublicationStatistics.objects.count(), 3)
+
+    def test_command_since_only_updates_changed_authors(self) -> None:
+        ContactPublicationStatistics.update_for_contacts(
+            [self.person.pk, self.meeting.pk, self.organization.pk],
+        )
+        ContactPublicationStatistics.objects.update(article_count=0)
+
+        # Only the archive issue, authored by the person and the meeting,
+        # has been published since
+        since = timezone.now() - datetime.timedelta(days=1)
+        ArchiveIssue.objects.filter(pk=self.archive_issue.pk).update(
+            last_published_at=timezone.now(),
+        )
+
+        call_command(
+            "update_publication_stats",
+            "--since",
+            since.isoformat(),
+            stdout=StringIO(),
+        )
+
+        counts = dict(
+            ContactPublicationStatistics.objects.values_list(
+                "contact_id",
+                "article_count",
+            ),
+        )
+        self.assertEqual(counts[self.person.pk], 3)
+        self.assertEqual(counts[self.meeting.pk], 1)
+        self.assertEqual(counts[self.organization.pk], 0)
@@ -0,0 +1,231 @@
+"""Namespaced caching shared by the apps of the site.
+
+Cached values belong to a namespace, such as "library:listing", and can
+depend on further namespaces, typically those of the models and the site
+they were computed from. Every namespace has a version token stored in the
+cache, and each cache key includes the tokens of its namespaces. Bumping a
+token therefore orphans every entry that depends on the namespace without
+having to find them, the same way pagination.counts invalidates counts.
+
+The signals in core.signals bump the namespace of a model whenever one of
+its instances is saved or deleted, and the namespace of a site whenever one
+of its pages is published, unpublished, moved or deleted, or its settings
+change:
+
+    items = get_or_set_cached(
+        "library:listing",
+        [site.pk, request.GET.urlencode()],
+        lambda: list(LibraryItem.objects.live()),
+        depends_on=[model_namespace(LibraryItem), site_namespace(site)],
+    )
+
+Hits and misses are counted per namespace in each process; see
+get_cache_metrics(). Each process logs its counts every
+CACHE_METRICS_LOG_INTERVAL_S seconds, at INFO level.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from django.core.cache import DEFAULT_CACHE_ALIAS, caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.db.models import Model
+from wagtail.models import Site
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY_PREFIX = "wf"
+CACHE_METRICS_LOG_INTERVAL_S = 15 * 60
+
+# Returned by cache.get() for missing keys, so None can be cached
+_MISSING = object()
+
+
+def get_cache(alias: str = DEFAULT_CACHE_ALIAS):
+    return caches[alias]
+
+
+def model_namespace(model: type[Model] | Model) -> str:
+    """Return the namespace bumped when instances of a model change."""
+    return f"model:{model._meta.label_lower}"
+
+
+def site_namespace(site: Site | int) -> str:
+    """Return the namespace bumped when a site's pages or settings change."""
+    site_id = site.pk if isinstance(site, Site) else site
+    return f"site:{site_id}"
+
+
+def _version_key(namespace: str) -> str:
+    return f"{CACHE_KEY_PREFIX}:version:{namespace}"
+
+
+def get_namespace_versions(namespaces: Iterable[str]) -> dict[str, int]:
+    """Return the current version tokens of the given namespaces.
+
+    Namespaces without a token (never bumped, or evicted) get a fresh one,
+    so an evicted token can never bring back entries cached before it.
+    """
+    cache = get_cache()
+    keys = {_version_key(namespace): namespace for namespace in namespaces}
+    versions = cache.get_many(keys)
+
+    missing = {key: time.time_ns() for key in keys if key not in versions}
+    if missing:
+        cache.set_many(missing, timeout=None)
+        versions.update(missing)
+
+    return {namespace: versions[key] for key, namespace in keys.items()}
+
+
+def bump_namespaces(namespaces: Iterable[str]) -> None:
+    """Invalidate every entry cached in or depending on the namespaces."""
+    token = time.time_ns()
+    get_cache().set_many(
+        {_version_key(namespace): token for namespace in namespaces},
+        timeout=None,
+    )
+
+
+def invalidate_model(model: type[Model] | Model) -> None:
+    """Invalidate the entries that depend on a model and its parent models."""
+    meta = model._meta
+    bump_namespaces(
+        model_namespace(candidate)
+        for candidate in [meta.concrete_model, *meta.get_parent_list()]
+    )
+
+
+def invalidate_site(site: Site | int) -> None:
+    bump_namespaces([site_namespace(site)])
+
+
+def make_cache_key(
+    namespace: str,
+    key_parts: Iterable[Any],
+    depends_on: Iterable[str] = (),
+) -> str:
+    """Return the versioned cache key of an entry in a namespace."""
+    namespaces = list(dict.fromkeys([namespace, *depends_on]))
+    versions = get_namespace_versions(namespaces)
+
+    digest = hashlib.sha256(
+        repr(
+            (
+                [str(part) for part in key_parts],
+                [(name, versions[name]) for name in namespaces],
+            ),
+        ).encode(),
+    ).hexdigest()
+    return f"{CACHE_KEY_PREFIX}:{namespace}:{digest}"
+
+
+@dataclass
+class NamespaceStats:
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+_stats: dict[str, NamespaceStats] = {}
+_stats_lock = threading.Lock()
+_stats_logged_at = time.monotonic()
+
+
+def record_lookup(namespace: str, hit: bool) -> None:
+    global _stats_logged_at
+    with _stats_lock:
+        stats = _stats.setdefault(namespace, NamespaceStats())
+        if hit:
+            stats.hits += 1
+        else:
+            stats.misses += 1
+
+        now = time.monotonic()
+        log_due = now - _stats_logged_at >= CACHE_METRICS_LOG_INTERVAL_S
+        if log_due:
+            _stats_logged_at = now
+
+    if log_due:
+        log_cache_metrics()
+
+
+def get_cache_metrics() -> dict[str, dict[str, float]]:
+    """Return hit and miss counts per namespace in this process."""
+    with _stats_lock:
+        return {
+            namespace: {**asdict(stats), "hit_rate": stats.hit_rate}
+            for namespace, stats in _stats.items()
+        }
+
+
+def log_cache_metrics() -> None:
+    """Log the hit and miss counts of each namespace in this process."""
+    for namespace, metrics in sorted(get_cache_metrics().items()):
+        logger.info(
+            "Cache namespace %s in process %d: %d hits, %d misses (%.0f%% hits)",
+            namespace,
+            os.getpid(),
+            metrics["hits"],
+            metrics["misses"],
+            metrics["hit_rate"] * 100,
+        )
+
+
+def reset_cache_metrics() -> None:
+    with _stats_lock:
+        _stats.clear()
+
+
+def get_cached(
+    namespace: str,
+    key_parts: Iterable[Any],
+    depends_on: Iterable[str] = (),
+    default: Any = None,
+) -> Any:
+    """Return a cached entry, or ``default`` if it is not cached."""
+    key = make_cache_key(namespace, key_parts, depends_on)
+    value = get_cache().get(key, _MISSING)
+    record_lookup(namespace, hit=value is not _MISSING)
+    return default if value is _MISSING else value
+
+
+def set_cached(
+    namespace: str,
+    key_parts: Iterable[Any],
+    value: Any,
+    depends_on: Iterable[str] = (),
+    timeout: float | None = DEFAULT_TIMEOUT,  # type: ignore
+) -> None:
+    key = make_cache_key(namespace, key_parts, depends_on)
+    get_cache().set(key, value, timeout)
+
+
+def get_or_set_cached(
+    namespace: str,
+    key_parts: Iterable[Any],
+    compute: Callable[[], Any],
+    depends_on: Iterable[str] = (),
+    timeout: float | None = DEFAULT_TIMEOUT,  # type: ignore
+) -> Any:
+    """Return a cached entry, computing and caching it on a miss."""
+    key_parts = list(key_parts)
+    key = make_cache_key(namespace, key_parts, depends_on)
+    cache = get_cache()
+
+    value = cache.get(key, _MISSING)
+    record_lookup(namespace, hit=value is not _MISSING)
+    if value is _MISSING:
+        value = compute()
+        cache.set(key, value, timeout)
+    return value
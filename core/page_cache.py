@@ -0,0 +1,261 @@
+"""Full-page response cache for anonymous visitors.
+
+PageCacheMiddleware stores the rendered responses of Wagtail pages for
+anonymous GET requests, keyed by host, path and the querystring parameters
+in PAGE_CACHE_QUERY_PARAMS, and serves later requests from the cache before
+sessions, authentication or the page's get_context run.
+
+Requests bypass the cache when they carry a session or messages cookie,
+i.e. for logged-in users, anonymous visitors with a cart, and anyone with
+flash messages, or when they have other querystring parameters. Responses
+are only stored when they are successful, set no cookies, are not marked
+private and belong to pages without view restrictions.
+
+Each entry records the version tokens (see core.cache) of its page and of
+its site's page cache. Publishing, unpublishing or moving a page bumps the
+tokens of the page, its ancestors, which list it, and any pages returned by
+its get_page_cache_purge_pages() method, which orphans their entries for
+every path and querystring. Changes to sites and site settings, which every
+page renders, bump the site's token.
+"""
+
+import hashlib
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse
+from wagtail.models import Page, Site
+
+from .cache import bump_namespaces, get_cache, get_namespace_versions, record_lookup
+
+PAGE_CACHE_NAMESPACE = "page_cache"
+
+# Querystring parameters that select what a page shows. Requests with other
+# parameters are not cached, as the page might depend on them.
+PAGE_CACHE_QUERY_PARAMS = frozenset(
+    {
+        # Pagination
+        "page",
+        "after",
+        "before",
+        # Paginated section of contact bibliographies
+        "section",
+        # Listing filters
+        "year",
+        "category",
+        "tag",
+        "title",
+        "publication_date__year",
+        "memorial_meeting__title",
+        # Library facets
+        "item_audience__title",
+        "item_genre__title",
+        "item_medium__title",
+        "item_time_period__title",
+        "topics__topic__title",
+        "authors__author__title",
+        "title__icontains",
+    },
+)
+
+# Parameters that do not change the page, e.g. campaign tracking
+PAGE_CACHE_IGNORED_QUERY_PARAMS = frozenset({"fbclid", "gclid"})
+PAGE_CACHE_IGNORED_QUERY_PARAM_PREFIXES = ("utm_",)
+
+# Cache-Control directives that keep a response out of the cache
+UNCACHEABLE_CACHE_CONTROL = ("private", "no-cache", "no-store")
+
+
+def get_page_cache_timeout() -> int:
+    return getattr(settings, "PAGE_CACHE_TIMEOUT", 0)
+
+
+def page_namespace(page: Page | int) -> str:
+    page_id = page.pk if isinstance(page, Page) else page
+    return f"{PAGE_CACHE_NAMESPACE}:page:{page_id}"
+
+
+def page_cache_site_namespace(site: Site | int) -> str:
+    site_id = site.pk if isinstance(site, Site) else site
+    return f"{PAGE_CACHE_NAMESPACE}:site:{site_id}"
+
+
+def get_cacheable_query(request: HttpRequest) -> list[tuple[str, str]] | None:
+    """Return the request's querystring for the cache key.
+
+    Returns None if the request has parameters the cache does not handle.
+    """
+    query = []
+    for key, values in request.GET.lists():
+        if key in PAGE_CACHE_QUERY_PARAMS:
+            query.extend((key, value) for value in values)
+        elif key not in PAGE_CACHE_IGNORED_QUERY_PARAMS and not key.startswith(
+            PAGE_CACHE_IGNORED_QUERY_PARAM_PREFIXES,
+        ):
+            return None
+    return sorted(query)
+
+
+def get_page_cache_key(request: HttpRequest, query: list[tuple[str, str]]) -> str:
+    digest = hashlib.sha256(
+        repr((request.get_host(), request.path, query)).encode(),
+    ).hexdigest()
+    return f"wf:{PAGE_CACHE_NAMESPACE}:{digest}"
+
+
+def request_can_use_page_cache(request: HttpRequest) -> bool:
+    if request.method != "GET" or get_page_cache_timeout() <= 0:
+        return False
+
+    # Sessions hold logins, carts and password-restricted page access, and
+    # messages are shown once
+    return not (
+        settings.SESSION_COOKIE_NAME in request.COOKIES
+        or getattr(settings, "MESSAGE_COOKIE_NAME", "messages") in request.COOKIES
+    )
+
+
+@dataclass
+class PageCacheCandidate:
+    """A page being served that may be stored in the cache."""
+
+    page_id: int
+    site_id: int
+    versions: dict[str, int]
+    timeout: int
+
+
+def prepare_page_response_caching(page: Page, request: HttpRequest) -> None:
+    """Mark a request as serving a page whose response may be cached.
+
+    Called before the page is served, so that the version tokens recorded
+    with the response predate the content it renders.
+    """
+    if not request_can_use_page_cache(request):
+        return
+
+    timeout = getattr(page.specific_class, "page_cache_timeout", None)
+    if timeout is None:
+        timeout = get_page_cache_timeout()
+    if timeout <= 0 or page.get_view_restrictions().exists():
+        return
+
+    site = Site.find_for_request(request)
+    if site is None:
+        return
+
+    namespaces = [page_namespace(page), page_cache_site_namespace(site)]
+    request.page_cache_candidate = PageCacheCandidate(  # type: ignore[attr-defined]
+        page_id=page.pk,
+        site_id=site.pk,
+        versions=get_namespace_versions(namespaces),
+        timeout=timeout,
+    )
+
+
+def response_is_cacheable(response: HttpResponse) -> bool:
+    if response.status_code != 200 or response.streaming or response.cookies:
+        return False
+
+    cache_control = response.get("Cache-Control", "").lower()
+    return not any(
+        directive in cache_control for directive in UNCACHEABLE_CACHE_CONTROL
+    )
+
+
+def get_cached_page_response(request: HttpRequest) -> HttpResponse | None:
+    """Return the cached response for a request, if there is a valid one."""
+    query = get_cacheable_query(request)
+    if query is None:
+        return None
+
+    entry = get_cache().get(get_page_cache_key(request, query))
+    if entry is not None:
+        current_versions = get_namespace_versions(entry["versions"])
+        if current_versions != entry["versions"]:
+            entry = None
+
+    record_lookup(PAGE_CACHE_NAMESPACE, hit=entry is not None)
+    if entry is None:
+        return None
+
+    response = HttpResponse(entry["content"], status=entry["status"])
+    for header, value in entry["headers"]:
+        response[header] = value
+    response["X-Page-Cache"] = "HIT"
+    return response
+
+
+def store_page_response(request: HttpRequest, response: HttpResponse) -> None:
+    candidate: PageCacheCandidate | None = getattr(
+        request,
+        "page_cache_candidate",
+        None,
+    )
+    if candidate is None or not response_is_cacheable(response):
+        return
+
+    query = get_cacheable_query(request)
+    if query is None:
+        return
+
+    get_cache().set(
+        get_page_cache_key(request, query),
+        {
+            "content": response.content,
+            "status": response.status_code,
+            "headers": list(response.items()),
+            "versions": candidate.versions,
+        },
+        candidate.timeout,
+    )
+    response["X-Page-Cache"] = "MISS"
+
+
+def get_pages_to_purge(page: Page) -> list[Page | int]:
+    """Return the page, its ancestors, and other pages that list it.
+
+    Page models can name further pages (or page IDs) that list them with a
+    get_page_cache_purge_pages() method.
+    """
+    pages: list[Page | int] = [page, *page.get_ancestors().filter(depth__gt=1)]
+
+    get_extra_pages = getattr(page.specific, "get_page_cache_purge_pages", None)
+    if get_extra_pages is not None:
+        pages.extend(get_extra_pages())
+
+    return pages
+
+
+def purge_pages(pages: Iterable[Page | int]) -> None:
+    """Invalidate the cached responses of pages, for every path and query."""
+    bump_namespaces(page_namespace(page) for page in pages)
+
+
+def purge_site(site: Site | int) -> None:
+    """Invalidate every cached page response of a site."""
+    bump_namespaces([page_cache_site_namespace(site)])
+
+
+class PageCacheMiddleware:
+    """Serve and store cached page responses for anonymous visitors.
+
+    Place it after GZipMiddleware, so compressed responses are not stored,
+    and before SessionMiddleware, so cached responses skip the session.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if not request_can_use_page_cache(request):
+            return self.get_response(request)
+
+        cached_response = get_cached_page_response(request)
+        if cached_response is not None:
+            return cached_response
+
+        response = self.get_response(request)
+        store_page_response(request, response)
+        return response
@@ -0,0 +1,161 @@
+"""Request-scoped registry of page instances.
+
+Listings and templates often need the parents or ancestors of many pages,
+and get_parent(), get_ancestors() and ``specific`` each cost a query per
+page. PageRegistry loads what is missing for any set of pages in one batch
+(one query, plus one per specific page type) and keeps every page it has
+seen, by path and ID, for the rest of the request.
+
+The registry is not consulted automatically: a call site resolves the
+pages it is about to loop over. Resolving pages primes the caches that
+treebeard and Wagtail already consult, so code calling get_parent() or
+``page.specific`` on them afterwards needs no changes:
+
+    registry = get_page_registry()
+    registry.resolve_parents(articles)
+    articles[0].get_parent()  # no query
+
+PageRegistryMiddleware gives every request its own registry. Elsewhere,
+e.g. in management commands, page_registry() scopes one explicitly; without
+one, get_page_registry() returns a new, unshared registry.
+"""
+
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.http import HttpRequest, HttpResponse
+from wagtail.models import Page
+
+_current_registry: ContextVar["PageRegistry | None"] = ContextVar(
+    "page_registry",
+    default=None,
+)
+
+
+def _is_specific(page: Page) -> bool:
+    specific_class = page.specific_class
+    return specific_class is None or isinstance(page, specific_class)
+
+
+class PageRegistry:
+    """Page instances by path and ID, loaded in bulk."""
+
+    def __init__(self):
+        self._pages_by_path: dict[str, Page] = {}
+        self._pages_by_id: dict[int, Page] = {}
+
+    def __len__(self) -> int:
+        return len(self._pages_by_id)
+
+    def get(self, *, path: str | None = None, page_id: int | None = None):
+        if path is not None:
+            return self._pages_by_path.get(path)
+        return self._pages_by_id.get(page_id)  # type: ignore[arg-type]
+
+    def add(self, pages: Iterable[Page]) -> None:
+        """Register pages, preferring specific instances to generic ones."""
+        for page in pages:
+            registered = self._pages_by_id.get(page.pk)
+            if registered is None or (
+                not _is_specific(registered) and _is_specific(page)
+            ):
+                self._pages_by_path[page.path] = page
+                self._pages_by_id[page.pk] = page
+
+    def _load_missing(self, paths: set[str]) -> None:
+        missing_paths = paths - self._pages_by_path.keys()
+        if missing_paths:
+            self.add(Page.objects.filter(path__in=missing_paths).specific())  # type: ignore[attr-defined]
+
+    def _prime(self, page: Page) -> None:
+        registered = self._pages_by_id.get(page.pk)
+        if (
+            registered is not None
+            and registered is not page
+            and _is_specific(registered)
+            and "specific" not in page.__dict__
+        ):
+            # Read by Wagtail's cached ``specific`` property
+            page.__dict__["specific"] = registered
+
+        if page.depth > 1:
+            parent = self._pages_by_path.get(page.path[: -page.steplen])
+            if parent is not None:
+                # Returned by treebeard's get_parent()
+                page._cached_parent_obj = parent  # type: ignore[attr-defined]
+                self._prime(parent)
+
+    def resolve_parents(self, pages: Iterable[Page]) -> None:
+        """Load the parents of pages in bulk, for get_parent()."""
+        pages = list(pages)
+        self.add(pages)
+        self._load_missing(
+            {page.path[: -page.steplen] for page in pages if page.depth > 1},
+        )
+        for page in pages:
+            self._prime(page)
+
+    def resolve_ancestors(self, pages: Iterable[Page]) -> None:
+        """Load all ancestors of pages in bulk."""
+        pages = list(pages)
+        self.add(pages)
+        self._load_missing(
+            {
+                page.path[: depth * page.steplen]
+                for page in pages
+                for depth in range(1, page.depth)
+            },
+        )
+        for page in pages:
+            self._prime(page)
+
+    def resolve_specific(self, pages: Iterable[Page]) -> None:
+        """Load the specific instances of pages in bulk, for ``specific``."""
+        pages = list(pages)
+        self.add(pages)
+        generic_ids = {
+            page.pk for page in pages if not _is_specific(self._pages_by_id[page.pk])
+        }
+        if generic_ids:
+            self.add(Page.objects.filter(pk__in=generic_ids).specific())  # type: ignore[attr-defined]
+        for page in pages:
+            self._prime(page)
+
+    def get_ancestors(self, page: Page, inclusive: bool = False) -> list[Page]:
+        """Return the specific ancestors of a page, from the root down."""
+        self.resolve_ancestors([page])
+        depths = range(1, page.depth + 1 if inclusive else page.depth)
+        ancestors = (
+            self._pages_by_path.get(page.path[: depth * page.steplen])
+            for depth in depths
+        )
+        return [ancestor for ancestor in ancestors if ancestor is not None]
+
+
+def get_page_registry() -> PageRegistry:
+    """Return the current registry, or a new one outside any scope."""
+    registry = _current_registry.get()
+    return registry if registry is not None else PageRegistry()
+
+
+@contextmanager
+def page_registry() -> Iterator[PageRegistry]:
+    """Scope a registry, shared by get_page_registry() calls within it."""
+    registry = PageRegistry()
+    token = _current_registry.set(registry)
+    try:
+        yield registry
+    finally:
+        _current_registry.reset(token)
+
+
+class PageRegistryMiddleware:
+    """Give each request its own page registry."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        with page_registry():
+            return self.get_response(request)
@@ -86,6 +86,14 @@ LOGGING = {
             "handlers": ["console", "file"],
             "level": os.getenv("DJANGO_LOG_LEVEL", "WARNING"),
         },
+        # Periodic per-process cache hit/miss counts (see core/cache.py)
+        "core.cache": {
+            "level": os.getenv("METRICS_LOG_LEVEL", "INFO"),
+        },
+        # Periodic per-process PayPal latencies (see paypal/client.py)
+        "paypal.client": {
+            "level": os.getenv("METRICS_LOG_LEVEL", "INFO"),
+        },
     },
 }
 
@@ -129,6 +137,8 @@ PAYPAL_API_URL = (
 )
 PAYPAL_CLIENT_ID = os.getenv("PAYPAL_CLIENT_ID")
 PAYPAL_CLIENT_SECRET = os.getenv("PAYPAL_CLIENT_SECRET")
+# The ID of the PayPal webhook that delivers subscription events
+PAYPAL_WEBHOOK_ID = os.getenv("PAYPAL_WEBHOOK_ID")
 
 # Quick-start development settings - unsuitable for production
 # See https://docs.djangoproject.com/en/2.1/howto/deployment/checklist/
@@ -147,6 +157,7 @@ INSTALLED_APPS = [
     "common",
     "community",
     "contact",
+    "core",
     "documents",
     "events",
     "facets",
@@ -213,6 +224,8 @@ CRISPY_TEMPLATE_PACK = "bootstrap5"
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
     "django.middleware.gzip.GZipMiddleware",
+    "core.page_cache.PageCacheMiddleware",
+    "core.page_registry.PageRegistryMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -280,6 +293,52 @@ WAGTAILSEARCH_BACKENDS = {
     },
 }
 
+# Site search query strategy (see docs/specifications/search_optimization.md):
+# - "wagtail": Wagtail's database search backend
+# - "tsvector": stored, weighted tsvectors on search cards ranked with ts_rank_cd
+#   (run `manage.py rebuild_search_cards` before switching)
+SEARCH_BACKEND_MODE = os.getenv("SEARCH_BACKEND_MODE", "wagtail")
+
+# How contact publication statistics are refreshed after authorship changes
+# (see contact/publication_stats.py):
+# - "immediate": recompute the changed contacts once the transaction commits
+# - "database": queue them for `manage.py process_publication_stats_queue`
+PUBLICATION_STATS_QUEUE = os.getenv("PUBLICATION_STATS_QUEUE", "immediate")
+
+# Cache shared by the workers (see core/cache.py), chosen by the environment:
+# - CACHE_REDIS_URL: a Redis server shared by all workers and hosts
+# - CACHE_DIRECTORY: files in a directory shared by the workers of one host
+# - neither: each worker process keeps its own local-memory cache
+CACHE_REDIS_URL = os.getenv("CACHE_REDIS_URL")
+CACHE_DIRECTORY = os.getenv("CACHE_DIRECTORY")
+
+# Seconds to keep rendered pages for anonymous visitors (see core/page_cache.py);
+# 0 disables the page cache. Publishing purges affected pages sooner.
+PAGE_CACHE_TIMEOUT = int(
+    os.getenv("PAGE_CACHE_TIMEOUT", "0" if DEBUG or RUNNING_TESTS else "600"),
+)
+
+if CACHE_REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": CACHE_REDIS_URL,
+        },
+    }
+elif CACHE_DIRECTORY:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+            "LOCATION": CACHE_DIRECTORY,
+        },
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        },
+    }
+
 WAGTAILEMBEDS_FINDERS = [
     {
         "class": "wagtail.embeds.finders.oembed",
@@ -328,9 +387,8 @@ STATICFILES_FINDERS = [
     "django.contrib.staticfiles.finders.AppDirectoriesFinder",
 ]
 
-STATICFILES_DIRS = [
-    os.path.join(CORE_DIR, "static"),
-]
+# core/static is found by AppDirectoriesFinder, as core is an installed app
+STATICFILES_DIRS: list[str] = []
 
 if USE_SPACES:
     STATIC_URL = f"{AWS_S3_ENDPOINT_URL}/{AWS_STORAGE_BUCKET_NAME}/{AWS_LOCATION}/"
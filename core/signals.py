@@ -0,0 +1,74 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from wagtail.contrib.settings.models import BaseGenericSetting, BaseSiteSetting
+from wagtail.models import Page, Site
+from wagtail.signals import page_published, page_unpublished, post_page_move
+
+from .cache import invalidate_model, invalidate_site
+from .page_cache import get_pages_to_purge, purge_pages, purge_site
+
+# Models saved on nearly every request or only by the framework itself,
+# which no cached content depends on
+UNTRACKED_APP_LABELS = {"admin", "contenttypes", "migrations", "sessions"}
+
+
+def invalidate_sites_of_url_path(url_path: str) -> None:
+    for site_root_path in Site.get_site_root_paths():
+        if url_path.startswith(site_root_path.root_path):
+            invalidate_site(site_root_path.site_id)
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def invalidate_model_on_change(sender, instance, **kwargs):
+    """Invalidate cached entries that depend on the changed model."""
+    if sender._meta.app_label in UNTRACKED_APP_LABELS:
+        return
+
+    invalidate_model(sender)
+
+    # Every page renders the site and its settings
+    if isinstance(instance, BaseSiteSetting):
+        invalidate_site(instance.site_id)
+        purge_site(instance.site_id)
+    elif isinstance(instance, BaseGenericSetting):
+        for site_id in Site.objects.values_list("pk", flat=True):
+            purge_site(site_id)
+    elif isinstance(instance, Site):
+        invalidate_site(instance)
+        purge_site(instance)
+    elif isinstance(instance, Page):
+        # Covers pages created live (e.g. by imports) and deleted pages,
+        # which send no publish signals
+        invalidate_sites_of_url_path(instance.url_path)
+
+
+@receiver(page_published)
+@receiver(page_unpublished)
+def invalidate_site_on_publish(sender, instance, **kwargs):
+    """Invalidate cached entries of the sites and pages that show the page."""
+    invalidate_sites_of_url_path(instance.url_path)
+    purge_pages(get_pages_to_purge(instance))
+
+
+@receiver(post_page_move)
+def invalidate_site_on_move(
+    sender,
+    instance,
+    parent_page_before,
+    url_path_before,
+    url_path_after,
+    **kwargs,
+):
+    invalidate_sites_of_url_path(url_path_before)
+    invalidate_sites_of_url_path(url_path_after)
+
+    # The URLs of the page and its descendants change, and the old parent
+    # no longer lists it
+    purge_pages(
+        [
+            *get_pages_to_purge(instance),
+            *instance.get_descendants(),
+            *get_pages_to_purge(parent_page_before),
+        ],
+    )
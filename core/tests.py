@@ -1,9 +1,29 @@
 """Tests for core utility functions."""
 
-from django.test import TestCase
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
 from wagtail.models import Locale, Page, Site
 
+from accounts.models import User
+from core.cache import (
+    get_cache_metrics,
+    get_cached,
+    get_or_set_cached,
+    invalidate_model,
+    invalidate_site,
+    model_namespace,
+    reset_cache_metrics,
+    set_cached,
+    site_namespace,
+)
+from core.page_cache import get_pages_to_purge
+from core.page_registry import PageRegistry, get_page_registry, page_registry
 from core.utils import get_default_site
+from home.models import HomePage
+from navigation.models import NavigationMenuSetting
+from wf_pages.models import WfPage
 
 
 class GetDefaultSiteTest(TestCase):
@@ -74,3 +94,290 @@ class GetDefaultSiteTest(TestCase):
         result = get_default_site()
         self.assertIsNotNone(result)
         self.assertEqual(result, site1)
+
+
+class NamespacedCacheTest(TestCase):
+    """Test the namespaced cache helpers in core.cache."""
+
+    def setUp(self):
+        cache.clear()
+        reset_cache_metrics()
+        self.site = Site.objects.get(is_default_site=True)
+
+    def test_get_or_set_computes_once(self):
+        compute_calls = []
+
+        def compute():
+            compute_calls.append(1)
+            return ["item"]
+
+        for _ in range(3):
+            value = get_or_set_cached("test:listing", ["page", 1], compute)
+
+        self.assertEqual(value, ["item"])
+        self.assertEqual(len(compute_calls), 1)
+        self.assertEqual(
+            get_cache_metrics()["test:listing"],
+            {"hits": 2, "misses": 1, "hit_rate": 2 / 3},
+        )
+
+    @patch("core.cache.logger")
+    def test_metrics_are_logged_periodically(self, mock_logger):
+        get_cached("test:listing", ["page", 1])
+        mock_logger.info.assert_not_called()
+
+        with patch("core.cache.CACHE_METRICS_LOG_INTERVAL_S", 0):
+            get_cached("test:listing", ["page", 1])
+
+        mock_logger.info.assert_called_once()
+        args = mock_logger.info.call_args.args
+        self.assertEqual(args[1], "test:listing")
+        self.assertEqual(args[3:], (0, 2, 0))
+
+    def test_key_parts_separate_entries(self):
+        set_cached("test:listing", ["page", 1], "first")
+        set_cached("test:listing", ["page", 2], "second")
+
+        self.assertEqual(get_cached("test:listing", ["page", 1]), "first")
+        self.assertEqual(get_cached("test:listing", ["page", 2]), "second")
+        self.assertIsNone(get_cached("test:listing", ["page", 3]))
+
+    def test_none_is_cached(self):
+        get_or_set_cached("test:listing", [], lambda: None)
+
+        self.assertIsNone(get_or_set_cached("test:listing", [], lambda: "computed"))
+
+    def test_invalidate_model(self):
+        depends_on = [model_namespace(HomePage)]
+        set_cached("test:listing", [], "cached", depends_on=depends_on)
+
+        invalidate_model(HomePage)
+
+        self.assertIsNone(get_cached("test:listing", [], depends_on=depends_on))
+
+    def test_invalidate_model_invalidates_parent_models(self):
+        depends_on = [model_namespace(Page)]
+        set_cached("test:listing", [], "cached", depends_on=depends_on)
+
+        invalidate_model(HomePage)
+
+        self.assertIsNone(get_cached("test:listing", [], depends_on=depends_on))
+
+    def test_invalidate_other_site_keeps_entries(self):
+        depends_on = [site_namespace(self.site)]
+        set_cached("test:fragment", [], "cached", depends_on=depends_on)
+
+        invalidate_site(self.site.pk + 1)
+        self.assertEqual(
+            get_cached("test:fragment", [], depends_on=depends_on), "cached"
+        )
+
+        invalidate_site(self.site)
+        self.assertIsNone(get_cached("test:fragment", [], depends_on=depends_on))
+
+    def test_saving_a_model_invalidates_its_namespace(self):
+        depends_on = [model_namespace(NavigationMenuSetting)]
+        set_cached("test:menu", [], "cached", depends_on=depends_on)
+
+        NavigationMenuSetting.for_site(self.site).save()
+
+        self.assertIsNone(get_cached("test:menu", [], depends_on=depends_on))
+
+    def test_publishing_a_page_invalidates_its_site(self):
+        home_page = HomePage(title="Home")
+        self.site.root_page.add_child(instance=home_page)
+        depends_on = [site_namespace(self.site)]
+        set_cached("test:fragment", [], "cached", depends_on=depends_on)
+
+        home_page.save_revision().publish()
+
+        self.assertIsNone(get_cached("test:fragment", [], depends_on=depends_on))
+
+    def test_evicted_version_does_not_revive_entries(self):
+        depends_on = [model_namespace(HomePage)]
+        set_cached("test:listing", [], "cached", depends_on=depends_on)
+
+        # Losing the version token must not make old entries reachable again
+        cache.delete("wf:version:model:home.homepage")
+
+        self.assertIsNone(get_cached("test:listing", [], depends_on=depends_on))
+
+
+@override_settings(PAGE_CACHE_TIMEOUT=600)
+class PageCacheTest(TestCase):
+    """Test the anonymous full-page cache in core.page_cache."""
+
+    def setUp(self):
+        cache.clear()
+        reset_cache_metrics()
+        site = Site.objects.get(is_default_site=True)
+        # Created on first use otherwise, which purges the site
+        NavigationMenuSetting.for_site(site)
+        self.home_page = HomePage(title="Home")
+        site.root_page.add_child(instance=self.home_page)
+        self.page = WfPage(title="About", body=[])
+        self.home_page.add_child(instance=self.page)
+        self.url = self.page.url
+
+    def test_second_request_is_served_from_cache(self):
+        first_response = self.client.get(self.url)
+        self.assertEqual(first_response["X-Page-Cache"], "MISS")
+
+        with self.assertNumQueries(0):
+            second_response = self.client.get(self.url)
+
+        self.assertEqual(second_response["X-Page-Cache"], "HIT")
+        self.assertEqual(second_response.content, first_response.content)
+        self.assertEqual(
+            get_cache_metrics()["page_cache"],
+            {"hits": 1, "misses": 1, "hit_rate": 0.5},
+        )
+
+    def test_publishing_purges_page_and_ancestors(self):
+        home_url = self.home_page.url
+        self.client.get(self.url)
+        self.client.get(home_url)
+
+        self.page.title = "About us"
+        self.page.save_revision().publish()
+
+        page_response = self.client.get(self.url)
+        self.assertEqual(page_response["X-Page-Cache"], "MISS")
+        self.assertContains(page_response, "About us")
+        self.assertEqual(self.client.get(home_url)["X-Page-Cache"], "MISS")
+
+    def test_publishing_keeps_unrelated_pages(self):
+        other_page = WfPage(title="Contact", body=[])
+        self.home_page.add_child(instance=other_page)
+        self.client.get(self.url)
+
+        other_page.save_revision().publish()
+
+        self.assertEqual(self.client.get(self.url)["X-Page-Cache"], "HIT")
+
+    def test_site_setting_change_purges_site(self):
+        self.client.get(self.url)
+
+        NavigationMenuSetting.for_site(Site.objects.get(is_default_site=True)).save()
+
+        self.assertEqual(self.client.get(self.url)["X-Page-Cache"], "MISS")
+
+    def test_allowed_query_params_are_cached_separately(self):
+        self.client.get(self.url, {"page": "2"})
+
+        self.assertEqual(
+            self.client.get(self.url, {"page": "2", "utm_source": "email"})[
+                "X-Page-Cache"
+            ],
+            "HIT",
+        )
+        self.assertEqual(
+            self.client.get(self.url, {"page": "3"})["X-Page-Cache"],
+            "MISS",
+        )
+
+    def test_other_query_params_bypass_cache(self):
+        self.client.get(self.url, {"query": "friends"})
+        response = self.client.get(self.url, {"query": "friends"})
+
+        self.assertNotIn("X-Page-Cache", response)
+
+    def test_logged_in_users_bypass_cache(self):
+        self.client.get(self.url)
+        user = User.objects.create_user(
+            email="reader@example.com",
+            password="password",
+        )
+        self.client.force_login(user)
+
+        response = self.client.get(self.url)
+
+        self.assertNotIn("X-Page-Cache", response)
+        self.assertContains(response, "Log out")
+
+    def test_get_pages_to_purge(self):
+        pages = get_pages_to_purge(self.page)
+
+        self.assertEqual(
+            [page.pk for page in pages],
+            [self.page.pk, self.page.get_parent().get_parent().pk, self.home_page.pk],
+        )
+
+
+class PageRegistryTest(TestCase):
+    """Test the bulk parent and ancestor loading of core.page_registry."""
+
+    def setUp(self):
+        site = Site.objects.get(is_default_site=True)
+        self.home_page = HomePage(title="Home")
+        site.root_page.add_child(instance=self.home_page)
+        self.section = WfPage(title="Section", body=[])
+        self.home_page.add_child(instance=self.section)
+        self.pages = []
+        for title in ["One", "Two", "Three"]:
+            page = WfPage(title=title, body=[])
+            self.section.add_child(instance=page)
+            self.pages.append(page)
+
+    def fetch_pages(self):
+        return list(Page.objects.filter(pk__in=[page.pk for page in self.pages]))
+
+    def test_resolve_parents_primes_get_parent(self):
+        pages = self.fetch_pages()
+        registry = PageRegistry()
+
+        # One query for the parent pages and one for their specific type
+        with self.assertNumQueries(2):
+            registry.resolve_parents(pages)
+
+        with self.assertNumQueries(0):
+            parents = [page.get_parent() for page in pages]
+
+        self.assertEqual(parents, [self.section] * 3)
+        self.assertIsInstance(parents[0], WfPage)
+
+    def test_resolve_ancestors(self):
+        pages = self.fetch_pages()
+        registry = PageRegistry()
+        registry.resolve_ancestors(pages)
+
+        with self.assertNumQueries(0):
+            ancestors = registry.get_ancestors(pages[0])
+            grandparent = pages[0].get_parent().get_parent()
+
+        self.assertEqual(
+            [ancestor.pk for ancestor in ancestors],
+            list(self.pages[0].get_ancestors().values_list("pk", flat=True)),
+        )
+        self.assertIsInstance(ancestors[-1], WfPage)
+        self.assertEqual(grandparent, self.home_page)
+
+    def test_resolve_specific_primes_specific(self):
+        pages = self.fetch_pages()
+        registry = PageRegistry()
+        registry.resolve_specific(pages)
+
+        with self.assertNumQueries(0):
+            specific_pages = [page.specific for page in pages]
+
+        self.assertTrue(all(isinstance(page, WfPage) for page in specific_pages))
+
+    def test_registered_pages_are_not_fetched_again(self):
+        registry = PageRegistry()
+        registry.resolve_parents(self.fetch_pages())
+        section_children = list(self.section.get_children())
+
+        with self.assertNumQueries(0):
+            registry.resolve_parents(section_children)
+
+    def test_registry_is_scoped(self):
+        self.assertIsNot(get_page_registry(), get_page_registry())
+
+        with page_registry() as registry:
+            self.assertIs(get_page_registry(), registry)
+            registry.add([self.home_page])
+            self.assertEqual(
+                get_page_registry().get(page_id=self.home_page.pk), self.home_page
+            )
+
+        self.assertIsNone(get_page_registry().get(page_id=self.home_page.pk))
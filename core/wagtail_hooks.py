@@ -0,0 +1,8 @@
+from wagtail import hooks
+
+from .page_cache import prepare_page_response_caching
+
+
+@hooks.register("before_serve_page")
+def prepare_page_cache(page, request, serve_args, serve_kwargs):
+    prepare_page_response_caching(page, request)
@@ -149,7 +149,8 @@ class EventsIndexPage(Page):
         else:
             # Default to Western events
             filter_category = Event.EventCategoryChoices.WESTERN
-        now = timezone.now()
+        # Truncated to the minute so the listing's cached count can be reused
+        now = timezone.now().replace(second=0, microsecond=0)
 
         # Upcoming events are events that have not yet ended
         # or have not yet started
@@ -170,6 +171,10 @@ class EventsIndexPage(Page):
             items=upcoming_events,
             items_per_page=items_per_page,
             page_number=page_number,
+            keyset=True,
+            after=request.GET.get("after"),
+            before=request.GET.get("before"),
+            cache_count=True,
         )
 
         context["event_category_title"] = filter_category.capitalize()
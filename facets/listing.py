@@ -0,0 +1,90 @@
+"""Paginated library item listings of facet pages.
+
+Facet pages (audiences, genres, mediums, time periods and topics) list
+their live library items, newest first, FACET_ITEMS_PER_PAGE at a time.
+Most visitors only see the first page, so each facet's first page and
+total count are cached together. Later pages are fetched with OFFSET and
+a cached count (see pagination.counts).
+
+Each facet's entry depends on the facet's own namespace (see core.cache).
+The signals in facets.signals bump it when a library item in the facet is
+saved (which includes publishing), unpublished or deleted, when an item
+leaves the facet, and when the item's topics change. Renamed authors show
+once the entry expires, after FACET_FIRST_PAGE_CACHE_TIMEOUT.
+"""
+
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+from django.db.models import QuerySet
+
+from core.cache import bump_namespaces, get_or_set_cached
+from pagination.helpers import PaginatorPageWithElidedPageRange, get_paginated_items
+
+FACET_LISTING_NAMESPACE = "facets:library_items"
+FACET_FIRST_PAGE_CACHE_TIMEOUT = 60 * 60
+FACET_ITEMS_PER_PAGE = 10
+
+
+def facet_listing_namespace(facet_id: int) -> str:
+    return f"{FACET_LISTING_NAMESPACE}:{facet_id}"
+
+
+def invalidate_facet_listings(facet_ids: Iterable[int | None]) -> None:
+    bump_namespaces(
+        facet_listing_namespace(facet_id)
+        for facet_id in set(facet_ids)
+        if facet_id is not None
+    )
+
+
+class FirstPageItems(Sequence):
+    """The cached first page of a listing, sized as the whole listing.
+
+    Paginating it gives the page numbers of the full listing, but only the
+    first page can be sliced from it.
+    """
+
+    def __init__(self, items: list, count: int):
+        self.items = items
+        self.total = count
+
+    def __len__(self) -> int:
+        return self.total
+
+    def __getitem__(self, index: Any) -> Any:
+        return self.items[index]
+
+
+def get_facet_library_items(
+    facet_id: int,
+    items: QuerySet,
+    page_number: int = 1,
+) -> PaginatorPageWithElidedPageRange:
+    """Return a page of a facet's library items, serving the first page
+    from the cache."""
+    if page_number != 1:
+        paginated_items = get_paginated_items(
+            items=items,
+            items_per_page=FACET_ITEMS_PER_PAGE,
+            page_number=page_number,
+            cache_count=True,
+        )
+        # Pages past the end fall back to the first page
+        if paginated_items.page.number == page_number:
+            return paginated_items
+
+    first_page = get_or_set_cached(
+        FACET_LISTING_NAMESPACE,
+        [facet_id],
+        lambda: {
+            "items": list(items[:FACET_ITEMS_PER_PAGE]),
+            "count": items.count(),
+        },
+        depends_on=[facet_listing_namespace(facet_id)],
+        timeout=FACET_FIRST_PAGE_CACHE_TIMEOUT,
+    )
+    return get_paginated_items(
+        items=FirstPageItems(**first_page),  # type: ignore[arg-type]
+        items_per_page=FACET_ITEMS_PER_PAGE,
+    )
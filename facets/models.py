@@ -1,36 +1,90 @@
+from django.db.models import Count
 from wagtail.models import Page
 
+from .listing import get_facet_library_items
+
 
 def get_library_items_for_facet(facet_instance, filter_field):
     """Helper to get library items filtered by facet with consistent ordering.
 
     Args:
-        facet_instance: The facet page instance (Audience, Genre, Medium, or TimePeriod)
+        facet_instance: The facet page instance (Audience, Genre, Medium, TimePeriod or Topic)
         filter_field: The field name to filter on (e.g., "item_audience")
 
     Returns:
-        QuerySet of LibraryItem objects filtered by the facet, ordered by publication date,
-        with authors prefetched to avoid N+1 queries.
+        QuerySet of LibraryItem objects filtered by the facet, ordered by publication date
+        (then by ID, so pages are stable), with authors prefetched to avoid N+1 queries.
     """
     # Avoid circular import
     from library.models import LibraryItem
 
     return (
         LibraryItem.objects.live()
+        .defer_streamfields()
         .filter(**{filter_field: facet_instance})
-        .order_by("-publication_date")
+        .order_by("-publication_date", "pk")
         .prefetch_related("authors__author")
     )
 
 
 class ChildPagesMixin:
-    """Mixin that provides a child_pages context variable for index pages."""
+    """Mixin that provides a child_pages context variable for index pages.
+
+    When ``child_library_item_filter`` names the LibraryItem field that
+    refers to the child pages, each child gets a ``library_item_count`` of
+    its live library items, from one grouped query.
+    """
 
     template = "facets/facet_index_page.html"
+    child_library_item_filter: str | None = None
+
+    def get_context(self, request, *args, **kwargs):
+        context = super().get_context(request, *args, **kwargs)
+        child_pages = list(self.get_children().live().order_by("title"))
+
+        if self.child_library_item_filter:
+            # Avoid circular import
+            from library.models import LibraryItem
+
+            field = self.child_library_item_filter
+            counts = dict(
+                LibraryItem.objects.live()
+                .filter(**{f"{field}__in": [child.pk for child in child_pages]})
+                .values_list(field)
+                .annotate(count=Count("pk", distinct=True))
+                .order_by(),
+            )
+            for child in child_pages:
+                child.library_item_count = counts.get(child.pk, 0)
+
+        context["child_pages"] = child_pages
+        context["show_library_item_counts"] = bool(self.child_library_item_filter)
+        return context
+
+
+class FacetLibraryItemsMixin:
+    """Mixin that lists the live library items of a facet page, paginated.
+
+    ``library_item_filter`` is the LibraryItem field that refers to the
+    facet. ``library_items`` holds the items of the current page, and
+    ``paginated_items`` the page with its page range.
+    """
+
+    library_item_filter: str
 
     def get_context(self, request, *args, **kwargs):
         context = super().get_context(request, *args, **kwargs)
-        context["child_pages"] = self.get_children().live().order_by("title")
+
+        _page_raw = request.GET.get("page", "1")
+        page_number = int(_page_raw) if _page_raw.isdigit() else 1
+
+        paginated_items = get_facet_library_items(
+            self.pk,
+            get_library_items_for_facet(self, self.library_item_filter),
+            page_number,
+        )
+        context["paginated_items"] = paginated_items
+        context["library_items"] = paginated_items.page.object_list
         return context
 
 
@@ -50,94 +104,68 @@ class FacetIndexPage(ChildPagesMixin, Page):
 class AudienceIndexPage(ChildPagesMixin, Page):
     parent_page_types = ["FacetIndexPage"]
     subpage_types: list[str] = ["Audience"]
+    child_library_item_filter = "item_audience"
 
     max_count = 1
 
 
-class Audience(Page):
+class Audience(FacetLibraryItemsMixin, Page):
     parent_page_types = ["AudienceIndexPage"]
     subpage_types: list[str] = []
-
-    def get_context(self, request, *args, **kwargs):
-        context = super().get_context(request, *args, **kwargs)
-        context["library_items"] = get_library_items_for_facet(self, "item_audience")
-        return context
+    library_item_filter = "item_audience"
 
 
 class GenreIndexPage(ChildPagesMixin, Page):
     parent_page_types = ["FacetIndexPage"]
     subpage_types: list[str] = ["Genre"]
+    child_library_item_filter = "item_genre"
 
     max_count = 1
 
 
-class Genre(Page):
+class Genre(FacetLibraryItemsMixin, Page):
     parent_page_types = ["GenreIndexPage"]
     subpage_types: list[str] = []
-
-    def get_context(self, request, *args, **kwargs):
-        context = super().get_context(request, *args, **kwargs)
-        context["library_items"] = get_library_items_for_facet(self, "item_genre")
-        return context
+    library_item_filter = "item_genre"
 
 
 class MediumIndexPage(ChildPagesMixin, Page):
     parent_page_types = ["FacetIndexPage"]
     subpage_types: list[str] = ["Medium"]
+    child_library_item_filter = "item_medium"
 
     max_count = 1
 
 
-class Medium(Page):
+class Medium(FacetLibraryItemsMixin, Page):
     parent_page_types = ["MediumIndexPage"]
     subpage_types: list[str] = []
-
-    def get_context(self, request, *args, **kwargs):
-        context = super().get_context(request, *args, **kwargs)
-        context["library_items"] = get_library_items_for_facet(self, "item_medium")
-        return context
+    library_item_filter = "item_medium"
 
 
 class TimePeriodIndexPage(ChildPagesMixin, Page):
     parent_page_types = ["FacetIndexPage"]
     subpage_types: list[str] = ["TimePeriod"]
+    child_library_item_filter = "item_time_period"
 
     max_count = 1
 
 
-class TimePeriod(Page):
+class TimePeriod(FacetLibraryItemsMixin, Page):
     parent_page_types = ["TimePeriodIndexPage"]
     subpage_types: list[str] = []
-
-    def get_context(self, request, *args, **kwargs):
-        context = super().get_context(request, *args, **kwargs)
-        context["library_items"] = get_library_items_for_facet(self, "item_time_period")
-        return context
+    library_item_filter = "item_time_period"
 
 
 class TopicIndexPage(ChildPagesMixin, Page):
     parent_page_types = ["FacetIndexPage"]
     subpage_types: list[str] = ["Topic"]
+    child_library_item_filter = "topics__topic"
 
     max_count = 1
 
 
-class Topic(Page):
+class Topic(FacetLibraryItemsMixin, Page):
     parent_page_types = ["TopicIndexPage"]
     subpage_types: list[str] = []
-
-    def get_context(self, request, *args, **kwargs):
-        # Avoid circular import
-        from library.models import LibraryItem
-
-        context = super().get_context(request, *args, **kwargs)
-
-        # Get live library items matching topic, ordered by publication date
-        context["library_items"] = (
-            LibraryItem.objects.live()
-            .filter(topics__topic=self)
-            .order_by("-publication_date")
-            .prefetch_related("authors__author")
-        )
-
-        return context
+    library_item_filter = "topics__topic"
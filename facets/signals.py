@@ -0,0 +1,60 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from wagtail.signals import page_unpublished
+
+from library.models import LibraryItem, LibraryItemTopic
+
+from .listing import invalidate_facet_listings
+
+# LibraryItem fields that refer to facet pages
+LIBRARY_ITEM_FACET_FIELDS = [
+    f"{field}_id"
+    for field in ("item_audience", "item_genre", "item_medium", "item_time_period")
+]
+
+
+def get_facet_ids(library_item: LibraryItem) -> list[int | None]:
+    """Return the IDs of the facets a library item is listed on."""
+    topic_ids = LibraryItemTopic.objects.filter(
+        library_item_id=library_item.pk,
+    ).values_list("topic_id", flat=True)
+    return [
+        *(getattr(library_item, field) for field in LIBRARY_ITEM_FACET_FIELDS),
+        *topic_ids,
+    ]
+
+
+@receiver(pre_save, sender=LibraryItem)
+def record_previous_facets(sender, instance, **kwargs):
+    """Remember the facets of a library item before it is saved, so the
+    listings of the facets it leaves are invalidated too."""
+    if instance.pk is None:
+        return
+    instance._previous_facet_ids = list(
+        LibraryItem.objects.filter(pk=instance.pk)
+        .values_list(*LIBRARY_ITEM_FACET_FIELDS)
+        .first()
+        or [],
+    )
+
+
+@receiver(post_save, sender=LibraryItem)
+@receiver(post_delete, sender=LibraryItem)
+@receiver(page_unpublished, sender=LibraryItem)
+def invalidate_facet_listings_on_item_change(sender, instance, **kwargs):
+    """Invalidate the listings of the facets of a changed library item.
+
+    Publishing saves the item, so it is covered too.
+    """
+    invalidate_facet_listings(
+        [
+            *get_facet_ids(instance),
+            *getattr(instance, "_previous_facet_ids", []),
+        ],
+    )
+
+
+@receiver(post_save, sender=LibraryItemTopic)
+@receiver(post_delete, sender=LibraryItemTopic)
+def invalidate_topic_listing_on_topic_change(sender, instance, **kwargs):
+    invalidate_facet_listings([instance.topic_id])
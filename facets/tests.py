@@ -1,5 +1,9 @@
+import datetime
+
+from django.core.cache import cache
 from django.test import RequestFactory, TestCase
 
+from facets.listing import FACET_ITEMS_PER_PAGE
 from facets.models import (
     Audience,
     AudienceIndexPage,
@@ -14,7 +18,7 @@ from facets.models import (
     TopicIndexPage,
 )
 from library.factories import LibraryItemFactory
-from library.models import LibraryIndexPage, LibraryItemTopic
+from library.models import LibraryIndexPage, LibraryItem, LibraryItemTopic
 
 from .factories import (
     AudienceFactory,
@@ -353,3 +357,147 @@ class TestTopicIndexPageGetContext(TestCase):
         child_pages = list(context["child_pages"])
         self.assertEqual(len(child_pages), 1)
         self.assertEqual(child_pages[0].specific_class, Topic)
+
+
+class TestFacetLibraryItemPagination(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.factory = RequestFactory()
+        self.audience = AudienceFactory.create()
+        self.other_audience = AudienceFactory.create()
+
+        start = datetime.date(2020, 1, 1)
+        self.library_items = [
+            LibraryItemFactory.create(
+                item_audience=self.audience,
+                publication_date=start + datetime.timedelta(days=day),
+            )
+            for day in range(FACET_ITEMS_PER_PAGE + 2)
+        ]
+        # Newest first
+        self.library_items.reverse()
+
+    def get_context(self, **params):
+        request = self.factory.get("/", params)
+        return self.audience.get_context(request)
+
+    def test_pages_are_ordered_newest_first(self) -> None:
+        first_page = self.get_context()
+        second_page = self.get_context(page="2")
+
+        self.assertEqual(
+            [item.pk for item in first_page["library_items"]],
+            [item.pk for item in self.library_items[:FACET_ITEMS_PER_PAGE]],
+        )
+        self.assertEqual(
+            [item.pk for item in second_page["library_items"]],
+            [item.pk for item in self.library_items[FACET_ITEMS_PER_PAGE:]],
+        )
+        self.assertEqual(first_page["paginated_items"].page.paginator.num_pages, 2)
+        self.assertEqual(second_page["paginated_items"].page.number, 2)
+
+    def test_out_of_range_page_shows_first_page(self) -> None:
+        context = self.get_context(page="9")
+
+        self.assertEqual(context["paginated_items"].page.number, 1)
+        self.assertEqual(len(context["library_items"]), FACET_ITEMS_PER_PAGE)
+
+    def test_first_page_is_cached(self) -> None:
+        self.get_context()
+
+        request = self.factory.get("/")
+        with self.assertNumQueries(0):
+            context = self.audience.get_context(request)
+            library_items = list(context["library_items"])
+
+        self.assertEqual(len(library_items), FACET_ITEMS_PER_PAGE)
+        self.assertEqual(
+            context["paginated_items"].page.paginator.count,
+            len(self.library_items),
+        )
+
+    def test_publishing_an_item_invalidates_first_page(self) -> None:
+        self.get_context()
+
+        new_item = LibraryItemFactory.create(
+            item_audience=self.audience,
+            publication_date=datetime.date(2021, 1, 1),
+        )
+        context = self.get_context()
+
+        self.assertEqual(context["library_items"][0].pk, new_item.pk)
+
+    def test_moving_an_item_invalidates_both_facets(self) -> None:
+        self.get_context()
+        self.other_audience.get_context(self.factory.get("/"))
+
+        moved_item = LibraryItem.objects.get(pk=self.library_items[0].pk)
+        moved_item.item_audience = self.other_audience
+        moved_item.save_revision().publish()
+
+        context = self.get_context()
+        other_context = self.other_audience.get_context(self.factory.get("/"))
+
+        self.assertNotIn(moved_item.pk, [item.pk for item in context["library_items"]])
+        self.assertEqual(
+            [item.pk for item in other_context["library_items"]],
+            [moved_item.pk],
+        )
+
+    def test_adding_a_topic_invalidates_topic_page(self) -> None:
+        topic = TopicFactory.create()
+        request = self.factory.get("/")
+        self.assertEqual(list(topic.get_context(request)["library_items"]), [])
+
+        LibraryItemTopic.objects.create(
+            topic=topic,
+            library_item=self.library_items[0],
+        )
+
+        self.assertEqual(
+            [item.pk for item in topic.get_context(request)["library_items"]],
+            [self.library_items[0].pk],
+        )
+
+
+class TestChildPageLibraryItemCounts(TestCase):
+    def setUp(self) -> None:
+        self.factory = RequestFactory()
+
+    def test_audience_index_counts_live_items_per_child(self) -> None:
+        audience = AudienceFactory.create(title="A audience")
+        empty_audience = AudienceFactory.create(title="B audience")
+        LibraryItemFactory.create_batch(2, item_audience=audience)
+        LibraryItemFactory.create(item_audience=audience, live=False)
+
+        audience_index_page = AudienceIndexPage.objects.get()
+        request = self.factory.get("/")
+        # The children, and their counts in one grouped query
+        with self.assertNumQueries(2):
+            context = audience_index_page.get_context(request)
+
+        self.assertTrue(context["show_library_item_counts"])
+        self.assertEqual(
+            [(child.pk, child.library_item_count) for child in context["child_pages"]],
+            [(audience.pk, 2), (empty_audience.pk, 0)],
+        )
+
+    def test_topic_index_counts_items_through_topics(self) -> None:
+        topic = TopicFactory.create()
+        for library_item in LibraryItemFactory.create_batch(3):
+            LibraryItemTopic.objects.create(topic=topic, library_item=library_item)
+
+        request = self.factory.get("/")
+        context = TopicIndexPage.objects.get().get_context(request)
+
+        self.assertEqual(
+            [child.library_item_count for child in context["child_pages"]],
+            [3],
+        )
+
+    def test_facet_index_page_has_no_counts(self) -> None:
+        facet_index_page = FacetIndexPageFactory.create()
+        request = self.factory.get("/")
+        context = facet_index_page.get_context(request)
+
+        self.assertFalse(context["show_library_item_counts"])
@@ -0,0 +1,301 @@
+"""An in-memory facet index of the live library items.
+
+The library index page filters items by audience, genre, medium, time
+period, topic, author and title. Rather than joining a table per selected
+facet on every request, the FacetIndex lists the IDs of the live items in
+display order, newest first, and keeps a bitset per facet value whose bit
+``i`` is set when the ``i``-th item has that value. Bitsets are Python
+ints, so intersecting facets is a bitwise AND and counting the items of an
+option is int.bit_count(), both in memory. The title filter is a single
+query on the trigram-indexed titles (see common.title_search), whose
+matches are ranked by similarity where pg_trgm is available. The database
+only fetches the items on the current page, by ID.
+
+The index is built in a handful of queries and cached (see core.cache),
+depending on the namespaces of library items, their authors and topics,
+the facet pages and the author pages, so publishing or editing any of them
+rebuilds it. Each process also keeps the index it last used, and reuses it
+for as long as its cache key is current, to skip unpickling it.
+"""
+
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from functools import cached_property
+from itertools import islice
+
+from django.apps import apps
+
+from common.title_search import filter_titles, trigram_search_available
+from core.cache import get_cache, make_cache_key, model_namespace, record_lookup
+
+FACET_INDEX_NAMESPACE = "library:facet_index"
+FACET_INDEX_CACHE_TIMEOUT = 60 * 60 * 24
+
+# Querystring keys of the facets, and the facet models listing their options
+FACET_MODELS = {
+    "item_audience__title": "facets.Audience",
+    "item_genre__title": "facets.Genre",
+    "item_medium__title": "facets.Medium",
+    "item_time_period__title": "facets.TimePeriod",
+    "topics__topic__title": "facets.Topic",
+}
+AUTHOR_FACET = "authors__author__title"
+TITLE_FILTER = "title__icontains"
+
+# Page types that can be chosen as library item authors
+AUTHOR_MODELS = ("contact.Person", "contact.Meeting", "contact.Organization")
+
+_local_index: tuple[str, "FacetIndex"] | None = None
+
+
+def positions_to_bits(positions: Iterable[int], size: int) -> int:
+    """Return a bitset with the bits at the given positions set."""
+    buffer = bytearray((size + 7) // 8)
+    for position in positions:
+        buffer[position >> 3] |= 1 << (position & 7)
+    return int.from_bytes(buffer, "little")
+
+
+def bit_positions(bits: int) -> Iterator[int]:
+    """Yield the positions of the set bits, lowest first."""
+    # The binary digits, least significant first
+    digits = bin(bits)[:1:-1]
+    position = digits.find("1")
+    while position != -1:
+        yield position
+        position = digits.find("1", position + 1)
+
+
+@dataclass
+class FacetOption:
+    """An option of a facet with the number of items it would show."""
+
+    title: str
+    count: int
+
+    def __str__(self) -> str:
+        return self.title
+
+
+@dataclass
+class FacetIndex:
+    # Live item IDs, in display order
+    item_ids: list[int] = field(default_factory=list)
+    # Facet key -> option title -> bitset of the items with that option
+    bitsets: dict[str, dict[str, int]] = field(default_factory=dict)
+    # Facet key -> option titles, in the order they are listed
+    options: dict[str, list[str]] = field(default_factory=dict)
+
+    @property
+    def all_items(self) -> int:
+        return (1 << len(self.item_ids)) - 1
+
+    @cached_property
+    def item_positions(self) -> dict[int, int]:
+        return {item_id: position for position, item_id in enumerate(self.item_ids)}
+
+    def get_title_positions(self, value: str) -> list[int]:
+        """Return the positions of the items whose titles contain the value,
+        most similar first where the database can rank them."""
+        from .models import LibraryItem
+
+        item_ids = filter_titles(
+            LibraryItem.objects.live(),
+            {"title": value},
+        ).values_list("pk", flat=True)
+        item_positions = self.item_positions
+        return [
+            item_positions[item_id] for item_id in item_ids if item_id in item_positions
+        ]
+
+    def select(self, facets: dict[str, str]) -> "FacetSelection":
+        """Return the selection of the items matching the facets."""
+        filters = {}
+        ranking = None
+        for key, value in facets.items():
+            if key == TITLE_FILTER:
+                positions = self.get_title_positions(value)
+                filters[key] = positions_to_bits(positions, len(self.item_ids))
+                if trigram_search_available():
+                    ranking = positions
+            else:
+                filters[key] = self.bitsets.get(key, {}).get(value, 0)
+        return FacetSelection(self, filters, ranking)
+
+
+@dataclass
+class FacetSelection:
+    """The bitsets of the selected facets of a FacetIndex."""
+
+    index: FacetIndex
+    # Facet key -> bitset of the items matching the selected value
+    filters: dict[str, int]
+    # Item positions in the order of the title filter's ranking, if any
+    ranking: list[int] | None = None
+
+    def match(self, exclude: str | None = None) -> int:
+        """Return the bitset of the items matching all facets but one."""
+        bits = self.index.all_items
+        for key, filter_bits in self.filters.items():
+            if key != exclude:
+                bits &= filter_bits
+        return bits
+
+    def get_options(self) -> dict[str, list[FacetOption]]:
+        """Return the options of each facet with their item counts.
+
+        An option's count is the number of items shown if it were selected
+        along with the other selected facets.
+        """
+        options = {}
+        for key, titles in self.index.options.items():
+            bits = self.match(exclude=key)
+            option_bits = self.index.bitsets.get(key, {})
+            options[key] = [
+                FacetOption(title, (bits & option_bits.get(title, 0)).bit_count())
+                for title in titles
+            ]
+        return options
+
+    def get_results(self) -> "FacetResults":
+        return FacetResults(self.index, self.match(), self.ranking)
+
+
+class FacetResults:
+    """The items matching a set of facets, as a sequence for a Paginator.
+
+    Its length is known from the bitset, and slicing it fetches only the
+    sliced items from the database.
+    """
+
+    def __init__(
+        self,
+        index: FacetIndex,
+        bits: int,
+        ranking: list[int] | None = None,
+    ):
+        self.index = index
+        self.bits = bits
+        self.ranking = ranking
+
+    def __len__(self) -> int:
+        return self.bits.bit_count()
+
+    def get_positions(self) -> Iterator[int]:
+        if self.ranking is None:
+            return bit_positions(self.bits)
+
+        # The binary digits, least significant first
+        digits = bin(self.bits)[:1:-1]
+        return (
+            position
+            for position in self.ranking
+            if position < len(digits) and digits[position] == "1"
+        )
+
+    def get_ids(self, start: int = 0, stop: int | None = None) -> list[int]:
+        return [
+            self.index.item_ids[position]
+            for position in islice(self.get_positions(), start, stop)
+        ]
+
+    def __getitem__(self, key: slice) -> list:
+        from .models import LibraryItem
+
+        if not isinstance(key, slice):
+            raise TypeError("FacetResults only supports slicing")
+
+        item_ids = self.get_ids(key.start or 0, key.stop)
+        items = LibraryItem.objects.filter(pk__in=item_ids).prefetch_related(
+            "authors__author",
+        )
+        items_by_id = {item.pk: item for item in items}
+        return [items_by_id[item_id] for item_id in item_ids if item_id in items_by_id]
+
+
+def build_facet_index() -> FacetIndex:
+    """Build the facet index of the live library items."""
+    from .models import LibraryItem, LibraryItemAuthor, LibraryItemTopic
+
+    index = FacetIndex()
+    # Facet key -> option title -> positions of the items with that option
+    positions: dict[str, dict[str, list[int]]] = defaultdict(
+        lambda: defaultdict(list),
+    )
+    item_facets = [key for key in FACET_MODELS if key.startswith("item_")]
+
+    # Newest first, with undated items first as PostgreSQL sorts NULLs
+    rows = (
+        LibraryItem.objects.live()
+        .order_by("-publication_date", "pk")
+        .values_list("pk", *item_facets)
+    )
+    for position, (item_id, *facet_titles) in enumerate(rows):
+        index.item_ids.append(item_id)
+        for key, facet_title in zip(item_facets, facet_titles, strict=True):
+            if facet_title is not None:
+                positions[key][facet_title].append(position)
+
+    item_positions = index.item_positions
+    for key, related_items, title_field in [
+        ("topics__topic__title", LibraryItemTopic.objects, "topic__title"),
+        (AUTHOR_FACET, LibraryItemAuthor.objects, "author__title"),
+    ]:
+        for item_id, related_title in related_items.filter(
+            library_item__live=True,
+        ).values_list("library_item_id", title_field):
+            if related_title is not None and item_id in item_positions:
+                positions[key][related_title].append(item_positions[item_id])
+
+    size = len(index.item_ids)
+    index.bitsets = {
+        key: {
+            title: positions_to_bits(title_positions, size)
+            for title, title_positions in options.items()
+        }
+        for key, options in positions.items()
+    }
+
+    for key, model_label in FACET_MODELS.items():
+        model = apps.get_model(model_label)
+        index.options[key] = list(model.objects.values_list("title", flat=True))
+    index.options[AUTHOR_FACET] = sorted(positions[AUTHOR_FACET])
+
+    return index
+
+
+def get_facet_index_dependencies() -> list[str]:
+    labels = [
+        "library.LibraryItem",
+        "library.LibraryItemAuthor",
+        "library.LibraryItemTopic",
+        *FACET_MODELS.values(),
+        *AUTHOR_MODELS,
+    ]
+    return [model_namespace(apps.get_model(label)) for label in labels]
+
+
+def get_facet_index() -> FacetIndex:
+    """Return the current facet index, building it if needed."""
+    global _local_index
+
+    key = make_cache_key(
+        FACET_INDEX_NAMESPACE,
+        [],
+        depends_on=get_facet_index_dependencies(),
+    )
+    local_index = _local_index
+    if local_index is not None and local_index[0] == key:
+        record_lookup(FACET_INDEX_NAMESPACE, hit=True)
+        return local_index[1]
+
+    cache = get_cache()
+    index = cache.get(key)
+    record_lookup(FACET_INDEX_NAMESPACE, hit=index is not None)
+    if index is None:
+        index = build_facet_index()
+        cache.set(key, index, FACET_INDEX_CACHE_TIMEOUT)
+
+    _local_index = (key, index)
+    return index
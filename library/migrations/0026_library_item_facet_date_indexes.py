@@ -0,0 +1,46 @@
+# Generated by Django 6.0.4 on 2026-10-18 15:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("facets", "0001_initial"),
+        ("library", "0025_alter_libraryitem_body"),
+        (
+            "taggit",
+            "0006_rename_taggeditem_content_type_object_id_taggit_tagg_content_8fc721_idx",
+        ),
+        ("wagtailcore", "0096_referenceindex_referenceindex_source_object_and_more"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="libraryitem",
+            index=models.Index(
+                fields=["item_audience", "-publication_date", "page_ptr"],
+                name="library_item_audience_date",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="libraryitem",
+            index=models.Index(
+                fields=["item_genre", "-publication_date", "page_ptr"],
+                name="library_item_genre_date",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="libraryitem",
+            index=models.Index(
+                fields=["item_medium", "-publication_date", "page_ptr"],
+                name="library_item_medium_date",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="libraryitem",
+            index=models.Index(
+                fields=["item_time_period", "-publication_date", "page_ptr"],
+                name="library_item_period_date",
+            ),
+        ),
+    ]
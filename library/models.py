@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models import Prefetch
 from django.http import HttpRequest
 from modelcluster.contrib.taggit import ClusterTaggableManager  # type: ignore
 from modelcluster.fields import ParentalKey  # type: ignore
@@ -13,9 +14,12 @@ from wagtail.fields import RichTextField, StreamField
 from wagtail.models import Orderable, Page
 from wagtail.search import index
 
-from common.models import DrupalFields
+from common.models import (
+    DrupalFields,
+    ServePrefetchMixin,
+    ServePrefetchRouteMixin,
+)
 from core.constants import COMMON_STREAMFIELD_BLOCKS
-from facets.models import Audience, Genre, Medium, TimePeriod, Topic
 from library.helpers import create_querystring_from_facets, filter_querystring_facets
 from pagination.helpers import get_paginated_items
 
@@ -28,13 +32,15 @@ class LibraryItemTag(TaggedItemBase):
     )
 
 
-class LibraryItem(DrupalFields, Page):  # type: ignore
+class LibraryItem(ServePrefetchMixin, DrupalFields, Page):  # type: ignore
     ITEM_SELECT_RELATED_FIELDS = (
         "item_audience",
         "item_genre",
         "item_medium",
         "item_time_period",
     )
+    serve_select_related = ITEM_SELECT_RELATED_FIELDS
+    serve_defer = ("drupal_body_migrated",)
 
     publication_date = models.DateField("Publication date", null=True, blank=True)
     publication_date_is_approximate = models.BooleanField(
@@ -90,41 +96,60 @@ class LibraryItem(DrupalFields, Page):  # type: ignore
             .prefetch_related(*related_prefetch)
         )
 
-    def get_context(self, request, *args, **kwargs):
-        """Override get_context to prefetch author and topic relationships.
-
-        Prevents N+1 queries when template loops through authors and topics
-        by prefetching related pages in a single query.
-        """
-        from django.db.models import Prefetch
+    def get_page_cache_purge_pages(self) -> list[int]:
+        """Return the IDs of the author and facet pages, which list the item."""
+        return [
+            *self.authors.values_list("author_id", flat=True),
+            *self.topics.values_list("topic_id", flat=True),
+            *(
+                facet_id
+                for facet_id in (
+                    self.item_audience_id,
+                    self.item_genre_id,
+                    self.item_medium_id,
+                    self.item_time_period_id,
+                )
+                if facet_id is not None
+            ),
+        ]
 
-        context = super().get_context(request, *args, **kwargs)
+    @classmethod
+    def get_serve_prefetch_related(cls):
+        """Prefetch authors and topics with their pages for the template."""
+        return [
+            Prefetch(
+                "authors",
+                queryset=LibraryItemAuthor.objects.select_related("author"),
+            ),
+            Prefetch(
+                "topics",
+                queryset=LibraryItemTopic.objects.select_related("topic"),
+            ),
+            "tags",
+        ]
 
-        # Reload instance with prefetches to avoid N+1 queries in template
-        self_with_prefetch = (
-            self.__class__.objects.filter(pk=self.pk)
-            .select_related(*self.ITEM_SELECT_RELATED_FIELDS)
-            .prefetch_related(
-                Prefetch(
-                    "authors",
-                    queryset=LibraryItemAuthor.objects.select_related("author"),
-                ),
-                Prefetch(
-                    "topics",
-                    queryset=LibraryItemTopic.objects.select_related("topic"),
-                ),
-                "tags",
-            )
-            .first()
+    class Meta:
+        # Facet pages list their items newest first (see
+        # facets.models.get_library_items_for_facet)
+        indexes = (
+            models.Index(
+                fields=["item_audience", "-publication_date", "page_ptr"],
+                name="library_item_audience_date",
+            ),
+            models.Index(
+                fields=["item_genre", "-publication_date", "page_ptr"],
+                name="library_item_genre_date",
+            ),
+            models.Index(
+                fields=["item_medium", "-publication_date", "page_ptr"],
+                name="library_item_medium_date",
+            ),
+            models.Index(
+                fields=["item_time_period", "-publication_date", "page_ptr"],
+                name="library_item_period_date",
+            ),
         )
 
-        # Replace the page instance in context with the prefetched version
-        # This avoids touching Django's internal _prefetched_objects_cache
-        if self_with_prefetch:
-            context["page"] = self_with_prefetch
-
-        return context
-
     content_panels = Page.content_panels + [
         InlinePanel(
             "authors",
@@ -248,7 +273,7 @@ class LibraryItemTopic(Orderable):
     ]
 
 
-class LibraryIndexPage(Page):
+class LibraryIndexPage(ServePrefetchRouteMixin, Page):
     intro = RichTextField(blank=True)
 
     content_panels = Page.content_panels + [FieldPanel("intro")]
@@ -267,21 +292,9 @@ class LibraryIndexPage(Page):
         *args: tuple,
         **kwargs: dict,
     ) -> dict:
-        context = super().get_context(request)
-
-        # Prepare a list of authors
-        library_item_authors = LibraryItemAuthor.objects.all()
-        authors = Page.objects.filter(
-            library_items_authored__in=library_item_authors,
-        ).distinct()
+        from .facet_index import get_facet_index
 
-        # Populate faceted search fields
-        context["audiences"] = Audience.objects.all()
-        context["genres"] = Genre.objects.all()
-        context["mediums"] = Medium.objects.all()
-        context["time_periods"] = TimePeriod.objects.all()
-        context["topics"] = Topic.objects.all()
-        context["authors"] = authors
+        context = super().get_context(request)
 
         query = request.GET.dict()
 
@@ -289,23 +302,31 @@ class LibraryIndexPage(Page):
             query=query,
         )
 
-        # Filter live (not draft) library items using facets from request
-        # reverse sort by publication date
-        library_items = (
-            LibraryItem.objects.live()
-            .filter(  # type: ignore
-                **facets,
-            )
-            .order_by("-publication_date")
-            .prefetch_related("authors__author")
-        )
+        facet_selection = get_facet_index().select(facets)
+
+        # Populate faceted search fields, with the number of items each
+        # option would show
+        facet_options = facet_selection.get_options()
+        context["audiences"] = facet_options["item_audience__title"]
+        context["genres"] = facet_options["item_genre__title"]
+        context["mediums"] = facet_options["item_medium__title"]
+        context["time_periods"] = facet_options["item_time_period__title"]
+        context["topics"] = facet_options["topics__topic__title"]
+        context["authors"] = facet_options["authors__author__title"]
+
+        # Live library items matching the facets from the request, newest
+        # first. Only the items on the requested page are fetched.
+        library_items = facet_selection.get_results()
         _page_raw = request.GET.get("page", "1")
         page_number = int(_page_raw) if _page_raw.isdigit() else 1
         items_per_page = 10
 
-        # Provide filtered, paginated library items
+        # Provide filtered, paginated library items. FacetResults counts
+        # the bitset of the cached facet index, so the count costs no query
+        # and needs no count cache, and slicing by offset skips through the
+        # bitset in memory, so there is no keyset to page by.
         context["paginated_items"] = get_paginated_items(
-            items=library_items,
+            items=library_items,  # type: ignore[arg-type]
             items_per_page=items_per_page,
             page_number=page_number,
         )
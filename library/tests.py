@@ -1,8 +1,15 @@
+import datetime
 import random
+import re
 from unittest.mock import Mock, patch
 
+from django.core.cache import cache
+from django.db import connection
 from django.test import RequestFactory, SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
+from wagtail.models import Site
 
+from contact.factories import PersonFactory
 from facets.factories import (
     AudienceFactory,
     GenreFactory,
@@ -10,14 +17,24 @@ from facets.factories import (
     TimePeriodFactory,
     TopicFactory,
 )
-from contact.factories import PersonFactory
 from home.models import HomePage
+from library.facet_index import (
+    FacetOption,
+    bit_positions,
+    get_facet_index,
+    positions_to_bits,
+)
 from library.helpers import (
     QUERYSTRING_FACETS,
     create_querystring_from_facets,
     filter_querystring_facets,
 )
-from library.models import LibraryIndexPage, LibraryItemAuthor, LibraryItemTopic
+from library.models import (
+    LibraryIndexPage,
+    LibraryItem,
+    LibraryItemAuthor,
+    LibraryItemTopic,
+)
 
 from .factories import (
     LibraryIndexPageFactory,
@@ -137,6 +154,134 @@ class TestLibraryIndexPage(TestCase):
         mock_create_querystring.assert_called_once()
 
 
+class TestBitsets(SimpleTestCase):
+    def test_positions_round_trip(self) -> None:
+        positions = [0, 3, 8, 9, 70]
+
+        bits = positions_to_bits(positions, 71)
+
+        self.assertEqual(bits.bit_count(), len(positions))
+        self.assertEqual(list(bit_positions(bits)), positions)
+
+    def test_empty_bitset(self) -> None:
+        self.assertEqual(positions_to_bits([], 0), 0)
+        self.assertEqual(list(bit_positions(0)), [])
+
+
+class TestLibraryFacetIndex(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.factory = RequestFactory()
+        self.library_index_page = LibraryIndexPageFactory.create()
+        self.books = GenreFactory.create(title="Books")
+        self.pamphlets = GenreFactory.create(title="Pamphlets")
+        self.adults = AudienceFactory.create(title="Adults")
+        self.peace = TopicFactory.create(title="Peace")
+        self.author = PersonFactory.create(given_name="Ann", family_name="Smith")
+
+        self.items = []
+        for day, genre, audience in [
+            (1, self.books, self.adults),
+            (2, self.books, None),
+            (3, self.pamphlets, self.adults),
+        ]:
+            self.items.append(
+                LibraryItemFactory.create(
+                    title=f"Item {day}",
+                    publication_date=datetime.date(2020, 1, day),
+                    item_genre=genre,
+                    item_audience=audience,
+                ),
+            )
+        LibraryItemTopic.objects.create(library_item=self.items[0], topic=self.peace)
+        LibraryItemAuthor.objects.create(
+            library_item=self.items[2],
+            author=self.author,
+        )
+
+    def get_context(self, **query) -> dict:
+        return self.library_index_page.get_context(self.factory.get("/", query))
+
+    def test_items_are_listed_newest_first(self) -> None:
+        context = self.get_context()
+
+        self.assertEqual(
+            list(context["paginated_items"].page),
+            list(reversed(self.items)),
+        )
+
+    def test_facets_are_intersected(self) -> None:
+        context = self.get_context(
+            item_genre__title="Books",
+            item_audience__title="Adults",
+        )
+
+        self.assertEqual(list(context["paginated_items"].page), [self.items[0]])
+
+    def test_topic_author_and_title_filters(self) -> None:
+        self.assertEqual(
+            list(
+                self.get_context(topics__topic__title="Peace")["paginated_items"].page,
+            ),
+            [self.items[0]],
+        )
+        self.assertEqual(
+            list(
+                self.get_context(authors__author__title=self.author.title)[
+                    "paginated_items"
+                ].page,
+            ),
+            [self.items[2]],
+        )
+        self.assertEqual(
+            list(self.get_context(title__icontains="ITEM 2")["paginated_items"].page),
+            [self.items[1]],
+        )
+
+    def test_unknown_facet_value_matches_nothing(self) -> None:
+        context = self.get_context(item_genre__title="Unknown")
+
+        self.assertEqual(list(context["paginated_items"].page), [])
+
+    def test_option_counts(self) -> None:
+        context = self.get_context(item_audience__title="Adults")
+
+        # Genre counts apply the selected audience
+        self.assertEqual(
+            context["genres"],
+            [FacetOption("Books", 1), FacetOption("Pamphlets", 1)],
+        )
+        # A facet's own selection does not narrow its options
+        self.assertEqual(context["audiences"], [FacetOption("Adults", 2)])
+        self.assertEqual(context["authors"], [FacetOption(self.author.title, 1)])
+
+    def test_only_the_current_page_is_fetched(self) -> None:
+        get_facet_index()
+        request = self.factory.get("/", {"item_genre__title": "Books"})
+
+        # The library item page and its authors
+        with self.assertNumQueries(2):
+            context = self.library_index_page.get_context(request)
+            page_items = list(context["paginated_items"].page)
+
+        self.assertEqual(page_items, [self.items[1], self.items[0]])
+        paginator = context["paginated_items"].page.paginator
+        # Counted from the facet index bitset
+        with self.assertNumQueries(0):
+            self.assertEqual(paginator.count, 2)
+
+    def test_index_is_rebuilt_when_items_change(self) -> None:
+        index = get_facet_index()
+        self.assertIs(get_facet_index(), index)
+
+        self.items[1].unpublish()
+
+        self.assertEqual(
+            list(self.get_context(item_genre__title="Books")["paginated_items"].page),
+            [self.items[0]],
+        )
+
+
 class TestLibraryItemGetContext(TestCase):
     def setUp(self) -> None:
         self.factory = RequestFactory()
@@ -186,3 +331,114 @@ class TestLibraryItemGetContext(TestCase):
             [topic.pk for topic in context_topics],
             [topic.pk for topic in topics],
         )
+
+    def test_get_context_uses_served_instance(self) -> None:
+        """The page is not reloaded; its relations are loaded onto it."""
+        genre = GenreFactory.create()
+        self.library_item.item_genre = genre
+        self.library_item.save()
+        library_item = LibraryItem.objects.get(pk=self.library_item.pk)
+
+        context = library_item.get_context(self.factory.get("/"))
+
+        self.assertIs(context["page"], library_item)
+        with self.assertNumQueries(0):
+            self.assertEqual(library_item.item_genre, genre)
+            self.assertIsNone(library_item.item_audience)
+
+        # Relations loaded once are not fetched again
+        with self.assertNumQueries(0):
+            library_item.prefetch_for_serve()
+
+    def test_served_item_is_loaded_once(self) -> None:
+        """Routing loads the item with its relations, so serving it does not
+        reload it."""
+        Site.objects.all().update(root_page=HomePage.objects.get())
+        # The site root was changed without signals, and the root paths
+        # cached while serving must not leak into other tests
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.library_item.item_genre = GenreFactory.create()
+        self.library_item.save()
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.library_item.url)
+
+        self.assertEqual(response.status_code, 200)
+        item_loads = [
+            query["sql"]
+            for query in queries.captured_queries
+            if re.search(r'FROM "library_libraryitem"\s', query["sql"])
+        ]
+        self.assertEqual(len(item_loads), 1)
+        self.assertIn('"facets_genre"', item_loads[0])
+        self.assertIn(
+            "drupal_body_migrated",
+            response.context["page"].get_deferred_fields(),
+        )
+
+    def test_get_context_on_preview_of_new_item(self) -> None:
+        """Previews of unsaved items have no rows to load relations from."""
+        genre = GenreFactory.create()
+        author = PersonFactory.create()
+        library_item = LibraryItem(
+            title="New item",
+            item_genre=genre,
+            authors=[LibraryItemAuthor(author=author)],
+        )
+
+        context = library_item.get_context(self.factory.get("/"))
+
+        self.assertIs(context["page"], library_item)
+        self.assertEqual(library_item.item_genre, genre)
+        self.assertEqual(
+            [item_author.author for item_author in library_item.authors.all()],
+            [author],
+        )
+
+    def test_get_context_on_edit_preview_keeps_unsaved_relations(self) -> None:
+        """Relations changed in the edit form are not replaced by saved rows."""
+        saved_author, new_author = PersonFactory.create_batch(2)
+        LibraryItemAuthor.objects.create(
+            library_item=self.library_item,
+            author=saved_author,
+        )
+        genre = GenreFactory.create()
+        library_item = LibraryItem.objects.get(pk=self.library_item.pk)
+        library_item.authors = [LibraryItemAuthor(author=new_author)]
+        library_item.item_genre_id = genre.pk
+
+        library_item.get_context(self.factory.get("/"))
+
+        self.assertEqual(
+            [item_author.author for item_author in library_item.authors.all()],
+            [new_author],
+        )
+        self.assertEqual(library_item.item_genre, genre)
+
+    def test_get_page_cache_purge_pages(self) -> None:
+        """Test that the author pages are purged along with the item."""
+        authors = PersonFactory.create_batch(2)
+        for author in authors:
+            LibraryItemAuthor.objects.create(
+                library_item=self.library_item,
+                author=author,
+            )
+
+        self.assertCountEqual(
+            self.library_item.get_page_cache_purge_pages(),
+            [author.pk for author in authors],
+        )
+
+    def test_get_page_cache_purge_pages_includes_facets(self) -> None:
+        """Test that the facet pages listing the item are purged too."""
+        audience = AudienceFactory.create()
+        topic = TopicFactory.create()
+        self.library_item.item_audience = audience
+        self.library_item.save()
+        LibraryItemTopic.objects.create(library_item=self.library_item, topic=topic)
+
+        self.assertCountEqual(
+            self.library_item.get_page_cache_purge_pages(),
+            [audience.pk, topic.pk],
+        )
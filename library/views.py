@@ -5,14 +5,9 @@ from wagtail.admin.ui.tables.pages import BulkActionsColumn, PageTitleColumn
 from wagtail.admin.viewsets.base import ViewSetGroup
 from wagtail.admin.viewsets.pages import PageListingViewSet
 
-from .models import (
-    Audience,
-    Genre,
-    Medium,
-    TimePeriod,
-    Topic,
-    LibraryItem,
-)
+from facets.models import Audience, Genre, Medium, TimePeriod, Topic
+
+from .models import LibraryItem
 
 
 class AudienceViewSet(PageListingViewSet):
@@ -0,0 +1,91 @@
+"""Partitioning of magazine issues into recent and archive issues.
+
+Issues become public access, and move from the recent issues to the archive
+on the magazine index page, MAGAZINE_ARCHIVE_THRESHOLD_DAYS after their
+publication date. get_archive_threshold_date() computes that cutoff from
+the current local date on every call, so long-running processes move
+issues to the archive on the right day without being restarted.
+
+The recent issues and the years of the archive issues only change when the
+cutoff moves, once a day, or when an issue changes. They are cached under a
+key that includes the cutoff date and depend on the MagazineIssue namespace
+(see core.cache), so a new day or a saved issue starts a new entry.
+"""
+
+import datetime
+
+from django.utils import timezone
+
+from core.cache import get_or_set_cached, model_namespace
+
+MAGAZINE_ARCHIVE_THRESHOLD_DAYS = 180
+
+MAGAZINE_ARCHIVE_NAMESPACE = "magazine:archive"
+# Entries are keyed by date, so they only need to outlive their day
+MAGAZINE_ARCHIVE_CACHE_TIMEOUT = 60 * 60 * 24
+
+
+def get_archive_threshold_date(
+    today: datetime.date | None = None,
+) -> datetime.date:
+    """Return the publication date before which issues are archived."""
+    if today is None:
+        today = timezone.localdate()
+    return today - datetime.timedelta(days=MAGAZINE_ARCHIVE_THRESHOLD_DAYS)
+
+
+def is_archived(publication_date: datetime.date) -> bool:
+    """Return whether an issue published on the date is public access."""
+    return publication_date < get_archive_threshold_date()
+
+
+def _get_cached_archive_data(name: str, compute, threshold: datetime.date):
+    from .models import MagazineIssue
+
+    return get_or_set_cached(
+        MAGAZINE_ARCHIVE_NAMESPACE,
+        [name, threshold.isoformat()],
+        compute,
+        depends_on=[model_namespace(MagazineIssue)],
+        timeout=MAGAZINE_ARCHIVE_CACHE_TIMEOUT,
+    )
+
+
+def get_recent_issues(threshold: datetime.date | None = None) -> list:
+    """Return the live issues published on or after the threshold date,
+    newest first, with their cover images."""
+    from .models import MagazineIssue
+
+    if threshold is None:
+        threshold = get_archive_threshold_date()
+
+    return _get_cached_archive_data(
+        "recent_issues",
+        lambda: list(
+            MagazineIssue.objects.live()
+            .filter(publication_date__gte=threshold)
+            .select_related("cover_image")
+            .order_by("-publication_date"),
+        ),
+        threshold,
+    )
+
+
+def get_archive_years(threshold: datetime.date | None = None) -> list[int]:
+    """Return the years of the live issues published before the threshold
+    date, in ascending order."""
+    from .models import MagazineIssue
+
+    if threshold is None:
+        threshold = get_archive_threshold_date()
+
+    return _get_cached_archive_data(
+        "archive_years",
+        lambda: [
+            date.year
+            for date in MagazineIssue.objects.live()
+            .filter(publication_date__lt=threshold)
+            .dates("publication_date", "year", order="ASC")
+        ],
+        threshold,
+    )
@@ -0,0 +1,27 @@
+# Generated by Django 6.0.4 on 2026-10-18 14:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("magazine", "0036_alter_magazineissue_cover_image"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="magazinearticle",
+            name="issue_number",
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="magazinearticle",
+            name="issue_publication_date",
+            field=models.DateField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="magazinearticle",
+            name="issue_title",
+            field=models.CharField(blank=True, default="", max_length=255),
+        ),
+    ]
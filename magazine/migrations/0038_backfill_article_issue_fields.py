@@ -0,0 +1,39 @@
+# Generated by Django 6.0.4 on 2026-10-18 14:25
+
+from django.db import migrations
+
+
+def backfill_article_issue_fields(apps, schema_editor):
+    """Copy the title, number and publication date of each issue to its articles."""
+    MagazineIssue = apps.get_model("magazine", "MagazineIssue")
+    MagazineArticle = apps.get_model("magazine", "MagazineArticle")
+
+    issues = MagazineIssue.objects.only(
+        "path",
+        "depth",
+        "title",
+        "issue_number",
+        "publication_date",
+    )
+    for issue in issues.iterator():
+        MagazineArticle.objects.filter(
+            path__startswith=issue.path,
+            depth=issue.depth + 1,
+        ).update(
+            issue_title=issue.title,
+            issue_number=issue.issue_number,
+            issue_publication_date=issue.publication_date,
+        )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("magazine", "0037_magazinearticle_issue_fields"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            backfill_article_issue_fields,
+            migrations.RunPython.noop,
+        ),
+    ]
@@ -22,14 +22,16 @@ from wagtail.search import index
 
 from common.models import DrupalFields
 from core.constants import COMMON_STREAMFIELD_BLOCKS
+from core.page_registry import get_page_registry
 from pagination.helpers import get_paginated_items
 
-from .panels import NestedInlinePanel
-
-MAGAZINE_ARCHIVE_THRESHOLD_DAYS = 180
-ARCHIVE_THRESHOLD_DATE = datetime.date.today() - timedelta(
-    days=MAGAZINE_ARCHIVE_THRESHOLD_DAYS,
+from .archive import (
+    get_archive_threshold_date,
+    get_archive_years,
+    get_recent_issues,
+    is_archived,
 )
+from .panels import NestedInlinePanel
 
 
 class MagazineIndexPage(Page):
@@ -80,27 +82,17 @@ class MagazineIndexPage(Page):
     ) -> dict:
         context = super().get_context(request)
 
-        published_issues = MagazineIssue.objects.live().order_by("-publication_date")
+        archive_threshold = get_archive_threshold_date()
 
         # recent issues are published after the archive threshold
-        context["recent_issues"] = published_issues.filter(
-            publication_date__gte=ARCHIVE_THRESHOLD_DATE,
-        )
+        context["recent_issues"] = get_recent_issues(archive_threshold)
 
-        archive_issues = published_issues.filter(
-            publication_date__lt=ARCHIVE_THRESHOLD_DATE,
+        archive_issues = (
+            MagazineIssue.objects.live()
+            .filter(publication_date__lt=archive_threshold)
+            .order_by("-publication_date")
         )
 
-        # Get the unique years of the archive issues as a list of integers (years)
-        archive_issues_years = archive_issues.dates(
-            "publication_date",
-            "year",
-            order="ASC",
-        )
-        archive_issues_years = [
-            archive_issue.year for archive_issue in archive_issues_years
-        ]
-
         # Filter archive issues by year, if a year is provided in the query string
         archive_year = request.GET.get("year")
         if archive_year:
@@ -116,10 +108,14 @@ class MagazineIndexPage(Page):
             items=archive_issues,
             items_per_page=items_per_page,
             page_number=page_number,
+            keyset=True,
+            after=request.GET.get("after"),
+            before=request.GET.get("before"),
+            cache_count=True,
         )
 
         context["archive_issues_fragment_identifier"] = "#archive-issues"
-        context["archive_issues_years"] = archive_issues_years
+        context["archive_issues_years"] = get_archive_years(archive_threshold)
 
         return context
 
@@ -142,10 +138,8 @@ class MagazineIssue(DrupalFields, Page):  # type: ignore
 
     @classmethod
     def get_queryset(cls):
-        """TODO: Prefetch related articles for performance."""
-        # TODO: Determine if it is possible or necessary to prefech the Articles for performance
-        # the main difficulty being the implicit relationship between the Issue and the Articles
-        # since the Articles are children of the Issue
+        """Articles are child pages rather than related objects, so they are
+        loaded per issue by magazine.toc instead of prefetched here."""
         return super().get_queryset()
 
     @property
@@ -188,7 +182,27 @@ class MagazineIssue(DrupalFields, Page):  # type: ignore
         subscribers based on publication date and archive threshold."""
 
         # check whether publication date is before public access date
-        return self.publication_date < ARCHIVE_THRESHOLD_DATE
+        return is_archived(self.publication_date)
+
+    def get_article_issue_fields(self) -> dict:
+        """Return the issue fields copied onto its articles."""
+        return {
+            "issue_title": self.title,
+            "issue_number": self.issue_number,
+            "issue_publication_date": self.publication_date,
+        }
+
+    def get_context(
+        self,
+        request: HttpRequest,
+        *args: tuple,
+        **kwargs: dict,
+    ) -> dict:
+        from .toc import get_issue_table_of_contents
+
+        context = super().get_context(request)
+        context["table_of_contents"] = get_issue_table_of_contents(self, request)
+        return context
 
     search_template = "search/magazine_issue.html"
     search_fields = Page.search_fields + [
@@ -349,8 +363,25 @@ class MagazineArticle(DrupalFields, Page):  # type: ignore
 
     drupal_node_id = models.PositiveIntegerField(null=True, blank=True, db_index=True)
 
+    # Copied from the parent issue (see sync_issue_fields), so access checks
+    # and date queries need not load the issue
+    issue_title = models.CharField(max_length=255, blank=True, default="")
+    issue_number = models.PositiveIntegerField(null=True, blank=True)
+    issue_publication_date = models.DateField(null=True, blank=True, db_index=True)
+
     search_template = "search/magazine_article.html"
 
+    def sync_issue_fields(self, issue: "MagazineIssue | None" = None) -> None:
+        """Copy the title, number and publication date of the parent issue."""
+        if issue is None:
+            parent = self.get_parent()
+            if parent is None or not isinstance(parent.specific, MagazineIssue):
+                return
+            issue = parent.specific
+
+        for article_field, value in issue.get_article_issue_fields().items():
+            setattr(self, article_field, value)
+
     @property
     def parent_issue(self):
         """Return the parent MagazineIssue.
@@ -373,25 +404,26 @@ class MagazineArticle(DrupalFields, Page):  # type: ignore
         MagazineArticle lists: the generic helper fetches parents as deferred
         specific instances, which trigger per-article queries when
         MagazineIssue-specific fields (e.g. ``publication_date``) are accessed.
-        This method fetches MagazineIssue objects directly, avoiding that N+1.
+        This method fetches MagazineIssue objects directly, avoiding that N+1,
+        and registers them in the page registry, so get_parent() and
+        is_public_access reuse them too.
         """
         articles = list(articles)
+        registry = get_page_registry()
         parent_paths = {
             article.path[: -article.steplen]
             for article in articles
             if article.depth > 1
+            and registry.get(path=article.path[: -article.steplen]) is None
         }
-        if not parent_paths:
-            return
-        issue_by_path = {
-            issue.path: issue
-            for issue in MagazineIssue.objects.filter(path__in=parent_paths)
-        }
+        if parent_paths:
+            registry.add(MagazineIssue.objects.filter(path__in=parent_paths))
+        registry.resolve_parents(articles)
+
         for article in articles:
-            if article.depth > 1:
-                parent = issue_by_path.get(article.path[: -article.steplen])
-                if parent is not None:
-                    article._parent_page = parent  # type: ignore[attr-defined]
+            parent = article.get_parent()
+            if isinstance(parent, MagazineIssue):
+                article._parent_page = parent  # type: ignore[attr-defined]
 
     @classmethod
     def get_queryset(cls):
@@ -463,13 +495,19 @@ class MagazineArticle(DrupalFields, Page):  # type: ignore
             },
         ]
 
+    def get_page_cache_purge_pages(self) -> list[int]:
+        """Return the IDs of the author pages, which list the article."""
+        return list(self.authors.values_list("author_id", flat=True))
+
     @property
     def is_public_access(self) -> bool:
         """Check whether article should be accessible to all readers or only
         subscribers based on whether the issue is public access."""
-        parent_issue = self.get_parent()
+        if self.issue_publication_date is None:
+            parent_issue = self.get_parent()
+            return parent_issue.specific.is_public_access  # type: ignore
 
-        return parent_issue.specific.is_public_access  # type: ignore
+        return is_archived(self.issue_publication_date)
 
     def get_context(
         self,
@@ -479,6 +517,10 @@ class MagazineArticle(DrupalFields, Page):  # type: ignore
     ) -> dict:
         context = super().get_context(request)
 
+        authors = list(self.authors.select_related("author"))
+        get_page_registry().resolve_specific(author.author for author in authors)
+        context["authors"] = authors
+
         user_is_authenticated = False
         user_is_subscriber = False
         user_is_superuser = False
@@ -735,6 +777,10 @@ class DeepArchiveIndexPage(Page):
             items=archive_issues,
             items_per_page=items_per_page,
             page_number=page_number,
+            keyset=True,
+            after=request.GET.get("after"),
+            before=request.GET.get("before"),
+            cache_count=True,
         )
 
         # Add publication years to context, for select menu
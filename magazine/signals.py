@@ -1,34 +1,103 @@
-from django.db.models.signals import post_delete, post_save
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
+from wagtail.signals import post_page_move
 
-from contact.models import ContactPublicationStatistics
+from contact.publication_stats import schedule_publication_stats_update
 
-from .models import ArchiveArticleAuthor, MagazineArticleAuthor
+from .models import (
+    ArchiveArticleAuthor,
+    MagazineArticle,
+    MagazineArticleAuthor,
+    MagazineIssue,
+)
+from .toc import invalidate_issue_toc
 
 
 @receiver(post_save, sender=MagazineArticleAuthor)
-def update_contact_stats_on_magazine_article_change(sender, instance, **kwargs):
-    """Update contact publication statistics when a magazine article author relationship is created or updated."""
-    if instance.author:
-        ContactPublicationStatistics.update_for_contact(instance.author)
-
-
 @receiver(post_delete, sender=MagazineArticleAuthor)
-def update_contact_stats_on_magazine_article_delete(sender, instance, **kwargs):
-    """Update contact publication statistics when a magazine article author relationship is deleted."""
-    if instance.author:
-        ContactPublicationStatistics.update_for_contact(instance.author)
+def schedule_contact_stats_on_magazine_article_author_change(
+    sender,
+    instance,
+    using,
+    **kwargs,
+):
+    """Schedule a statistics update for the author of a changed magazine article author relationship."""
+    schedule_publication_stats_update([instance.author_id], using=using)
 
 
 @receiver(post_save, sender=ArchiveArticleAuthor)
-def update_contact_stats_on_archive_article_change(sender, instance, **kwargs):
-    """Update contact publication statistics when an archive article author relationship is created or updated."""
-    if instance.author:
-        ContactPublicationStatistics.update_for_contact(instance.author)
+@receiver(post_delete, sender=ArchiveArticleAuthor)
+def schedule_contact_stats_on_archive_article_author_change(
+    sender,
+    instance,
+    using,
+    **kwargs,
+):
+    """Schedule a statistics update for the author of a changed archive article author relationship."""
+    schedule_publication_stats_update([instance.author_id], using=using)
 
 
-@receiver(post_delete, sender=ArchiveArticleAuthor)
-def update_contact_stats_on_archive_article_delete(sender, instance, **kwargs):
-    """Update contact publication statistics when an archive article author relationship is deleted."""
-    if instance.author:
-        ContactPublicationStatistics.update_for_contact(instance.author)
+@receiver(post_save, sender=MagazineIssue)
+def invalidate_toc_on_issue_change(sender, instance, **kwargs):
+    """Invalidate the table of contents, as the article URLs include the issue slug."""
+    invalidate_issue_toc(instance.path)
+
+
+@receiver(post_save, sender=MagazineArticle)
+@receiver(post_delete, sender=MagazineArticle)
+def invalidate_toc_on_article_change(sender, instance, **kwargs):
+    """Invalidate the table of contents of the issue of a changed article.
+
+    Publishing and unpublishing save the article, so they are covered too.
+    """
+    invalidate_issue_toc(instance.path[: -instance.steplen])
+
+
+@receiver(post_page_move, sender=MagazineArticle)
+def invalidate_toc_on_article_move(
+    sender,
+    instance,
+    parent_page_before,
+    parent_page_after,
+    **kwargs,
+):
+    invalidate_issue_toc(parent_page_before.path)
+    invalidate_issue_toc(parent_page_after.path)
+
+
+@receiver(post_page_move, sender=MagazineIssue)
+def invalidate_toc_on_issue_move(sender, instance, **kwargs):
+    invalidate_issue_toc(instance.path)
+
+
+# Fields of MagazineIssue copied onto its articles
+ARTICLE_ISSUE_SOURCE_FIELDS = {"title", "issue_number", "publication_date"}
+
+
+@receiver(pre_save, sender=MagazineArticle)
+def sync_article_issue_fields(sender, instance, update_fields=None, **kwargs):
+    """Copy the issue fields when an article is created, published or saved."""
+    if update_fields is None:
+        instance.sync_issue_fields()
+
+
+@receiver(post_save, sender=MagazineIssue)
+def sync_issue_fields_to_articles(sender, instance, update_fields=None, **kwargs):
+    """Copy the issue fields to its articles when they may have changed.
+
+    Saving a draft revision only updates revision bookkeeping fields, so the
+    draft values are not copied until the issue is published.
+    """
+    if update_fields is None or ARTICLE_ISSUE_SOURCE_FIELDS & set(update_fields):
+        MagazineArticle.objects.child_of(instance).update(
+            **instance.get_article_issue_fields(),
+        )
+
+
+@receiver(post_page_move, sender=MagazineArticle)
+def sync_article_issue_fields_on_move(sender, instance, parent_page_after, **kwargs):
+    issue = parent_page_after.specific
+    if isinstance(issue, MagazineIssue):
+        MagazineArticle.objects.filter(pk=instance.pk).update(
+            **issue.get_article_issue_fields(),
+        )
@@ -1,8 +1,13 @@
-from django.test import TestCase
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
 from django.utils import timezone
 
 from contact.factories import PersonFactory
-from contact.models import ContactPublicationStatistics
+from contact.models import ContactPublicationStatistics, PendingPublicationStatistics
+from contact.publication_stats import PUBLICATION_STATS_QUEUE_DATABASE
 from magazine.factories import (
     MagazineArticleFactory,
     MagazineDepartmentFactory,
@@ -63,10 +68,11 @@ class MagazineSignalsTest(TestCase):
         self.assertEqual(ContactPublicationStatistics.objects.count(), 0)
 
         # Create a magazine article author relationship
-        _ = MagazineArticleAuthor.objects.create(
-            article=self.magazine_article,
-            author=self.person,
-        )
+        with self.captureOnCommitCallbacks(execute=True):
+            _ = MagazineArticleAuthor.objects.create(
+                article=self.magazine_article,
+                author=self.person,
+            )
 
         # Check that statistics were created
         self.assertEqual(ContactPublicationStatistics.objects.count(), 1)
@@ -84,10 +90,11 @@ class MagazineSignalsTest(TestCase):
     def test_magazine_article_author_delete(self):
         """Test that ContactPublicationStatistics is updated when a MagazineArticleAuthor is deleted."""
         # Create a magazine article author relationship
-        article_author = MagazineArticleAuthor.objects.create(
-            article=self.magazine_article,
-            author=self.person,
-        )
+        with self.captureOnCommitCallbacks(execute=True):
+            article_author = MagazineArticleAuthor.objects.create(
+                article=self.magazine_article,
+                author=self.person,
+            )
 
         # Check that statistics exist
         self.assertEqual(ContactPublicationStatistics.objects.count(), 1)
@@ -97,7 +104,8 @@ class MagazineSignalsTest(TestCase):
         )
 
         # Delete the relationship
-        article_author.delete()
+        with self.captureOnCommitCallbacks(execute=True):
+            article_author.delete()
 
         # Check that statistics were updated
         self.assertEqual(ContactPublicationStatistics.objects.count(), 1)
@@ -112,10 +120,11 @@ class MagazineSignalsTest(TestCase):
         self.assertEqual(ContactPublicationStatistics.objects.count(), 0)
 
         # Create an archive article author relationship
-        _ = ArchiveArticleAuthor.objects.create(
-            article=self.archive_article,
-            author=self.person,
-        )
+        with self.captureOnCommitCallbacks(execute=True):
+            _ = ArchiveArticleAuthor.objects.create(
+                article=self.archive_article,
+                author=self.person,
+            )
 
         # Check that statistics were created
         self.assertEqual(ContactPublicationStatistics.objects.count(), 1)
@@ -133,10 +142,11 @@ class MagazineSignalsTest(TestCase):
     def test_archive_article_author_delete(self):
         """Test that ContactPublicationStatistics is updated when an ArchiveArticleAuthor is deleted."""
         # Create an archive article author relationship
-        archive_author = ArchiveArticleAuthor.objects.create(
-            article=self.archive_article,
-            author=self.person,
-        )
+        with self.captureOnCommitCallbacks(execute=True):
+            archive_author = ArchiveArticleAuthor.objects.create(
+                article=self.archive_article,
+                author=self.person,
+            )
 
         # Check that statistics exist
         self.assertEqual(ContactPublicationStatistics.objects.count(), 1)
@@ -146,7 +156,8 @@ class MagazineSignalsTest(TestCase):
         )
 
         # Delete the relationship
-        archive_author.delete()
+        with self.captureOnCommitCallbacks(execute=True):
+            archive_author.delete()
 
         # Check that statistics were updated
         self.assertEqual(ContactPublicationStatistics.objects.count(), 1)
@@ -158,25 +169,28 @@ class MagazineSignalsTest(TestCase):
     def test_multiple_articles_count(self):
         """Test that ContactPublicationStatistics correctly counts multiple articles."""
         # Create two magazine article author relationships and one archive
-        MagazineArticleAuthor.objects.create(
-            article=self.magazine_article,
-            author=self.person,
-        )
+        with self.captureOnCommitCallbacks(execute=True):
+            MagazineArticleAuthor.objects.create(
+                article=self.magazine_article,
+                author=self.person,
+            )
 
         # Create another magazine article with the same department
         second_article = MagazineArticleFactory.create(
             department=self.department,
         )
 
-        MagazineArticleAuthor.objects.create(
-            article=second_article,
-            author=self.person,
-        )
+        with self.captureOnCommitCallbacks(execute=True):
+            MagazineArticleAuthor.objects.create(
+                article=second_article,
+                author=self.person,
+            )
 
-        ArchiveArticleAuthor.objects.create(
-            article=self.archive_article,
-            author=self.person,
-        )
+        with self.captureOnCommitCallbacks(execute=True):
+            ArchiveArticleAuthor.objects.create(
+                article=self.archive_article,
+                author=self.person,
+            )
 
         # Check that statistics were created and count is correct
         self.assertEqual(ContactPublicationStatistics.objects.count(), 1)
@@ -186,13 +200,83 @@ class MagazineSignalsTest(TestCase):
         )
 
         # Delete one relationship
-        MagazineArticleAuthor.objects.filter(
-            article=self.magazine_article,
-            author=self.person,
-        ).delete()
+        with self.captureOnCommitCallbacks(execute=True):
+            MagazineArticleAuthor.objects.filter(
+                article=self.magazine_article,
+                author=self.person,
+            ).delete()
 
         # Check that statistics were updated
         self.assertEqual(
             ContactPublicationStatistics.objects.get(contact=self.person).article_count,
             2,
         )
+
+    def test_updates_are_coalesced_per_transaction(self):
+        """Test that several author changes in one transaction recompute each contact once."""
+        second_article = MagazineArticleFactory.create(department=self.department)
+
+        with (
+            patch.object(
+                ContactPublicationStatistics,
+                "update_for_contacts",
+                wraps=ContactPublicationStatistics.update_for_contacts,
+            ) as mock_update,
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            MagazineArticleAuthor.objects.create(
+                article=self.magazine_article,
+                author=self.person,
+            )
+            MagazineArticleAuthor.objects.create(
+                article=second_article,
+                author=self.person,
+            )
+            ArchiveArticleAuthor.objects.create(
+                article=self.archive_article,
+                author=self.person,
+            )
+
+            # Nothing is recomputed before the transaction commits
+            mock_update.assert_not_called()
+
+        mock_update.assert_called_once_with([self.person.pk])
+        self.assertEqual(
+            ContactPublicationStatistics.objects.get(contact=self.person).article_count,
+            3,
+        )
+
+    @override_settings(PUBLICATION_STATS_QUEUE=PUBLICATION_STATS_QUEUE_DATABASE)
+    def test_database_queue(self):
+        """Test that the database queue defers updates to the management command."""
+        with self.captureOnCommitCallbacks(execute=True):
+            MagazineArticleAuthor.objects.create(
+                article=self.magazine_article,
+                author=self.person,
+            )
+        with self.captureOnCommitCallbacks(execute=True):
+            ArchiveArticleAuthor.objects.create(
+                article=self.archive_article,
+                author=self.person,
+            )
+
+        # Queued once, not yet computed
+        self.assertEqual(
+            list(
+                PendingPublicationStatistics.objects.values_list(
+                    "contact_id", flat=True
+                )
+            ),
+            [self.person.pk],
+        )
+        self.assertEqual(ContactPublicationStatistics.objects.count(), 0)
+
+        stdout = StringIO()
+        call_command("process_publication_stats_queue", stdout=stdout)
+
+        self.assertIn("for 1 queued contacts", stdout.getvalue())
+        self.assertFalse(PendingPublicationStatistics.objects.exists())
+        self.assertEqual(
+            ContactPublicationStatistics.objects.get(contact=self.person).article_count,
+            2,
+        )
@@ -1,10 +1,13 @@
 import datetime
+from unittest.mock import patch
 
+from django.core.cache import cache
 from django.db import connection, reset_queries
 from django.test import RequestFactory, TestCase, override_settings
 from wagtail.models import Page, Site
 
 from accounts.models import User
+from contact.factories import PersonFactory
 from contact.models import Person, PersonIndexPage
 from home.models import HomePage
 from magazine.factories import (
@@ -16,18 +19,30 @@ from subscription.models import (
     Subscription,
 )
 
+from .archive import (
+    MAGAZINE_ARCHIVE_THRESHOLD_DAYS,
+    get_archive_threshold_date,
+    get_archive_years,
+    get_recent_issues,
+)
 from .models import (
     ArchiveArticle,
     ArchiveArticleAuthor,
     ArchiveIssue,
     DeepArchiveIndexPage,
     MagazineArticle,
+    MagazineArticleAuthor,
     MagazineDepartment,
     MagazineDepartmentIndexPage,
     MagazineIndexPage,
     MagazineIssue,
     MagazineTagIndexPage,
 )
+from .toc import (
+    build_table_of_contents,
+    get_issue_table_of_contents,
+    load_issue_articles,
+)
 
 
 class MagazineIndexPageTest(TestCase):
@@ -65,6 +80,58 @@ class MagazineIndexPageTest(TestCase):
             self.magazine_index.add_child(instance=archive_magazine_issue)
             self.archive_magazine_issues.append(archive_magazine_issue)
 
+    def test_get_archive_threshold_date(self) -> None:
+        self.assertEqual(
+            get_archive_threshold_date(datetime.date(2024, 12, 31)),
+            datetime.date(2024, 12, 31)
+            - datetime.timedelta(days=MAGAZINE_ARCHIVE_THRESHOLD_DAYS),
+        )
+
+    def test_archive_threshold_follows_current_date(self) -> None:
+        """Issues move to the archive on the right day without a restart."""
+        later = datetime.date.today() + datetime.timedelta(
+            days=MAGAZINE_ARCHIVE_THRESHOLD_DAYS + 1,
+        )
+        self.assertFalse(self.recent_magazine_issue.is_public_access)
+        self.assertEqual(get_recent_issues(), [self.recent_magazine_issue])
+
+        with patch("django.utils.timezone.localdate", return_value=later):
+            self.assertTrue(self.recent_magazine_issue.is_public_access)
+            self.assertEqual(get_recent_issues(), [])
+            self.assertIn(
+                self.recent_magazine_issue.publication_date.year,
+                get_archive_years(),
+            )
+
+    def test_get_archive_years(self) -> None:
+        expected_years = sorted(
+            {issue.publication_date.year for issue in self.archive_magazine_issues},
+        )
+
+        self.assertEqual(get_archive_years(), expected_years)
+
+    def test_recent_issues_and_archive_years_are_cached(self) -> None:
+        request = RequestFactory().get("/magazine/")
+        self.magazine_index.get_context(request)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(get_recent_issues(), [self.recent_magazine_issue])
+            get_archive_years()
+
+    def test_saving_issue_invalidates_recent_issues(self) -> None:
+        self.assertEqual(get_recent_issues(), [self.recent_magazine_issue])
+
+        new_issue = MagazineIssue(
+            title="Issue 2",
+            publication_date=datetime.date.today(),
+        )
+        self.magazine_index.add_child(instance=new_issue)
+
+        self.assertCountEqual(
+            get_recent_issues(),
+            [self.recent_magazine_issue, new_issue],
+        )
+
     def test_get_sitemap_urls(self) -> None:
         """Validate the output of get_sitemap_urls."""
 
@@ -250,6 +317,83 @@ class MagazineIssueTest(TestCase):
             ],
         )
 
+    def test_table_of_contents(self) -> None:
+        """The table of contents partitions the live articles."""
+        draft_article = self.recent_magazine_issue.add_child(
+            instance=MagazineArticle(
+                title="Draft",
+                department=self.magazine_department_one,
+                live=False,
+            ),
+        )
+        self.assertIsNotNone(draft_article)
+
+        toc = build_table_of_contents(
+            load_issue_articles(self.recent_magazine_issue),
+        )
+
+        self.assertEqual(
+            [article["title"] for article in toc["featured_articles"]],
+            ["Article 1"],
+        )
+        self.assertEqual(
+            [
+                (department["title"], [a["title"] for a in department["articles"]])
+                for department in toc["departments"]
+            ],
+            [("Department 1", ["Article 2"]), ("Department 2", ["Article 1"])],
+        )
+        self.assertEqual(
+            toc["featured_articles"][0]["url"],
+            self.magazine_article_one.url,
+        )
+
+    def test_table_of_contents_is_cached(self) -> None:
+        cache.clear()
+        get_issue_table_of_contents(self.recent_magazine_issue)
+
+        # Only the namespace version is read
+        with self.assertNumQueries(0):
+            toc = get_issue_table_of_contents(self.recent_magazine_issue)
+
+        self.assertEqual(len(toc["featured_articles"]), 1)
+
+    def test_publishing_article_invalidates_table_of_contents(self) -> None:
+        cache.clear()
+        get_issue_table_of_contents(self.recent_magazine_issue)
+
+        self.magazine_article_two.is_featured = True
+        self.magazine_article_two.save_revision().publish()
+
+        toc = get_issue_table_of_contents(self.recent_magazine_issue)
+        self.assertEqual(
+            [article["title"] for article in toc["featured_articles"]],
+            ["Article 1", "Article 2"],
+        )
+
+    def test_other_issue_keeps_table_of_contents(self) -> None:
+        cache.clear()
+        get_issue_table_of_contents(self.recent_magazine_issue)
+
+        self.archive_magazine_issue.add_child(
+            instance=MagazineArticle(
+                title="Archive article",
+                department=self.magazine_department_one,
+            ),
+        )
+
+        with self.assertNumQueries(0):
+            get_issue_table_of_contents(self.recent_magazine_issue)
+
+    def test_issue_page_renders_table_of_contents(self) -> None:
+        # The site root was changed without signals in setUp
+        cache.clear()
+        response = self.client.get(self.recent_magazine_issue.url)
+
+        self.assertContains(response, "Featured Articles")
+        self.assertContains(response, 'id="department-department-1"')
+        self.assertContains(response, f'href="{self.magazine_article_two.url}"')
+
     def test_publication_end_date(self) -> None:
         """Test that the publication_end_date property returns the correct
         date."""
@@ -554,6 +698,25 @@ class MagazineArticleTest(TestCase):
         self.assertFalse(self.recent_magazine_article.is_public_access)
         self.assertTrue(self.archive_magazine_article.is_public_access)
 
+    def test_get_context_loads_specific_authors(self) -> None:
+        """Authors are loaded with their specific pages in bulk."""
+        people = [PersonFactory(), PersonFactory()]
+        for person in people:
+            MagazineArticleAuthor.objects.create(
+                article=self.recent_magazine_article,
+                author=person,
+            )
+        request = RequestFactory().get("/magazine/issue-1/article-1/")
+        request.user = self.regular_user
+
+        context = self.recent_magazine_article.get_context(request)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                [author.author.specific for author in context["authors"]],
+                people,
+            )
+
     def test_recent_get_context_anonymous(self) -> None:
         """Test that the get_context method returns the correct context."""
         mock_request = RequestFactory().get("/magazine/issue-1/article-1/")
@@ -914,3 +1077,72 @@ class ArchiveIssueQueryOptimizationTestCase(TestCase):
             f"Expected ≤5 queries with prefetch optimization, but got {total_queries}. "
             f"Queries: {[q['sql'] for q in connection.queries]}",
         )
+
+
+class MagazineArticleIssueFieldsTest(TestCase):
+    """Test the issue fields copied onto magazine articles."""
+
+    def setUp(self) -> None:
+        self.issue = MagazineIssueFactory.create(
+            title="Spring",
+            issue_number=7,
+            publication_date=datetime.date(2020, 3, 1),
+        )
+        self.article = MagazineArticleFactory.create(parent=self.issue)
+
+    def test_new_article_copies_issue_fields(self) -> None:
+        self.article.refresh_from_db()
+
+        self.assertEqual(self.article.issue_title, "Spring")
+        self.assertEqual(self.article.issue_number, 7)
+        self.assertEqual(self.article.issue_publication_date, datetime.date(2020, 3, 1))
+
+    def test_publishing_issue_updates_articles(self) -> None:
+        self.issue.title = "Summer"
+        self.issue.publication_date = datetime.date(2020, 6, 1)
+        self.issue.save_revision().publish()
+
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.issue_title, "Summer")
+        self.assertEqual(self.article.issue_publication_date, datetime.date(2020, 6, 1))
+
+    def test_issue_draft_does_not_update_articles(self) -> None:
+        self.issue.title = "Draft title"
+        self.issue.save_revision()
+
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.issue_title, "Spring")
+
+    def test_moving_article_copies_new_issue_fields(self) -> None:
+        other_issue = MagazineIssueFactory.create(
+            title="Autumn",
+            issue_number=8,
+            publication_date=datetime.date(2020, 9, 1),
+        )
+
+        self.article.move(other_issue, pos="last-child")
+
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.issue_title, "Autumn")
+        self.assertEqual(self.article.issue_number, 8)
+
+    def test_is_public_access_does_not_load_issue(self) -> None:
+        article = MagazineArticle.objects.get(pk=self.article.pk)
+
+        with self.assertNumQueries(0):
+            self.assertTrue(article.is_public_access)
+
+    def test_latest_articles_query_uses_article_table(self) -> None:
+        newer_issue = MagazineIssueFactory.create(
+            publication_date=datetime.date(2021, 1, 1),
+        )
+        newer_article = MagazineArticleFactory.create(parent=newer_issue)
+
+        self.assertEqual(
+            list(
+                MagazineArticle.objects.live()
+                .order_by("-issue_publication_date")
+                .values_list("pk", flat=True),
+            ),
+            [newer_article.pk, self.article.pk],
+        )
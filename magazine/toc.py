@@ -0,0 +1,116 @@
+"""Tables of contents of magazine issues.
+
+get_issue_table_of_contents() loads the live articles of an issue in one
+pass, with their departments and authors, and partitions them in memory
+into the featured articles and the articles of each department. The result
+is plain data (titles, URLs and authors), cached per issue and site, so
+rendering a cached issue page makes no article queries.
+
+Entries depend on the issue's namespace (see core.cache), which the signals
+in magazine.signals bump when the issue or one of its articles is saved,
+published, unpublished, moved or deleted. Renamed author and department
+pages show once the entry expires, after ISSUE_TOC_CACHE_TIMEOUT.
+"""
+
+from typing import Any
+
+from django.http import HttpRequest
+from wagtail.models import Site
+
+from core.cache import bump_namespaces, get_or_set_cached
+
+from .models import MagazineArticle, MagazineIssue
+
+ISSUE_TOC_NAMESPACE = "magazine:issue_toc"
+ISSUE_TOC_CACHE_TIMEOUT = 60 * 60
+
+
+def issue_toc_namespace(issue_path: str) -> str:
+    """Return the namespace of an issue's table of contents.
+
+    It is keyed by tree path, so the articles of an issue can invalidate it
+    without loading the issue.
+    """
+    return f"{ISSUE_TOC_NAMESPACE}:{issue_path}"
+
+
+def invalidate_issue_toc(issue_path: str) -> None:
+    bump_namespaces([issue_toc_namespace(issue_path)])
+
+
+def load_issue_articles(issue: MagazineIssue) -> list[MagazineArticle]:
+    """Return the live articles of an issue, in page tree order."""
+    return list(
+        MagazineArticle.objects.child_of(issue)
+        .live()
+        .defer_streamfields()
+        .defer("body_migrated")
+        .select_related("department")
+        .prefetch_related("authors__author")
+        .order_by("path"),
+    )
+
+
+def _article_entry(
+    article: MagazineArticle,
+    request: HttpRequest | None,
+) -> dict[str, Any]:
+    return {
+        "title": article.title,
+        "url": article.get_url(request),
+        "is_featured": article.is_featured,
+        "authors": [
+            {
+                "title": article_author.author.title,
+                "url": article_author.author.get_url(request),
+                "live": article_author.author.live,
+            }
+            for article_author in article.authors.all()
+        ],
+    }
+
+
+def build_table_of_contents(
+    articles: list[MagazineArticle],
+    request: HttpRequest | None = None,
+) -> dict[str, Any]:
+    """Partition articles into featured articles and department groups.
+
+    Departments are ordered by title, and articles keep their tree order
+    within each department.
+    """
+    entries = {article.pk: _article_entry(article, request) for article in articles}
+
+    departments: dict[int, dict[str, Any]] = {}
+    for article in sorted(articles, key=lambda article: article.department.title):
+        department = departments.setdefault(
+            article.department_id,
+            {"title": article.department.title, "articles": []},
+        )
+        department["articles"].append(entries[article.pk])
+
+    return {
+        "featured_articles": [
+            entries[article.pk] for article in articles if article.is_featured
+        ],
+        "departments": list(departments.values()),
+    }
+
+
+def get_issue_table_of_contents(
+    issue: MagazineIssue,
+    request: HttpRequest | None = None,
+) -> dict[str, Any]:
+    """Return the cached table of contents of an issue.
+
+    URLs are relative to the request's site, as with ``{% pageurl %}``.
+    """
+    site = Site.find_for_request(request) if request is not None else None
+
+    return get_or_set_cached(
+        ISSUE_TOC_NAMESPACE,
+        [issue.pk, site.pk if site else None],
+        lambda: build_table_of_contents(load_issue_articles(issue), request),
+        depends_on=[issue_toc_namespace(issue.path)],
+        timeout=ISSUE_TOC_CACHE_TIMEOUT,
+    )
@@ -6,6 +6,7 @@ from wagtail.models import Page
 from wagtail.search import index
 
 from common.models import DrupalFields
+from common.title_search import TITLE_SIMILARITY_ALIAS, filter_titles
 from contact.models import Meeting
 from pagination.helpers import get_paginated_items
 
@@ -50,6 +51,10 @@ class Memorial(DrupalFields, Page):  # type: ignore
     def full_name(self) -> str:
         return f"{self.memorial_person.given_name} {self.memorial_person.family_name}"
 
+    def get_page_cache_purge_pages(self) -> list[int]:
+        """Return the ID of the meeting page, which lists the memorial."""
+        return [self.memorial_meeting_id] if self.memorial_meeting_id else []
+
     content_panels = Page.content_panels + [
         PageChooserPanel("memorial_person"),
         FieldPanel("date_of_birth"),
@@ -85,11 +90,10 @@ class MemorialIndexPage(Page):
             "title",
             "memorial_meeting__title",
         ]
-        facets = {
-            f"{key}__icontains": query[key] for key in query if key in allowed_keys
-        }
+        facets = {key: query[key] for key in query if key in allowed_keys}
 
-        return Memorial.objects.all().filter(**facets)
+        # Indexed, and ranked by similarity where pg_trgm is available
+        return filter_titles(Memorial.objects.all(), facets)
 
     def get_context(
         self,
@@ -107,10 +111,18 @@ class MemorialIndexPage(Page):
         _page_raw = request.GET.get("page", "1")
         page_number = int(_page_raw) if _page_raw.isdigit() else 1
 
+        # Similarity scores are floats, which cannot be matched exactly
+        # from a cursor, so ranked results are paged by offset instead
+        ranked = TITLE_SIMILARITY_ALIAS in filtered_memorials.query.annotations
+
         context["memorials"] = get_paginated_items(
             items=filtered_memorials,
             items_per_page=items_per_page,
             page_number=page_number,
+            keyset=not ranked,
+            after=request.GET.get("after"),
+            before=request.GET.get("before"),
+            cache_count=True,
         )
 
         # Populate faceted search fields
@@ -1,4 +1,7 @@
+from unittest.mock import Mock, patch
+
 from django.test import RequestFactory, TestCase
+
 from community.models import CommunityPage
 from contact.factories import MeetingFactory, PersonFactory
 from memorials.factories import MemorialFactory, MemorialIndexPageFactory
@@ -99,6 +102,24 @@ class MemorialIndexPageModelTest(TestCase):
         self.assertEqual(memorials.count(), 1)
         self.assertEqual(memorials.first(), memorial)
 
+    def test_get_filtered_memorials_filters_titles_ignoring_case(self) -> None:
+        memorial_page: MemorialIndexPage = MemorialIndexPage()
+        memorial: Memorial = MemorialFactory(
+            title="Test Memorial",
+            memorial_person=self.person,
+            memorial_meeting=self.meeting,
+        )
+        MemorialFactory(
+            title="Other Memorial",
+            memorial_person=self.person,
+        )
+
+        memorials = memorial_page.get_filtered_memorials(
+            {"title": "test mem", "memorial_meeting__title": "MEETING"},
+        )
+
+        self.assertEqual(list(memorials), [memorial])
+
 
 class MemorialIndexPageGetContextTest(TestCase):
     def setUp(self) -> None:
@@ -126,3 +147,23 @@ class MemorialIndexPageGetContextTest(TestCase):
             len(context["meetings"]),
             2,
         )
+
+    @patch("memorials.models.get_paginated_items")
+    @patch("common.title_search.trigram_search_available", return_value=True)
+    def test_ranked_results_are_paginated_by_offset(
+        self,
+        _,
+        mock_get_paginated_items: Mock,
+    ) -> None:
+        self.memorial_index_page.get_context(self.factory.get("/", {"title": "a"}))
+
+        self.assertFalse(mock_get_paginated_items.call_args.kwargs["keyset"])
+
+    @patch("memorials.models.get_paginated_items")
+    def test_unranked_results_are_paginated_by_key(
+        self,
+        mock_get_paginated_items: Mock,
+    ) -> None:
+        self.memorial_index_page.get_context(self.factory.get("/"))
+
+        self.assertTrue(mock_get_paginated_items.call_args.kwargs["keyset"])
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class NavigationConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "navigation"
+
+    def ready(self):
+        """Import signals when app is ready."""
+        from . import signals  # noqa: F401
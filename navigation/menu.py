@@ -0,0 +1,145 @@
+"""The navigation menu, compiled for rendering without queries.
+
+The menu_items StreamField of NavigationMenuSetting resolves every linked
+page and its URL when rendered. get_navigation_menu() instead returns a
+cached structure of plain titles, hrefs and submenu IDs, compiled once from
+the default site's setting.
+
+The cached menu depends on the NavigationMenuSetting and Site models (see
+core.cache), so saving the setting recompiles it. The signals in
+navigation.signals recompile it when a linked page, or one of its
+ancestors, is published with a new title or slug, moved or unpublished, as
+that can change the page's URL. Deleting a page unpublishes it first.
+"""
+
+from typing import Any
+
+from django.core.cache import cache
+from wagtail.models import Page, Site
+
+from core.cache import bump_namespaces, get_or_set_cached, model_namespace
+from core.utils import get_default_site
+
+from .models import NavigationMenuSetting
+
+NAVIGATION_MENU_NAMESPACE = "navigation:menu"
+NAVIGATION_MENU_CACHE_TIMEOUT = 60 * 60 * 24
+
+# The tree paths, URL paths and titles of the pages the cached menu links to
+LINKED_PAGES_CACHE_KEY = "wf:navigation:linked_pages"
+
+
+def _compile_link(value, linked_pages: list[Page]) -> dict[str, Any]:
+    page = value.get("page")
+    if page is not None:
+        linked_pages.append(page)
+
+    return {
+        "type": "link",
+        "title": value["title"],
+        "href": value.href(),
+    }
+
+
+def compile_navigation_menu(setting: NavigationMenuSetting) -> dict[str, Any]:
+    """Resolve the menu items of a setting into plain data.
+
+    Returns the menu ``items`` and the ``linked_pages``, as (path, url_path,
+    title) tuples.
+    """
+    linked_pages: list[Page] = []
+    items = []
+
+    for block in setting.menu_items:
+        if block.block_type == "drop_down":
+            items.append(
+                {
+                    "type": "dropdown",
+                    "title": block.value["title"],
+                    "submenu_id": block.value.submenu_id(),
+                    "items": [
+                        _compile_link(child.value, linked_pages)
+                        for child in block.value["menu_items"]
+                    ],
+                },
+            )
+        else:
+            items.append(_compile_link(block.value, linked_pages))
+
+    return {
+        "items": items,
+        "linked_pages": [
+            (page.path, page.url_path, page.title) for page in linked_pages
+        ],
+    }
+
+
+def _compile_default_site_menu() -> dict[str, Any]:
+    site = get_default_site()
+    if site is None:
+        menu: dict[str, Any] = {"items": [], "linked_pages": []}
+    else:
+        menu = compile_navigation_menu(NavigationMenuSetting.for_site(site))
+
+    cache.set(
+        LINKED_PAGES_CACHE_KEY,
+        menu["linked_pages"],
+        NAVIGATION_MENU_CACHE_TIMEOUT,
+    )
+    return menu
+
+
+def get_navigation_menu() -> list[dict[str, Any]]:
+    """Return the compiled menu items of the default site."""
+    menu = get_or_set_cached(
+        NAVIGATION_MENU_NAMESPACE,
+        ["default_site"],
+        _compile_default_site_menu,
+        depends_on=[model_namespace(NavigationMenuSetting), model_namespace(Site)],
+        timeout=NAVIGATION_MENU_CACHE_TIMEOUT,
+    )
+    return menu["items"]
+
+
+def menu_links_below(path: str = "", url_path: str = "") -> bool:
+    """Return whether the cached menu links to a page at or below a path.
+
+    ``path`` is a tree path and ``url_path`` a URL path; either may be
+    empty. Returns True if the linked pages are not cached, e.g. evicted,
+    as the menu may still be.
+    """
+    linked_pages = cache.get(LINKED_PAGES_CACHE_KEY)
+    if linked_pages is None:
+        return True
+
+    return any(
+        (path and linked_path.startswith(path))
+        or (url_path and linked_url_path.startswith(url_path))
+        for linked_path, linked_url_path, _linked_title in linked_pages
+    )
+
+
+def menu_links_changed(page: Page) -> bool:
+    """Return whether the cached menu links to a page, or a page below it,
+    whose title or URL differs from the page as it is now.
+
+    A new slug changes the URL paths of the page and its descendants, so a
+    linked page below ``page`` is stale if its URL path no longer starts with
+    the page's. Returns True if the linked pages are not cached.
+    """
+    linked_pages = cache.get(LINKED_PAGES_CACHE_KEY)
+    if linked_pages is None:
+        return True
+
+    return any(
+        linked_path.startswith(page.path)
+        and (
+            not linked_url_path.startswith(page.url_path)
+            or (linked_path == page.path and linked_title != page.title)
+        )
+        for linked_path, linked_url_path, linked_title in linked_pages
+    )
+
+
+def invalidate_navigation_menu() -> None:
+    bump_namespaces([NAVIGATION_MENU_NAMESPACE])
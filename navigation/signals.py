@@ -0,0 +1,34 @@
+from django.dispatch import receiver
+from wagtail.models import Site
+from wagtail.signals import page_published, page_unpublished, post_page_move
+
+from core.page_cache import purge_site
+
+from .menu import invalidate_navigation_menu, menu_links_below, menu_links_changed
+
+
+def invalidate_menu_and_pages() -> None:
+    """Recompile the menu, and purge the cached pages that render it."""
+    invalidate_navigation_menu()
+    for site_id in Site.objects.values_list("pk", flat=True):
+        purge_site(site_id)
+
+
+@receiver(page_published)
+def invalidate_menu_on_page_publish(sender, instance, **kwargs):
+    # Publishing a new title or slug changes what the menu shows, and a new
+    # slug also changes the URLs of the page's descendants
+    if menu_links_changed(instance):
+        invalidate_menu_and_pages()
+
+
+@receiver(page_unpublished)
+def invalidate_menu_on_page_unpublish(sender, instance, **kwargs):
+    if menu_links_below(path=instance.path):
+        invalidate_menu_and_pages()
+
+
+@receiver(post_page_move)
+def invalidate_menu_on_page_move(sender, instance, url_path_before, **kwargs):
+    if menu_links_below(url_path=url_path_before):
+        invalidate_menu_and_pages()
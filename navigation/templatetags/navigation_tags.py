@@ -0,0 +1,11 @@
+from django import template
+
+from navigation.menu import get_navigation_menu
+
+register = template.Library()
+
+
+@register.inclusion_tag("navigation/menu.html")
+def navigation_menu():
+    """Render the links of the default site's navigation menu."""
+    return {"menu_items": get_navigation_menu()}
@@ -1,7 +1,11 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
 from django.test import TestCase
 from wagtail.models import Site
 
 from home.models import HomePage
+from wf_pages.models import WfPage
 
 from .blocks import (
     NavigationDropdownMenuBlock,
@@ -10,6 +14,8 @@ from .blocks import (
     NavigationExternalLinkStructValue,
     NavigationPageChooserBlock,
 )
+from .menu import get_navigation_menu
+from .models import NavigationMenuSetting
 
 
 class TestNavigationExternalLinkStructValue(TestCase):
@@ -147,3 +153,173 @@ class TestNavigationDropdownMenuStructValue(TestCase):
             nav_struct_value.submenu_id(),
             "dropdown-menu-",
         )
+
+
+class TestNavigationMenu(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.site = Site.objects.get(is_default_site=True)
+        self.home_page = HomePage(title="Home")
+        self.site.root_page.add_child(instance=self.home_page)
+        self.section_page = WfPage(title="Section", body=[])
+        self.home_page.add_child(instance=self.section_page)
+        self.about_page = WfPage(title="About", body=[])
+        self.section_page.add_child(instance=self.about_page)
+
+        self.setting = NavigationMenuSetting.for_site(self.site)
+        self.setting.menu_items = [
+            (
+                "internal_page",
+                {"title": "Home", "page": self.home_page, "anchor": None},
+            ),
+            (
+                "drop_down",
+                {
+                    "title": "About Us",
+                    "menu_items": [
+                        (
+                            "page",
+                            {
+                                "title": "About",
+                                "page": self.about_page,
+                                "anchor": "staff",
+                            },
+                        ),
+                        (
+                            "external_link",
+                            {
+                                "title": "Blog",
+                                "url": "https://example.com",
+                                "anchor": None,
+                            },
+                        ),
+                    ],
+                },
+            ),
+        ]
+        self.setting.save()
+
+    def test_menu_is_pre_resolved(self) -> None:
+        self.assertEqual(
+            get_navigation_menu(),
+            [
+                {"type": "link", "title": "Home", "href": self.home_page.url},
+                {
+                    "type": "dropdown",
+                    "title": "About Us",
+                    "submenu_id": "dropdown-menu-about-us",
+                    "items": [
+                        {
+                            "type": "link",
+                            "title": "About",
+                            "href": f"{self.about_page.url}#staff",
+                        },
+                        {
+                            "type": "link",
+                            "title": "Blog",
+                            "href": "https://example.com",
+                        },
+                    ],
+                },
+            ],
+        )
+
+    def test_cached_menu_renders_without_queries(self) -> None:
+        get_navigation_menu()
+
+        with self.assertNumQueries(0):
+            menu = get_navigation_menu()
+
+        self.assertEqual(menu[0]["title"], "Home")
+
+    def test_saving_setting_rebuilds_menu(self) -> None:
+        get_navigation_menu()
+
+        self.setting.menu_items = []
+        self.setting.save()
+
+        self.assertEqual(get_navigation_menu(), [])
+
+    def test_changing_linked_page_slug_rebuilds_menu(self) -> None:
+        get_navigation_menu()
+
+        self.about_page.slug = "about-us"
+        self.about_page.save_revision().publish()
+
+        self.assertTrue(
+            get_navigation_menu()[1]["items"][0]["href"].endswith(
+                "/section/about-us/#staff",
+            ),
+        )
+
+    def test_changing_ancestor_slug_rebuilds_menu(self) -> None:
+        get_navigation_menu()
+
+        self.section_page.slug = "company"
+        self.section_page.save_revision().publish()
+
+        self.assertTrue(
+            get_navigation_menu()[1]["items"][0]["href"].endswith(
+                "/company/about/#staff",
+            ),
+        )
+
+    def test_moving_linked_page_rebuilds_menu(self) -> None:
+        get_navigation_menu()
+
+        self.about_page.move(self.home_page, pos="last-child")
+
+        self.assertTrue(
+            get_navigation_menu()[1]["items"][0]["href"].endswith(
+                "/home/about/#staff",
+            ),
+        )
+
+    def test_changing_linked_page_title_rebuilds_menu(self) -> None:
+        get_navigation_menu()
+
+        self.about_page.title = "About Us"
+        with patch("navigation.signals.invalidate_menu_and_pages") as invalidate:
+            self.about_page.save_revision().publish()
+
+        invalidate.assert_called_once()
+
+    @patch("navigation.signals.invalidate_menu_and_pages")
+    def test_saving_draft_keeps_menu(self, invalidate) -> None:
+        get_navigation_menu()
+
+        self.about_page.slug = "about-us"
+        self.about_page.save_revision()
+
+        invalidate.assert_not_called()
+
+    @patch("navigation.signals.invalidate_menu_and_pages")
+    def test_republishing_unchanged_page_keeps_menu(self, invalidate) -> None:
+        get_navigation_menu()
+
+        self.section_page.save_revision().publish()
+        self.about_page.save_revision().publish()
+
+        invalidate.assert_not_called()
+
+    def test_unpublishing_linked_page_rebuilds_menu(self) -> None:
+        get_navigation_menu()
+
+        with patch("navigation.signals.invalidate_menu_and_pages") as invalidate:
+            self.about_page.unpublish()
+
+        invalidate.assert_called_once()
+
+    def test_unrelated_page_keeps_menu(self) -> None:
+        menu = get_navigation_menu()
+        other_page = WfPage(title="Contact", body=[])
+        self.home_page.add_child(instance=other_page)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(get_navigation_menu(), menu)
+
+    def test_navbar_renders_menu(self) -> None:
+        response = self.client.get(self.home_page.url)
+
+        self.assertContains(response, 'id="dropdown-menu-about-us"')
+        self.assertContains(response, f'href="{self.about_page.url}#staff"')
@@ -0,0 +1,19 @@
+# Generated by Django 6.0.4 on 2026-10-18 15:28
+
+import datetime
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("news", "0030_alter_newsitem_body"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="newsitem",
+            name="publication_date",
+            field=models.DateField(db_index=True, default=datetime.date.today),
+        ),
+    ]
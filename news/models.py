@@ -1,7 +1,8 @@
-from collections import defaultdict
 from datetime import date, datetime
 
 from django.db import models
+from django.db.models import F, Min, Value
+from django.db.models.functions import Coalesce
 from django.http import HttpRequest
 from modelcluster.contrib.taggit import ClusterTaggableManager
 from modelcluster.fields import ParentalKey
@@ -17,8 +18,13 @@ from wagtail.models import Orderable, Page
 from wagtail.search import index
 
 from common.models import DrupalFields
+from core.cache import get_or_set_cached, model_namespace
 from core.constants import COMMON_STREAMFIELD_BLOCKS
 
+NEWS_YEARS_NAMESPACE = "news:years"
+
+UNCATEGORIZED_TOPIC = "Uncategorized"
+
 
 class NewsIndexPage(Page):
     intro = RichTextField(blank=True)
@@ -42,12 +48,7 @@ class NewsIndexPage(Page):
         context = super().get_context(request)
 
         current_year = datetime.now().year
-        earliest = NewsItem.objects.order_by("publication_date").first()
-
-        if earliest is None:
-            earliest_year = current_year
-        else:
-            earliest_year = earliest.publication_date.year
+        earliest_year = self.get_earliest_news_year() or current_year
 
         # Get inclusive set of years from earliest to current (hence +1)
         context["news_years"] = range(earliest_year, current_year + 1)
@@ -55,45 +56,43 @@ class NewsIndexPage(Page):
         default_year = current_year
         context["selected_year"] = int(request.GET.get("year", default_year))
 
-        # Filter live (not draft) news items
-        # and items from selected year
-        # reverse chronological order
-        news_items = (
-            NewsItem.get_queryset()
-            .live()
+        # One row per news item and topic, grouped by topic title with
+        # {% regroup %} in the template, newest first within each topic.
+        # Items without topics get a single "Uncategorized" row.
+        context["news_items"] = (
+            NewsItem.objects.live()
+            .defer_streamfields()
             .filter(publication_date__year=context["selected_year"])
-            .order_by("-publication_date")
+            .annotate(
+                topic_title=Coalesce(
+                    F("topics__topic__title"),
+                    Value(UNCATEGORIZED_TOPIC),
+                ),
+            )
+            .order_by("topic_title", "-publication_date", "pk")
         )
 
-        uncategorized_topic = "Uncategorized"
-
-        # Grouping NewsItems by Topic title
-        grouped_news_items = defaultdict(list)
-        for item in news_items:
-            # Cache topics list to avoid repeated queries on prefetched data
-            item_topics = list(item.topics.all())
-
-            if len(item_topics) == 0:
-                grouped_news_items[uncategorized_topic].append(item)
+        return context
 
-            for topic_relation in item_topics:
-                title = topic_relation.topic.title
-                grouped_news_items[title].append(item)
+    @staticmethod
+    def get_earliest_news_year() -> int | None:
+        """Return the year of the earliest news item, if there are any.
 
-        # Sorting the groups and the items within each group
-        sorted_topics = sorted(grouped_news_items.keys())
-        sorted_grouped_news_items = {
-            topic: sorted(
-                grouped_news_items[topic],
-                key=lambda x: x.publication_date,
-                reverse=True,  # Sorts in reverse chronological order
-            )
-            for topic in sorted_topics
-        }
+        Cached until a news item changes.
+        """
 
-        context["grouped_news_items"] = sorted_grouped_news_items
+        def get_earliest_year() -> int | None:
+            earliest = NewsItem.objects.aggregate(
+                earliest=Min("publication_date"),
+            )["earliest"]
+            return earliest.year if earliest else None
 
-        return context
+        return get_or_set_cached(
+            NEWS_YEARS_NAMESPACE,
+            ["earliest"],
+            get_earliest_year,
+            depends_on=[model_namespace(NewsItem)],
+        )
 
 
 class NewsItemTag(TaggedItemBase):
@@ -111,7 +110,7 @@ class NewsItem(DrupalFields, Page):
         blank=True,
         help_text="Briefly summarize the news item for display in news lists",
     )
-    publication_date = models.DateField(default=date.today)
+    publication_date = models.DateField(default=date.today, db_index=True)
     body = StreamField(
         COMMON_STREAMFIELD_BLOCKS,
         use_json_field=True,
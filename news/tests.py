@@ -1,14 +1,18 @@
 from datetime import datetime
+from django.core.cache import cache
 from django.test import RequestFactory, TestCase
+from facets.factories import TopicFactory
 from home.models import HomePage
 
 from news.models import (
+    UNCATEGORIZED_TOPIC,
     NewsIndexPage,
     NewsItem,
 )
 from .factories import (
     NewsIndexPageFactory,
     NewsItemFactory,
+    NewsItemTopicFactory,
 )
 
 
@@ -84,17 +88,92 @@ class TestNewsIndexPageGetContext(TestCase):
         # Test if the context contains the correct selected year
         self.assertEqual(context["selected_year"], self.current_year)
 
-        # assert grouped_news_items is a defaultdict
-        self.assertIsInstance(context["grouped_news_items"], dict)
-
         # Extract topic titles from NewsItemTopic instances
         expected_topics = []
         for item in self.current_year_news_items:
             for topic in item.topics.all():
                 expected_topics.append(topic.topic.title)
+            if not item.topics.exists():
+                expected_topics.append(UNCATEGORIZED_TOPIC)
 
-        # Extract topic titles from the context's grouped_news_items keys
-        actual_topics = sorted(list(context["grouped_news_items"].keys()))
+        # Extract topic titles from the context's news items
+        actual_topics = sorted(
+            {item.topic_title for item in context["news_items"]},
+        )
 
-        # Test if grouped_news_items has the correct keys
+        # Test if news_items has the correct topics
         self.assertEqual(actual_topics, expected_topics)
+
+    def test_news_items_are_ordered_by_topic_then_date(self) -> None:
+        first_topic = TopicFactory.create(title="Alpha topic")
+        second_topic = TopicFactory.create(title="Beta topic")
+
+        older_item = NewsItemFactory.create(
+            publication_date=f"{self.current_year}-01-02",
+            parent=self.news_index_page,
+        )
+        newer_item = NewsItemFactory.create(
+            publication_date=f"{self.current_year}-01-03",
+            parent=self.news_index_page,
+        )
+        for item in [older_item, newer_item]:
+            NewsItemTopicFactory.create(news_item=item, topic=second_topic)
+        NewsItemTopicFactory.create(news_item=older_item, topic=first_topic)
+
+        request = self.factory.get("/")
+        context = self.news_index_page.get_context(request)
+
+        rows = [
+            (item.topic_title, item.publication_date, item.pk)
+            for item in context["news_items"]
+        ]
+        self.assertEqual(
+            [
+                (topic_title, pk)
+                for topic_title, _, pk in rows
+                if topic_title in ["Alpha topic", "Beta topic"]
+            ],
+            [
+                ("Alpha topic", older_item.pk),
+                ("Beta topic", newer_item.pk),
+                ("Beta topic", older_item.pk),
+            ],
+        )
+        # Topics in order, newest first within each topic
+        self.assertEqual(
+            [(topic_title, date) for topic_title, date, _ in rows],
+            sorted(
+                [(topic_title, date) for topic_title, date, _ in rows],
+                key=lambda row: (row[0], -row[1].toordinal()),
+            ),
+        )
+
+    def test_page_renders_topic_groups(self) -> None:
+        topic = TopicFactory.create(title="Rendered topic")
+        NewsItemTopicFactory.create(
+            news_item=self.current_year_news_items[0],
+            topic=topic,
+        )
+
+        request = self.factory.get("/")
+        response = self.news_index_page.serve(request)
+        response.render()
+
+        self.assertContains(response, "Rendered topic")
+        self.assertContains(response, self.current_year_news_items[0].title)
+
+    def test_earliest_year_is_cached_until_news_items_change(self) -> None:
+        cache.clear()
+        self.assertEqual(
+            self.news_index_page.get_earliest_news_year(),
+            self.initial_year,
+        )
+
+        with self.assertNumQueries(0):
+            self.news_index_page.get_earliest_news_year()
+
+        NewsItemFactory.create(
+            publication_date="2010-06-01",
+            parent=self.news_index_page,
+        )
+        self.assertEqual(self.news_index_page.get_earliest_news_year(), 2010)
@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+
+
+class PaginationConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "pagination"
+
+    def ready(self):
+        """Import signals when app is ready."""
+        from . import signals  # noqa: F401
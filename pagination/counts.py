@@ -0,0 +1,113 @@
+"""Cache the total counts of paginated listings.
+
+A count is cached under a hash of the listing's count query, so each
+normalized filter set (ordering removed) gets its own entry. The key also
+includes a generation token for every table the query reads, which the
+signals in pagination.signals replace whenever a page of that model is
+published, unpublished, moved or deleted. Replacing the token orphans every
+cached count that depends on the table, without having to find them.
+"""
+
+import hashlib
+import time
+from collections.abc import Callable
+
+from django.apps import apps
+from django.core.cache import cache
+from django.db.models import Model, QuerySet
+from wagtail.models import Page
+
+COUNT_CACHE_PREFIX = "pagination:count"
+
+# Counts also expire on their own, bounding staleness from changes made
+# outside the signals (e.g. bulk updates or raw SQL)
+COUNT_CACHE_TIMEOUT = 60 * 60 * 6
+
+
+def _generation_key(table: str) -> str:
+    return f"{COUNT_CACHE_PREFIX}:generation:{table}"
+
+
+def get_table_generations(tables: list[str]) -> list[int]:
+    """Return the current generation tokens of the given tables.
+
+    Tables without a token (never invalidated, or evicted) get a fresh one,
+    so an evicted token can never bring back counts cached before it.
+    """
+    keys = [_generation_key(table) for table in tables]
+    generations = cache.get_many(keys)
+
+    missing = {key: time.time_ns() for key in keys if key not in generations}
+    if missing:
+        cache.set_many(missing, timeout=None)
+        generations.update(missing)
+
+    return [generations[key] for key in keys]
+
+
+def get_model_tables(model: type[Model]) -> list[str]:
+    """Return the tables holding a model's rows that listings filter on.
+
+    Concrete parents are included, apart from Wagtail's page table, which
+    every page listing joins and which would otherwise make any publish
+    invalidate every cached count.
+    """
+    models = [model, *model._meta.get_parent_list()]
+    tables = [
+        candidate._meta.db_table
+        for candidate in models
+        if candidate is not Page or model is Page
+    ]
+    return list(dict.fromkeys(tables))
+
+
+def invalidate_counts_for_model(model: type[Model]) -> None:
+    """Drop the cached counts of every listing that reads the model's tables."""
+    cache.set_many(
+        {_generation_key(table): time.time_ns() for table in get_model_tables(model)},
+        timeout=None,
+    )
+
+
+def get_count_cache_key(items: QuerySet) -> str:
+    """Return the cache key for the count of a queryset.
+
+    The key combines a hash of the unordered query's SQL and parameters with
+    the generation tokens of every table the query reads.
+    """
+    query = items.order_by().query.clone()
+    sql, params = query.sql_with_params()
+
+    known_tables = {model._meta.db_table for model in apps.get_models()}
+    tables = sorted(
+        {
+            alias.table_name
+            for alias in query.alias_map.values()
+            if alias.table_name in known_tables
+        },
+    )
+    generations = get_table_generations(tables)
+
+    digest = hashlib.sha256(
+        repr((items.db, sql, params, generations)).encode(),
+    ).hexdigest()
+    return f"{COUNT_CACHE_PREFIX}:{digest}"
+
+
+def get_cached_count(
+    items: QuerySet,
+    count: Callable[[QuerySet], int] | None = None,
+) -> int:
+    """Return the number of items, from the cache when possible.
+
+    ``count`` computes the value on a cache miss and defaults to
+    ``QuerySet.count``.
+    """
+    cache_key = get_count_cache_key(items)
+    cached_count = cache.get(cache_key)
+    if cached_count is not None:
+        return cached_count
+
+    total = count(items) if count else items.count()
+    cache.set(cache_key, total, timeout=COUNT_CACHE_TIMEOUT)
+    return total
@@ -1,7 +1,22 @@
-from dataclasses import dataclass
+import datetime
+import decimal
+import uuid
 from collections.abc import Iterator
-from django.core.paginator import Paginator, Page
-from django.db.models import QuerySet
+from dataclasses import dataclass
+from functools import cached_property
+
+from django.core import signing
+from django.core.exceptions import FieldDoesNotExist
+from django.core.paginator import Page, Paginator
+from django.db import connections
+from django.db.models import F, Q, QuerySet
+
+from .counts import get_cached_count
+
+# Querysets estimated to have fewer rows than this are counted exactly
+EXACT_COUNT_THRESHOLD = 10_000
+
+KEYSET_TOKEN_SALT = "pagination.keyset"
 
 
 @dataclass
@@ -12,14 +27,291 @@ class PaginatorPageWithElidedPageRange:
     elided_page_range: Iterator[int | str]
 
 
+def estimate_count(items: QuerySet) -> int:
+    """Return the number of items, estimated by the planner for large sets.
+
+    On PostgreSQL the planner's row estimate is used when it is at least
+    EXACT_COUNT_THRESHOLD, avoiding a full COUNT(*) scan; smaller querysets,
+    and other databases, are counted exactly.
+    """
+    connection = connections[items.db]
+    if connection.vendor != "postgresql":
+        return items.count()
+
+    sql, params = items.query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    estimated_rows = int(plan[0]["Plan"]["Plan Rows"])
+
+    if estimated_rows < EXACT_COUNT_THRESHOLD:
+        return items.count()
+    return estimated_rows
+
+
+def _encode_key_value(value):
+    if isinstance(value, datetime.date | datetime.time):
+        return value.isoformat()
+    if isinstance(value, decimal.Decimal | uuid.UUID):
+        return str(value)
+    return value
+
+
+class CachedCountPaginator(Paginator):
+    """A Paginator whose total count comes from the count cache.
+
+    See pagination.counts for how cached counts are keyed and invalidated.
+    """
+
+    @cached_property
+    def count(self) -> int:
+        if isinstance(self.object_list, QuerySet):
+            return get_cached_count(self.object_list)
+        return super().count
+
+
+class KeysetPage(Page):
+    """A page fetched by key rather than by offset.
+
+    ``has_next`` is known exactly from a look-ahead row, and ``next_cursor`` /
+    ``previous_cursor`` are opaque tokens for the neighbouring pages.
+    """
+
+    def __init__(self, object_list, number, paginator, has_next: bool):
+        super().__init__(object_list, number, paginator)
+        self._has_next = has_next
+
+    def has_next(self) -> bool:
+        return self._has_next
+
+    @cached_property
+    def next_cursor(self) -> str | None:
+        if not self.has_next() or not self.object_list:
+            return None
+        return self.paginator.make_token("after", self.object_list[-1], self.number)
+
+    @cached_property
+    def previous_cursor(self) -> str | None:
+        if not self.has_previous() or not self.object_list:
+            return None
+        return self.paginator.make_token("before", self.object_list[0], self.number)
+
+
+class KeysetPaginator(Paginator):
+    """Paginate by the queryset's ordering keys instead of OFFSET.
+
+    Pages reached through ``after``/``before`` tokens filter on the ordering
+    keys of the neighbouring page's last/first item, so deep pages cost the
+    same as the first one. Page numbers still work (using OFFSET), so numbered
+    links and the elided page range keep working. The total count is
+    estimated (see estimate_count).
+
+    NULL key values are handled with PostgreSQL's default ordering, where
+    NULLs sort last ascending and first descending.
+    """
+
+    def __init__(
+        self,
+        object_list: QuerySet,
+        per_page: int,
+        cache_count: bool = False,
+        **kwargs,
+    ):
+        self.cache_count = cache_count
+        ordering = list(object_list.query.order_by) or list(
+            object_list.model._meta.ordering,
+        )
+        ordering = [
+            field for field in ordering if field.lstrip("-") not in ("pk", "id")
+        ] + ["pk"]
+        self.key_fields = [field.lstrip("-") for field in ordering]
+        self.key_descending = [field.startswith("-") for field in ordering]
+        self.key_aliases = [f"_keyset_{index}" for index in range(len(ordering))]
+        self.key_nullable = [
+            self._is_nullable(object_list.model, field) for field in self.key_fields
+        ]
+
+        object_list = object_list.annotate(
+            **{
+                alias: F(field)
+                for alias, field in zip(self.key_aliases, self.key_fields, strict=True)
+            },
+        ).order_by(*ordering)
+        super().__init__(object_list, per_page, **kwargs)
+
+    @classmethod
+    def supports(cls, object_list) -> bool:
+        """Whether the object list's ordering can be used as a keyset."""
+        if not isinstance(object_list, QuerySet):
+            return False
+        ordering = list(object_list.query.order_by) or list(
+            object_list.model._meta.ordering,
+        )
+        return all(isinstance(field, str) and field != "?" for field in ordering)
+
+    @staticmethod
+    def _is_nullable(model, field_name: str) -> bool:
+        """Whether a key may be NULL; lookups across relations are assumed to."""
+        if field_name == "pk":
+            return False
+        try:
+            return model._meta.get_field(field_name).null
+        except FieldDoesNotExist:
+            return True
+
+    @cached_property
+    def count(self) -> int:
+        if self.cache_count:
+            return get_cached_count(self.object_list, count=estimate_count)
+        return estimate_count(self.object_list)
+
+    def _get_page(self, *args, **kwargs):
+        return KeysetPage(*args, **kwargs)
+
+    def page(self, number) -> KeysetPage:
+        """Return the given 1-based page number, using OFFSET."""
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        rows = list(self.object_list[bottom : bottom + self.per_page + 1])
+        return self._build_page(rows, number, reverse=False)
+
+    def page_from_token(self, token: str) -> KeysetPage | None:
+        """Return the page a token points to, or None for invalid tokens."""
+        try:
+            payload = signing.loads(token, salt=KEYSET_TOKEN_SALT)
+            direction, number, values = payload["d"], int(payload["n"]), payload["k"]
+        except (signing.BadSignature, KeyError, TypeError, ValueError):
+            return None
+        if direction not in ("after", "before") or len(values) != len(
+            self.key_fields,
+        ):
+            return None
+
+        reverse = direction == "before"
+        number = number - 1 if reverse else number + 1
+        if number < 1:
+            return None
+
+        boundary = self._boundary_filter(values, reverse)
+        items = self.object_list.filter(boundary)
+        if reverse:
+            items = items.reverse()
+        rows = list(items[: self.per_page + 1])
+        if not rows:
+            return None
+        return self._build_page(rows, number, reverse=reverse)
+
+    def make_token(self, direction: str, item, number: int) -> str:
+        values = [_encode_key_value(getattr(item, alias)) for alias in self.key_aliases]
+        return signing.dumps(
+            {"d": direction, "n": number, "k": values},
+            salt=KEYSET_TOKEN_SALT,
+            compress=True,
+        )
+
+    def _build_page(self, rows: list, number: int, reverse: bool) -> KeysetPage:
+        has_more = len(rows) > self.per_page
+        rows = rows[: self.per_page]
+        if reverse:
+            rows.reverse()
+            # Walking backwards, the look-ahead row is on the previous page
+            has_next = True
+        else:
+            has_next = has_more
+
+        # Keep the estimated page count consistent with what was fetched
+        minimum_count = (number - 1) * self.per_page + len(rows) + int(has_next)
+        if self.count < minimum_count:
+            self.__dict__["count"] = minimum_count
+            self.__dict__.pop("num_pages", None)
+
+        return self._get_page(rows, number, self, has_next=has_next)
+
+    def _boundary_filter(self, values: list, reverse: bool) -> Q:
+        """Rows strictly after (or before, if reverse) the given key values."""
+        boundary = Q(pk__in=[])
+        equal_prefix = Q()
+        for field, descending, nullable, value in zip(
+            self.key_fields,
+            self.key_descending,
+            self.key_nullable,
+            values,
+            strict=True,
+        ):
+            boundary |= equal_prefix & self._beyond(
+                field,
+                value,
+                descending != reverse,
+                nullable,
+            )
+            equal_prefix &= (
+                Q(**{f"{field}__isnull": True})
+                if value is None
+                else Q(**{field: value})
+            )
+        return boundary
+
+    @staticmethod
+    def _beyond(field: str, value, descending: bool, nullable: bool) -> Q:
+        """Rows whose field sorts after the value in the given direction."""
+        if value is None:
+            # NULLs sort last ascending: nothing comes after them.
+            # NULLs sort first descending: every non-NULL value follows.
+            return Q(**{f"{field}__isnull": False}) if descending else Q(pk__in=[])
+        if descending:
+            return Q(**{f"{field}__lt": value})
+        if nullable:
+            return Q(**{f"{field}__gt": value}) | Q(**{f"{field}__isnull": True})
+        return Q(**{f"{field}__gt": value})
+
+
 def get_paginated_items(
     items: QuerySet,
     items_per_page: int,
     page_number: int = 1,
+    keyset: bool = False,
+    after: str | None = None,
+    before: str | None = None,
+    cache_count: bool = False,
 ) -> PaginatorPageWithElidedPageRange:
-    """Paginate items and return a page of items."""
+    """Paginate items and return a page of items.
 
-    paginator: Paginator = Paginator(items, items_per_page)
+    With ``keyset=True`` the page is fetched by key using the opaque
+    ``after``/``before`` tokens from the previous request (exposed as
+    ``page.next_cursor`` and ``page.previous_cursor``), and the total count
+    is estimated. Querysets whose ordering cannot serve as a keyset fall back
+    to regular pagination.
+
+    With ``cache_count=True`` the total count is read from the count cache
+    (see pagination.counts). Only use it for listings of pages, whose cached
+    counts are invalidated when pages are published, unpublished, moved or
+    deleted.
+    """
+
+    if keyset and KeysetPaginator.supports(items):
+        paginator: Paginator = KeysetPaginator(
+            items,
+            items_per_page,
+            cache_count=cache_count,
+        )
+
+        token = after or before
+        page = paginator.page_from_token(token) if token else None  # type: ignore[attr-defined]
+        if page is None:
+            page = paginator.page(
+                page_number if 1 <= page_number <= paginator.num_pages else 1,
+            )
+
+        return PaginatorPageWithElidedPageRange(
+            page=page,
+            elided_page_range=paginator.get_elided_page_range(page.number),
+        )
+
+    paginator = (
+        CachedCountPaginator(items, items_per_page)
+        if cache_count
+        else Paginator(items, items_per_page)
+    )
 
     paginator_page_number = (
         page_number if 1 <= page_number <= paginator.num_pages else 1
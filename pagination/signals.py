@@ -0,0 +1,26 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from wagtail.models import Page
+from wagtail.signals import page_published, page_unpublished, post_page_move
+
+from .counts import invalidate_counts_for_model
+
+
+@receiver(page_published)
+@receiver(page_unpublished)
+@receiver(post_page_move)
+def invalidate_counts_on_page_change(sender, instance, **kwargs):
+    """Drop cached listing counts that include the changed page's model."""
+    invalidate_counts_for_model(instance.specific_class or type(instance))
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def invalidate_counts_on_page_save(sender, instance, **kwargs):
+    """Drop cached listing counts when a page is saved or deleted directly.
+
+    This covers pages created live with ``add_child`` (e.g. by imports) and
+    deletions, which do not send the publish/unpublish signals.
+    """
+    if isinstance(instance, Page):
+        invalidate_counts_for_model(instance.specific_class or type(instance))
@@ -1,11 +1,23 @@
+import datetime
+
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.core.paginator import Paginator
 from django.test import TestCase
+from django.utils import timezone
 from django_stubs_ext import QuerySetAny
 
 from accounts.factories import UserFactory
+from library.factories import LibraryItemFactory
+from library.models import LibraryItem
 
-from .helpers import get_paginated_items, PaginatorPageWithElidedPageRange
+from .counts import get_cached_count, get_count_cache_key
+from .helpers import (
+    KeysetPage,
+    PaginatorPageWithElidedPageRange,
+    estimate_count,
+    get_paginated_items,
+)
 
 User = get_user_model()
 
@@ -139,3 +151,203 @@ class GetPaginatedItemsTests(TestCase):
                 23,
             ],
         )
+
+
+class KeysetPaginationTests(TestCase):
+    users: QuerySetAny
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        UserFactory.create_batch(95)
+        cls.users = User.objects.all().order_by("id")
+
+        # Give every third user a last login, with ties, leaving the rest NULL
+        now = timezone.now()
+        for index, user in enumerate(cls.users):
+            if index % 3 == 0:
+                user.last_login = now - datetime.timedelta(days=index % 7)
+                user.save(update_fields=["last_login"])
+
+    def walk_forward(self, items: QuerySetAny, items_per_page: int) -> list:
+        pages = []
+        after = None
+        while True:
+            result = get_paginated_items(
+                items,
+                items_per_page=items_per_page,
+                keyset=True,
+                after=after,
+            )
+            pages.append(result.page)
+            if not result.page.has_next():
+                return pages
+            after = result.page.next_cursor
+
+    def test_keyset_page_is_returned(self) -> None:
+        result = get_paginated_items(self.users, items_per_page=10, keyset=True)
+
+        self.assertIsInstance(result.page, KeysetPage)
+        self.assertEqual(result.page.number, 1)
+        self.assertEqual(list(result.page), list(self.users[:10]))
+        self.assertIsNone(result.page.previous_cursor)
+        self.assertIsNotNone(result.page.next_cursor)
+
+    def test_walking_forward_matches_offset_pagination(self) -> None:
+        pages = self.walk_forward(self.users, items_per_page=10)
+
+        self.assertEqual([page.number for page in pages], list(range(1, 11)))
+        self.assertEqual(
+            [user for page in pages for user in page],
+            list(self.users),
+        )
+        self.assertIsNone(pages[-1].next_cursor)
+
+    def test_walking_backward_returns_previous_pages(self) -> None:
+        pages = self.walk_forward(self.users, items_per_page=10)
+        before = pages[-1].previous_cursor
+
+        for expected_page in reversed(pages[:-1]):
+            result = get_paginated_items(
+                self.users,
+                items_per_page=10,
+                keyset=True,
+                before=before,
+            )
+            self.assertEqual(result.page.number, expected_page.number)
+            self.assertEqual(list(result.page), list(expected_page))
+            self.assertTrue(result.page.has_next())
+            before = result.page.previous_cursor
+
+        self.assertIsNone(before)
+
+    def test_nullable_and_tied_ordering_keys(self) -> None:
+        for ordering in (
+            ("last_login",),
+            ("-last_login",),
+            ("is_staff", "-last_login"),
+        ):
+            with self.subTest(ordering=ordering):
+                items = User.objects.order_by(*ordering)
+                pages = self.walk_forward(items, items_per_page=7)
+
+                self.assertEqual(
+                    [user for page in pages for user in page],
+                    list(items.order_by(*ordering, "pk")),
+                )
+
+    def test_next_page_does_not_use_offset(self) -> None:
+        first_page = get_paginated_items(self.users, items_per_page=10, keyset=True)
+
+        # The page itself, then the count (planner estimate and exact count)
+        with self.assertNumQueries(3) as context:
+            result = get_paginated_items(
+                self.users,
+                items_per_page=10,
+                keyset=True,
+                after=first_page.page.next_cursor,
+            )
+            list(result.page)
+
+        self.assertEqual(result.page.number, 2)
+        for query in context.captured_queries:
+            self.assertNotIn("OFFSET", query["sql"])
+
+    def test_invalid_cursor_falls_back_to_page_number(self) -> None:
+        result = get_paginated_items(
+            self.users,
+            items_per_page=10,
+            page_number=3,
+            keyset=True,
+            after="not-a-valid-cursor",
+        )
+
+        self.assertEqual(result.page.number, 3)
+        self.assertEqual(list(result.page), list(self.users[20:30]))
+
+    def test_unsupported_ordering_falls_back_to_paginator(self) -> None:
+        result = get_paginated_items(
+            User.objects.order_by("?"),
+            items_per_page=10,
+            keyset=True,
+        )
+
+        self.assertNotIsInstance(result.page, KeysetPage)
+        self.assertEqual(len(result.page), 10)
+
+    def test_estimate_count_is_exact_for_small_querysets(self) -> None:
+        self.assertEqual(estimate_count(self.users), 95)
+
+
+class CountCacheTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.library_item = LibraryItemFactory.create(title="Cached count")
+
+    def count_live_items(self) -> int:
+        return get_cached_count(LibraryItem.objects.live())
+
+    def test_count_is_cached(self) -> None:
+        self.assertEqual(self.count_live_items(), 1)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.count_live_items(), 1)
+
+    def test_cache_key_ignores_ordering(self) -> None:
+        items = LibraryItem.objects.live()
+
+        self.assertEqual(
+            get_count_cache_key(items.order_by("title")),
+            get_count_cache_key(items.order_by("-publication_date")),
+        )
+
+    def test_cache_key_depends_on_filters(self) -> None:
+        items = LibraryItem.objects.live()
+
+        self.assertNotEqual(
+            get_count_cache_key(items.filter(title="Cached count")),
+            get_count_cache_key(items.filter(title="Something else")),
+        )
+
+    def test_publish_and_unpublish_invalidate_count(self) -> None:
+        draft_item = LibraryItemFactory.create(live=False)
+        self.assertEqual(self.count_live_items(), 1)
+
+        draft_item.save_revision().publish()
+        self.assertEqual(self.count_live_items(), 2)
+
+        draft_item.refresh_from_db()
+        draft_item.unpublish()
+        self.assertEqual(self.count_live_items(), 1)
+
+    def test_delete_invalidates_count(self) -> None:
+        self.assertEqual(self.count_live_items(), 1)
+
+        self.library_item.delete()
+
+        self.assertEqual(self.count_live_items(), 0)
+
+    def test_other_models_do_not_invalidate_count(self) -> None:
+        self.assertEqual(self.count_live_items(), 1)
+        user = UserFactory.create()
+        user.delete()
+
+        with self.assertNumQueries(0):
+            self.count_live_items()
+
+    def test_get_paginated_items_uses_cached_count(self) -> None:
+        get_paginated_items(
+            LibraryItem.objects.live().order_by("title"),
+            items_per_page=10,
+            cache_count=True,
+        )
+
+        with self.assertNumQueries(1) as context:
+            result = get_paginated_items(
+                LibraryItem.objects.live().order_by("title"),
+                items_per_page=10,
+                cache_count=True,
+            )
+            list(result.page)
+
+        self.assertEqual(result.page.paginator.count, 1)
+        self.assertNotIn("COUNT", context.captured_queries[0]["sql"])
@@ -1,14 +1,38 @@
+import time
+from collections.abc import Callable
+from http import HTTPStatus
+
 import requests
 from django.conf import settings
+from django.core.cache import cache
 
+from paypal.client import paypal_request
+from paypal.constants import PAYPAL_OAUTH_TOKEN_PATH
 from paypal.models import PayPalError
 
+AUTH_TOKEN_CACHE_KEY = "paypal_auth_token"
+AUTH_TOKEN_LOCK_KEY = "paypal_auth_token_lock"
 
-def get_auth_token() -> str:
-    """Get an auth token from PayPal."""
+# Refresh tokens this long before PayPal expires them
+AUTH_TOKEN_REFRESH_MARGIN_S = 5 * 60
+# How long one worker may hold the refresh lock
+AUTH_TOKEN_LOCK_TIMEOUT_S = 10
+# How long other workers wait for that refresh when they have no valid token
+AUTH_TOKEN_LOCK_WAIT_S = 2
+AUTH_TOKEN_LOCK_POLL_S = 0.05
+
+
+def request_auth_token() -> dict:
+    """Request a new access token from PayPal.
 
-    response = requests.post(
-        url=f"{settings.PAYPAL_API_URL}/v1/oauth2/token",
+    Returns PayPal's response, including ``access_token`` and its lifetime
+    in seconds, ``expires_in``.
+    """
+
+    response = paypal_request(
+        "POST",
+        PAYPAL_OAUTH_TOKEN_PATH,
+        endpoint="oauth_token",
         auth=(
             settings.PAYPAL_CLIENT_ID,  # type: ignore
             settings.PAYPAL_CLIENT_SECRET,  # type: ignore
@@ -23,11 +47,93 @@ def get_auth_token() -> str:
     except requests.exceptions.HTTPError as e:
         raise PayPalError(e)
 
-    return response.json()["access_token"]
+    return response.json()
+
+
+def get_auth_token() -> str:
+    """Get a new auth token from PayPal."""
+
+    return request_auth_token()["access_token"]
+
+
+def _get_valid_cached_token(margin_s: float = 0) -> str | None:
+    cached_token = cache.get(AUTH_TOKEN_CACHE_KEY)
+    if cached_token and time.time() < cached_token["expires_at"] - margin_s:
+        return cached_token["access_token"]
+    return None
+
+
+def refresh_auth_token() -> str:
+    """Request a new auth token and store it in the cache until it expires."""
+
+    token = request_auth_token()
+    expires_in = int(token.get("expires_in", 0))
+    if expires_in > 0:
+        cache.set(
+            AUTH_TOKEN_CACHE_KEY,
+            {
+                "access_token": token["access_token"],
+                "expires_at": time.time() + expires_in,
+            },
+            expires_in,
+        )
+    return token["access_token"]
+
+
+def get_cached_auth_token() -> str:
+    """Get an auth token, reusing the cached one until shortly before expiry.
+
+    Only the worker that acquires the refresh lock requests a new token.
+    Meanwhile, other workers keep using the old token while it is still
+    valid, or wait briefly for the new one, so an expiring token does not
+    cause every worker to request a token at once.
+    """
+
+    token = _get_valid_cached_token(margin_s=AUTH_TOKEN_REFRESH_MARGIN_S)
+    if token:
+        return token
+
+    if cache.add(AUTH_TOKEN_LOCK_KEY, True, AUTH_TOKEN_LOCK_TIMEOUT_S):
+        try:
+            return refresh_auth_token()
+        finally:
+            cache.delete(AUTH_TOKEN_LOCK_KEY)
+
+    deadline = time.monotonic() + AUTH_TOKEN_LOCK_WAIT_S
+    while True:
+        token = _get_valid_cached_token()
+        if token:
+            return token
+        if time.monotonic() >= deadline:
+            # The refreshing worker is slow or failed; don't block the request
+            return refresh_auth_token()
+        time.sleep(AUTH_TOKEN_LOCK_POLL_S)
+
+
+def invalidate_auth_token() -> None:
+    """Drop the cached auth token, e.g. after PayPal rejected it."""
+
+    cache.delete(AUTH_TOKEN_CACHE_KEY)
 
 
 def construct_paypal_auth_headers() -> dict[str, str]:
     return {
-        "Authorization": f"Bearer {get_auth_token()}",
+        "Authorization": f"Bearer {get_cached_auth_token()}",
         "Content-Type": "application/json",
     }
+
+
+def retry_on_unauthorized(
+    send_request: Callable[[], requests.Response],
+) -> requests.Response:
+    """Send a request, retrying once with a new token if PayPal returns 401.
+
+    ``send_request`` must build its auth headers when called, so that the
+    retry picks up the new token.
+    """
+
+    response = send_request()
+    if response.status_code == HTTPStatus.UNAUTHORIZED:
+        invalidate_auth_token()
+        response = send_request()
+    return response
@@ -0,0 +1,199 @@
+"""Shared HTTP client for the PayPal REST API.
+
+All PayPal calls go through paypal_request(), which uses one pooled,
+keep-alive requests.Session per process, so consecutive calls reuse the TLS
+connection instead of opening a new one. The session retries connection
+errors and 429/5xx responses with exponential backoff (honoring
+Retry-After), every request has explicit connect and read timeouts, and the
+latency of each call is recorded per endpoint (see get_latency_metrics).
+Each process logs its latencies every LATENCY_METRICS_LOG_INTERVAL_S seconds
+at INFO level, and the refresh_subscription_statuses command reports those
+of its run.
+"""
+
+import logging
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .models import PayPalError
+
+logger = logging.getLogger(__name__)
+
+CONNECT_TIMEOUT_S = 3.05
+READ_TIMEOUT_S = 20
+
+POOL_CONNECTIONS = 1
+POOL_MAXSIZE = 10
+
+MAX_RETRIES = 3
+RETRY_BACKOFF_FACTOR = 0.5
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+LATENCY_METRICS_LOG_INTERVAL_S = 15 * 60
+
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+
+
+def build_session() -> requests.Session:
+    """Build a session with a connection pool and retry policy for PayPal."""
+
+    retry = Retry(
+        total=MAX_RETRIES,
+        connect=MAX_RETRIES,
+        # A read timeout means PayPal may have acted on the request already
+        read=0,
+        status=MAX_RETRIES,
+        backoff_factor=RETRY_BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUS_CODES,
+        # POSTs are safe to retry: order calls carry a PayPal-Request-Id
+        # idempotency key, and requesting an OAuth token has no side effects
+        allowed_methods=None,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=retry,
+    )
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session() -> requests.Session:
+    """Return the process-wide PayPal session, creating it on first use."""
+
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = build_session()
+    return _session
+
+
+def reset_session() -> None:
+    """Close the process-wide session, e.g. after changing its settings."""
+
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+        _session = None
+
+
+@dataclass
+class EndpointLatency:
+    calls: int = 0
+    errors: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.calls if self.calls else 0.0
+
+
+_latencies: dict[str, EndpointLatency] = {}
+_latencies_lock = threading.Lock()
+_latencies_logged_at = time.monotonic()
+
+
+def record_latency(endpoint: str, elapsed_ms: float, error: bool) -> None:
+    global _latencies_logged_at
+    with _latencies_lock:
+        latency = _latencies.setdefault(endpoint, EndpointLatency())
+        latency.calls += 1
+        latency.errors += int(error)
+        latency.total_ms += elapsed_ms
+        latency.max_ms = max(latency.max_ms, elapsed_ms)
+
+        now = time.monotonic()
+        log_due = now - _latencies_logged_at >= LATENCY_METRICS_LOG_INTERVAL_S
+        if log_due:
+            _latencies_logged_at = now
+
+    if log_due:
+        log_latency_metrics()
+
+
+def get_latency_metrics() -> dict[str, dict[str, float]]:
+    """Return call counts, errors and latencies per endpoint in this process.
+
+    Latencies include retries, i.e. they are what the caller waited for.
+    """
+
+    with _latencies_lock:
+        return {
+            endpoint: {**asdict(latency), "mean_ms": latency.mean_ms}
+            for endpoint, latency in _latencies.items()
+        }
+
+
+def describe_latency_metrics() -> list[str]:
+    """Return one line per endpoint describing its calls and latencies."""
+
+    return [
+        f"{endpoint}: {metrics['calls']} calls, {metrics['errors']} errors, "
+        f"mean {metrics['mean_ms']:.0f} ms, max {metrics['max_ms']:.0f} ms"
+        for endpoint, metrics in sorted(get_latency_metrics().items())
+    ]
+
+
+def log_latency_metrics() -> None:
+    """Log the latencies of each endpoint called by this process."""
+
+    for line in describe_latency_metrics():
+        logger.info("PayPal latency in process %d: %s", os.getpid(), line)
+
+
+def reset_latency_metrics() -> None:
+    with _latencies_lock:
+        _latencies.clear()
+
+
+def paypal_request(
+    method: str,
+    path: str,
+    *,
+    endpoint: str,
+    **kwargs,
+) -> requests.Response:
+    """Send a request to the PayPal API through the shared session.
+
+    ``path`` is relative to ``settings.PAYPAL_API_URL`` and ``endpoint`` names
+    the call in the latency metrics. Other keyword arguments are passed on to
+    ``requests``. Network errors raise PayPalError; HTTP error responses are
+    returned for the caller to handle.
+    """
+
+    kwargs.setdefault("timeout", (CONNECT_TIMEOUT_S, READ_TIMEOUT_S))
+    url = f"{settings.PAYPAL_API_URL}{path}"
+
+    started = time.perf_counter()
+    try:
+        response = get_session().request(method, url, **kwargs)
+    except requests.exceptions.RequestException as error:
+        record_latency(endpoint, (time.perf_counter() - started) * 1000, error=True)
+        logger.warning("PayPal %s request failed: %s", endpoint, error)
+        raise PayPalError(error)
+
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    record_latency(endpoint, elapsed_ms, error=response.status_code >= 400)
+    logger.debug(
+        "PayPal %s returned %s in %.1f ms",
+        endpoint,
+        response.status_code,
+        elapsed_ms,
+    )
+    return response
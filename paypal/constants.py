@@ -1,9 +1,11 @@
-from django.conf import settings
 from paypal.models import CurrencyCode
 
 
-PAYPAL_ORDER_BASE_URL = f"{settings.PAYPAL_API_URL}/v2/checkout/orders"  # type: ignore
-PAYPAL_SUBSCRIPTIONS_BASE_URL = f"{settings.PAYPAL_API_URL}/v1/billing/subscriptions"  # type: ignore
+# API paths, relative to settings.PAYPAL_API_URL
+PAYPAL_OAUTH_TOKEN_PATH = "/v1/oauth2/token"
+PAYPAL_ORDERS_PATH = "/v2/checkout/orders"
+PAYPAL_SUBSCRIPTIONS_PATH = "/v1/billing/subscriptions"
+PAYPAL_VERIFY_WEBHOOK_SIGNATURE_PATH = "/v1/notifications/verify-webhook-signature"
 
 DEFAULT_CURRENCY_CODE = CurrencyCode.USD
 
@@ -0,0 +1,213 @@
+"""A local stand-in for the PayPal REST API, for tests.
+
+FakePayPalServer serves the endpoints the site uses (OAuth token, create and
+capture order, get subscription, verify webhook signature) over HTTP/1.1
+keep-alive on localhost, and records requests and TCP connections, so
+connection reuse, retries and timeouts of paypal.client can be verified
+without network access:
+
+    with FakePayPalServer() as server, override_settings(
+        PAYPAL_API_URL=server.url,
+    ):
+        server.fail_next(HTTPStatus.SERVICE_UNAVAILABLE)
+        create_order(value_usd="10.00")
+"""
+
+import json
+import re
+import sys
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Self
+
+FAKE_ACCESS_TOKEN = "fake-access-token"
+FAKE_TOKEN_EXPIRES_IN_S = 32400
+
+
+@dataclass
+class RecordedRequest:
+    method: str
+    path: str
+    headers: dict[str, str]
+    body: bytes
+
+
+class FakePayPalRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "FakePayPalHTTPServer"
+
+    def setup(self):
+        super().setup()
+        self.server.fake.record_connection()
+
+    def log_message(self, format, *args):
+        """Keep test output quiet."""
+
+    def do_GET(self):
+        self.handle_api_request()
+
+    def do_POST(self):
+        self.handle_api_request()
+
+    def handle_api_request(self):
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length) if length else b""
+        fake = self.server.fake
+        fake.record_request(
+            RecordedRequest(
+                method=self.command,
+                path=self.path,
+                headers=dict(self.headers),
+                body=body,
+            ),
+        )
+
+        if fake.delay_s:
+            time.sleep(fake.delay_s)
+
+        status, payload, headers = fake.get_response(
+            self.command,
+            self.path,
+            self.headers,
+        )
+        content = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(content)
+
+
+class FakePayPalHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, fake: "FakePayPalServer"):
+        self.fake = fake
+        super().__init__(("127.0.0.1", 0), FakePayPalRequestHandler)
+
+    def handle_error(self, request, client_address):
+        """Ignore clients that hang up early, e.g. after a read timeout."""
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+class FakePayPalServer:
+    """An in-process fake PayPal API listening on a free localhost port."""
+
+    def __init__(self):
+        self.requests: list[RecordedRequest] = []
+        self.connection_count = 0
+        self.subscription_statuses: dict[str, str] = {}
+        self.webhook_signatures_valid = True
+        # Seconds to wait before answering each request
+        self.delay_s = 0.0
+
+        self._failures: deque[tuple[int, dict[str, str]]] = deque()
+        self._orders_by_request_id: dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._httpd: FakePayPalHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        assert self._httpd is not None, "The fake PayPal server is not running"
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> Self:
+        self._httpd = FakePayPalHTTPServer(self)
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever,
+            daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def __enter__(self) -> Self:
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def fail_next(
+        self,
+        status: int,
+        times: int = 1,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        """Answer the next ``times`` requests with an error status."""
+        with self._lock:
+            self._failures.extend([(status, headers or {})] * times)
+
+    def record_connection(self) -> None:
+        with self._lock:
+            self.connection_count += 1
+
+    def record_request(self, request: RecordedRequest) -> None:
+        with self._lock:
+            self.requests.append(request)
+
+    def requests_to(self, path_prefix: str) -> list[RecordedRequest]:
+        return [
+            request for request in self.requests if request.path.startswith(path_prefix)
+        ]
+
+    def get_response(self, method: str, path: str, headers) -> tuple[int, dict, dict]:
+        with self._lock:
+            if self._failures:
+                status, failure_headers = self._failures.popleft()
+                return status, {"name": HTTPStatus(status).phrase}, failure_headers
+
+        if method == "POST" and path == "/v1/oauth2/token":
+            return (
+                HTTPStatus.OK,
+                {
+                    "access_token": FAKE_ACCESS_TOKEN,
+                    "token_type": "Bearer",
+                    "expires_in": FAKE_TOKEN_EXPIRES_IN_S,
+                },
+                {},
+            )
+
+        if headers.get("Authorization") != f"Bearer {FAKE_ACCESS_TOKEN}":
+            return HTTPStatus.UNAUTHORIZED, {"name": "AUTHENTICATION_FAILURE"}, {}
+
+        if method == "POST" and path == "/v2/checkout/orders":
+            # Like PayPal, repeat requests with the same PayPal-Request-Id
+            # return the original order
+            request_id = headers.get("PayPal-Request-Id") or str(len(self.requests))
+            with self._lock:
+                order_id = self._orders_by_request_id.setdefault(
+                    request_id,
+                    f"FAKE-ORDER-{len(self._orders_by_request_id) + 1}",
+                )
+            return HTTPStatus.CREATED, {"id": order_id, "status": "CREATED"}, {}
+
+        match = re.fullmatch(r"/v2/checkout/orders/([^/]+)/capture", path)
+        if method == "POST" and match:
+            return HTTPStatus.CREATED, {"id": match[1], "status": "COMPLETED"}, {}
+
+        match = re.fullmatch(r"/v1/billing/subscriptions/([^/]+)", path)
+        if method == "GET" and match:
+            status = self.subscription_statuses.get(match[1], "ACTIVE")
+            return HTTPStatus.OK, {"id": match[1], "status": status}, {}
+
+        if method == "POST" and path == "/v1/notifications/verify-webhook-signature":
+            verification_status = (
+                "SUCCESS" if self.webhook_signatures_valid else "FAILURE"
+            )
+            return HTTPStatus.OK, {"verification_status": verification_status}, {}
+
+        return HTTPStatus.NOT_FOUND, {"name": "RESOURCE_NOT_FOUND"}, {}
@@ -1,8 +1,9 @@
 import logging
-import requests
+import uuid
 from requests import HTTPError
-from .auth import construct_paypal_auth_headers
-from .constants import PAYPAL_ORDER_BASE_URL, DEFAULT_CURRENCY_CODE
+from .auth import construct_paypal_auth_headers, retry_on_unauthorized
+from .client import paypal_request
+from .constants import PAYPAL_ORDERS_PATH, DEFAULT_CURRENCY_CODE
 from .models import PayPalError
 
 logger = logging.getLogger(__name__)
@@ -14,22 +15,30 @@ def create_order(
 ) -> dict:
     """Create a PayPal order."""
 
-    headers = construct_paypal_auth_headers()
+    # Lets PayPal recognize retries of this call instead of creating new orders
+    request_id = str(uuid.uuid4())
 
-    response = requests.post(
-        url=PAYPAL_ORDER_BASE_URL,
-        headers=headers,
-        json={
-            "intent": "CAPTURE",
-            "purchase_units": [
-                {
-                    "amount": {
-                        "currency_code": DEFAULT_CURRENCY_CODE.value,
-                        "value": value_usd,
+    response = retry_on_unauthorized(
+        lambda: paypal_request(
+            "POST",
+            PAYPAL_ORDERS_PATH,
+            endpoint="create_order",
+            headers={
+                **construct_paypal_auth_headers(),
+                "PayPal-Request-Id": request_id,
+            },
+            json={
+                "intent": "CAPTURE",
+                "purchase_units": [
+                    {
+                        "amount": {
+                            "currency_code": DEFAULT_CURRENCY_CODE.value,
+                            "value": value_usd,
+                        },
                     },
-                },
-            ],
-        },
+                ],
+            },
+        ),
     )
     try:
         response.raise_for_status()
@@ -44,18 +53,26 @@ def capture_order(
     *,
     paypal_order_id: str,
 ) -> dict:
-    headers = construct_paypal_auth_headers()
+    # Lets PayPal recognize retries of this call instead of capturing twice
+    request_id = str(uuid.uuid4())
 
-    response = requests.post(
-        url=f"{PAYPAL_ORDER_BASE_URL}/{paypal_order_id}/capture",
-        headers=headers,
-        # Uncomment one of these to force an error for negative testing
-        # (in sandbox mode only).
-        # Documentation:
-        # https://developer.paypal.com/tools/sandbox/negative-testing/request-headers/
-        # "PayPal-Mock-Response": '{"mock_application_codes": "INSTRUMENT_DECLINED"}'
-        # "PayPal-Mock-Response": '{"mock_application_codes": "TRANSACTION_REFUSED"}'
-        # "PayPal-Mock-Response": '{"mock_application_codes": "INTERNAL_SERVER_ERROR"}'
+    response = retry_on_unauthorized(
+        lambda: paypal_request(
+            "POST",
+            f"{PAYPAL_ORDERS_PATH}/{paypal_order_id}/capture",
+            endpoint="capture_order",
+            headers={
+                **construct_paypal_auth_headers(),
+                "PayPal-Request-Id": request_id,
+            },
+            # Uncomment one of these to force an error for negative testing
+            # (in sandbox mode only).
+            # Documentation:
+            # https://developer.paypal.com/tools/sandbox/negative-testing/request-headers/
+            # "PayPal-Mock-Response": '{"mock_application_codes": "INSTRUMENT_DECLINED"}'
+            # "PayPal-Mock-Response": '{"mock_application_codes": "TRANSACTION_REFUSED"}'
+            # "PayPal-Mock-Response": '{"mock_application_codes": "INTERNAL_SERVER_ERROR"}'
+        ),
     )
 
     try:
@@ -1,24 +1,46 @@
+"""PayPal subscription lookups and cached subscription statuses.
+
+Fetched statuses are cached for about a day. Each entry gets a jittered TTL,
+so statuses cached at the same time do not all expire at once, and records
+when it stops being fresh, so refresh_subscription_statuses() can skip
+statuses that stay fresh. Subscription.is_active reads the status stored on
+the subscription, not this cache (see subscription.paypal_status).
+"""
+
 import logging
+import random
+import time
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import batched
+
 from django.core.cache import cache
-import requests
 from requests.exceptions import HTTPError
 
-from .auth import construct_paypal_auth_headers
-from paypal.constants import ONE_DAY_S, PAYPAL_SUBSCRIPTIONS_BASE_URL
+from .auth import construct_paypal_auth_headers, retry_on_unauthorized
+from .client import paypal_request
+from paypal.constants import ONE_DAY_S, PAYPAL_SUBSCRIPTIONS_PATH
 from paypal.models import PayPalError
 
 logger = logging.getLogger(__name__)
 
+# How long a cached status is fresh, give or take the jitter fraction
+SUBSCRIPTION_STATUS_TTL_S = ONE_DAY_S
+SUBSCRIPTION_STATUS_TTL_JITTER = 0.1
+
 
 def get_subscription(
     *,
     paypal_subscription_id: str,
 ) -> dict:
-    headers = construct_paypal_auth_headers()
-
-    response = requests.get(
-        url=f"{PAYPAL_SUBSCRIPTIONS_BASE_URL}/{paypal_subscription_id}",
-        headers=headers,
+    response = retry_on_unauthorized(
+        lambda: paypal_request(
+            "GET",
+            f"{PAYPAL_SUBSCRIPTIONS_PATH}/{paypal_subscription_id}",
+            endpoint="get_subscription",
+            headers=construct_paypal_auth_headers(),
+        ),
     )
 
     try:
@@ -30,30 +52,104 @@ def get_subscription(
     return response.json()
 
 
-def subscription_is_active(
+def get_subscription_status_cache_key(paypal_subscription_id: str) -> str:
+    return f"paypal_subscription_{paypal_subscription_id}"
+
+
+def get_jittered_ttl(
+    ttl_s: float = SUBSCRIPTION_STATUS_TTL_S,
+    jitter: float = SUBSCRIPTION_STATUS_TTL_JITTER,
+) -> float:
+    """Return ``ttl_s`` randomly shortened or lengthened by up to ``jitter``."""
+    return ttl_s * random.uniform(1 - jitter, 1 + jitter)
+
+
+def _get_status_and_fresh_until(entry) -> tuple[str, float]:
+    # Entries cached as a bare status are fresh until the cache expires them
+    if isinstance(entry, str):
+        return entry, float("inf")
+    return entry["status"], entry["fresh_until"]
+
+
+def fetch_subscription_status(paypal_subscription_id: str) -> str:
+    """Get a subscription's status from PayPal and cache it.
+
+    Raises PayPalError if PayPal cannot be reached or returns an error.
+    """
+    status = get_subscription(
+        paypal_subscription_id=paypal_subscription_id,
+    )["status"]
+
+    fresh_for_s = get_jittered_ttl()
+    cache.set(
+        get_subscription_status_cache_key(paypal_subscription_id),
+        {"status": status, "fresh_until": time.time() + fresh_for_s},
+        fresh_for_s,
+    )
+    return status
+
+
+@dataclass
+class SubscriptionRefreshResult:
+    refreshed: int = 0
+    skipped: int = 0
+    failed: int = 0
+    # The fetched status of each refreshed subscription
+    statuses: dict[str, str] = field(default_factory=dict)
+
+
+def refresh_subscription_statuses(
+    paypal_subscription_ids: Iterable[str],
     *,
-    paypal_subscription_id: str,
-) -> bool:
-    """Check the status of a PayPal subscription."""
-    # Check the cache first
-    cache_key = f"paypal_subscription_{paypal_subscription_id}"
-    status = cache.get(cache_key)
-
-    if status is None:
-        try:
-            subscription = get_subscription(
-                paypal_subscription_id=paypal_subscription_id,
-            )
-        except PayPalError:
-            return False
-
-        status = subscription["status"]
-
-        # Cache the status for one day
-        cache.set(
-            cache_key,
-            status,
-            ONE_DAY_S,  # 24 hours
-        )
-
-    return status == "ACTIVE"
+    max_workers: int = 8,
+    batch_size: int = 100,
+    refresh_within_s: float | None = None,
+) -> SubscriptionRefreshResult:
+    """Fetch and cache the statuses of many subscriptions.
+
+    Subscriptions are processed in batches of ``batch_size`` with at most
+    ``max_workers`` concurrent PayPal requests. With ``refresh_within_s``,
+    statuses that stay fresh for longer than that are skipped.
+    """
+    result = SubscriptionRefreshResult()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for batch in batched(paypal_subscription_ids, batch_size):
+            to_refresh = list(batch)
+
+            if refresh_within_s is not None:
+                cache_keys = {
+                    get_subscription_status_cache_key(subscription_id): subscription_id
+                    for subscription_id in batch
+                }
+                refresh_before = time.time() + refresh_within_s
+                fresh_ids = {
+                    cache_keys[key]
+                    for key, entry in cache.get_many(cache_keys).items()
+                    if _get_status_and_fresh_until(entry)[1] > refresh_before
+                }
+                to_refresh = [
+                    subscription_id
+                    for subscription_id in batch
+                    if subscription_id not in fresh_ids
+                ]
+                result.skipped += len(batch) - len(to_refresh)
+
+            futures = [
+                executor.submit(fetch_subscription_status, subscription_id)
+                for subscription_id in to_refresh
+            ]
+            for subscription_id, future in zip(to_refresh, futures):
+                try:
+                    status = future.result()
+                except PayPalError:
+                    logger.warning(
+                        "Could not refresh the status of PayPal subscription %s",
+                        subscription_id,
+                    )
+                    result.failed += 1
+                else:
+                    result.refreshed += 1
+                    result.statuses[subscription_id] = status
+
+    return result
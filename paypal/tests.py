@@ -1,35 +1,52 @@
-from http import HTTPStatus
 import json
+import time
+from http import HTTPStatus
+from io import StringIO
 from unittest import mock
+
 from django.core.cache import cache
-from django.test import Client, TestCase
+from django.core.management import call_command
+from django.test import Client, TestCase, override_settings
 from django.urls import reverse
+from django.utils import timezone
 from requests.exceptions import HTTPError
-from accounts.models import User
 
+from accounts.models import User
 from orders.factories import OrderFactory
 from orders.models import Order
 from subscription.models import Subscription
 
+from . import client as paypal_client
 from .auth import (
-    get_auth_token,
+    AUTH_TOKEN_CACHE_KEY,
+    AUTH_TOKEN_LOCK_KEY,
     construct_paypal_auth_headers,
+    get_auth_token,
+    get_cached_auth_token,
+    retry_on_unauthorized,
+)
+from .client import get_latency_metrics, reset_latency_metrics, reset_session
+from .fake_server import FAKE_ACCESS_TOKEN, FakePayPalServer
+from .models import (
+    PayPalError,
 )
 from .orders import (
-    create_order,
     capture_order,
+    create_order,
 )
 from .subscriptions import (
+    SUBSCRIPTION_STATUS_TTL_JITTER,
+    SUBSCRIPTION_STATUS_TTL_S,
+    fetch_subscription_status,
+    get_jittered_ttl,
     get_subscription,
-    subscription_is_active,
-)
-from .models import (
-    PayPalError,
+    get_subscription_status_cache_key,
+    refresh_subscription_statuses,
 )
 
 
 class GetAuthTokenTest(TestCase):
-    @mock.patch("paypal.auth.requests.post")
+    @mock.patch("paypal.auth.paypal_request")
     def test_get_auth_token_success(self, mock_post):
         # Mock successful API response
         mock_response = mock.Mock()
@@ -41,7 +58,7 @@ class GetAuthTokenTest(TestCase):
         result = get_auth_token()
         self.assertEqual(result, "some_token")
 
-    @mock.patch("paypal.auth.requests.post")
+    @mock.patch("paypal.auth.paypal_request")
     def test_get_auth_token_failure(self, mock_post):
         # Mock failed API response
         mock_response = mock.Mock()
@@ -54,8 +71,102 @@ class GetAuthTokenTest(TestCase):
             get_auth_token()
 
 
+class GetCachedAuthTokenTest(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def mock_token_response(self, mock_post, token="some_token", expires_in=32400):
+        mock_response = mock.Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "access_token": token,
+            "expires_in": expires_in,
+        }
+        mock_post.return_value = mock_response
+
+    @mock.patch("paypal.auth.paypal_request")
+    def test_token_is_cached(self, mock_post):
+        self.mock_token_response(mock_post)
+
+        self.assertEqual(get_cached_auth_token(), "some_token")
+        self.assertEqual(get_cached_auth_token(), "some_token")
+
+        mock_post.assert_called_once()
+
+    @mock.patch("paypal.auth.paypal_request")
+    def test_token_is_refreshed_before_expiry(self, mock_post):
+        self.mock_token_response(mock_post, token="new_token")
+        cache.set(
+            AUTH_TOKEN_CACHE_KEY,
+            {"access_token": "old_token", "expires_at": time.time() + 60},
+        )
+
+        self.assertEqual(get_cached_auth_token(), "new_token")
+        mock_post.assert_called_once()
+
+    @mock.patch("paypal.auth.paypal_request")
+    def test_expiring_token_is_used_while_another_worker_refreshes(self, mock_post):
+        cache.set(
+            AUTH_TOKEN_CACHE_KEY,
+            {"access_token": "old_token", "expires_at": time.time() + 60},
+        )
+        cache.set(AUTH_TOKEN_LOCK_KEY, True)
+
+        self.assertEqual(get_cached_auth_token(), "old_token")
+        mock_post.assert_not_called()
+
+    @mock.patch("paypal.auth.AUTH_TOKEN_LOCK_WAIT_S", 0)
+    @mock.patch("paypal.auth.paypal_request")
+    def test_token_is_requested_when_refreshing_worker_is_slow(self, mock_post):
+        self.mock_token_response(mock_post)
+        cache.set(AUTH_TOKEN_LOCK_KEY, True)
+
+        self.assertEqual(get_cached_auth_token(), "some_token")
+        mock_post.assert_called_once()
+
+    @mock.patch("paypal.auth.paypal_request")
+    def test_lock_is_released_after_refresh_failure(self, mock_post):
+        mock_response = mock.Mock()
+        mock_response.raise_for_status.side_effect = HTTPError()
+        mock_post.return_value = mock_response
+
+        with self.assertRaises(PayPalError):
+            get_cached_auth_token()
+
+        self.assertIsNone(cache.get(AUTH_TOKEN_LOCK_KEY))
+
+
+class RetryOnUnauthorizedTest(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_retries_once_with_new_token(self):
+        cache.set(
+            AUTH_TOKEN_CACHE_KEY,
+            {"access_token": "revoked_token", "expires_at": time.time() + 3600},
+        )
+        unauthorized_response = mock.Mock(status_code=HTTPStatus.UNAUTHORIZED)
+        ok_response = mock.Mock(status_code=HTTPStatus.OK)
+        send_request = mock.Mock(side_effect=[unauthorized_response, ok_response])
+
+        response = retry_on_unauthorized(send_request)
+
+        self.assertIs(response, ok_response)
+        self.assertEqual(send_request.call_count, 2)
+        self.assertIsNone(cache.get(AUTH_TOKEN_CACHE_KEY))
+
+    def test_does_not_retry_twice(self):
+        unauthorized_response = mock.Mock(status_code=HTTPStatus.UNAUTHORIZED)
+        send_request = mock.Mock(return_value=unauthorized_response)
+
+        response = retry_on_unauthorized(send_request)
+
+        self.assertIs(response, unauthorized_response)
+        self.assertEqual(send_request.call_count, 2)
+
+
 class ConstructPayPalAuthHeadersTest(TestCase):
-    @mock.patch("paypal.auth.get_auth_token")
+    @mock.patch("paypal.auth.get_cached_auth_token")
     def test_construct_paypal_auth_headers(self, mock_get_auth_token):
         # Mock get_auth_token to return a sample token
         mock_get_auth_token.return_value = "sample_token"
@@ -72,7 +183,7 @@ class ConstructPayPalAuthHeadersTest(TestCase):
 
 
 class CreateOrderTest(TestCase):
-    @mock.patch("paypal.orders.requests.post")
+    @mock.patch("paypal.orders.paypal_request")
     @mock.patch("paypal.orders.construct_paypal_auth_headers")
     def test_create_order_success(self, mock_construct_headers, mock_post):
         # Mock the construct_paypal_auth_headers function
@@ -92,7 +203,7 @@ class CreateOrderTest(TestCase):
         # Validate the result
         self.assertEqual(result, {"order_id": "12345"})
 
-    @mock.patch("paypal.orders.requests.post")
+    @mock.patch("paypal.orders.paypal_request")
     @mock.patch("paypal.orders.construct_paypal_auth_headers")
     def test_create_order_failure(self, mock_construct_headers, mock_post):
         # Mock the construct_paypal_auth_headers function
@@ -112,7 +223,7 @@ class CreateOrderTest(TestCase):
 
 
 class CaptureOrderTest(TestCase):
-    @mock.patch("paypal.orders.requests.post")
+    @mock.patch("paypal.orders.paypal_request")
     @mock.patch("paypal.orders.construct_paypal_auth_headers")
     def test_capture_order_success(self, mock_construct_headers, mock_post):
         # Mock construct_paypal_auth_headers
@@ -133,7 +244,7 @@ class CaptureOrderTest(TestCase):
         self.assertEqual(result, {"status": "COMPLETED"})
 
     @mock.patch("paypal.orders.logger")
-    @mock.patch("paypal.orders.requests.post")
+    @mock.patch("paypal.orders.paypal_request")
     @mock.patch("paypal.orders.construct_paypal_auth_headers")
     def test_capture_order_failure(
         self,
@@ -162,7 +273,7 @@ class CaptureOrderTest(TestCase):
 
 class GetSubscriptionTest(TestCase):
     @mock.patch("paypal.subscriptions.logger")
-    @mock.patch("paypal.subscriptions.requests.get")
+    @mock.patch("paypal.subscriptions.paypal_request")
     @mock.patch("paypal.subscriptions.construct_paypal_auth_headers")
     def test_get_subscription_success(
         self,
@@ -188,7 +299,7 @@ class GetSubscriptionTest(TestCase):
         self.assertEqual(result, {"status": "ACTIVE"})
 
     @mock.patch("paypal.subscriptions.logger")
-    @mock.patch("paypal.subscriptions.requests.get")
+    @mock.patch("paypal.subscriptions.paypal_request")
     @mock.patch("paypal.subscriptions.construct_paypal_auth_headers")
     def test_get_subscription_failure(
         self,
@@ -215,62 +326,46 @@ class GetSubscriptionTest(TestCase):
         mock_logger.exception.assert_called()
 
 
-class SubscriptionIsActiveTest(TestCase):
+class FetchSubscriptionStatusTest(TestCase):
     @mock.patch("paypal.subscriptions.get_subscription")
-    def test_subscription_is_active_cache_miss(self, mock_get_subscription):
-        # Mock get_subscription for cache miss scenario
+    def test_status_is_cached_with_jittered_ttl(self, mock_get_subscription):
         mock_get_subscription.return_value = {"status": "ACTIVE"}
-
-        # Ensure the cache is empty
         cache.clear()
 
-        # Call function
-        result = subscription_is_active(paypal_subscription_id="sub12345")
-
-        # Validate result
-        self.assertTrue(result)
-
-    @mock.patch("paypal.subscriptions.get_subscription")
-    def test_subscription_is_active_cache_hit(self, mock_get_subscription):
-        # Populate the cache
-        cache.set("paypal_subscription_sub12345", "ACTIVE", None)
+        status = fetch_subscription_status("sub12345")
 
-        # Call function
-        result = subscription_is_active(paypal_subscription_id="sub12345")
-
-        # Validate result
-        self.assertTrue(result)
-
-        # Make sure get_subscription was not called
-        mock_get_subscription.assert_not_called()
+        self.assertEqual(status, "ACTIVE")
+        entry = cache.get(get_subscription_status_cache_key("sub12345"))
+        self.assertEqual(entry["status"], "ACTIVE")
+        fresh_for_s = entry["fresh_until"] - time.time()
+        self.assertLessEqual(
+            fresh_for_s,
+            SUBSCRIPTION_STATUS_TTL_S * (1 + SUBSCRIPTION_STATUS_TTL_JITTER),
+        )
+        self.assertGreater(
+            fresh_for_s,
+            SUBSCRIPTION_STATUS_TTL_S * (1 - SUBSCRIPTION_STATUS_TTL_JITTER) - 60,
+        )
 
     @mock.patch("paypal.subscriptions.get_subscription")
-    def test_subscription_is_not_active(self, mock_get_subscription):
-        # Mock get_subscription for an inactive subscription
-        mock_get_subscription.return_value = {"status": "INACTIVE"}
-
-        # Ensure the cache is empty
+    def test_error_is_raised(self, mock_get_subscription):
+        mock_get_subscription.side_effect = PayPalError("Error message")
         cache.clear()
 
-        # Call function
-        result = subscription_is_active(paypal_subscription_id="sub12345")
-
-        # Validate result
-        self.assertFalse(result)
-
-    @mock.patch("paypal.subscriptions.get_subscription")
-    def test_subscription_is_active_error(self, mock_get_subscription):
-        # Mock get_subscription to raise a PayPalError
-        mock_get_subscription.side_effect = PayPalError("Error message")
+        with self.assertRaises(PayPalError):
+            fetch_subscription_status("sub12345")
 
-        # Ensure the cache is empty
-        cache.clear()
+        self.assertIsNone(cache.get(get_subscription_status_cache_key("sub12345")))
 
-        # Call function
-        result = subscription_is_active(paypal_subscription_id="sub12345")
+    def test_jittered_ttls_differ(self):
+        ttls = {get_jittered_ttl() for _ in range(10)}
 
-        # Validate result
-        self.assertFalse(result)
+        self.assertGreater(len(ttls), 1)
+        for ttl in ttls:
+            self.assertLessEqual(
+                abs(ttl - SUBSCRIPTION_STATUS_TTL_S),
+                SUBSCRIPTION_STATUS_TTL_S * SUBSCRIPTION_STATUS_TTL_JITTER,
+            )
 
 
 class CreatePayPalOrderTest(TestCase):
@@ -426,7 +521,9 @@ class LinkPayPalSubscriptionTest(TestCase):
         )
         self.subscription_id = "sample_subscription_id"
 
-    def test_successful_link(self):
+    @mock.patch("paypal.views.get_subscription")
+    def test_successful_link(self, mock_get_subscription):
+        mock_get_subscription.return_value = {"status": "ACTIVE"}
         self.client.login(
             email="testuser@email.com",
             password="testpass",
@@ -460,6 +557,35 @@ class LinkPayPalSubscriptionTest(TestCase):
             subscription.paypal_subscription_id,
             self.subscription_id,
         )
+        self.assertEqual(subscription.status, "ACTIVE")
+        self.assertIsNotNone(subscription.status_checked_at)
+
+    @mock.patch("paypal.views.logger")
+    @mock.patch("paypal.views.get_subscription")
+    def test_link_when_paypal_fails(self, mock_get_subscription, mock_logger):
+        mock_get_subscription.side_effect = PayPalError("Error message")
+        Subscription.objects.create(
+            user=self.user,
+            paypal_subscription_id="old_subscription_id",
+            status="CANCELLED",
+            status_checked_at=timezone.now(),
+        )
+        self.client.login(
+            email="testuser@email.com",
+            password="testpass",
+        )
+
+        response = self.client.post(
+            self.url,
+            data=json.dumps({"subscription_id": self.subscription_id}),
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        subscription = Subscription.objects.get(user=self.user)
+        # The old subscription's status does not apply to the new one
+        self.assertEqual(subscription.status, "")
+        self.assertIsNone(subscription.status_checked_at)
 
     def test_unauthenticated_user(self):
         payload = json.dumps(
@@ -494,3 +620,388 @@ class LinkPayPalSubscriptionTest(TestCase):
             response.status_code,
             HTTPStatus.METHOD_NOT_ALLOWED,
         )
+
+
+@mock.patch.object(paypal_client, "RETRY_BACKOFF_FACTOR", 0)
+class PayPalClientTest(TestCase):
+    """Exercise the shared PayPal session against a local fake PayPal API."""
+
+    def setUp(self):
+        cache.clear()
+        reset_session()
+        reset_latency_metrics()
+        self.server = FakePayPalServer().start()
+        self.addCleanup(self.server.stop)
+        self.addCleanup(reset_session)
+
+        settings_override = override_settings(PAYPAL_API_URL=self.server.url)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def test_calls_reuse_one_connection(self):
+        create_order(value_usd="10.00")
+        capture_order(paypal_order_id="FAKE-ORDER-1")
+        get_subscription(paypal_subscription_id="sub12345")
+
+        # One token request followed by three API calls, over one connection
+        self.assertEqual(len(self.server.requests), 4)
+        self.assertEqual(len(self.server.requests_to("/v1/oauth2/token")), 1)
+        self.assertEqual(self.server.connection_count, 1)
+
+    def test_server_errors_are_retried(self):
+        get_cached_auth_token()
+        self.server.fail_next(HTTPStatus.SERVICE_UNAVAILABLE, times=2)
+
+        result = get_subscription(paypal_subscription_id="sub12345")
+
+        self.assertEqual(result["status"], "ACTIVE")
+        self.assertEqual(len(self.server.requests_to("/v1/billing")), 3)
+
+    def test_rate_limit_is_retried(self):
+        get_cached_auth_token()
+        self.server.fail_next(
+            HTTPStatus.TOO_MANY_REQUESTS,
+            headers={"Retry-After": "0"},
+        )
+
+        result = capture_order(paypal_order_id="FAKE-ORDER-1")
+
+        self.assertEqual(result["status"], "COMPLETED")
+
+    @mock.patch("paypal.orders.logger")
+    def test_retries_are_bounded(self, mock_logger):
+        get_cached_auth_token()
+        self.server.fail_next(
+            HTTPStatus.INTERNAL_SERVER_ERROR,
+            times=paypal_client.MAX_RETRIES + 1,
+        )
+
+        with self.assertRaises(PayPalError):
+            capture_order(paypal_order_id="FAKE-ORDER-1")
+
+        self.assertEqual(
+            len(self.server.requests_to("/v2/checkout/orders")),
+            paypal_client.MAX_RETRIES + 1,
+        )
+
+    def test_order_retries_reuse_the_idempotency_key(self):
+        get_cached_auth_token()
+        self.server.fail_next(HTTPStatus.BAD_GATEWAY)
+
+        result = create_order(value_usd="10.00")
+
+        attempts = self.server.requests_to("/v2/checkout/orders")
+        self.assertEqual(len(attempts), 2)
+        self.assertEqual(
+            attempts[0].headers["PayPal-Request-Id"],
+            attempts[1].headers["PayPal-Request-Id"],
+        )
+        self.assertEqual(result["id"], "FAKE-ORDER-1")
+
+    def test_rejected_token_is_replaced(self):
+        cache.set(
+            AUTH_TOKEN_CACHE_KEY,
+            {"access_token": "revoked-token", "expires_at": time.time() + 3600},
+        )
+
+        result = get_subscription(paypal_subscription_id="sub12345")
+
+        self.assertEqual(result["status"], "ACTIVE")
+        self.assertEqual(
+            cache.get(AUTH_TOKEN_CACHE_KEY)["access_token"],
+            FAKE_ACCESS_TOKEN,
+        )
+
+    @mock.patch.object(paypal_client, "READ_TIMEOUT_S", 0.1)
+    def test_read_timeout_raises_paypal_error(self):
+        get_cached_auth_token()
+        self.server.delay_s = 0.5
+
+        with self.assertRaises(PayPalError):
+            get_subscription(paypal_subscription_id="sub12345")
+
+        # Timed out reads are not retried
+        self.assertEqual(len(self.server.requests_to("/v1/billing")), 1)
+
+    def test_latency_metrics_are_recorded_per_endpoint(self):
+        create_order(value_usd="10.00")
+        create_order(value_usd="20.00")
+        self.server.fail_next(
+            HTTPStatus.NOT_FOUND,
+        )
+        with (
+            mock.patch("paypal.subscriptions.logger"),
+            self.assertRaises(PayPalError),
+        ):
+            get_subscription(paypal_subscription_id="missing")
+
+        metrics = get_latency_metrics()
+
+        self.assertEqual(metrics["oauth_token"]["calls"], 1)
+        self.assertEqual(metrics["create_order"]["calls"], 2)
+        self.assertEqual(metrics["create_order"]["errors"], 0)
+        self.assertEqual(metrics["get_subscription"]["errors"], 1)
+        self.assertGreater(metrics["create_order"]["max_ms"], 0)
+        self.assertGreaterEqual(
+            metrics["create_order"]["max_ms"],
+            metrics["create_order"]["mean_ms"],
+        )
+
+    @mock.patch("paypal.client.logger")
+    def test_latency_metrics_are_logged_periodically(self, mock_logger):
+        create_order(value_usd="10.00")
+        mock_logger.info.assert_not_called()
+
+        with mock.patch.object(paypal_client, "LATENCY_METRICS_LOG_INTERVAL_S", 0):
+            create_order(value_usd="20.00")
+
+        logged = [call.args[2] for call in mock_logger.info.call_args_list]
+        self.assertTrue(
+            any(line.startswith("create_order: 2 calls, 0 errors") for line in logged),
+        )
+
+
+class RefreshSubscriptionStatusesTest(TestCase):
+    """Refresh cached subscription statuses against a local fake PayPal API."""
+
+    def setUp(self):
+        cache.clear()
+        reset_session()
+        self.server = FakePayPalServer().start()
+        self.addCleanup(self.server.stop)
+        self.addCleanup(reset_session)
+
+        settings_override = override_settings(PAYPAL_API_URL=self.server.url)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def test_refreshes_all_statuses(self):
+        subscription_ids = [f"sub{number}" for number in range(25)]
+        self.server.subscription_statuses["sub3"] = "SUSPENDED"
+
+        result = refresh_subscription_statuses(
+            subscription_ids,
+            max_workers=4,
+            batch_size=10,
+        )
+
+        self.assertEqual(result.refreshed, 25)
+        self.assertEqual(result.failed, 0)
+        self.assertEqual(len(self.server.requests_to("/v1/billing")), 25)
+        # The pool has room for all workers, so connections are reused
+        self.assertLessEqual(self.server.connection_count, 4 + 1)
+        self.assertEqual(result.statuses["sub1"], "ACTIVE")
+        self.assertEqual(result.statuses["sub3"], "SUSPENDED")
+        self.assertEqual(
+            cache.get(get_subscription_status_cache_key("sub3"))["status"],
+            "SUSPENDED",
+        )
+
+    def test_skips_statuses_that_stay_fresh(self):
+        cache.set(
+            get_subscription_status_cache_key("sub1"),
+            {"status": "ACTIVE", "fresh_until": time.time() + 7200},
+        )
+        cache.set(
+            get_subscription_status_cache_key("sub2"),
+            {"status": "ACTIVE", "fresh_until": time.time() + 60},
+        )
+
+        result = refresh_subscription_statuses(
+            ["sub1", "sub2", "sub3"],
+            refresh_within_s=3600,
+        )
+
+        self.assertEqual(result.refreshed, 2)
+        self.assertEqual(result.skipped, 1)
+        self.assertEqual(
+            [request.path for request in self.server.requests_to("/v1/billing")],
+            ["/v1/billing/subscriptions/sub2", "/v1/billing/subscriptions/sub3"],
+        )
+
+    @mock.patch.object(paypal_client, "RETRY_BACKOFF_FACTOR", 0)
+    @mock.patch("paypal.subscriptions.logger")
+    def test_failures_are_counted(self, mock_logger):
+        get_cached_auth_token()
+        self.server.fail_next(
+            HTTPStatus.BAD_REQUEST,
+        )
+
+        result = refresh_subscription_statuses(["sub1", "sub2"], max_workers=1)
+
+        self.assertEqual(result.refreshed, 1)
+        self.assertEqual(result.failed, 1)
+
+    def test_command_refreshes_paypal_subscriptions(self):
+        for number, paypal_subscription_id in enumerate(["subA", "subB", None]):
+            Subscription.objects.create(
+                user=User.objects.create_user(
+                    email=f"subscriber{number}@example.com",
+                    password="password",
+                ),
+                paypal_subscription_id=paypal_subscription_id,
+            )
+        stdout = StringIO()
+
+        call_command("refresh_subscription_statuses", "--workers=2", stdout=stdout)
+
+        self.assertIn("Refreshed 2 subscription statuses", stdout.getvalue())
+        self.assertIn("PayPal get_subscription: 2 calls, 0 errors", stdout.getvalue())
+        self.assertEqual(
+            sorted(request.path for request in self.server.requests_to("/v1/billing")),
+            ["/v1/billing/subscriptions/subA", "/v1/billing/subscriptions/subB"],
+        )
+        self.assertEqual(
+            dict(
+                Subscription.objects.exclude(
+                    paypal_subscription_id=None,
+                ).values_list("paypal_subscription_id", "status"),
+            ),
+            {"subA": "ACTIVE", "subB": "ACTIVE"},
+        )
+
+    def test_command_skips_recently_checked_subscriptions(self):
+        user = User.objects.create_user(
+            email="subscriber@example.com",
+            password="password",
+        )
+        Subscription.objects.create(
+            user=user,
+            paypal_subscription_id="subA",
+            status="ACTIVE",
+            status_checked_at=timezone.now(),
+        )
+
+        call_command(
+            "refresh_subscription_statuses",
+            "--older-than=3600",
+            stdout=StringIO(),
+        )
+
+        self.assertEqual(self.server.requests_to("/v1/billing"), [])
+
+
+# Headers of a webhook delivery signed by PayPal
+SIGNATURE_HEADERS = {
+    "PayPal-Auth-Algo": "SHA256withRSA",
+    "PayPal-Cert-Url": "https://api.paypal.com/v1/notifications/certs/CERT",
+    "PayPal-Transmission-Id": "transmission-id",
+    "PayPal-Transmission-Sig": "signature",
+    "PayPal-Transmission-Time": "2026-10-18T12:00:00Z",
+}
+
+
+class PayPalWebhookTest(TestCase):
+    """Receive webhook events verified by a local fake PayPal API."""
+
+    def setUp(self):
+        cache.clear()
+        reset_session()
+        self.server = FakePayPalServer().start()
+        self.addCleanup(self.server.stop)
+        self.addCleanup(reset_session)
+
+        settings_override = override_settings(
+            PAYPAL_API_URL=self.server.url,
+            PAYPAL_WEBHOOK_ID="WEBHOOK-ID",
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.url = reverse("paypal:paypal_webhook")
+        self.subscription = Subscription.objects.create(
+            user=User.objects.create_user(
+                email="subscriber@example.com",
+                password="password",
+            ),
+            paypal_subscription_id="sub12345",
+        )
+
+    def post_event(self, event_type, status, create_time, headers=None):
+        return self.client.post(
+            self.url,
+            data=json.dumps(
+                {
+                    "id": "WH-1",
+                    "event_type": event_type,
+                    "create_time": create_time,
+                    "resource": {"id": "sub12345", "status": status},
+                },
+            ),
+            content_type="application/json",
+            headers=SIGNATURE_HEADERS if headers is None else headers,
+        )
+
+    def test_subscription_event_updates_status(self):
+        response = self.post_event(
+            "BILLING.SUBSCRIPTION.CANCELLED",
+            "CANCELLED",
+            "2026-10-18T12:00:00Z",
+        )
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.subscription.refresh_from_db()
+        self.assertEqual(self.subscription.status, "CANCELLED")
+        self.assertFalse(self.subscription.is_active)
+
+        verification = json.loads(
+            self.server.requests_to("/v1/notifications")[0].body,
+        )
+        self.assertEqual(verification["webhook_id"], "WEBHOOK-ID")
+        self.assertEqual(verification["transmission_sig"], "signature")
+        self.assertEqual(verification["webhook_event"]["id"], "WH-1")
+
+    def test_older_events_are_ignored(self):
+        self.post_event(
+            "BILLING.SUBSCRIPTION.CANCELLED",
+            "CANCELLED",
+            "2026-10-18T12:00:00Z",
+        )
+        self.post_event(
+            "BILLING.SUBSCRIPTION.ACTIVATED",
+            "ACTIVE",
+            "2026-10-17T12:00:00Z",
+        )
+
+        self.subscription.refresh_from_db()
+        self.assertEqual(self.subscription.status, "CANCELLED")
+
+    @mock.patch("paypal.views.logger")
+    def test_invalid_signature_is_rejected(self, mock_logger):
+        self.server.webhook_signatures_valid = False
+
+        response = self.post_event(
+            "BILLING.SUBSCRIPTION.ACTIVATED",
+            "ACTIVE",
+            "2026-10-18T12:00:00Z",
+        )
+
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+        self.subscription.refresh_from_db()
+        self.assertEqual(self.subscription.status, "")
+
+    @mock.patch("paypal.views.logger")
+    def test_unsigned_event_is_rejected(self, mock_logger):
+        response = self.post_event(
+            "BILLING.SUBSCRIPTION.ACTIVATED",
+            "ACTIVE",
+            "2026-10-18T12:00:00Z",
+            headers={},
+        )
+
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+        self.assertEqual(self.server.requests_to("/v1/notifications"), [])
+
+    @mock.patch.object(paypal_client, "RETRY_BACKOFF_FACTOR", 0)
+    @mock.patch("paypal.webhooks.logger")
+    def test_unverifiable_event_is_retried_by_paypal(self, mock_logger):
+        get_cached_auth_token()
+        self.server.fail_next(HTTPStatus.BAD_REQUEST)
+
+        response = self.post_event(
+            "BILLING.SUBSCRIPTION.ACTIVATED",
+            "ACTIVE",
+            "2026-10-18T12:00:00Z",
+        )
+
+        self.assertEqual(response.status_code, HTTPStatus.SERVICE_UNAVAILABLE)
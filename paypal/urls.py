@@ -19,4 +19,9 @@ urlpatterns = [
         views.link_paypal_subscription,
         name="link_paypal_subscription",
     ),
+    path(
+        "webhook/",
+        views.paypal_webhook,
+        name="paypal_webhook",
+    ),
 ]
@@ -3,12 +3,19 @@ import json
 import logging
 from django.contrib.auth.decorators import login_required
 from django.http import JsonResponse
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_POST
 
 from orders.models import Order
 from subscription.models import Subscription
+from subscription.paypal_status import record_paypal_status
 
+from .models import PayPalError
 from .orders import capture_order, create_order
+from .subscriptions import get_subscription
+from .webhooks import verify_webhook_signature
 
 logger = logging.getLogger(__name__)
 
@@ -157,9 +164,88 @@ def link_paypal_subscription(request) -> JsonResponse:
     subscription, _ = Subscription.objects.get_or_create(
         user=request.user,
     )
-    subscription.paypal_subscription_id = body_json["subscription_id"]
+    paypal_subscription_id = body_json["subscription_id"]
+    if subscription.paypal_subscription_id != paypal_subscription_id:
+        subscription.paypal_subscription_id = paypal_subscription_id
+        subscription.status = ""
+        subscription.status_checked_at = None
     subscription.save()
 
+    # Store the status now, so the subscriber's next page view has it
+    checked_at = timezone.now()
+    try:
+        paypal_subscription = get_subscription(
+            paypal_subscription_id=paypal_subscription_id,
+        )
+    except PayPalError:
+        logger.warning(
+            "Could not fetch the status of PayPal subscription %s",
+            paypal_subscription_id,
+        )
+    else:
+        record_paypal_status(
+            paypal_subscription_id,
+            paypal_subscription["status"],
+            checked_at,
+        )
+
+    return JsonResponse(
+        {
+            "success": True,
+        },
+    )
+
+
+@csrf_exempt
+@require_POST
+def paypal_webhook(request) -> JsonResponse:
+    """Receive PayPal webhook events and store subscription statuses.
+
+    PayPal redelivers events that get an error response, so an event that
+    cannot be verified right now is answered with 503.
+    """
+
+    try:
+        event = json.loads(request.body.decode("utf-8"))
+    except ValueError:
+        return JsonResponse(
+            {
+                "error": "Invalid JSON.",
+            },
+            status=HTTPStatus.BAD_REQUEST,
+        )
+
+    try:
+        verified = verify_webhook_signature(request.headers, request.body)
+    except PayPalError:
+        return JsonResponse(
+            {
+                "error": "Could not verify the webhook signature.",
+            },
+            status=HTTPStatus.SERVICE_UNAVAILABLE,
+        )
+
+    if not verified:
+        logger.warning("Rejected PayPal webhook event %s", event.get("id"))
+        return JsonResponse(
+            {
+                "error": "Invalid webhook signature.",
+            },
+            status=HTTPStatus.BAD_REQUEST,
+        )
+
+    resource = event.get("resource") or {}
+    if (
+        event.get("event_type", "").startswith("BILLING.SUBSCRIPTION.")
+        and resource.get("id")
+        and resource.get("status")
+    ):
+        record_paypal_status(
+            resource["id"],
+            resource["status"],
+            parse_datetime(event.get("create_time") or "") or timezone.now(),
+        )
+
     return JsonResponse(
         {
             "success": True,
@@ -0,0 +1,66 @@
+import json
+import logging
+
+from django.conf import settings
+from requests.exceptions import HTTPError
+
+from paypal.auth import construct_paypal_auth_headers, retry_on_unauthorized
+from paypal.client import paypal_request
+from paypal.constants import PAYPAL_VERIFY_WEBHOOK_SIGNATURE_PATH
+from paypal.models import PayPalError
+
+logger = logging.getLogger(__name__)
+
+# Request headers PayPal signs webhook deliveries with, by verification field
+WEBHOOK_SIGNATURE_HEADERS = {
+    "auth_algo": "PayPal-Auth-Algo",
+    "cert_url": "PayPal-Cert-Url",
+    "transmission_id": "PayPal-Transmission-Id",
+    "transmission_sig": "PayPal-Transmission-Sig",
+    "transmission_time": "PayPal-Transmission-Time",
+}
+
+
+def verify_webhook_signature(headers, body: bytes) -> bool:
+    """Ask PayPal whether a webhook delivery is genuine.
+
+    ``headers`` are the delivery's request headers and ``body`` its raw
+    request body. Raises PayPalError if PayPal cannot be asked.
+    """
+
+    webhook_id = getattr(settings, "PAYPAL_WEBHOOK_ID", None)
+    if not webhook_id:
+        logger.error("PAYPAL_WEBHOOK_ID is not set; rejecting PayPal webhook")
+        return False
+
+    verification = {
+        field: headers.get(header)
+        for field, header in WEBHOOK_SIGNATURE_HEADERS.items()
+    }
+    if not all(verification.values()):
+        return False
+    verification["webhook_id"] = webhook_id
+
+    # PayPal checks the signature against the event as it was sent, so pass
+    # the raw body on instead of re-serializing the parsed event
+    payload = (
+        json.dumps(verification)[:-1] + ', "webhook_event": ' + body.decode() + "}"
+    )
+
+    response = retry_on_unauthorized(
+        lambda: paypal_request(
+            "POST",
+            PAYPAL_VERIFY_WEBHOOK_SIGNATURE_PATH,
+            endpoint="verify_webhook_signature",
+            headers=construct_paypal_auth_headers(),
+            data=payload,
+        ),
+    )
+
+    try:
+        response.raise_for_status()
+    except HTTPError as error:
+        logger.exception("PayPal webhook verification failed")
+        raise PayPalError(error)
+
+    return response.json().get("verification_status") == "SUCCESS"
@@ -0,0 +1,62 @@
+"""Deferred, coalesced rebuilds of search cards.
+
+Publishing, unpublishing or moving a page changes the cards of other pages:
+its children embed its title, URL and date, the pages it authored embed its
+title and URL, and a move changes the URLs of its whole subtree. The signals
+in search.signals call schedule_search_card_refresh() for those instead of
+rebuilding the cards straight away. Page IDs are collected per database
+connection and flushed once the surrounding transaction commits, so
+publishing several pages at once, or a page and its parent, rebuilds each
+affected card once.
+"""
+
+import threading
+from collections.abc import Iterable
+
+from django.db import DEFAULT_DB_ALIAS, transaction
+
+from .cards import get_referencing_page_ids, refresh_live_search_cards
+
+_pending = threading.local()
+
+
+def _get_pending(using: str) -> dict[str, set[int]]:
+    if not hasattr(_pending, "page_ids"):
+        _pending.page_ids = {}
+    return _pending.page_ids.setdefault(using, {"pages": set(), "referenced": set()})
+
+
+def schedule_search_card_refresh(
+    page_ids: Iterable[int] = (),
+    referenced_page_ids: Iterable[int] = (),
+    using: str = DEFAULT_DB_ALIAS,
+) -> None:
+    """Rebuild cards when the transaction commits.
+
+    The cards of ``page_ids`` are rebuilt, along with the cards that embed
+    details of ``referenced_page_ids``. Outside a transaction they are
+    rebuilt immediately.
+    """
+    pending = _get_pending(using)
+    pending["pages"].update(page_ids)
+    pending["referenced"].update(referenced_page_ids)
+    # As with contact.publication_stats, every callback flushes everything
+    # pending, so all but the first callback of a transaction find nothing
+    transaction.on_commit(
+        lambda: flush_search_card_refreshes(using),
+        using=using,
+    )
+
+
+def flush_search_card_refreshes(using: str = DEFAULT_DB_ALIAS) -> int:
+    """Rebuild the pending cards now and return how many were rebuilt."""
+    pending = _get_pending(using)
+    if not pending["pages"] and not pending["referenced"]:
+        return 0
+    page_ids = set(pending["pages"])
+    referenced_page_ids = set(pending["referenced"])
+    pending["pages"].clear()
+    pending["referenced"].clear()
+
+    page_ids.update(get_referencing_page_ids(referenced_page_ids))
+    return refresh_live_search_cards(page_ids)
@@ -0,0 +1,238 @@
+"""Build and look up materialized search result cards.
+
+A card captures everything a search result template needs (title, URL,
+teaser, date, parent summary and authors) so that rendering a results page
+never has to load specific page instances, parent pages, or authors.
+"""
+
+import datetime
+import logging
+from collections import defaultdict
+from collections.abc import Iterable
+
+from django.db.models import Q, prefetch_related_objects
+from django.utils import timezone
+from wagtail.models import Page
+
+from core.page_registry import get_page_registry
+
+from .models import SearchCard
+from .vectors import update_search_vectors
+
+logger = logging.getLogger(__name__)
+
+# Attributes checked, in order, for a short summary of the page
+TEASER_FIELDS = ("teaser", "description")
+
+# Attributes checked, in order, for the date shown on the card
+DATE_FIELDS = ("publication_date", "start_date")
+
+
+def _first_value(page: Page, field_names: tuple[str, ...]):
+    for field_name in field_names:
+        value = getattr(page, field_name, None)
+        if value:
+            return value
+    return None
+
+
+def _as_date(value) -> datetime.date | None:
+    if isinstance(value, datetime.datetime):
+        if timezone.is_aware(value):
+            return timezone.localdate(value)
+        return value.date()
+    return value
+
+
+def _get_authors(page: Page) -> list[dict]:
+    """Return author summaries for pages with an ``authors`` relation.
+
+    Magazine articles and library items link authors through an orderable
+    with an ``author`` page foreign key.
+    """
+    author_links = getattr(page, "authors", None)
+    if author_links is None or not hasattr(author_links, "all"):
+        return []
+
+    authors = []
+    for author_link in author_links.all():
+        author = author_link.author
+        if author is None:
+            continue
+        authors.append(
+            {
+                "id": author.pk,
+                "title": author.title,
+                "url": (author.get_url() or "") if author.live else None,
+            },
+        )
+    return authors
+
+
+def build_search_card(page: Page, parent: Page | None = None) -> SearchCard:
+    """Return an unsaved SearchCard populated from a specific page instance.
+
+    The specific parent page may be passed in when the caller has already
+    loaded it; otherwise it is fetched. Pages directly below the tree root
+    have no parent summary.
+    """
+    card = SearchCard(
+        page_id=page.pk,
+        content_type_id=page.content_type_id,
+        search_template=getattr(page, "search_template", "") or "",
+        title=page.title,
+        url=page.get_url() or "",
+        teaser=str(_first_value(page, TEASER_FIELDS) or ""),
+        date=_as_date(_first_value(page, DATE_FIELDS)),
+        authors=_get_authors(page),
+    )
+
+    if parent is None and page.depth > 2:
+        parent = page.get_parent().specific
+    if parent is not None:
+        card.parent_title = parent.title
+        card.parent_url = parent.get_url() or ""
+        card.parent_date = _as_date(getattr(parent, "publication_date", None))
+
+    return card
+
+
+def build_search_cards(pages: Iterable[Page]) -> list[SearchCard]:
+    """Return unsaved cards for the given specific page instances.
+
+    Parents and authors are loaded in bulk so building a batch of cards costs
+    a fixed number of queries per page type rather than per page.
+    """
+    pages = list(pages)
+    if not pages:
+        return []
+
+    pages_by_class = defaultdict(list)
+    for page in pages:
+        pages_by_class[type(page)].append(page)
+    for page_class, class_pages in pages_by_class.items():
+        if hasattr(page_class, "authors"):
+            prefetch_related_objects(class_pages, "authors__author")
+
+    # Parents that are part of the batch (e.g. an issue and its articles in
+    # the same results page) are reused rather than fetched again
+    registry = get_page_registry()
+    registry.add(pages)
+    registry.resolve_parents(page for page in pages if page.depth > 2)
+
+    return [build_search_card(page) for page in pages]
+
+
+def refresh_search_cards(pages: Iterable[Page]) -> list[SearchCard]:
+    """Build and upsert cards for the given specific page instances."""
+    pages = list(pages)
+    cards = build_search_cards(pages)
+    if not cards:
+        return []
+
+    update_fields = [
+        field.name
+        for field in SearchCard._meta.concrete_fields
+        if not field.primary_key and field.name != "search_vector"
+    ]
+    SearchCard.objects.bulk_create(
+        cards,
+        update_conflicts=True,
+        unique_fields=["page"],
+        update_fields=update_fields,
+    )
+    update_search_vectors(pages)
+    return cards
+
+
+def get_search_cards(pages: Iterable[Page]) -> list[SearchCard]:
+    """Return cards for the given pages, preserving their order."""
+    return get_search_cards_by_page_id([page.pk for page in pages])
+
+
+def get_search_cards_by_page_id(page_ids: Iterable[int]) -> list[SearchCard]:
+    """Return cards for the pages with the given IDs, preserving their order.
+
+    Specific pages are only loaded for pages without a stored card (e.g.
+    content published before cards were introduced), whose cards are built
+    in memory. Nothing is written, so search requests stay read-only; the
+    signals in search.signals and ``rebuild_search_cards --missing`` store
+    the missing cards.
+    """
+    page_ids = list(page_ids)
+    cards_by_page_id = {
+        card.page_id: card
+        for card in SearchCard.objects.filter(page_id__in=page_ids).select_related(
+            "content_type",
+        )
+    }
+
+    missing_ids = [page_id for page_id in page_ids if page_id not in cards_by_page_id]
+    if missing_ids:
+        logger.debug("Rendering %d missing search cards", len(missing_ids))
+        specific_pages = Page.objects.filter(id__in=missing_ids).specific()  # type: ignore[attr-defined]
+        for card in build_search_cards(specific_pages):
+            cards_by_page_id[card.page_id] = card
+
+    return [
+        cards_by_page_id[page_id] for page_id in page_ids if page_id in cards_by_page_id
+    ]
+
+
+def get_referencing_page_ids(page_ids: Iterable[int]) -> set[int]:
+    """Return the IDs of pages whose cards embed details of the given pages.
+
+    Child pages embed their parent's title, URL and date, and authored pages
+    embed their authors' titles and URLs.
+    """
+    page_ids = list(page_ids)
+    if not page_ids:
+        return set()
+
+    children = Q(pk__in=[])
+    for path, depth in Page.objects.filter(id__in=page_ids).values_list(
+        "path",
+        "depth",
+    ):
+        children |= Q(path__startswith=path, depth=depth + 1)
+    referencing_ids = set(
+        Page.objects.live().filter(children).values_list("id", flat=True),  # type: ignore[attr-defined]
+    )
+
+    authored = Q(pk__in=[])
+    for page_id in page_ids:
+        authored |= Q(authors__contains=[{"id": page_id}])
+    referencing_ids.update(
+        SearchCard.objects.filter(authored).values_list("page_id", flat=True),
+    )
+    return referencing_ids
+
+
+def embedded_details_changed(old_card: SearchCard, card: SearchCard) -> bool:
+    """Return whether a rebuilt card changes what other cards embed of it."""
+    return (old_card.title, old_card.url, old_card.date) != (
+        card.title,
+        card.url,
+        card.date,
+    )
+
+
+def refresh_live_search_cards(
+    page_ids: Iterable[int],
+    batch_size: int = 500,
+) -> int:
+    """Rebuild cards for the live pages among the given IDs, in batches.
+
+    Cards of pages that are no longer live are deleted. Returns the number of
+    cards rebuilt.
+    """
+    page_ids = list(page_ids)
+    SearchCard.objects.filter(page_id__in=page_ids).exclude(page__live=True).delete()
+
+    live_ids = list(
+        Page.objects.live().filter(id__in=page_ids).values_list("id", flat=True),  # type: ignore[attr-defined]
+    )
+    for start in range(0, len(live_ids), batch_size):
+        batch_ids = live_ids[start : start + batch_size]
+        refresh_search_cards(Page.objects.filter(id__in=batch_ids).specific())  # type: ignore[attr-defined]
+    return len(live_ids)
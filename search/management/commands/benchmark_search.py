@@ -0,0 +1,221 @@
+import random
+import statistics
+import time
+import uuid
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from wagtail.models import Page
+from wagtail.search.backends import get_search_backend
+
+from pagination.helpers import get_paginated_items
+from search.cards import get_search_cards, refresh_search_cards
+from search.models import SearchCard
+from search.vectors import search_cards
+
+# Common words so that some queries match a large share of the corpus
+COMMON_WORDS = [
+    "friends",
+    "meeting",
+    "peace",
+    "quaker",
+    "worship",
+    "community",
+    "spirit",
+    "light",
+    "witness",
+    "service",
+]
+
+SYLLABLES = ["ka", "lo", "mi", "ren", "sto", "val", "der", "pin", "qua", "tor"]
+
+DEFAULT_QUERIES = [
+    "friends",
+    "quaker peace",
+    "worship light spirit",
+    "kalomi",
+    "renval pinqua storen",
+]
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare Wagtail's database search backend with the stored card "
+        "tsvectors on a generated corpus of pages. The corpus is created in a "
+        "transaction that is rolled back afterwards unless --keep is given."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--pages",
+            type=int,
+            default=100_000,
+            help="Number of pages to generate",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=5,
+            help="Number of timed runs per query and backend",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of pages to create and index per batch",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="Random seed for the generated corpus",
+        )
+        parser.add_argument(
+            "--query",
+            action="append",
+            dest="queries",
+            help="Query to benchmark (may be repeated); defaults to a built-in set",
+        )
+        parser.add_argument(
+            "--keep",
+            action="store_true",
+            help="Keep the generated pages instead of rolling them back",
+        )
+
+    def handle(self, *args, **options):
+        queries = options["queries"] or DEFAULT_QUERIES
+
+        with transaction.atomic():
+            parent = self.generate_corpus(
+                options["pages"],
+                options["batch_size"],
+                random.Random(options["seed"]),
+            )
+
+            self.stdout.write("Analyzing tables...")
+            tables = ["wagtailsearch_indexentry", SearchCard._meta.db_table]
+            with connection.cursor() as cursor:
+                # Merge the GIN pending lists filled by the bulk inserts, as
+                # autovacuum would have done on a live database
+                cursor.execute(
+                    """
+                    SELECT gin_clean_pending_list(i.indexrelid::regclass)
+                    FROM pg_index i
+                    JOIN pg_class c ON c.oid = i.indexrelid
+                    JOIN pg_am am ON am.oid = c.relam
+                    WHERE am.amname = 'gin' AND i.indrelid::regclass::text = ANY(%s)
+                    """,
+                    [tables],
+                )
+                for table in tables:
+                    cursor.execute(f"ANALYZE {connection.ops.quote_name(table)}")
+
+            self.stdout.write(
+                f"{'query':<28}{'backend':<10}{'hits':>8}{'median ms':>12}{'p95 ms':>10}"
+            )
+            for query in queries:
+                for backend_name, run in (
+                    ("wagtail", self.run_wagtail_search),
+                    ("tsvector", self.run_tsvector_search),
+                ):
+                    timings, hits = self.time_search(run, query, options["repeat"])
+                    self.stdout.write(
+                        f"{query:<28}{backend_name:<10}{hits:>8}"
+                        f"{statistics.median(timings):>12.1f}"
+                        f"{self.percentile(timings, 95):>10.1f}",
+                    )
+
+            if options["keep"]:
+                self.stdout.write(
+                    self.style.SUCCESS(f"Kept generated pages below '{parent.title}'"),
+                )
+            else:
+                transaction.set_rollback(True)
+                self.stdout.write(self.style.SUCCESS("Rolled back generated pages"))
+
+    def generate_corpus(
+        self, page_count: int, batch_size: int, rng: random.Random
+    ) -> Page:
+        """Create, index and build cards for page_count title-only pages.
+
+        Pages are plain ``Page`` rows inserted in bulk below a new parent page,
+        so the corpus measures query and ranking cost rather than the cost of
+        extracting text from specific page types.
+        """
+        vocabulary = COMMON_WORDS + [
+            a + b + c for a in SYLLABLES for b in SYLLABLES for c in SYLLABLES
+        ]
+        # Zipf-like word frequencies, as in natural text
+        weights = [1 / rank for rank in range(1, len(vocabulary) + 1)]
+
+        root = Page.get_first_root_node()
+        parent = root.add_child(
+            instance=Page(
+                title="Search benchmark",
+                slug=f"search-benchmark-{uuid.uuid4().hex[:8]}",
+            ),
+        )
+        content_type = ContentType.objects.get_for_model(Page)
+        search_backend = get_search_backend()
+
+        self.stdout.write(f"Generating {page_count} pages...")
+        for start in range(0, page_count, batch_size):
+            batch = []
+            for position in range(start, min(start + batch_size, page_count)):
+                title = " ".join(
+                    rng.choices(vocabulary, weights, k=rng.randint(6, 12))
+                )[:255]
+                slug = f"page-{position}"
+                batch.append(
+                    Page(
+                        title=title,
+                        draft_title=title,
+                        slug=slug,
+                        content_type=content_type,
+                        live=True,
+                        depth=parent.depth + 1,
+                        path=Page._get_path(
+                            parent.path, parent.depth + 1, position + 1
+                        ),
+                        numchild=0,
+                        url_path=f"{parent.url_path}{slug}/",
+                        locale_id=parent.locale_id,
+                    ),
+                )
+            pages = Page.objects.bulk_create(batch)
+            search_backend.add_bulk(Page, pages)
+            refresh_search_cards(pages)
+            self.stdout.write(f"Created {start + len(pages)} of {page_count} pages...")
+
+        Page.objects.filter(pk=parent.pk).update(numchild=page_count)
+        return parent
+
+    @staticmethod
+    def run_wagtail_search(query: str) -> int:
+        results = Page.objects.live().search(query, operator="or")  # type: ignore[attr-defined]
+        paginated = get_paginated_items(results, 25, 1)
+        get_search_cards(paginated.page.object_list)
+        return paginated.page.paginator.count
+
+    @staticmethod
+    def run_tsvector_search(query: str) -> int:
+        paginated = get_paginated_items(search_cards(query), 25, 1)
+        list(paginated.page.object_list)
+        return paginated.page.paginator.count
+
+    @staticmethod
+    def time_search(run, query: str, repeat: int) -> tuple[list[float], int]:
+        hits = run(query)  # warm up caches
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            run(query)
+            timings.append((time.perf_counter() - started) * 1000)
+        return timings, hits
+
+    @staticmethod
+    def percentile(values: list[float], percent: int) -> float:
+        ordered = sorted(values)
+        index = min(len(ordered) - 1, round(percent / 100 * (len(ordered) - 1)))
+        return ordered[index]
@@ -0,0 +1,51 @@
+from django.core.management.base import BaseCommand
+from wagtail.models import Page
+
+from search.cards import refresh_search_cards
+from search.models import SearchCard
+
+
+class Command(BaseCommand):
+    help = "Rebuild the materialized search result cards for all live pages"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of pages to load and write per batch",
+        )
+        parser.add_argument(
+            "--missing",
+            action="store_true",
+            help=(
+                "Only build cards for live pages without one, which search "
+                "results render in memory until they are stored"
+            ),
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+
+        # Cards for pages that are no longer live would never be shown
+        deleted_count, _ = SearchCard.objects.exclude(page__live=True).delete()
+
+        pages = Page.objects.live().filter(depth__gt=1)
+        if options["missing"]:
+            pages = pages.filter(search_card__isnull=True)
+        page_ids = list(pages.values_list("id", flat=True))
+        for start in range(0, len(page_ids), batch_size):
+            batch_ids = page_ids[start : start + batch_size]
+            refresh_search_cards(
+                Page.objects.filter(id__in=batch_ids).specific(),
+            )
+            self.stdout.write(
+                f"Rebuilt {min(start + batch_size, len(page_ids))} of {len(page_ids)} search cards...",
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Successfully rebuilt {len(page_ids)} search cards "
+                f"(removed {deleted_count} stale cards)",
+            ),
+        )
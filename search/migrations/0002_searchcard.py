@@ -0,0 +1,54 @@
+# Generated by Django 6.0.4 on 2026-10-18 11:09
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("search", "0001_add_search_indexes"),
+        ("wagtailcore", "0096_referenceindex_referenceindex_source_object_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SearchCard",
+            fields=[
+                (
+                    "page",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="search_card",
+                        serialize=False,
+                        to="wagtailcore.page",
+                    ),
+                ),
+                ("search_template", models.CharField(blank=True, max_length=255)),
+                ("title", models.CharField(max_length=255)),
+                ("url", models.CharField(blank=True, max_length=2048)),
+                ("teaser", models.TextField(blank=True)),
+                ("date", models.DateField(blank=True, null=True)),
+                ("parent_title", models.CharField(blank=True, max_length=255)),
+                ("parent_url", models.CharField(blank=True, max_length=2048)),
+                ("parent_date", models.DateField(blank=True, null=True)),
+                ("authors", models.JSONField(blank=True, default=list)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "content_type",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="contenttypes.contenttype",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Search card",
+                "verbose_name_plural": "Search cards",
+            },
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 6.0.4 on 2026-10-18 11:32
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("search", "0002_searchcard"),
+        ("wagtailcore", "0096_referenceindex_referenceindex_source_object_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="searchcard",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="searchcard",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="search_card_vector_gin"
+            ),
+        ),
+    ]
@@ -0,0 +1,59 @@
+from django.contrib.contenttypes.models import ContentType
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
+from django.db import models
+
+
+class SearchCard(models.Model):
+    """Denormalized, render-ready summary of a live page for search results.
+
+    Search results render entirely from these rows, so a results page costs
+    one query for the full-text hit list plus one query for the cards,
+    regardless of which page types match. search.signals rebuilds the card
+    when a page is published or moved, and the cards that embed a page
+    (as their parent or author) once it is unpublished, moved, or published
+    with a new title, URL or date (see search.card_refresh); unpublishing a
+    page deletes its card. Pages without a card, such as
+    content published before cards were introduced, are rendered from cards
+    built in memory, and ``rebuild_search_cards --missing`` stores them.
+    """
+
+    page = models.OneToOneField(
+        "wagtailcore.Page",
+        on_delete=models.CASCADE,
+        related_name="search_card",
+        primary_key=True,
+    )
+    content_type = models.ForeignKey(
+        ContentType,
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+    search_template = models.CharField(max_length=255, blank=True)
+
+    title = models.CharField(max_length=255)
+    url = models.CharField(max_length=2048, blank=True)
+    teaser = models.TextField(blank=True)
+    date = models.DateField(null=True, blank=True)
+
+    # Parent page summary, e.g. the MagazineIssue of a MagazineArticle
+    parent_title = models.CharField(max_length=255, blank=True)
+    parent_url = models.CharField(max_length=2048, blank=True)
+    parent_date = models.DateField(null=True, blank=True)
+
+    # List of {"id": int, "title": str, "url": str | None} dictionaries,
+    # where url is None for authors that are not live (rendered unlinked)
+    authors = models.JSONField(default=list, blank=True)
+
+    # Weighted full-text vector, maintained by search.vectors
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Search card"
+        verbose_name_plural = "Search cards"
+        indexes = (GinIndex(fields=["search_vector"], name="search_card_vector_gin"),)
+
+    def __str__(self) -> str:
+        return f"Search card for {self.title}"
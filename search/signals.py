@@ -0,0 +1,39 @@
+from django.dispatch import receiver
+from wagtail.models import Page
+from wagtail.signals import page_published, page_unpublished, post_page_move
+
+from .card_refresh import schedule_search_card_refresh
+from .cards import embedded_details_changed, refresh_search_cards
+from .models import SearchCard
+
+
+@receiver(page_published)
+def refresh_search_card_on_publish(sender, instance, **kwargs):
+    """Refresh the published page's card, and schedule the cards that embed
+    it if what they embed has changed."""
+    old_card = SearchCard.objects.filter(page=instance).first()
+    cards = refresh_search_cards([instance])
+    if old_card is None or (cards and embedded_details_changed(old_card, cards[0])):
+        schedule_search_card_refresh(referenced_page_ids=[instance.pk])
+
+
+@receiver(page_unpublished)
+def delete_search_card_on_unpublish(sender, instance, **kwargs):
+    """Remove the unpublished page's card and schedule the cards that embed
+    it."""
+    SearchCard.objects.filter(page=instance).delete()
+    schedule_search_card_refresh(referenced_page_ids=[instance.pk])
+
+
+@receiver(post_page_move)
+def refresh_search_cards_on_move(sender, instance, **kwargs):
+    """Schedule the cards of the moved subtree, since their URLs have
+    changed, and the cards that embed the moved page."""
+    subtree_ids = Page.objects.descendant_of(instance, inclusive=True).values_list(
+        "id",
+        flat=True,
+    )
+    schedule_search_card_refresh(
+        page_ids=subtree_ids,
+        referenced_page_ids=[instance.pk],
+    )
@@ -1,5 +1,7 @@
 from http import HTTPStatus
+from io import StringIO
 
+from django.core.management import call_command
 from django.db import connection
 from django.template import TemplateDoesNotExist
 from django.test import Client, TestCase, override_settings
@@ -10,7 +12,10 @@ from wagtail.search.backends import get_search_backend
 
 from contact.factories import PersonFactory
 from magazine.factories import MagazineArticleFactory, MagazineIssueFactory
-from magazine.models import MagazineArticle
+from magazine.models import MagazineArticle, MagazineArticleAuthor
+from search.cards import build_search_card, get_search_cards, refresh_search_cards
+from search.models import SearchCard
+from search.vectors import SEARCH_BACKEND_TSVECTOR, get_weighted_texts, search_cards
 from search.views import MAX_QUERY_LENGTH, MAX_QUERY_WORDS, STOPWORDS
 
 
@@ -119,71 +124,51 @@ class SearchOptimizationTestCase(TestCase):
             search_backend.add(page)
 
     @override_settings(DEBUG=True)
-    def test_search_prefetches_related_data(self) -> None:
-        """Test that search view prefetches related data to avoid N+1 queries."""
-
-        # Perform the search and capture query count
-        # Note: This count includes Django setup queries, search queries, and template rendering
+    def test_search_results_are_search_cards(self) -> None:
+        """Test that search results are rendered from materialized search cards."""
         response = self.client.get(reverse("search"), {"query": "Test Article"})
 
-        # Verify the search worked
         self.assertEqual(response.status_code, HTTPStatus.OK)
 
-        # Now access the data in templates - should not trigger additional queries
         search_results = response.context["paginated_search_results"].page.object_list
 
-        # With perfect prefetching, accessing authors should trigger exactly 0 queries.
-        # This verifies that all related data (authors and their linked author pages)
-        # has been prefetched by the view.
-        with self.assertNumQueries(0):
-            for result in search_results:
-                if isinstance(result, MagazineArticle):
-                    # Access authors - should be prefetched
-                    _ = list(result.authors.all())
-                    for author_link in result.authors.all():
-                        # Access author details - should also be prefetched
-                        _ = author_link.author.title if author_link.author else ""
+        self.assertGreater(len(search_results), 0)
+        for result in search_results:
+            self.assertIsInstance(result, SearchCard)
 
     @override_settings(DEBUG=True)
-    def test_search_prefetches_parent_pages(self) -> None:
-        """Test that search view prefetches parent pages for magazine articles."""
-
-        # Perform the search
+    def test_search_cards_embed_parent_issue(self) -> None:
+        """Test that magazine article cards carry their parent issue summary."""
         response = self.client.get(reverse("search"), {"query": "Test Article"})
 
-        # Verify the search worked
         self.assertEqual(response.status_code, HTTPStatus.OK)
 
         search_results = response.context["paginated_search_results"].page.object_list
 
-        # With parent page prefetching, accessing get_parent().specific should not trigger queries
+        # Reading card fields never touches the database
         with self.assertNumQueries(0):
             for result in search_results:
-                if isinstance(result, MagazineArticle):
-                    # Access parent page - should be prefetched
-                    parent = result.get_parent()
-                    # Access specific parent - should also be prefetched
-                    _ = parent.specific
+                if result.page_id in (self.article1.pk, self.article2.pk):
+                    self.assertEqual(result.parent_title, "Test Issue")
+                    self.assertEqual(
+                        result.parent_url,
+                        self.magazine_issue.get_url() or "",
+                    )
 
     @override_settings(DEBUG=True)
     def test_search_full_request_query_count(self) -> None:
         """Test total queries for complete search request including template rendering.
 
         This is the most important test - it catches N+1 issues that only appear
-        during template rendering (like parent page lookups from {% pageurl %} tags).
+        during template rendering.
 
-        Query count varies (14-20) depending on Django's internal cache state:
-        - 14 queries: All caches warm (content types, navigation, sites)
-        - 17 queries: Content types cached, navigation exists, some site lookups
-        - 20 queries: Fresh database, navigation settings created on first request
+        Query count varies depending on Django's internal cache state (content
+        types, navigation settings, sites) and on whether the cards already
+        exist, so we verify the count is reasonable rather than exact.
 
-        This is normal TestCase behavior and doesn't indicate N+1 issues.
-        We verify the query count is reasonable (≤20) rather than exact.
-
-        KEY OPTIMIZATION: Parent pages are bulk-prefetched for ALL search results,
-        then cached on each page instance. This prevents N+1 queries from {% pageurl %}
-        tags while keeping code simple and general-purpose. Without this optimization,
-        we'd have 2 queries per result (N+1 pattern).
+        KEY OPTIMIZATION: Results render from SearchCard rows, which embed the
+        URL, teaser, parent issue and author summaries. Rendering a results page
+        costs one query for all cards regardless of result types.
         """
         # Count queries for the ENTIRE request/response cycle
         with CaptureQueriesContext(connection) as context:
@@ -204,43 +189,34 @@ class SearchOptimizationTestCase(TestCase):
             self.MAX_SEARCH_QUERIES,
             f"Expected ≤{self.MAX_SEARCH_QUERIES} queries, got {query_count}. "
             f"This likely indicates an N+1 query regression. "
-            f"Check for missing select_related/prefetch_related.",
+            f"Check that results render from search cards.",
         )
 
     @override_settings(DEBUG=True)
-    def test_search_query_optimization(self) -> None:
-        """Test that search queries are optimized to avoid N+1 database queries."""
-        # Perform the search
-        response = self.client.get(reverse("search"), {"query": "Test Article"})
+    def test_search_with_existing_cards_does_not_load_pages(self) -> None:
+        """Test that once cards exist, result count does not affect query count."""
+        # Warm up: store the cards and fill the per-process caches
+        call_command("rebuild_search_cards", "--missing", stdout=StringIO())
+        self.client.get(reverse("search"), {"query": "Test Article"})
+        self.assertTrue(SearchCard.objects.filter(page=self.article1).exists())
 
-        # Verify the search worked
-        self.assertEqual(response.status_code, HTTPStatus.OK)
-        search_results = response.context["paginated_search_results"].page
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(reverse("search"), {"query": "Test Article"})
 
-        # Find magazine articles in the results (already specific from view)
-        magazine_articles = [
-            result for result in search_results if isinstance(result, MagazineArticle)
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        card_queries = [
+            query
+            for query in context.captured_queries
+            if "search_searchcard" in query["sql"]
         ]
-
-        # We should have found our test articles
-        self.assertGreater(
-            len(magazine_articles),
-            0,
-            "Should have found magazine articles in search results",
+        self.assertEqual(len(card_queries), 1)
+        self.assertFalse(
+            any(
+                "magazine_magazinearticleauthor" in query["sql"]
+                for query in context.captured_queries
+            ),
         )
 
-        # Now simulate what the template does - access the authors
-        # This should NOT trigger additional queries since the view already prefetched everything
-        # The results from the view are already specific instances with prefetched data
-        with self.assertNumQueries(0):
-            for article in magazine_articles:
-                # Access authors (this is what the template does)
-                authors = list(article.authors.all())
-                for author in authors:
-                    # Access author details (what template does with author.author.title)
-                    # We don't need to store this, just access it to trigger potential queries
-                    _ = author.author.title if author.author else "Unknown"
-
     def test_search_results_include_authors(self) -> None:
         """Test that search results include author information in the response context."""
         response = self.client.get(reverse("search"), {"query": "Test Article"})
@@ -250,39 +226,248 @@ class SearchOptimizationTestCase(TestCase):
         # Verify that the response includes the necessary context
         self.assertIn("paginated_search_results", response.context)
 
-        # Check that magazine articles are found and have accessible authors
         search_results = response.context["paginated_search_results"].page
-        magazine_articles = [
-            result
-            for result in search_results
-            if isinstance(result.specific, MagazineArticle)
-        ]
+        authors_by_title = {result.title: result.authors for result in search_results}
+
+        # article1 has 2 authors, article2 has 1 author
+        self.assertCountEqual(
+            [author["title"] for author in authors_by_title["Test Article One"]],
+            [self.author1.title, self.author2.title],
+        )
+        self.assertEqual(
+            [author["id"] for author in authors_by_title["Test Article Two"]],
+            [self.author1.pk],
+        )
 
-        self.assertGreater(len(magazine_articles), 0)
-
-        # Verify that authors are accessible (this would fail if prefetch wasn't working)
-        for article in magazine_articles:
-            authors = article.specific.authors.all()
-            author_count = len(authors)
-            # Assert that we have the expected number of authors based on our test data
-            # article1 has 2 authors, article2 has 1 author
-            self.assertGreater(
-                author_count,
-                0,
-                f"Article '{article.title}' should have at least one author",
+
+class SearchCardTestCase(TestCase):
+    """Test that search cards follow page publishing and related page changes."""
+
+    def setUp(self) -> None:
+        self.magazine_issue = MagazineIssueFactory(title="Card Issue")
+        self.author = PersonFactory(given_name="Card", family_name="Author")
+        self.article = MagazineArticleFactory(
+            title="Card Article",
+            teaser="Card teaser",
+            parent=self.magazine_issue,
+        )
+        MagazineArticleAuthor.objects.create(article=self.article, author=self.author)
+
+    def test_build_search_card(self) -> None:
+        card = build_search_card(self.article)
+
+        self.assertEqual(card.title, "Card Article")
+        self.assertEqual(card.teaser, "Card teaser")
+        self.assertEqual(card.search_template, "search/magazine_article.html")
+        self.assertEqual(card.url, self.article.get_url() or "")
+        self.assertEqual(card.parent_title, "Card Issue")
+        self.assertEqual(card.parent_date, self.magazine_issue.publication_date)
+        self.assertEqual(
+            card.authors,
+            [
+                {
+                    "id": self.author.pk,
+                    "title": self.author.title,
+                    "url": self.author.get_url() or "",
+                },
+            ],
+        )
+
+    def test_get_search_cards_renders_missing_cards_without_storing(self) -> None:
+        pages = [self.article.page_ptr, self.magazine_issue.page_ptr]
+
+        cards = get_search_cards(pages)
+
+        self.assertEqual([card.page_id for card in cards], [page.pk for page in pages])
+        self.assertEqual(cards[0].parent_title, "Card Issue")
+        self.assertEqual(SearchCard.objects.count(), 0)
+
+    def test_get_search_cards_reads_stored_cards(self) -> None:
+        pages = [self.article.page_ptr, self.magazine_issue.page_ptr]
+        refresh_search_cards([self.article, self.magazine_issue])
+
+        with self.assertNumQueries(1):
+            cards = get_search_cards(pages)
+
+        self.assertEqual([card.page_id for card in cards], [page.pk for page in pages])
+
+    def test_publish_refreshes_card(self) -> None:
+        refresh_search_cards([self.article])
+
+        self.article.teaser = "Updated teaser"
+        self.article.save_revision().publish()
+
+        self.assertEqual(
+            SearchCard.objects.get(page=self.article).teaser,
+            "Updated teaser",
+        )
+
+    def test_unpublish_deletes_card(self) -> None:
+        refresh_search_cards([self.article])
+
+        self.article.unpublish()
+
+        self.assertFalse(SearchCard.objects.filter(page=self.article).exists())
+
+    def test_publishing_parent_refreshes_child_cards(self) -> None:
+        refresh_search_cards([self.article])
+
+        refresh_search_cards([self.magazine_issue])
+
+        self.magazine_issue.title = "Renamed Issue"
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            self.magazine_issue.save_revision().publish()
+            # Child cards are rebuilt once the transaction commits
+            self.assertEqual(
+                SearchCard.objects.get(page=self.article).parent_title,
+                "Card Issue",
             )
-            if article.title == "Test Article One":
-                self.assertEqual(
-                    author_count,
-                    2,
-                    "Test Article One should have exactly 2 authors",
-                )
-            elif article.title == "Test Article Two":
-                self.assertEqual(
-                    author_count,
-                    1,
-                    "Test Article Two should have exactly 1 author",
-                )
+
+        self.assertGreater(len(callbacks), 0)
+        self.assertEqual(
+            SearchCard.objects.get(page=self.article).parent_title,
+            "Renamed Issue",
+        )
+
+    def test_republishing_unchanged_parent_keeps_child_cards(self) -> None:
+        refresh_search_cards([self.article, self.magazine_issue])
+        SearchCard.objects.filter(page=self.article).update(teaser="Stale")
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            self.magazine_issue.save_revision().publish()
+
+        self.assertEqual(callbacks, [])
+        self.assertEqual(SearchCard.objects.get(page=self.article).teaser, "Stale")
+
+    def test_publishing_author_refreshes_authored_cards(self) -> None:
+        refresh_search_cards([self.article])
+
+        self.author.given_name = "Renamed"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.author.save_revision().publish()
+        self.author.refresh_from_db()
+
+        self.assertEqual(
+            SearchCard.objects.get(page=self.article).authors[0]["title"],
+            self.author.title,
+        )
+
+    def test_unpublishing_author_unlinks_authored_cards(self) -> None:
+        refresh_search_cards([self.article])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.author.unpublish()
+
+        self.assertIsNone(SearchCard.objects.get(page=self.article).authors[0]["url"])
+
+    def test_rebuild_search_cards_command_missing_only(self) -> None:
+        refresh_search_cards([self.article])
+        SearchCard.objects.filter(page=self.article).update(teaser="Stale")
+
+        call_command("rebuild_search_cards", "--missing", stdout=StringIO())
+
+        self.assertEqual(SearchCard.objects.get(page=self.article).teaser, "Stale")
+        self.assertTrue(SearchCard.objects.filter(page=self.magazine_issue).exists())
+
+    def test_rebuild_search_cards_command(self) -> None:
+        call_command("rebuild_search_cards", stdout=StringIO())
+
+        self.assertTrue(SearchCard.objects.filter(page=self.article).exists())
+        self.assertTrue(SearchCard.objects.filter(page=self.magazine_issue).exists())
+
+
+@override_settings(SEARCH_BACKEND_MODE=SEARCH_BACKEND_TSVECTOR)
+class SearchVectorTestCase(TestCase):
+    """Test the stored card vectors and the tsvector search backend mode."""
+
+    def setUp(self) -> None:
+        self.magazine_issue = MagazineIssueFactory(title="Vector Issue")
+        self.title_match = MagazineArticleFactory(
+            title="Stewardship of the land",
+            teaser="A reflection",
+            parent=self.magazine_issue,
+        )
+        self.teaser_match = MagazineArticleFactory(
+            title="Letters",
+            teaser="On stewardship",
+            parent=self.magazine_issue,
+        )
+        self.no_match = MagazineArticleFactory(
+            title="Unrelated",
+            teaser="Nothing here",
+            parent=self.magazine_issue,
+        )
+        call_command("rebuild_search_cards", stdout=StringIO())
+
+    def test_weighted_texts(self) -> None:
+        title, summary, body = get_weighted_texts(self.teaser_match)
+
+        self.assertEqual(title, "Letters")
+        self.assertIn("On stewardship", summary)
+        self.assertNotIn("On stewardship", body)
+
+    def test_search_cards_ranks_title_matches_first(self) -> None:
+        results = list(search_cards("stewardship"))
+
+        self.assertEqual(
+            [card.page_id for card in results],
+            [self.title_match.pk, self.teaser_match.pk],
+        )
+
+    def test_search_cards_or_operator(self) -> None:
+        results = search_cards("stewardship unrelated")
+
+        self.assertEqual(results.count(), 3)
+
+    def test_view_renders_cards_from_vectors(self) -> None:
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(reverse("search"), {"query": "stewardship"})
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        results = response.context["paginated_search_results"].page.object_list
+        self.assertEqual(
+            [card.page_id for card in results],
+            [self.title_match.pk, self.teaser_match.pk],
+        )
+        self.assertContains(response, "Stewardship of the land")
+        self.assertFalse(
+            any(
+                "wagtailsearch_indexentry" in query["sql"]
+                for query in context.captured_queries
+            ),
+        )
+
+    def test_publish_updates_vector(self) -> None:
+        self.no_match.title = "Stewardship revisited"
+        self.no_match.save_revision().publish()
+
+        self.assertIn(
+            self.no_match.pk,
+            search_cards("stewardship").values_list("page_id", flat=True),
+        )
+
+    def test_unpublish_removes_from_results(self) -> None:
+        self.title_match.unpublish()
+
+        self.assertEqual(
+            list(search_cards("stewardship").values_list("page_id", flat=True)),
+            [self.teaser_match.pk],
+        )
+
+    def test_benchmark_command(self) -> None:
+        stdout = StringIO()
+
+        call_command(
+            "benchmark_search",
+            pages=20,
+            repeat=1,
+            query=["friends"],
+            stdout=stdout,
+        )
+
+        self.assertIn("tsvector", stdout.getvalue())
+        self.assertIn("Rolled back generated pages", stdout.getvalue())
+        self.assertFalse(Page.objects.filter(slug="page-0").exists())
 
 
 class SearchTemplateRenderingTestCase(TestCase):
@@ -523,8 +708,8 @@ class CustomSearchTemplateRenderingTestCase(TestCase):
         # Should have unique debug class
         self.assertContains(response, 'class="search-result-event"')
 
-        # Note: The event template checks for entity.specific.date but the Event model
-        # uses start_date, so the calendar icon won't render. This is a template bug.
+        # Should render the start date from the card
+        self.assertContains(response, "bi-calendar-event")
 
     def test_meeting_custom_template_renders(self) -> None:
         """Test that meeting search results use custom template."""
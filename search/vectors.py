@@ -0,0 +1,120 @@
+"""Maintain and query the stored full-text vectors on search cards.
+
+Each card stores a weighted ``tsvector`` (title A, teaser/intro B, remaining
+searchable fields C) behind a GIN index. In the ``tsvector`` search backend
+mode the search view queries these vectors directly and ranks matches with
+``ts_rank_cd``, instead of going through Wagtail's database search backend.
+"""
+
+import operator
+from collections.abc import Iterable
+from functools import reduce
+
+from django.conf import settings
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db import connection
+from django.db.models import F, QuerySet
+from django.utils.encoding import force_str
+from wagtail.models import Page
+from wagtail.search import index
+
+from .models import SearchCard
+
+SEARCH_BACKEND_WAGTAIL = "wagtail"
+SEARCH_BACKEND_TSVECTOR = "tsvector"
+
+# Text search configuration used for both indexing and querying
+SEARCH_CONFIG = "english"
+
+# Attributes weighted "B"; all other search fields except the title get "C"
+SUMMARY_FIELDS = ("teaser", "intro", "description")
+
+
+def get_search_backend_mode() -> str:
+    """Return the configured search backend mode for the search view."""
+    return getattr(settings, "SEARCH_BACKEND_MODE", SEARCH_BACKEND_WAGTAIL)
+
+
+def _as_text(value) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, list | tuple):
+        return " ".join(_as_text(item) for item in value)
+    return force_str(value)
+
+
+def get_weighted_texts(page: Page) -> tuple[str, str, str]:
+    """Return the (title, summary, body) texts to index for a specific page.
+
+    Only the page's own search fields are used. Related fields (authors,
+    topics, etc.) are left to Wagtail's index to avoid per-page queries
+    while building cards in bulk.
+    """
+    summary = " ".join(
+        _as_text(getattr(page, field_name, None)) for field_name in SUMMARY_FIELDS
+    )
+
+    body_texts = []
+    for search_field in page.get_search_fields():
+        if not isinstance(search_field, index.SearchField):
+            continue
+        if (
+            search_field.field_name == "title"
+            or search_field.field_name in SUMMARY_FIELDS
+        ):
+            continue
+        body_texts.append(_as_text(search_field.get_value(page)))
+
+    return page.title, summary.strip(), " ".join(body_texts).strip()
+
+
+def update_search_vectors(pages: Iterable[Page]) -> None:
+    """Recompute the stored vectors of the given pages' cards in one query."""
+    rows = [(page.pk, *get_weighted_texts(page)) for page in pages]
+    if not rows:
+        return
+
+    table = connection.ops.quote_name(SearchCard._meta.db_table)
+    values_sql = ", ".join(["(%s::bigint, %s::text, %s::text, %s::text)"] * len(rows))
+    sql = f"""
+        UPDATE {table} AS card
+        SET search_vector =
+            setweight(to_tsvector(%s::regconfig, data.title), 'A')
+            || setweight(to_tsvector(%s::regconfig, data.summary), 'B')
+            || setweight(to_tsvector(%s::regconfig, data.body), 'C')
+        FROM (VALUES {values_sql}) AS data (page_id, title, summary, body)
+        WHERE card.page_id = data.page_id
+    """
+    params = [SEARCH_CONFIG] * 3 + [value for row in rows for value in row]
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+
+
+def build_search_query(search_query: str, operator_name: str = "or") -> SearchQuery:
+    """Combine the words of an already sanitized query into a tsquery."""
+    combine = operator.or_ if operator_name == "or" else operator.and_
+    return reduce(
+        combine,
+        (
+            SearchQuery(word, config=SEARCH_CONFIG, search_type="plain")
+            for word in search_query.split()
+        ),
+    )
+
+
+def search_cards(search_query: str, operator_name: str = "or") -> QuerySet[SearchCard]:
+    """Return cards of live pages matching the query, best matches first.
+
+    The ``@@`` match is served by the GIN index on ``search_vector`` and
+    matches are ranked with ``ts_rank_cd`` (cover density). Cards only exist
+    for live pages (see search.signals), so no join on the page table is
+    needed.
+    """
+    query = build_search_query(search_query, operator_name)
+    return (
+        SearchCard.objects.filter(search_vector=query)
+        .annotate(
+            rank=SearchRank(F("search_vector"), query, cover_density=True),
+        )
+        .order_by("-rank", "page_id")
+    )
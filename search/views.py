@@ -1,13 +1,14 @@
 import re
 
-from django.contrib.contenttypes.models import ContentType
 from django.http import HttpRequest, HttpResponse
 from django.shortcuts import render
 from wagtail.models import Page
 
-from magazine.models import MagazineArticle
 from pagination.helpers import get_paginated_items
 
+from .cards import get_search_cards
+from .vectors import SEARCH_BACKEND_TSVECTOR, get_search_backend_mode, search_cards
+
 MAX_QUERY_LENGTH = 30  # characters
 MAX_QUERY_WORDS = 5  # words
 
@@ -214,17 +215,15 @@ def search(request: HttpRequest) -> HttpResponse:
                 },
             )
 
-        # Build an optimized queryset and then search it
-        search_results = (
-            Page.objects.live()  # type: ignore[attr-defined]
-            .select_related(  # Fetch related fields in single query
-                "content_type",
-            )
-            .search(
+        if get_search_backend_mode() == SEARCH_BACKEND_TSVECTOR:
+            # Query the stored card vectors directly; results are already cards
+            search_results = search_cards(search_query, operator_name="or")
+        else:
+            # Build an optimized queryset and then search it
+            search_results = Page.objects.live().search(  # type: ignore[attr-defined]
                 search_query,
                 operator="or",
             )
-        )
     else:
         search_results = Page.objects.none()
 
@@ -234,9 +233,10 @@ def search(request: HttpRequest) -> HttpResponse:
         page_number,
     )
 
-    # Optimize specific page loading with prefetch_related for common patterns
+    # Render results from materialized search cards rather than specific pages
     # NOTE FOR SENTRY: This section contains optimized queries.
-    # All search result parent pages are bulk-prefetched to avoid N+1 from pageurl tags.
+    # Cards embed the URL, teaser, parent and author summaries each template
+    # needs, so the whole results page costs a single extra query.
     # See SearchOptimizationTestCase.EXPECTED_TOTAL_QUERIES in search/tests.py for counts.
     if search_query and paginated_search_results:
         # Tag Sentry transaction to indicate this is an optimized query pattern
@@ -247,102 +247,17 @@ def search(request: HttpRequest) -> HttpResponse:
             sentry_sdk.set_context(
                 "search_optimization",
                 {
-                    "note": "Parent pages bulk-prefetched for all results. See SearchOptimizationTestCase in search/tests.py.",
+                    "note": "Results rendered from materialized search cards. See SearchOptimizationTestCase in search/tests.py.",
                 },
             )
         except ImportError:
             pass  # Sentry not installed, skip tagging
 
-        # Get the base queryset for the paginated results
-        paginated_results = paginated_search_results.page.object_list
-
-        # Optimize by grouping pages by content type to avoid double-fetching
-        # Magazine articles need special optimization, fetch them separately
-        magazine_article_ct = ContentType.objects.get_for_model(MagazineArticle)
-
-        # Separate magazine articles from other page types
-        magazine_article_pages = [
-            p for p in paginated_results if p.content_type_id == magazine_article_ct.id
-        ]
-        other_pages = [
-            p for p in paginated_results if p.content_type_id != magazine_article_ct.id
-        ]
-
-        specific_instances = []
-
-        # Fetch magazine articles with all optimizations (no double-fetch)
-        if magazine_article_pages:
-            # Use get_queryset() to inherit all optimizations:
-            # - defer_streamfields() to avoid loading large body/body_migrated fields
-            # - select_related("department") for efficient department access
-            # - prefetch_related("authors__author", "tags") for related data
-            magazine_articles = list(
-                MagazineArticle.get_queryset().filter(
-                    id__in=[p.id for p in magazine_article_pages],
-                ),
+        if get_search_backend_mode() != SEARCH_BACKEND_TSVECTOR:
+            paginated_search_results.page.object_list = get_search_cards(
+                paginated_search_results.page.object_list,
             )
 
-            # Bulk-annotate parent MagazineIssue instances so parent_issue
-            # property can use _parent_page without triggering N+1 queries.
-            # Uses prefetch_parent_issues() rather than the generic
-            # Page.objects.annotate_parent_page(), which fetches deferred
-            # specific instances and causes per-article queries when
-            # MagazineIssue-specific fields are accessed in the template.
-            MagazineArticle.prefetch_parent_issues(magazine_articles)
-
-            specific_instances.extend(magazine_articles)
-
-        # Fetch other page types using standard .specific()
-        if other_pages:
-            # Type checker doesn't recognize Wagtail's .specific() method on PageQuerySet
-            other_specific = (
-                Page.objects.filter(
-                    id__in=[p.id for p in other_pages],
-                )
-                .select_related("content_type")
-                .specific()  # type: ignore[attr-defined]
-            )
-            specific_instances.extend(other_specific)
-
-        # Prefetch parent pages for all search results to optimize {% pageurl %} tag
-        # The pageurl tag needs parent information to construct URLs, which would otherwise
-        # trigger N+1 queries. We bulk fetch all unique parent pages and cache them.
-        if specific_instances:
-            # Collect unique parent paths (exclude root pages which have no parent)
-            parent_paths = set()
-            for page in specific_instances:
-                if page.depth > 1:  # Not root page
-                    parent_path = page.path[: -page.steplen]
-                    parent_paths.add(parent_path)
-
-            if parent_paths:
-                # Bulk fetch all parent pages
-                parent_pages = Page.objects.filter(path__in=parent_paths).specific()  # type: ignore[attr-defined]
-                parent_map = {page.path: page for page in parent_pages}
-
-                # Cache parent on each page by overriding get_parent() method
-                # NOTE: Monkey-patching get_parent() is required because {% pageurl %} internally
-                # calls it, and we can't modify Wagtail's template tag behavior. While this
-                # approach can be surprising to future contributors, it's the most pragmatic
-                # solution for preventing N+1 queries without modifying templates or Wagtail internals.
-                for page in specific_instances:
-                    if page.depth > 1:
-                        parent_path = page.path[: -page.steplen]
-                        if parent_path in parent_map:
-                            cached_parent = parent_map[parent_path]
-                            # Override get_parent method to return cached parent
-                            page.get_parent = lambda cached_parent=cached_parent: (
-                                cached_parent
-                            )
-
-        # Create a mapping of page IDs to specific instances
-        specific_map = {page.id: page for page in specific_instances}
-
-        # Replace with specific instances in the same order
-        paginated_search_results.page.object_list = [
-            specific_map.get(p.id, p) for p in paginated_results
-        ]
-
     return render(
         request,
         "search/search.html",
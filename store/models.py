@@ -102,6 +102,10 @@ class Book(Product):  # type: ignore
     ]
     subpage_types: list[str] = []
 
+    def get_page_cache_purge_pages(self) -> list[int]:
+        """Return the IDs of the author pages, which list the book."""
+        return list(self.authors.values_list("author_id", flat=True))
+
 
 class BookAuthor(Orderable):
     book = ParentalKey(
@@ -0,0 +1,59 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from paypal.client import describe_latency_metrics, reset_latency_metrics
+from subscription.paypal_status import reconcile_paypal_statuses
+
+
+class Command(BaseCommand):
+    help = (
+        "Reconcile the stored PayPal statuses of subscriptions with PayPal, "
+        "e.g. to catch up on missed webhooks"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=8,
+            help="Maximum number of concurrent PayPal requests",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=100,
+            help="Number of subscriptions to reconcile per batch",
+        )
+        parser.add_argument(
+            "--older-than",
+            type=int,
+            default=None,
+            metavar="SECONDS",
+            help=(
+                "Only reconcile subscriptions whose status was not checked "
+                "within this many seconds (default: reconcile all)"
+            ),
+        )
+
+    def handle(self, *args, **options):
+        checked_before = None
+        if options["older_than"] is not None:
+            checked_before = timezone.now() - timedelta(seconds=options["older_than"])
+
+        reset_latency_metrics()
+        result = reconcile_paypal_statuses(
+            max_workers=options["workers"],
+            batch_size=options["batch_size"],
+            checked_before=checked_before,
+        )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Refreshed {result.refreshed} subscription statuses "
+                f"({result.failed} failed)",
+            ),
+        )
+        for line in describe_latency_metrics():
+            self.stdout.write(f"PayPal {line}")
@@ -0,0 +1,39 @@
+# Generated by Django 6.0.4 on 2026-10-18 13:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("subscription", "0019_alter_subscription_paypal_subscription_id"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="subscription",
+            name="status",
+            field=models.CharField(
+                blank=True,
+                choices=[
+                    ("APPROVAL_PENDING", "Approval pending"),
+                    ("APPROVED", "Approved"),
+                    ("ACTIVE", "Active"),
+                    ("SUSPENDED", "Suspended"),
+                    ("CANCELLED", "Cancelled"),
+                    ("EXPIRED", "Expired"),
+                ],
+                default="",
+                help_text="The PayPal subscription status, updated by PayPal webhooks and the refresh_subscription_statuses command.",
+                max_length=32,
+            ),
+        ),
+        migrations.AddField(
+            model_name="subscription",
+            name="status_checked_at",
+            field=models.DateTimeField(
+                blank=True,
+                help_text="When the PayPal subscription status was last updated.",
+                null=True,
+            ),
+        ),
+    ]
@@ -12,11 +12,19 @@ from wagtail.fields import RichTextField, StreamField
 from wagtail.models import Page
 
 from paypal import blocks as paypal_blocks
-from paypal import subscriptions as paypal_subscriptions
 
 logger = logging.getLogger(__name__)
 
 
+class PayPalSubscriptionStatus(models.TextChoices):
+    APPROVAL_PENDING = "APPROVAL_PENDING", "Approval pending"
+    APPROVED = "APPROVED", "Approved"
+    ACTIVE = "ACTIVE", "Active"
+    SUSPENDED = "SUSPENDED", "Suspended"
+    CANCELLED = "CANCELLED", "Cancelled"
+    EXPIRED = "EXPIRED", "Expired"
+
+
 class Subscription(models.Model):
     """A subscription to the magazine."""
 
@@ -43,6 +51,20 @@ class Subscription(models.Model):
         blank=True,
     )
 
+    status = models.CharField(
+        help_text="The PayPal subscription status, updated by PayPal webhooks and the refresh_subscription_statuses command.",
+        max_length=32,
+        choices=PayPalSubscriptionStatus.choices,
+        blank=True,
+        default="",
+    )
+
+    status_checked_at = models.DateTimeField(
+        help_text="When the PayPal subscription status was last updated.",
+        null=True,
+        blank=True,
+    )
+
     class Meta:
         indexes = [
             models.Index(
@@ -56,6 +78,8 @@ class Subscription(models.Model):
             "paypal_subscription_id",
         ),
         FieldPanel("expiration_date"),
+        FieldPanel("status", read_only=True),
+        FieldPanel("status_checked_at", read_only=True),
     ]
 
     def __str__(self) -> str:
@@ -65,8 +89,9 @@ class Subscription(models.Model):
     def is_active(self) -> bool:
         """Return whether the subscription is active.
 
-        If the subscription has a PayPal subscription ID, check with
-        PayPal.
+        If the subscription has a PayPal subscription ID, check the
+        locally stored PayPal status. Subscriptions whose status has never
+        been checked have it fetched from PayPal and stored once.
 
         Otherwise, if the subscription has an expiration date, check
         that the date is in the future.
@@ -76,9 +101,12 @@ class Subscription(models.Model):
         """
 
         if self.paypal_subscription_id:
-            return paypal_subscriptions.subscription_is_active(
-                paypal_subscription_id=self.paypal_subscription_id,
-            )
+            if self.status_checked_at is None:
+                from .paypal_status import store_paypal_status
+
+                store_paypal_status(self)
+
+            return self.status == PayPalSubscriptionStatus.ACTIVE
 
         if self.expiration_date is not None:
             expires_in_future = self.expiration_date >= timezone.now().date()
@@ -0,0 +1,127 @@
+"""Locally stored PayPal subscription statuses.
+
+Subscription.is_active reads Subscription.status, so subscriber page views
+do not call PayPal. The status is kept up to date by the PayPal webhook
+(paypal.views.paypal_webhook), when a subscription is linked, and by the
+refresh_subscription_statuses management command, which reconciles all
+subscriptions with PayPal. Subscriptions that have never been checked, e.g.
+ones linked before statuses were stored, have their status fetched and
+stored on their first check.
+"""
+
+import datetime
+import logging
+from itertools import batched
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from paypal.models import PayPalError
+from paypal.subscriptions import (
+    SubscriptionRefreshResult,
+    fetch_subscription_status,
+    refresh_subscription_statuses,
+)
+
+from .models import Subscription
+
+logger = logging.getLogger(__name__)
+
+
+def record_paypal_status(
+    paypal_subscription_id: str,
+    status: str,
+    checked_at: datetime.datetime,
+) -> bool:
+    """Store a subscription's PayPal status as of ``checked_at``.
+
+    Statuses older than the stored one are ignored, so webhooks delivered
+    late or out of order cannot overwrite newer information. Returns whether
+    the status was stored.
+    """
+    updated = (
+        Subscription.objects.filter(
+            paypal_subscription_id=paypal_subscription_id,
+        )
+        .filter(
+            Q(status_checked_at__isnull=True) | Q(status_checked_at__lte=checked_at),
+        )
+        .update(
+            status=status,
+            status_checked_at=checked_at,
+        )
+    )
+    return updated > 0
+
+
+def store_paypal_status(subscription: Subscription) -> bool:
+    """Fetch a subscription's status from PayPal and store it, on the
+    instance as well.
+
+    Returns whether the status was stored.
+    """
+    checked_at = timezone.now()
+    try:
+        status = fetch_subscription_status(subscription.paypal_subscription_id)
+    except PayPalError:
+        logger.warning(
+            "Could not store the status of PayPal subscription %s",
+            subscription.paypal_subscription_id,
+        )
+        return False
+
+    if not record_paypal_status(
+        subscription.paypal_subscription_id,
+        status,
+        checked_at,
+    ):
+        return False
+    subscription.status = status
+    subscription.status_checked_at = checked_at
+    return True
+
+
+def reconcile_paypal_statuses(
+    *,
+    max_workers: int = 8,
+    batch_size: int = 100,
+    checked_before: datetime.datetime | None = None,
+) -> SubscriptionRefreshResult:
+    """Fetch the PayPal status of subscriptions and store it.
+
+    With ``checked_before``, only subscriptions whose status was not checked
+    since then are reconciled.
+    """
+    subscriptions = (
+        Subscription.objects.exclude(paypal_subscription_id__isnull=True)
+        .exclude(paypal_subscription_id="")
+        .order_by("pk")
+    )
+    if checked_before is not None:
+        subscriptions = subscriptions.filter(
+            Q(status_checked_at__isnull=True) | Q(status_checked_at__lt=checked_before),
+        )
+
+    result = SubscriptionRefreshResult()
+    paypal_subscription_ids = subscriptions.values_list(
+        "paypal_subscription_id",
+        flat=True,
+    )
+    for batch in batched(paypal_subscription_ids.iterator(), batch_size):
+        # Webhooks received while the batch is fetched are newer than this
+        checked_at = timezone.now()
+        batch_result = refresh_subscription_statuses(
+            batch,
+            max_workers=max_workers,
+            batch_size=batch_size,
+        )
+
+        with transaction.atomic():
+            for paypal_subscription_id, status in batch_result.statuses.items():
+                record_paypal_status(paypal_subscription_id, status, checked_at)
+
+        result.refreshed += batch_result.refreshed
+        result.failed += batch_result.failed
+
+    return result
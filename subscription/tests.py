@@ -9,12 +9,15 @@ from wagtail.models import Site
 from accounts.factories import UserFactory
 from accounts.models import User
 from home.models import HomePage
+from paypal.models import PayPalError
 from subscription.factories import SubscriptionFactory
 from subscription.models import (
     ManageSubscriptionPage,
+    PayPalSubscriptionStatus,
     Subscription,
     SubscriptionIndexPage,
 )
+from subscription.paypal_status import record_paypal_status, store_paypal_status
 
 
 class SubscriptionTestCase(TestCase):
@@ -209,18 +212,45 @@ class ManageSubscriptionPageTestCase(TestCase):
 
 
 class TestSubscriptionModel(TestCase):
-    @patch("subscription.models.paypal_subscriptions.subscription_is_active")
-    def test_is_active_with_paypal_active(self, mock_is_active):
-        mock_is_active.return_value = True
-        subscription = Subscription(paypal_subscription_id="some_id")
+    @patch("subscription.paypal_status.fetch_subscription_status")
+    def test_is_active_with_unchecked_paypal_status(self, mock_fetch_status):
+        """Never checked statuses are fetched from PayPal and stored once."""
+        subscription = SubscriptionFactory(paypal_subscription_id="some_id")
+        mock_fetch_status.return_value = "ACTIVE"
+
+        self.assertTrue(subscription.is_active)
         self.assertTrue(subscription.is_active)
 
-    @patch("subscription.models.paypal_subscriptions.subscription_is_active")
-    def test_is_active_with_paypal_inactive(self, mock_is_active):
-        mock_is_active.return_value = False
-        subscription = Subscription(paypal_subscription_id="some_id")
+        mock_fetch_status.assert_called_once_with("some_id")
+        subscription.refresh_from_db()
+        self.assertEqual(subscription.status, PayPalSubscriptionStatus.ACTIVE)
+        self.assertIsNotNone(subscription.status_checked_at)
+
+    @patch("subscription.paypal_status.fetch_subscription_status")
+    def test_is_active_with_unchecked_paypal_status_error(self, mock_fetch_status):
+        """A PayPal error leaves the status unchecked, to be fetched again."""
+        subscription = SubscriptionFactory(paypal_subscription_id="some_id")
+        mock_fetch_status.side_effect = PayPalError("unavailable")
+
         self.assertFalse(subscription.is_active)
 
+        subscription.refresh_from_db()
+        self.assertIsNone(subscription.status_checked_at)
+
+    @patch("subscription.paypal_status.fetch_subscription_status")
+    def test_is_active_reads_stored_paypal_status(self, mock_fetch_status):
+        subscription = Subscription(
+            paypal_subscription_id="some_id",
+            status=PayPalSubscriptionStatus.ACTIVE,
+            status_checked_at=timezone.now(),
+        )
+        self.assertTrue(subscription.is_active)
+
+        subscription.status = PayPalSubscriptionStatus.SUSPENDED
+        self.assertFalse(subscription.is_active)
+
+        mock_fetch_status.assert_not_called()
+
     def test_is_active_with_future_expiration(self):
         future_date = timezone.now().date() + timedelta(days=10)
         subscription = Subscription(expiration_date=future_date)
@@ -234,3 +264,56 @@ class TestSubscriptionModel(TestCase):
     def test_is_active_with_no_data(self):
         subscription = Subscription()
         self.assertFalse(subscription.is_active)
+
+
+class RecordPayPalStatusTestCase(TestCase):
+    def setUp(self) -> None:
+        self.subscription = SubscriptionFactory(paypal_subscription_id="sub12345")
+        self.now = timezone.now()
+
+    def test_records_status(self) -> None:
+        self.assertTrue(record_paypal_status("sub12345", "ACTIVE", self.now))
+
+        self.subscription.refresh_from_db()
+        self.assertEqual(self.subscription.status, "ACTIVE")
+        self.assertEqual(self.subscription.status_checked_at, self.now)
+
+    def test_ignores_older_status(self) -> None:
+        record_paypal_status("sub12345", "CANCELLED", self.now)
+
+        self.assertFalse(
+            record_paypal_status("sub12345", "ACTIVE", self.now - timedelta(hours=1)),
+        )
+
+        self.subscription.refresh_from_db()
+        self.assertEqual(self.subscription.status, "CANCELLED")
+
+    def test_unknown_subscription(self) -> None:
+        self.assertFalse(record_paypal_status("unknown", "ACTIVE", self.now))
+
+
+class StorePayPalStatusTestCase(TestCase):
+    def setUp(self) -> None:
+        self.subscription = SubscriptionFactory(paypal_subscription_id="sub12345")
+
+    @patch("subscription.paypal_status.fetch_subscription_status")
+    def test_stores_status(self, mock_fetch_status) -> None:
+        mock_fetch_status.return_value = "ACTIVE"
+
+        self.assertTrue(store_paypal_status(self.subscription))
+        self.assertEqual(self.subscription.status, "ACTIVE")
+
+        self.subscription.refresh_from_db()
+        self.assertEqual(self.subscription.status, "ACTIVE")
+        self.assertIsNotNone(self.subscription.status_checked_at)
+        self.assertTrue(self.subscription.is_active)
+
+    @patch("subscription.paypal_status.fetch_subscription_status")
+    def test_error_keeps_status_unchecked(self, mock_fetch_status) -> None:
+        mock_fetch_status.side_effect = PayPalError("unavailable")
+
+        self.assertFalse(store_paypal_status(self.subscription))
+        self.assertIsNone(self.subscription.status_checked_at)
+
+        self.subscription.refresh_from_db()
+        self.assertIsNone(self.subscription.status_checked_at)
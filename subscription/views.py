@@ -12,14 +12,16 @@ class SubscriptionViewSet(ModelViewSet):
         "user",
         "paypal_subscription_id",
         "expiration_date",
-        "is_active",
+        "status",
     )
     inspect_view_enabled = True
     inspect_view_fields = [
         "user",
         "paypal_subscription_id",
-        # The 'is_active' field requires an HTTP request or cache hit
-        # because it fetches the current status from PayPal.
+        "status",
+        "status_checked_at",
+        # The 'is_active' field may require an HTTP request or cache hit
+        # for subscriptions whose PayPal status has not been stored yet.
         # Adding it to the inspect view to avoid unnecessary requests.
         "is_active",
     ]
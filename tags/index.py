@@ -0,0 +1,164 @@
+"""Maintain and read the tagged content index (see tags.models.TaggedPage)
+and the tag usage counts derived from it (see tags.models.TagUsage)."""
+
+from django.apps import apps
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import QuerySet
+from django.urls import reverse
+from taggit.models import Tag, TaggedItemBase
+from wagtail.models import Page, PageViewRestriction
+
+from core.cache import get_or_set_cached, model_namespace
+
+from .models import TaggedPage, TagUsage
+
+# The through models of the page types with tags
+TAGGED_ITEM_MODELS = (
+    "library.LibraryItemTag",
+    "magazine.MagazineArticleTag",
+    "news.NewsItemTag",
+    "wf_pages.WfPageTag",
+)
+
+TAG_CLOUD_NAMESPACE = "tags:cloud"
+
+SORT_TITLE_MAX_LENGTH = TaggedPage._meta.get_field("sort_title").max_length
+
+
+def get_tagged_item_models() -> list[type[TaggedItemBase]]:
+    return [apps.get_model(label) for label in TAGGED_ITEM_MODELS]
+
+
+def get_tagged_item_model(page_model: type[Page]) -> type[TaggedItemBase] | None:
+    """Return the through model of a page type's tags, if it has tags."""
+    for tagged_item_model in get_tagged_item_models():
+        if issubclass(
+            page_model,
+            tagged_item_model._meta.get_field("content_object").related_model,
+        ):
+            return tagged_item_model
+    return None
+
+
+def make_sort_title(title: str) -> str:
+    return title.lower()[:SORT_TITLE_MAX_LENGTH]
+
+
+def sync_tagged_page(page: Page) -> None:
+    """Update the index entries of a page from its current tags, and the
+    usage counts of its current and former tags."""
+    tagged_item_model = get_tagged_item_model(page.specific_class)
+    if tagged_item_model is None:
+        return
+
+    tag_ids = list(
+        tagged_item_model.objects.filter(content_object_id=page.pk).values_list(
+            "tag_id",
+            flat=True,
+        ),
+    )
+    entries = TaggedPage.objects.filter(page_id=page.pk)
+    former_tag_ids = set(entries.values_list("tag_id", flat=True))
+    entries.exclude(tag_id__in=tag_ids).delete()
+    if not tag_ids:
+        TagUsage.update_for_tags(former_tag_ids)
+        return
+
+    public = not page.get_view_restrictions().exists()
+    TaggedPage.objects.bulk_create(
+        [
+            TaggedPage(
+                tag_id=tag_id,
+                page_id=page.pk,
+                content_type_id=page.content_type_id,
+                sort_title=make_sort_title(page.title),
+                live=page.live,
+                public=public,
+            )
+            for tag_id in tag_ids
+        ],
+        update_conflicts=True,
+        unique_fields=["tag", "page"],
+        update_fields=["content_type", "sort_title", "live", "public"],
+    )
+    TagUsage.update_for_tags(former_tag_ids.union(tag_ids))
+
+
+def sync_tagged_page_by_id(page_id: int) -> None:
+    page = Page.objects.filter(pk=page_id).first()
+    if page is None:
+        entries = TaggedPage.objects.filter(page_id=page_id)
+        tag_ids = set(entries.values_list("tag_id", flat=True))
+        entries.delete()
+        TagUsage.update_for_tags(tag_ids)
+    else:
+        sync_tagged_page(page)
+
+
+def update_public_flags(root: Page) -> None:
+    """Recompute the public flags of the entries of a page and its
+    descendants, e.g. after a view restriction or a move."""
+    entries = TaggedPage.objects.filter(page__path__startswith=root.path)
+    page_paths = dict(entries.values_list("page_id", "page__path").distinct())
+    if not page_paths:
+        return
+
+    restricted_paths = tuple(
+        PageViewRestriction.objects.values_list("page__path", flat=True),
+    )
+    restricted_ids = [
+        page_id
+        for page_id, path in page_paths.items()
+        if path.startswith(restricted_paths)
+    ]
+    entries.filter(page_id__in=restricted_ids).update(public=False)
+    entries.exclude(page_id__in=restricted_ids).update(public=True)
+    TagUsage.update_for_tags(entries.values_list("tag_id", flat=True).distinct())
+
+
+def get_tagged_pages(tag_slug: str) -> QuerySet[TaggedPage]:
+    """Return the index entries of the live, public pages with a tag,
+    sorted by title."""
+    return TaggedPage.objects.filter(
+        tag__slug=tag_slug,
+        live=True,
+        public=True,
+    ).order_by("sort_title", "page_id")
+
+
+def build_tag_cloud() -> list[dict]:
+    """Return the tags of live, public pages, most used first.
+
+    Each tag has its total count and its counts per content type, keyed by
+    "app_label.model".
+    """
+    tags = {}
+    usages = TagUsage.objects.select_related("tag").order_by("tag__name")
+    for usage in usages:
+        if usage.tag_id not in tags:
+            tags[usage.tag_id] = {
+                "name": usage.tag.name,
+                "slug": usage.tag.slug,
+                "url": reverse(
+                    "tags:tagged_page_list",
+                    kwargs={"tag": usage.tag.slug},
+                ),
+                "count": 0,
+                "counts": {},
+            }
+        content_type = ContentType.objects.get_for_id(usage.content_type_id)
+        tag = tags[usage.tag_id]
+        tag["count"] += usage.count
+        tag["counts"][f"{content_type.app_label}.{content_type.model}"] = usage.count
+
+    return sorted(tags.values(), key=lambda tag: -tag["count"])
+
+
+def get_tag_cloud() -> list[dict]:
+    """Return the cached tag cloud (see build_tag_cloud)."""
+    return get_or_set_cached(
+        TAG_CLOUD_NAMESPACE,
+        [],
+        build_tag_cloud,
+        depends_on=[model_namespace(TagUsage), model_namespace(Tag)],
+    )
@@ -0,0 +1,72 @@
+# Generated by Django 6.0.4 on 2026-10-18 15:05
+
+from django.db import migrations
+
+# The through models of the page types with tags, as in tags.index
+TAGGED_ITEM_MODELS = (
+    ("library", "LibraryItemTag"),
+    ("magazine", "MagazineArticleTag"),
+    ("news", "NewsItemTag"),
+    ("wf_pages", "WfPageTag"),
+)
+
+
+def backfill_tagged_pages(apps, schema_editor):
+    """Create the index entries of the existing tags."""
+    Page = apps.get_model("wagtailcore", "Page")
+    PageViewRestriction = apps.get_model("wagtailcore", "PageViewRestriction")
+    TaggedPage = apps.get_model("tags", "TaggedPage")
+
+    restricted_paths = tuple(
+        PageViewRestriction.objects.values_list("page__path", flat=True),
+    )
+    max_length = TaggedPage._meta.get_field("sort_title").max_length
+
+    for app_label, model_name in TAGGED_ITEM_MODELS:
+        tagged_item_model = apps.get_model(app_label, model_name)
+        tags_by_page_id = {}
+        for page_id, tag_id in tagged_item_model.objects.values_list(
+            "content_object_id",
+            "tag_id",
+        ):
+            tags_by_page_id.setdefault(page_id, []).append(tag_id)
+
+        pages = Page.objects.filter(pk__in=tags_by_page_id).only(
+            "title",
+            "path",
+            "live",
+            "content_type_id",
+        )
+        TaggedPage.objects.bulk_create(
+            [
+                TaggedPage(
+                    tag_id=tag_id,
+                    page_id=page.pk,
+                    content_type_id=page.content_type_id,
+                    sort_title=page.title.lower()[:max_length],
+                    live=page.live,
+                    public=not page.path.startswith(restricted_paths),
+                )
+                for page in pages.iterator()
+                for tag_id in tags_by_page_id[page.pk]
+            ],
+            batch_size=1000,
+            ignore_conflicts=True,
+        )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tags", "0001_initial"),
+        ("library", "0025_alter_libraryitem_body"),
+        ("magazine", "0038_backfill_article_issue_fields"),
+        ("news", "0030_alter_newsitem_body"),
+        ("wf_pages", "0022_alter_wfpage_body"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            backfill_tagged_pages,
+            migrations.RunPython.noop,
+        ),
+    ]
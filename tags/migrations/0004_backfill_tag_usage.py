@@ -0,0 +1,35 @@
+# Generated by Django 6.0.4 on 2026-10-18 15:40
+
+from django.db import migrations
+from django.db.models import Count
+
+
+def backfill_tag_usage(apps, schema_editor):
+    """Count the live, public pages of each tag and content type."""
+    TaggedPage = apps.get_model("tags", "TaggedPage")
+    TagUsage = apps.get_model("tags", "TagUsage")
+
+    rows = (
+        TaggedPage.objects.filter(live=True, public=True)
+        .values("tag_id", "content_type_id")
+        .annotate(count=Count("pk"))
+        .order_by()
+    )
+    TagUsage.objects.bulk_create(
+        [TagUsage(**row) for row in rows],
+        batch_size=1000,
+        ignore_conflicts=True,
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tags", "0003_tagusage"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            backfill_tag_usage,
+            migrations.RunPython.noop,
+        ),
+    ]
@@ -1 +1,135 @@
-# Create your models here.
+from django.contrib.contenttypes.models import ContentType
+from django.db import models
+from django.db.models import Count, Q
+
+
+class TaggedPage(models.Model):
+    """An entry of the tagged content index: one tag of one page.
+
+    Tag pages list the entries of a tag, sorted and paginated in the
+    database, and load the specific pages of the current page of entries
+    only. The index covers the page types with tags (library items,
+    magazine articles, news items and WF pages), and tags.signals keeps it
+    in sync with their tags, titles, live status and view restrictions.
+    """
+
+    tag = models.ForeignKey(
+        "taggit.Tag",
+        on_delete=models.CASCADE,
+        related_name="tagged_pages",
+    )
+    page = models.ForeignKey(
+        "wagtailcore.Page",
+        on_delete=models.CASCADE,
+        related_name="tagged_page_entries",
+    )
+    content_type = models.ForeignKey(
+        ContentType,
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+    # The lowercased title, which tag pages are sorted by
+    sort_title = models.CharField(max_length=255)
+    live = models.BooleanField(default=True)
+    # Whether the page is free of view restrictions, including inherited ones
+    public = models.BooleanField(default=True)
+
+    class Meta:
+        verbose_name = "Tagged page"
+        verbose_name_plural = "Tagged pages"
+        constraints = (
+            models.UniqueConstraint(
+                fields=["tag", "page"],
+                name="tagged_page_unique_tag_page",
+            ),
+        )
+        indexes = (
+            models.Index(
+                fields=["tag", "sort_title", "page"],
+                condition=Q(live=True, public=True),
+                name="tagged_page_listing_idx",
+            ),
+        )
+
+    def __str__(self) -> str:
+        return f"Tag {self.tag_id} of {self.sort_title}"
+
+
+class TagUsage(models.Model):
+    """The number of live, public pages of one content type with a tag.
+
+    Rows are recomputed from the tagged content index whenever the index
+    entries of a tag change, so popular tags can be listed, and empty tags
+    hidden, without counting across the tagged item tables. Tags without
+    live, public pages have no rows.
+    """
+
+    tag = models.ForeignKey(
+        "taggit.Tag",
+        on_delete=models.CASCADE,
+        related_name="usages",
+    )
+    content_type = models.ForeignKey(
+        ContentType,
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+    count = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Tag usage"
+        verbose_name_plural = "Tag usage"
+        constraints = (
+            models.UniqueConstraint(
+                fields=["tag", "content_type"],
+                name="tag_usage_unique_tag_content_type",
+            ),
+        )
+
+    def __str__(self) -> str:
+        return f"Tag {self.tag_id} used {self.count} times"
+
+    @classmethod
+    def update_for_tags(cls, tag_ids) -> None:
+        """Recompute the usage counts of the given tags.
+
+        Takes a grouped count of the index entries, a delete of the rows
+        that dropped to zero and an upsert of the others.
+        """
+        from core.cache import invalidate_model
+
+        tag_ids = set(tag_ids)
+        if not tag_ids:
+            return
+
+        rows = (
+            TaggedPage.objects.filter(tag_id__in=tag_ids, live=True, public=True)
+            .values("tag_id", "content_type_id")
+            .annotate(count=Count("pk"))
+            .order_by()
+        )
+        usages = [cls(**row) for row in rows]
+        used = {(usage.tag_id, usage.content_type_id) for usage in usages}
+
+        existing = cls.objects.filter(tag_id__in=tag_ids).values_list(
+            "pk",
+            "tag_id",
+            "content_type_id",
+        )
+        stale_ids = [
+            pk
+            for pk, tag_id, content_type_id in existing
+            if (tag_id, content_type_id) not in used
+        ]
+        if stale_ids:
+            cls.objects.filter(pk__in=stale_ids).delete()
+
+        cls.objects.bulk_create(
+            usages,
+            update_conflicts=True,
+            unique_fields=["tag", "content_type"],
+            update_fields=["count", "updated_at"],
+        )
+        # Bulk writes send no signals, so core.signals does not see them
+        invalidate_model(cls)
@@ -0,0 +1,59 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from wagtail.models import PageViewRestriction
+from wagtail.signals import page_unpublished, post_page_move
+
+from .index import (
+    get_tagged_item_models,
+    sync_tagged_page,
+    sync_tagged_page_by_id,
+    update_public_flags,
+)
+from .models import TagUsage
+
+TAGGED_PAGE_MODELS = [
+    tagged_item_model._meta.get_field("content_object").related_model
+    for tagged_item_model in get_tagged_item_models()
+]
+
+
+def sync_tagged_page_on_tag_change(sender, instance, **kwargs):
+    """Update the index entries of a page whose tags changed."""
+    sync_tagged_page_by_id(instance.content_object_id)
+
+
+def sync_tagged_page_on_tag_delete(sender, instance, **kwargs):
+    """Update the index entries of a page that lost a tag, and the tag's
+    usage counts."""
+    sync_tagged_page_by_id(instance.content_object_id)
+    # When the page itself is being deleted, its index entries may already
+    # be gone, so the sync above cannot tell which tags it had
+    TagUsage.update_for_tags([instance.tag_id])
+
+
+def sync_tagged_page_on_save(sender, instance, **kwargs):
+    """Update the titles and live status of a saved page's entries."""
+    sync_tagged_page(instance)
+
+
+for tagged_item_model in get_tagged_item_models():
+    post_save.connect(sync_tagged_page_on_tag_change, sender=tagged_item_model)
+    post_delete.connect(sync_tagged_page_on_tag_delete, sender=tagged_item_model)
+
+for page_model in TAGGED_PAGE_MODELS:
+    post_save.connect(sync_tagged_page_on_save, sender=page_model)
+    # Unpublishing may save the generic page rather than the specific one
+    page_unpublished.connect(sync_tagged_page_on_save, sender=page_model)
+
+
+@receiver(post_save, sender=PageViewRestriction)
+@receiver(post_delete, sender=PageViewRestriction)
+def update_public_flags_on_restriction_change(sender, instance, **kwargs):
+    """Hide or show the entries of the restricted page and its descendants."""
+    update_public_flags(instance.page)
+
+
+@receiver(post_page_move)
+def update_public_flags_on_move(sender, instance, **kwargs):
+    """Moved pages may gain or lose restrictions inherited from ancestors."""
+    update_public_flags(instance)
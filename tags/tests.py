@@ -1,16 +1,27 @@
 import re
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from taggit.models import Tag
-from library.models import LibraryItem
+from wagtail.models import PageViewRestriction
+
+from contact.factories import PersonFactory
 from library.factories import LibraryItemFactory
+from library.models import LibraryItem
 from magazine.factories import MagazineArticleFactory
 from magazine.models import MagazineArticle, MagazineArticleAuthor, MagazineIssue
 from news.factories import NewsItemFactory
 from news.models import NewsItem
+from tags.index import get_tagged_pages
+from tags.models import TaggedPage, TagUsage
 from wf_pages.factories import WfPageFactory
 from wf_pages.models import WfPage
-from contact.factories import PersonFactory
 
 
 class TaggedPageListViewQuerysetAndContentOrderTest(TestCase):
@@ -236,17 +247,281 @@ class TaggedPageListViewQueryOptimizationTest(TestCase):
             article.save()
 
     def test_parent_page_annotated_after_view(self):
-        """The view calls annotate_parent_page() so every article in the response
-        has _parent_page set to its MagazineIssue without additional DB queries."""
+        """Every article card in the response carries its MagazineIssue."""
         response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
 
+        cards = response.context["paginated_items"].page.object_list
+        self.assertEqual(len(cards), 3)
+
+        for card in cards:
+            issue = MagazineArticle.objects.get(pk=card.page_id).get_parent()
+            self.assertIsInstance(issue.specific, MagazineIssue)
+            self.assertEqual(card.parent_title, issue.title)
+
+    def test_pages_with_cards_are_not_loaded(self):
+        call_command("rebuild_search_cards", "--missing", stdout=StringIO())
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context["search_cards"]), 3)
+        self.assertFalse(
+            any(
+                "magazine_magazinearticle" in query["sql"]
+                for query in queries.captured_queries
+            ),
+        )
+
+
+class TaggedPageIndexTest(TestCase):
+    """The tagged content index follows tags, titles, publishing and
+    view restrictions."""
+
+    def setUp(self):
+        self.tag = Tag.objects.create(name="Index Tag", slug="index-tag")
+        self.other_tag = Tag.objects.create(name="Other Tag", slug="other-tag")
+
+        self.library_item = LibraryItemFactory(title="Indexed Library Item")
+        self.library_item.tags.add(self.tag)
+        self.library_item.save()
+
+    def get_listed_page_ids(self, tag=None):
+        tag = tag or self.tag
+        return list(get_tagged_pages(tag.slug).values_list("page_id", flat=True))
+
+    def test_adding_and_removing_tags_updates_index(self):
+        self.assertEqual(self.get_listed_page_ids(), [self.library_item.pk])
+
+        self.library_item.tags.add(self.other_tag)
+        self.library_item.save()
+        self.assertEqual(
+            self.get_listed_page_ids(self.other_tag),
+            [self.library_item.pk],
+        )
+
+        self.library_item.tags.remove(self.tag.name)
+        self.library_item.save()
+        self.assertEqual(self.get_listed_page_ids(), [])
+        self.assertEqual(
+            TaggedPage.objects.filter(page_id=self.library_item.pk).count(),
+            1,
+        )
+
+    def test_entry_records_content_type_and_sort_title(self):
+        self.library_item.title = "Renamed Library Item"
+        self.library_item.save()
+
+        entry = TaggedPage.objects.get(tag=self.tag, page_id=self.library_item.pk)
+        self.assertEqual(entry.sort_title, "renamed library item")
+        self.assertEqual(entry.content_type_id, self.library_item.content_type_id)
+
+    def test_unpublished_pages_are_not_listed(self):
+        self.library_item.unpublish()
+        self.assertEqual(self.get_listed_page_ids(), [])
+
+        self.library_item.refresh_from_db()
+        self.library_item.save_revision().publish()
+        self.assertEqual(self.get_listed_page_ids(), [self.library_item.pk])
+
+    def test_restricted_pages_are_not_listed(self):
+        parent = self.library_item.get_parent()
+        restriction = PageViewRestriction.objects.create(
+            page=parent,
+            restriction_type=PageViewRestriction.PASSWORD,
+            password="secret",
+        )
+        self.assertEqual(self.get_listed_page_ids(), [])
+
+        restriction.delete()
+        self.assertEqual(self.get_listed_page_ids(), [self.library_item.pk])
+
+    def test_deleted_pages_are_removed(self):
+        self.library_item.delete()
+        self.assertFalse(TaggedPage.objects.exists())
+
+
+class TaggedPageListViewSliceTest(TestCase):
+    """Only the specific pages of the requested page of results are loaded."""
+
+    def setUp(self):
+        self.tag = Tag.objects.create(name="Slice Tag", slug="slice-tag")
+        self.url = reverse("tags:tagged_page_list", kwargs={"tag": self.tag.slug})
+
+    def add_items(self, count, start=0):
+        for i in range(start, start + count):
+            library_item = LibraryItemFactory(title=f"Library Item {i:03}")
+            library_item.tags.add(self.tag)
+            library_item.save()
+
+            news_item = NewsItemFactory(title=f"News Item {i:03}")
+            news_item.tags.add(self.tag)
+            news_item.save()
+
+    def count_queries(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(queries), response
+
+    def test_query_count_does_not_grow_with_tagged_pages(self):
+        # The first request of each size also fills the per-process caches
+        self.add_items(6)
+        self.count_queries(self.url)
+        small_count, _ = self.count_queries(self.url)
+
+        self.add_items(20, start=6)
+        self.count_queries(self.url)
+        large_count, response = self.count_queries(self.url)
+
+        self.assertLessEqual(large_count, small_count)
+        self.assertEqual(
+            response.context["paginated_items"].page.paginator.count,
+            52,
+        )
+
+    def test_later_pages_are_sorted_by_title(self):
+        self.add_items(8)
+
+        response = self.client.get(self.url + "?page=2")
         items = response.context["paginated_items"].page.object_list
-        magazine_articles = [
-            item for item in items if isinstance(item, MagazineArticle)
-        ]
-        self.assertGreater(len(magazine_articles), 0)
-
-        for article in magazine_articles:
-            self.assertIsNotNone(article._parent_page)
-            self.assertIsInstance(article.parent_issue, MagazineIssue)
+
+        self.assertEqual(
+            [item.title for item in items],
+            [f"News Item {i:03}" for i in range(2, 8)],
+        )
+        self.assertEqual(response.context["page_obj"].number, 2)
+        self.assertEqual(response.context["paginator"].num_pages, 2)
+
+
+class TagUsageTest(TestCase):
+    """Usage counts follow the live, public pages of each tag."""
+
+    def setUp(self):
+        self.tag = Tag.objects.create(name="Usage Tag", slug="usage-tag")
+
+        self.library_items = []
+        for i in range(2):
+            library_item = LibraryItemFactory(title=f"Library Item {i}")
+            library_item.tags.add(self.tag)
+            library_item.save()
+            self.library_items.append(library_item)
+
+        self.news_item = NewsItemFactory(title="News Item")
+        self.news_item.tags.add(self.tag)
+        self.news_item.save()
+
+    def get_counts(self):
+        return {
+            usage.content_type.model: usage.count
+            for usage in TagUsage.objects.filter(tag=self.tag)
+        }
+
+    def test_counts_are_split_by_content_type(self):
+        self.assertEqual(self.get_counts(), {"libraryitem": 2, "newsitem": 1})
+
+    def test_unpublishing_and_removing_tags_update_counts(self):
+        self.library_items[0].unpublish()
+        self.assertEqual(self.get_counts(), {"libraryitem": 1, "newsitem": 1})
+
+        self.news_item.tags.remove(self.tag.name)
+        self.news_item.save()
+        self.assertEqual(self.get_counts(), {"libraryitem": 1})
+
+    def test_deleting_pages_updates_counts(self):
+        self.news_item.delete()
+        self.assertEqual(self.get_counts(), {"libraryitem": 2})
+
+
+class TagCloudViewTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.url = reverse("tags:tag_cloud")
+
+        self.popular_tag = Tag.objects.create(name="Popular", slug="popular")
+        self.rare_tag = Tag.objects.create(name="Rare", slug="rare")
+        Tag.objects.create(name="Unused", slug="unused")
+
+        for i in range(2):
+            library_item = LibraryItemFactory(title=f"Library Item {i}")
+            library_item.tags.add(self.popular_tag)
+            library_item.save()
+
+        self.news_item = NewsItemFactory(title="News Item")
+        self.news_item.tags.add(self.popular_tag, self.rare_tag)
+        self.news_item.save()
+
+    def test_lists_used_tags_by_usage(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json()["tags"],
+            [
+                {
+                    "name": "Popular",
+                    "slug": "popular",
+                    "url": reverse(
+                        "tags:tagged_page_list",
+                        kwargs={"tag": "popular"},
+                    ),
+                    "count": 3,
+                    "counts": {"library.libraryitem": 2, "news.newsitem": 1},
+                },
+                {
+                    "name": "Rare",
+                    "slug": "rare",
+                    "url": reverse("tags:tagged_page_list", kwargs={"tag": "rare"}),
+                    "count": 1,
+                    "counts": {"news.newsitem": 1},
+                },
+            ],
+        )
+
+    def test_limit(self):
+        response = self.client.get(self.url, {"limit": "1"})
+
+        self.assertEqual(
+            [tag["slug"] for tag in response.json()["tags"]],
+            ["popular"],
+        )
+
+    def test_cached_cloud_follows_tag_changes(self):
+        self.client.get(self.url)
+
+        self.news_item.tags.remove(self.rare_tag.name)
+        self.news_item.save()
+
+        response = self.client.get(self.url)
+        self.assertEqual(
+            [tag["slug"] for tag in response.json()["tags"]],
+            ["popular"],
+        )
+
+
+class TagViewSetUsageColumnTest(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_superuser(
+            email="admin@email.com",
+            password="password",  # nosec - Banned password
+        )
+        self.client.force_login(self.user)
+
+        self.used_tag = Tag.objects.create(name="B Used", slug="b-used")
+        Tag.objects.create(name="A Unused", slug="a-unused")
+
+        library_item = LibraryItemFactory(title="Library Item")
+        library_item.tags.add(self.used_tag)
+        library_item.save()
+
+    def test_tags_are_sortable_by_usage(self):
+        response = self.client.get(
+            reverse("content_tags:index"),
+            {"ordering": "-usage_count"},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        tags = list(response.context["object_list"])
+        self.assertEqual([tag.slug for tag in tags], ["b-used", "a-unused"])
+        self.assertEqual([tag.usage_count for tag in tags], [1, 0])
@@ -5,6 +5,11 @@ from . import views
 app_name = "tags"
 
 urlpatterns = [
+    re_path(
+        r"^cloud\.json$",
+        views.TagCloudView.as_view(),
+        name="tag_cloud",
+    ),
     re_path(
         r"^(?P<tag>[\w-]+)/$",
         views.TaggedPageListView.as_view(),
@@ -1,86 +1,30 @@
-from itertools import chain
-
-from django.views.generic import ListView
-from django.db.models import Q
+from django.db.models import Sum
+from django.db.models.functions import Coalesce
+from django.http import JsonResponse
+from django.views.generic import ListView, View
 from taggit.models import Tag
+from wagtail.admin.ui.tables import Column
+from wagtail.admin.views.generic import IndexView
 from wagtail.admin.viewsets.model import ModelViewSet
 
-from library.models import LibraryItem
-from magazine.models import MagazineArticle
-from news.models import NewsItem
 from pagination.helpers import get_paginated_items
-from wf_pages.models import WfPage
+from search.cards import get_search_cards_by_page_id
+
+from .index import get_tag_cloud, get_tagged_pages
 
 
 class TaggedPageListView(ListView):
     template_name = "tags/tagged_page_list.html"
-    paginate_by = 10
+    # Paginated in get_context_data, which loads the search cards
+    paginate_by = None
+    items_per_page = 10
 
     def get_queryset(self):
-        """Return a list of all the pages tagged with the given tag.
+        """Return the tagged content index entries of the given tag.
 
-        The combined list is sorted alphabetically by title.
+        The entries are sorted alphabetically by title in the database.
         """
-        tag = self.kwargs["tag"]
-        # Get all the pages tagged with the given tag
-        filter_condition = Q(tags__slug__in=[tag])
-
-        library_items = (
-            LibraryItem.get_queryset()
-            .filter(filter_condition)
-            .live()
-            .public()
-            .select_related("content_type")
-            .prefetch_related("authors__author")
-            # DB-level ordering unnecessary; combined list is sorted below
-        )
-
-        magazine_articles = list(
-            MagazineArticle.get_queryset()
-            .filter(filter_condition)
-            .live()
-            .public()
-            .select_related("content_type")
-            .prefetch_related("authors__author"),
-            # DB-level ordering unnecessary; combined list is sorted below
-        )
-
-        # Bulk-annotate parent MagazineIssues to avoid N+1 from
-        # article._parent_page in magazine_article_summary.html
-        MagazineArticle.prefetch_parent_issues(magazine_articles)
-
-        news_items = (
-            NewsItem.objects.filter(filter_condition)
-            .live()
-            .public()
-            .select_related("content_type")
-            # DB-level ordering unnecessary; combined list is sorted below
-        )
-
-        pages = (
-            WfPage.get_queryset()
-            .filter(filter_condition)
-            .live()
-            .public()
-            .select_related("content_type")
-            # DB-level ordering unnecessary; combined list is sorted below
-        )
-
-        combined_queryset_list = list(
-            chain(
-                library_items,
-                magazine_articles,
-                news_items,
-                pages,
-            ),
-        )
-
-        sorted_queryset = sorted(
-            combined_queryset_list,
-            key=lambda instance: instance.title.lower(),
-        )
-
-        return sorted_queryset
+        return get_tagged_pages(self.kwargs["tag"])
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -93,23 +37,63 @@ class TaggedPageListView(ListView):
         _page_raw = self.request.GET.get("page", "1")
         page_number = int(_page_raw) if _page_raw.isdigit() else 1
 
-        context["paginated_items"] = get_paginated_items(
-            items=self.get_queryset(),
-            items_per_page=self.paginate_by,
+        paginated_items = get_paginated_items(
+            items=self.object_list,
+            items_per_page=self.items_per_page,
             page_number=page_number,
         )
+        # Tagged pages render with the same result templates as site search,
+        # from the cards of the current page of entries only
+        page = paginated_items.page
+        page.object_list = get_search_cards_by_page_id(
+            entry.page_id for entry in page.object_list
+        )
+
+        context["paginated_items"] = paginated_items
+        context["paginator"] = page.paginator
+        context["page_obj"] = page
+        context["search_cards"] = page.object_list
 
         return context
 
 
+class TagCloudView(View):
+    """List the tags of live, public pages with their usage counts as JSON.
+
+    The optional ``limit`` parameter keeps only the most used tags.
+    """
+
+    def get(self, request, *args, **kwargs):
+        tags = get_tag_cloud()
+
+        limit = request.GET.get("limit", "")
+        if limit.isdigit():
+            tags = tags[: int(limit)]
+
+        return JsonResponse({"tags": tags})
+
+
+class TagIndexView(IndexView):
+    def get_base_queryset(self):
+        return (
+            super()
+            .get_base_queryset()
+            .annotate(
+                usage_count=Coalesce(Sum("usages__count"), 0),
+            )
+        )
+
+
 class TagViewSet(ModelViewSet):
     model = Tag
     menu_label = "Tags"
     icon = "tag"
     name = "content_tags"
+    index_view_class = TagIndexView
     list_display = (
         "name",
         "slug",
+        Column("usage_count", label="Usage", sort_key="usage_count"),
     )
     search_fields = ("name",)
     ordering = ["name"]